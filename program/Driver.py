@@ -1,43 +1,226 @@
 import sys
+import argparse
+from contextlib import nullcontext
 from antlr4 import *
-from CompiscriptLexer import CompiscriptLexer
 from CompiscriptParser import CompiscriptParser
 from semantic.type_checker import TypeChecker
 from semantic.error_reporter import ErrorReporter
-from semantic.table import print_symbol_table   
+from semantic.table import print_symbol_table
+from frontend.syntax_errors import attach_syntax_listener, run_checker, SYNTAX_MODES, E_SYNTAX
+from perf.parser_profile import enable_profiling, ParseProfile
+from frontend.fast_lexer import create_lexer, LEXERS
+from frontend.streaming import SlidingTokenStream, stream_check
+from perf.memory_report import MemoryProfiler
+from intermediate.tac_gen import generate_tac
+from intermediate.optimize import optimize
+from intermediate.global_opt import optimize_global
+from intermediate.inline import inline_calls
+from codegen.mips import generate_mips
+from codegen.simulator import MipsSimulator, SimulatorError
+from codegen.peephole import peephole
+from codegen.bytecode import compile_bytecode
+from codegen.vm import StackVM
+from codegen.pygen import generate_python
+from codegen.pyrun import run_python
+from intermediate.interp import TacRuntimeError
+
+
+def build_arg_parser():
+    ap = argparse.ArgumentParser(prog="Driver.py", description="Compilador de Compiscript")
+    ap.add_argument("archivo", help="programa .cps a compilar")
+    ap.add_argument("--syntax-mode", choices=SYNTAX_MODES, default="skip",
+                    help="qué hacer con el análisis semántico si hay errores sintácticos")
+    ap.add_argument("--lexer", choices=LEXERS, default="antlr",
+                    help="lexer a usar: el generado por ANTLR o el basado en regex (más rápido)")
+    ap.add_argument("--stream", action="store_true",
+                    help="parsea y chequea una sentencia a la vez, soltando cada subárbol (memoria acotada)")
+    ap.add_argument("--profile-parser", choices=("text", "json"), default=None,
+                    help="perfila las decisiones de predicción del parser (SLL/LL, lookahead, tiempo)")
+    ap.add_argument("--memory-report", choices=("text", "json"), default=None,
+                    help="mide memoria (pico y retenida) por fase con tracemalloc")
+    ap.add_argument("--tac", choices=("text", "bin"), default=None,
+                    help="genera código de tres direcciones si no hay errores")
+    ap.add_argument("--tac-out", default=None,
+                    help="archivo de salida del TAC (por defecto: texto a stdout, binario a <archivo>.tac)")
+    ap.add_argument("-O", "--optimize", type=int, nargs="?", const=1, default=0, choices=(0, 1, 2),
+                    help="optimiza el TAC y muestra estadísticas: 1 = local (constantes, copias, "
+                         "código muerto), 2 = además inlining y SSA (SCCP, GVN, LICM); con --mips "
+                         "también aplica la mirilla al ensamblador")
+    ap.add_argument("--mips", nargs="?", const="", default=None, metavar="SALIDA",
+                    help="genera ensamblador MIPS (por defecto en <archivo>.s) y muestra loads/stores por función")
+    ap.add_argument("--no-regalloc", action="store_true",
+                    help="con --mips: todo valor vive en el marco (sin linear scan), para comparar")
+    ap.add_argument("--run", action="store_true",
+                    help="con --mips: ejecuta el ensamblador en el simulador incluido y muestra sus contadores")
+    ap.add_argument("--vm", action="store_true",
+                    help="compila el TAC a bytecode y lo ejecuta en la VM de pila")
+    ap.add_argument("--python", nargs="?", const="", default=None, metavar="SALIDA",
+                    help="traduce el programa a Python (escrito en SALIDA si se indica) y lo ejecuta")
+    return ap
 
 
 def main(argv):
     if len(argv) < 2:
         print("Uso: python Driver.py <archivo.cps>")
         return
+    args = build_arg_parser().parse_args(argv[1:])
+
+    mem = MemoryProfiler() if args.memory_report else None
+    phase = mem.phase if mem else (lambda name: nullcontext())
+    if mem:
+        mem.start()
 
-    
-    input_stream = FileStream(argv[1], encoding="utf-8")
-    lexer = CompiscriptLexer(input_stream)
-    stream = CommonTokenStream(lexer)
+    reporter = ErrorReporter()
+
+    with phase("lexing"):
+        input_stream = FileStream(args.archivo, encoding="utf-8")
+        lexer = create_lexer(input_stream, args.lexer)
+        stream = SlidingTokenStream(lexer) if args.stream else CommonTokenStream(lexer)
+        if not args.stream:
+            stream.fill()
     parser = CompiscriptParser(stream)
+    syntax = attach_syntax_listener(lexer, parser, reporter)
+    profiler = enable_profiling(parser) if args.profile_parser else None
+    checker = TypeChecker(reporter, record_types=args.tac is not None or args.mips is not None
+                          or args.vm or args.python is not None)
 
-    
-    tree = parser.program()
+    if args.stream:
+        # Modo streaming: no se construye el árbol completo del programa
+        with phase("stream-check"):
+            stats = stream_check(parser, stream, checker, syntax, args.syntax_mode)
+        checked = stats.checked > 0
+    else:
+        with phase("parsing"):
+            tree = parser.program()
+        with phase("checking"):
+            checked = run_checker(checker, tree, syntax, args.syntax_mode)
 
-    
-    reporter = ErrorReporter()
-    checker = TypeChecker(reporter)
+    if profiler is not None:
+        profile = ParseProfile.from_simulator(profiler)
+        print(profile.to_json() if args.profile_parser == "json" else profile.to_text())
 
-    
-    checker.visit(tree)
 
-    
-    if reporter.has_errors():
+    syntax_errors = [e for e in reporter if e.code == E_SYNTAX]
+    semantic_errors = [e for e in reporter if e.code != E_SYNTAX]
+    if syntax_errors:
+        print("\nErrores sintácticos encontrados:")
+        for e in syntax_errors:
+            print("   ", e)
+        if not checked:
+            print("\nAnálisis semántico omitido por errores sintácticos.")
+    if semantic_errors:
         print("\nErrores semánticos encontrados:")
-        for e in reporter:
+        for e in semantic_errors:
             print("   ", e)
-    else:
+    elif not reporter.has_errors():
         print("\nAnálisis semántico completado sin errores.")
 
-    
-    print_symbol_table(checker.scopes)
+
+    with phase("symbol-table"):
+        print_symbol_table(checker.scopes)
+
+    if (args.tac or args.mips is not None or args.vm) and not reporter.has_errors():
+        if args.stream:
+            print("\nLa generación de código necesita el árbol completo: no está disponible con --stream.")
+        else:
+            with phase("tac"):
+                tac = generate_tac(tree, checker)
+            if reporter.has_errors():
+                # literales que no caben en un operando TAC
+                print("\nErrores en la generación de código:")
+                for e in reporter:
+                    print("   ", e)
+            else:
+                if args.optimize >= 2:
+                    with phase("inline"):
+                        print(inline_calls(tac).to_text())
+                if args.optimize:
+                    with phase("optimize"):
+                        report = optimize_global(tac) if args.optimize >= 2 else optimize(tac)
+                    print(report.to_text())
+                if args.tac:
+                    emit_tac(tac, args)
+                if args.mips is not None:
+                    with phase("mips"):
+                        mips = generate_mips(tac, allocate=not args.no_regalloc)
+                    if args.optimize:
+                        with phase("peephole"):
+                            print("\n" + peephole(mips).to_text())
+                    emit_mips(mips, args)
+                if args.vm:
+                    with phase("vm"):
+                        run_vm(tac)
+
+    if args.python is not None and not reporter.has_errors():
+        if args.stream:
+            print("\nLa traducción a Python necesita el árbol completo: no está disponible con --stream.")
+        else:
+            with phase("python"):
+                source = generate_python(tree, checker)
+            emit_python(source, args)
+
+    if mem:
+        mem.stop()
+        print()
+        print(mem.to_json() if args.memory_report == "json" else mem.to_text())
+
+
+def emit_tac(tac, args):
+    if args.tac == "bin":
+        out = args.tac_out or args.archivo.rsplit(".", 1)[0] + ".tac"
+        with open(out, "wb") as f:
+            f.write(tac.to_bytes())
+        print(f"\nTAC binario escrito en {out} ({len(tac.code)} instrucciones)")
+    elif args.tac_out:
+        with open(args.tac_out, "w", encoding="utf-8") as f:
+            f.write(tac.to_text())
+        print(f"\nTAC escrito en {args.tac_out} ({len(tac.code)} instrucciones)")
+    else:
+        print("\nCódigo de tres direcciones:")
+        print(tac.to_text())
+
+
+def run_vm(tac):
+    bc = compile_bytecode(tac)
+    vm = StackVM(bc, echo=True)
+    print(f"\nSalida del programa (VM, {len(bc.code)} palabras de bytecode):")
+    try:
+        vm.run()
+    except TacRuntimeError as e:
+        print(f"Error en tiempo de ejecución: {e}")
+
+
+def emit_python(source, args):
+    if args.python:
+        with open(args.python, "w", encoding="utf-8") as f:
+            f.write(source)
+        print(f"\nPython escrito en {args.python}")
+    print("\nSalida del programa (Python):")
+    try:
+        run_python(source, echo=True)
+    except TacRuntimeError as e:
+        print(f"Error en tiempo de ejecución: {e}")
+
+
+def emit_mips(mips, args):
+    out = args.mips or args.archivo.rsplit(".", 1)[0] + ".s"
+    with open(out, "w", encoding="utf-8") as f:
+        f.write(mips.to_asm())
+    print("\n" + mips.report())
+    print(f"\nMIPS escrito en {out}")
+    if args.run:
+        sim = MipsSimulator(mips)
+        print("\nSalida del programa:")
+        error = None
+        try:
+            sim.run()
+        except SimulatorError as e:
+            error = e
+        for line in sim.lines():
+            print(line)
+        if error:
+            print(f"Error del simulador: {error}")
+        print(f"\ninstrucciones {sim.steps}, lw/lb {sim.loads}, sw/sb {sim.stores}, ciclos (estimados) {sim.cycles}")
 
 
 if __name__ == "__main__":
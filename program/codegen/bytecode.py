@@ -0,0 +1,382 @@
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
+
+from intermediate.tac import (
+    TacProgram,
+    MOV, ADD, SUB, MUL, DIV, MOD, CONCAT, EQ, NE, LT, LE, GT, GE, NEG, NOT,
+    LABEL, GOTO, IF_FALSE, IF_TRUE, PARAM, CALL, RET, PRINT,
+    NEWARR, ALOAD, ASTORE, LEN, NEW, GETF, SETF, TRY, ENDTRY, CATCH, TOSTR, STRCMP, NOP,
+    SWITCH, HASH, METHOD, DEST_OPS, READS,
+    K_TEMP, K_VAR, K_INT, K_STR, K_NAME, K_CONST, NONE, operand,
+)
+from intermediate.tac_gen import MAIN
+from codegen.regalloc import Liveness
+
+# Bytecode de una máquina de pila (ver codegen/vm.py), compilado desde el
+# TAC. Todo el programa es un solo array('i'): cada instrucción es su opcode
+# seguido de 0, 1 o 2 argumentos enteros. Los valores que no son índices
+# (enteros grandes, strings, null/true/false, nombres) van a la tabla de
+# constantes. Cada variable ya tiene su slot: parámetros primero, luego
+# locales y temporales de la función; las globales en un arreglo aparte y
+# las capturadas se leen del marco activo más reciente de su dueña.
+#
+# Cada instrucción TAC se traduce a una secuencia que deja la pila como la
+# encontró, salvo 'param' (apila el argumento) y 'call' (los consume); así
+# los 'param' de una llamada se acumulan en la pila hasta el 'call'.
+# Excepción: si un temporal lo lee solo la instrucción siguiente (y como su
+# primer operando), su valor se queda en la pila y se ahorran el STORE y el
+# LOAD; así 't1 = i < n; ifFalse t1' queda en LOAD, CONST, LT, JUMP_IF_FALSE.
+
+OPCODES = (
+    "LOAD", "STORE", "CONST", "LOAD_GLOBAL", "STORE_GLOBAL", "LOAD_OUTER", "STORE_OUTER",
+    "MOVE", "ADD", "SUB", "MUL", "DIV", "MOD", "CONCAT",
+    "EQ", "NE", "LT", "LE", "GT", "GE", "NEG", "NOT", "TOSTR", "STRCMP", "HASH",
+    "JUMP", "JUMP_IF_FALSE", "JUMP_IF_TRUE", "SWITCH",
+    "CALL", "CALL_VALUE", "RETURN", "RETURN_NONE", "POP",
+    "PRINT", "NEWARR", "ALOAD", "ASTORE", "LEN", "NEW", "GETF", "SETF", "METHOD",
+    "TRY", "ENDTRY", "CATCH",
+    "ADD_CONST",
+)
+(B_LOAD, B_STORE, B_CONST, B_LOAD_GLOBAL, B_STORE_GLOBAL, B_LOAD_OUTER, B_STORE_OUTER,
+ B_MOVE, B_ADD, B_SUB, B_MUL, B_DIV, B_MOD, B_CONCAT,
+ B_EQ, B_NE, B_LT, B_LE, B_GT, B_GE, B_NEG, B_NOT, B_TOSTR, B_STRCMP, B_HASH,
+ B_JUMP, B_JUMP_IF_FALSE, B_JUMP_IF_TRUE, B_SWITCH,
+ B_CALL, B_CALL_VALUE, B_RETURN, B_RETURN_NONE, B_POP,
+ B_PRINT, B_NEWARR, B_ALOAD, B_ASTORE, B_LEN, B_NEW, B_GETF, B_SETF, B_METHOD,
+ B_TRY, B_ENDTRY, B_CATCH,
+ B_ADD_CONST) = range(len(OPCODES))
+
+# argumentos que lleva cada opcode en el código
+ARGS = [0] * len(OPCODES)
+for _op in (B_LOAD, B_STORE, B_CONST, B_LOAD_GLOBAL, B_STORE_GLOBAL, B_HASH, B_JUMP,
+            B_JUMP_IF_FALSE, B_JUMP_IF_TRUE, B_CALL_VALUE, B_NEW, B_GETF, B_SETF, B_METHOD,
+            B_TRY):
+    ARGS[_op] = 1
+for _op in (B_LOAD_OUTER, B_STORE_OUTER, B_MOVE, B_SWITCH, B_CALL):
+    ARGS[_op] = 2
+ARGS[B_ADD_CONST] = 3          # slot destino, slot origen, constante: 'i = i + 1' sin la pila
+ARGS = tuple(ARGS)
+
+# operaciones binarias del TAC que pasan tal cual (los dos operandos en la pila)
+_BINARY = {ADD: B_ADD, SUB: B_SUB, MUL: B_MUL, DIV: B_DIV, MOD: B_MOD, CONCAT: B_CONCAT,
+           EQ: B_EQ, NE: B_NE, LT: B_LT, LE: B_LE, GT: B_GT, GE: B_GE, STRCMP: B_STRCMP,
+           ALOAD: B_ALOAD}
+_UNARY = {NEG: B_NEG, NOT: B_NOT, TOSTR: B_TOSTR, NEWARR: B_NEWARR, LEN: B_LEN}
+# operando (0 = d, 1 = a) que cada instrucción apila primero
+_FIRST = {op: 1 for op in (MOV, NEG, NOT, TOSTR, NEWARR, LEN, HASH, IF_FALSE, IF_TRUE, SWITCH,
+                           PARAM, RET, PRINT, GETF, METHOD, *_BINARY)}
+_FIRST[ASTORE] = _FIRST[SETF] = 0
+
+
+@dataclass
+class BytecodeFunction:
+    name: str
+    entry: int             # posición de la primera instrucción en el código
+    params: int            # los argumentos llegan a los slots 0..params-1
+    slots: int             # parámetros + locales + temporales
+
+
+@dataclass
+class BytecodeProgram:
+    code: array = field(default_factory=lambda: array("i"))
+    consts: List[object] = field(default_factory=list)
+    functions: List[BytecodeFunction] = field(default_factory=list)
+    tables: List[List[int]] = field(default_factory=list)      # switch: [por defecto, pc(lo), ...]
+    vtables: Dict[str, List[str]] = field(default_factory=dict)
+    globals: int = 0
+    main: int = 0          # índice de __main__ en 'functions'
+
+    def disassemble(self) -> str:
+        starts = {f.entry: f.name for f in self.functions}
+        lines = []
+        pc, code = 0, self.code
+        while pc < len(code):
+            if pc in starts:
+                lines.append(f"{starts[pc]}:")
+            op = code[pc]
+            args = [code[pc + 1 + k] for k in range(ARGS[op])]
+            shown = [repr(self.consts[args[0]])] if op == B_CONST else [str(x) for x in args]
+            lines.append(f"  {pc:>5}  {OPCODES[op]:<14}{', '.join(shown)}")
+            pc += 1 + ARGS[op]
+        return "\n".join(lines)
+
+
+class BytecodeCompiler:
+    """
+    Traduce cada función del TAC a bytecode de pila. Los saltos se emiten
+    con la etiqueta TAC y se resuelven al final, cuando se conoce la
+    posición de cada una.
+    """
+
+    def __init__(self, prog: TacProgram):
+        self.prog = prog
+        self.out = BytecodeProgram()
+        self.code = self.out.code
+        self._consts: Dict[tuple, int] = {}
+        self._globals: Dict[int, int] = {}
+        self._slots: List[Dict[int, int]] = [{} for _ in prog.functions]
+        self._funcs = {f.name: i for i, f in enumerate(prog.functions)}
+        self._labels: Dict[int, int] = {}
+        self._fixups: List[int] = []       # posiciones con una etiqueta TAC por resolver
+        self._tables: Set[int] = set()     # tablas de salto que usa algún 'switch' emitido
+        self._keep = False                 # el resultado de esta instrucción queda en la pila
+        self._held = NONE                  # temporal que ya está en el tope de la pila
+
+    def compile(self) -> BytecodeProgram:
+        prog = self.prog
+        self._temp_base: List[int] = []
+        for fi, f in enumerate(prog.functions):
+            own = self._slots[fi]
+            for v in f.params + f.locals:
+                own[v] = len(own)
+            self._temp_base.append(len(own))
+        for fi, f in enumerate(prog.functions):
+            self.fi = fi
+            entry = len(self.code)
+            last = NOP
+            kept = self.stack_temps(fi)
+            for i in range(f.start, f.end):
+                self._keep = i in kept
+                self.instr(*prog.code[i])
+                self._held = prog.code.d[i] if self._keep else NONE
+                if prog.code.op[i] != NOP:
+                    last = prog.code.op[i]
+            if last != RET:
+                self.emit(B_RETURN_NONE)
+            self.out.functions.append(BytecodeFunction(f.name, entry, len(f.params), 0))
+        for fi, f in enumerate(prog.functions):
+            self.out.functions[fi].slots = len(self._slots[fi]) + f.temps
+        for pos in self._fixups:
+            self.code[pos] = self._labels[self.code[pos]]
+        # el optimizador puede plegar o borrar un 'switch' y dejar su tabla
+        # apuntando a etiquetas que ya no existen: solo se resuelven las usadas
+        self.out.tables = [[self._labels[x >> 3] for x in t] if ti in self._tables else []
+                           for ti, t in enumerate(prog.tables)]
+        self.out.vtables = {c.name: list(c.methods) for c in prog.classes}
+        self.out.globals = len(self._globals)
+        self.out.main = self._funcs[MAIN]
+        return self.out
+
+    def stack_temps(self, fi: int) -> Set[int]:
+        """
+        Posiciones cuyo resultado (un temporal) lee solo la instrucción
+        siguiente del mismo bloque, como el primer operando que apila, y que
+        queda muerto después: ese valor no necesita pasar por su slot.
+        """
+        prog = self.prog
+        f = prog.functions[fi]
+        code = prog.code
+        ops, ds, arrays = code.op, code.d, (code.d, code.a, code.b)
+        live = Liveness(prog, fi, [operand(K_TEMP, t) for t in range(f.temps)])
+        if live.live is None:
+            return set()
+        cfg = live.cfg
+        out: Set[int] = set()
+        for blk in range(len(cfg)):
+            r = cfg.item_range(blk)
+            items = cfg.items[r.start:r.stop] if r else []
+            for k in range(len(items) - 1):
+                i, j = items[k], items[k + 1]
+                t, op, nxt = ds[i], ops[i], ops[j]
+                if op not in DEST_OPS or t & 7 != K_TEMP or nxt not in _FIRST:
+                    continue
+                if op == ADD and code.b[i] & 7 == K_INT and self._local(code.a[i]) is not None:
+                    continue                       # ya es un ADD_CONST
+                if arrays[_FIRST[nxt]][j] != t or [arrays[x][j] for x in READS[nxt]].count(t) != 1:
+                    continue
+                if self._dead_after(items, k + 1, t, live.live.out[blk], live):
+                    out.add(i)
+        return out
+
+    def _dead_after(self, items: List[int], k: int, t: int, live_out: int, live: Liveness) -> bool:
+        code = self.prog.code
+        if code.op[items[k]] in DEST_OPS and code.d[items[k]] == t:
+            return True
+        for i in items[k + 1:]:
+            op = code.op[i]
+            if any((code.d, code.a, code.b)[x][i] == t for x in READS[op]):
+                return False
+            if op in DEST_OPS and code.d[i] == t:
+                return True
+        return not (live_out >> live.bit[t]) & 1
+
+    # ---------------- Emisión ----------------
+
+    def emit(self, op: int, *args: int) -> None:
+        self.code.append(op)
+        self.code.extend(args)
+
+    def jump(self, op: int, label: int) -> None:
+        self.emit(op, label >> 3)
+        self._fixups.append(len(self.code) - 1)
+
+    def const(self, value) -> int:
+        key = (type(value), value)
+        k = self._consts.get(key)
+        if k is None:
+            k = self._consts[key] = len(self.out.consts)
+            self.out.consts.append(value)
+        return k
+
+    def slot(self, x: int, fi: int) -> int:
+        """Slot de un temporal o de una variable propia de la función 'fi'."""
+        if x & 7 == K_TEMP:
+            return self._temp_base[fi] + (x >> 3)
+        own = self._slots[fi]
+        if x not in own:
+            # no está en params/locals (no debería pasar): después de los temporales
+            own[x] = len(own) + self.prog.functions[fi].temps
+        return own[x]
+
+    def _where(self, x: int):
+        """('local', slot) | ('global', i) | ('outer', función, slot) de un temporal o variable."""
+        if x & 7 == K_TEMP:
+            return ("local", self.slot(x, self.fi))
+        owner = self.prog.vars[x >> 3].func
+        if owner == -1:
+            return ("global", self._globals.setdefault(x, len(self._globals)))
+        if owner == self.fi:
+            return ("local", self.slot(x, owner))
+        return ("outer", owner, self.slot(x, owner))
+
+    def push(self, x: int) -> None:
+        if x == self._held:
+            self._held = NONE
+            return
+        k, v = x & 7, x >> 3
+        if k in (K_TEMP, K_VAR):
+            where = self._where(x)
+            if where[0] == "local":
+                self.emit(B_LOAD, where[1])
+            elif where[0] == "global":
+                self.emit(B_LOAD_GLOBAL, where[1])
+            else:
+                self.emit(B_LOAD_OUTER, where[1], where[2])
+        elif k == K_INT:
+            self.emit(B_CONST, self.const(v))
+        elif k == K_STR:
+            self.emit(B_CONST, self.const(self.prog.strings[v]))
+        elif k == K_CONST:
+            self.emit(B_CONST, self.const((None, False, True)[v]))
+        elif k == K_NAME:
+            self.emit(B_CONST, self.const(self.prog.names[v]))
+        else:
+            self.emit(B_CONST, self.const(None))
+
+    def store(self, x: int) -> None:
+        if self._keep:
+            return
+        if x == NONE:
+            self.emit(B_POP)
+            return
+        where = self._where(x)
+        if where[0] == "local":
+            self.emit(B_STORE, where[1])
+        elif where[0] == "global":
+            self.emit(B_STORE_GLOBAL, where[1])
+        else:
+            self.emit(B_STORE_OUTER, where[1], where[2])
+
+    def _local(self, x: int):
+        """Slot de 'x' si es un temporal o variable propia (None si vive en otro lado)."""
+        if x & 7 not in (K_TEMP, K_VAR):
+            return None
+        where = self._where(x)
+        return where[1] if where[0] == "local" else None
+
+    # ---------------- Instrucciones ----------------
+
+    def instr(self, op: int, d: int, a: int, b: int) -> None:
+        if op == NOP:
+            return
+        if op == LABEL:
+            self._labels[a >> 3] = len(self.code)
+            return
+        if op == MOV:
+            src, dst = self._local(a), self._local(d)
+            if src is not None and dst is not None and not self._keep and a != self._held:
+                self.emit(B_MOVE, dst, src)   # la copia más común, sin pasar por la pila
+                return
+            self.push(a)
+            self.store(d)
+        elif op in _BINARY:
+            src, dst = self._local(a), self._local(d)
+            if op == ADD and b & 7 == K_INT and src is not None and dst is not None \
+                    and a != self._held:
+                self.emit(B_ADD_CONST, dst, src, self.const(b >> 3))
+                return
+            self.push(a)
+            self.push(b)
+            self.emit(_BINARY[op])
+            self.store(d)
+        elif op in _UNARY:
+            self.push(a)
+            self.emit(_UNARY[op])
+            self.store(d)
+        elif op == HASH:
+            self.push(a)
+            self.emit(B_HASH, b >> 3)
+            self.store(d)
+        elif op == GOTO:
+            self.jump(B_JUMP, a)
+        elif op in (IF_FALSE, IF_TRUE):
+            self.push(a)
+            self.jump(B_JUMP_IF_FALSE if op == IF_FALSE else B_JUMP_IF_TRUE, b)
+        elif op == SWITCH:
+            self.push(a)
+            self._tables.add(b >> 3)
+            self.emit(B_SWITCH, self.const(d >> 3), b >> 3)
+        elif op == PARAM:
+            self.push(a)
+        elif op == CALL:
+            n = b >> 3
+            callee = self._funcs.get(self.prog.names[a >> 3]) if a & 7 == K_NAME else None
+            if callee is not None:
+                self.emit(B_CALL, callee, n)
+            else:
+                self.push(a)
+                self.emit(B_CALL_VALUE, n)
+            self.store(d)
+        elif op == RET:
+            if a == NONE:
+                self.emit(B_RETURN_NONE)
+            else:
+                self.push(a)
+                self.emit(B_RETURN)
+        elif op == PRINT:
+            self.push(a)
+            self.emit(B_PRINT)
+        elif op == ASTORE:
+            self.push(d)
+            self.push(a)
+            self.push(b)
+            self.emit(B_ASTORE)
+        elif op == NEW:
+            self.emit(B_NEW, self.const(self.prog.names[a >> 3]))
+            self.store(d)
+        elif op == GETF:
+            self.push(a)
+            self.emit(B_GETF, self.prog.field_offset(b))
+            self.store(d)
+        elif op == SETF:
+            self.push(d)
+            self.push(b)
+            self.emit(B_SETF, self.prog.field_offset(a))
+        elif op == METHOD:
+            self.push(a)
+            self.emit(B_METHOD, b >> 3)
+            self.store(d)
+        elif op == TRY:
+            self.jump(B_TRY, a)
+        elif op == ENDTRY:
+            self.emit(B_ENDTRY)
+        elif op == CATCH:
+            self.emit(B_CATCH)
+            self.store(d)
+
+
+def compile_bytecode(prog: TacProgram) -> BytecodeProgram:
+    """Bytecode de pila del programa TAC (optimizado o no)."""
+    return BytecodeCompiler(prog).compile()
@@ -0,0 +1,984 @@
+from __future__ import annotations
+import copy
+import dataclasses
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from intermediate.tac import (
+    TacProgram, TacBuffer,
+    MOV, ADD, SUB, MUL, DIV, MOD, CONCAT, EQ, NE, LT, LE, GT, GE, NEG, NOT,
+    LABEL, GOTO, IF_FALSE, IF_TRUE, PARAM, CALL, RET, PRINT,
+    NEWARR, ALOAD, ASTORE, LEN, NEW, GETF, SETF, TRY, ENDTRY, CATCH, TOSTR, STRCMP, NOP,
+    SWITCH, HASH, METHOD,
+    K_TEMP, K_VAR, K_INT, K_STR, K_NAME, K_CONST, NONE, C_TRUE,
+    TAG_STRING, TAG_INT,
+)
+from intermediate.ssa import has_try
+from intermediate.escape import heap_environments
+from intermediate.tac_gen import MAIN
+from semantic.frames import WORD, SAVED_REGS, FRAME_ALIGN
+from codegen.regalloc import Interval, LinearScan, Liveness, split_webs, tracked_values, S_REGS
+from codegen import runtime
+
+# Una instrucción MIPS es una tupla (op, *operandos) con los registros como
+# strings ('$t0'), inmediatos como int y etiquetas como string. Los accesos a
+# memoria son (op, reg, offset, base); las etiquetas son ('label', nombre).
+# Las pseudoinstrucciones li, la y move se dejan como tales.
+
+MEMORY_OPS = frozenset(("lw", "sw", "lb", "lbu", "sb"))
+LOADS = frozenset(("lw", "lb", "lbu"))
+STORES = frozenset(("sw", "sb"))
+
+_S1, _S2, _S3 = "$t8", "$t9", "$v1"     # registros auxiliares del generador
+_ARG_REGS = ("$a0", "$a1", "$a2", "$a3")  # argumentos de una llamada de cola
+# instrucciones TAC que terminan en un 'jal' (a otra función o al runtime)
+_CALLING_OPS = frozenset((CALL, CONCAT, STRCMP, TOSTR, PRINT, TRY, ENDTRY, CATCH, HASH))
+
+
+def format_ins(ins: tuple) -> str:
+    op = ins[0]
+    if op == "label":
+        return f"{ins[1]}:"
+    if op in MEMORY_OPS:
+        return f"    {op} {ins[1]}, {ins[2]}({ins[3]})"
+    if len(ins) == 1:
+        return f"    {op}"
+    return f"    {op} " + ", ".join(str(x) for x in ins[1:])
+
+
+_MEM_RE = re.compile(r"^(-?\d+)\((\$\w+)\)$")
+
+
+def _operand(tok: str):
+    if tok.startswith("$"):
+        return tok
+    try:
+        return int(tok, 0)
+    except ValueError:
+        return tok
+
+
+def parse_asm(text: str) -> List[tuple]:
+    """Instrucciones de un texto en ensamblador (solo sección de código)."""
+    out = []
+    for line in text.splitlines():
+        line = line.split("#", 1)[0].strip()
+        while line and ":" in line.split()[0]:
+            label, _, line = line.partition(":")
+            out.append(("label", label.strip()))
+            line = line.strip()
+        if not line or line.startswith("."):
+            continue
+        op, _, rest = line.partition(" ")
+        args = [a.strip() for a in rest.split(",")] if rest.strip() else []
+        if op in MEMORY_OPS:
+            m = _MEM_RE.match(args[1])
+            out.append((op, args[0], int(m.group(1)), m.group(2)))
+        else:
+            out.append((op, *(_operand(a) for a in args)))
+    return out
+
+
+def _private_copy(prog: TacProgram) -> TacProgram:
+    """Copia con su propio código y funciones: la separación en webs reescribe operandos."""
+    c = copy.copy(prog)
+    c.code = TacBuffer()
+    for name in ("op", "d", "a", "b"):
+        getattr(c.code, name).extend(getattr(prog.code, name))
+    c.functions = [dataclasses.replace(f, params=list(f.params), locals=list(f.locals),
+                                       captures=list(f.captures)) for f in prog.functions]
+    return c
+
+
+def _var_offsets(items: List[Tuple[int, Optional[int]]], start: int = 0) -> Dict[int, int]:
+    """
+    Offset de cada (variable, slot de semantic.frames). Las que no tienen
+    slot (sin símbolo, como 'this') van en palabras nuevas después de la
+    última usada.
+    """
+    out = {v: slot for v, slot in items if slot is not None}
+    top = max(out.values(), default=start)
+    for v, slot in items:
+        if slot is None:
+            top += WORD
+            out[v] = top
+    return out
+
+
+def _captured_slot(info) -> Optional[int]:
+    return info.slot if info.captured else None
+
+
+def _env_size(env: Dict[int, int]) -> int:
+    """Bytes del registro de entorno: el enlace al padre más hasta la última variable."""
+    return max(env.values(), default=0) + WORD
+
+
+def _asciiz(s: str) -> str:
+    return '"' + s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+
+
+def _small(v: int) -> bool:
+    return -32768 <= v <= 32767
+
+
+def func_label(name: str) -> str:
+    return "F_" + name.replace(".", "__")
+
+
+@dataclass
+class FunctionStats:
+    name: str
+    instructions: int = 0
+    loads: int = 0
+    stores: int = 0
+    values: int = 0          # temporales y variables candidatas a registro
+    in_regs: int = 0
+    spilled: int = 0
+    saved_s: int = 0         # registros $s que guarda el prólogo
+    frame: int = 0
+    tail_calls: int = 0      # llamadas en posición de cola convertidas en saltos
+    frameless: bool = False  # hoja sin marco: ni $ra ni $fp se guardan
+    stack_env: bool = False  # su registro de entorno va en el marco (ninguna clausura escapa)
+
+
+def _count(stats: FunctionStats, ins: tuple) -> None:
+    stats.instructions += 1
+    if ins[0] in LOADS:
+        stats.loads += 1
+    elif ins[0] in STORES:
+        stats.stores += 1
+
+
+@dataclass
+class MipsProgram:
+    data: List[tuple] = field(default_factory=list)     # (etiqueta, directiva, valor)
+    text: List[tuple] = field(default_factory=list)
+    functions: List[FunctionStats] = field(default_factory=list)
+    user_end: int = 0        # en text[user_end:] empieza el runtime
+
+    def recount(self) -> None:
+        """Recalcula instrucciones y lw/sw por función después de reescribir 'text'."""
+        starts = {func_label(s.name): s for s in self.functions}
+        cur = None
+        for s in self.functions:
+            s.instructions = s.loads = s.stores = 0
+        for ins in self.text[:self.user_end]:
+            if ins[0] == "label":
+                cur = starts.get(ins[1], cur)
+            elif cur is not None:
+                _count(cur, ins)
+
+    def to_asm(self) -> str:
+        lines = [".data"]
+        for label, directive, value in self.data:
+            shown = _asciiz(value) if directive == ".asciiz" else value
+            lines.append(f"{label}: {directive} {shown}")
+        lines += ["", ".text", ".globl main"]
+        lines += [format_ins(ins) for ins in self.text]
+        return "\n".join(lines) + "\n"
+
+    def totals(self) -> FunctionStats:
+        t = FunctionStats("total")
+        for s in self.functions:
+            for k in ("instructions", "loads", "stores", "values", "in_regs", "spilled", "saved_s",
+                      "tail_calls"):
+                setattr(t, k, getattr(t, k) + getattr(s, k))
+        return t
+
+    def report(self) -> str:
+        rows = [f"{'función':<24}{'instr':>7}{'lw':>6}{'sw':>6}{'en reg':>8}{'spill':>7}{'$s':>4}"
+                f"{'frame':>7}{'cola':>6}"]
+        for s in self.functions + [self.totals()]:
+            frame = "hoja" if s.frameless else s.frame
+            rows.append(f"{s.name:<24}{s.instructions:>7}{s.loads:>6}{s.stores:>6}"
+                        f"{s.in_regs:>8}{s.spilled:>7}{s.saved_s:>4}{frame:>7}{s.tail_calls:>6}")
+        return "\n".join(rows)
+
+
+class _FrameInfo:
+    """Dónde vive cada valor de la función que se está generando."""
+
+    def __init__(self) -> None:
+        self.reg: Dict[int, str] = {}       # operando -> registro
+        self.slot: Dict[int, int] = {}      # operando -> offset respecto de $fp
+        self.link = None                    # offset del enlace estático
+        self.env = None                     # offset del puntero al entorno propio (en el heap)
+        self.env_frame = None               # offset del entorno propio si vive en el marco
+        self.saved: List[Tuple[str, int]] = []
+        self.size = 0
+        self.base = "$fp"                   # base de los slots ($sp en una hoja sin marco)
+
+
+class MipsGenerator:
+    """
+    Traduce un TacProgram a MIPS. Con allocate=True los temporales y las
+    variables locales no capturadas van a registros por linear scan (en las
+    funciones con try/catch lo que lee el manejador se queda en memoria y se
+    guardan todos los $s: un error puede llegar desde una llamada que los
+    dejó modificados); con allocate=False todo valor vive en su slot del marco, que es la
+    referencia para medir cuántos lw/sw ahorra la asignación.
+
+    Marco (como semantic.frames): argumentos en $fp+4k, $ra en $fp-4, $fp del
+    llamador en $fp-8, luego enlace estático, puntero al entorno, los locales,
+    los $s guardados y los slots de spill de temporales. Las posiciones de
+    las variables son las de semantic.frames (TacVar.slot): los locales de
+    bloques disjuntos comparten slot, las globales están en __globals ($gp) y
+    las capturadas en el registro de entorno de su dueña
+    ([enlace al entorno padre, var1, var2, ...]). Ese registro va en el heap
+    solo si alguna función anidada escapa (intermediate/escape.py); si no,
+    ocupa palabras del propio marco y la dueña accede a sus variables
+    capturadas respecto de $fp, como a cualquier slot.
+    """
+
+    def __init__(self, prog: TacProgram, allocate: bool = True, tail_calls: bool = True,
+                 leaves: bool = True, stack_envs: bool = True):
+        self.prog = prog = _private_copy(prog) if allocate else prog
+        self.allocate = allocate
+        self.tail_calls = tail_calls
+        self.leaves = leaves and allocate
+        self.out: List[tuple] = []
+        self.result = MipsProgram()
+        self._funcs = {f.name: i for i, f in enumerate(prog.functions)}
+        self._nested = {f.parent for f in prog.functions if f.parent >= 0}
+        self._heap_envs = heap_environments(prog) if stack_envs else set(range(len(prog.functions)))
+        captured = {v for g in prog.functions for v in g.captures}
+        self._globals = _var_offsets([(i, v.slot) for i, v in enumerate(prog.vars) if v.kind == "global"],
+                                     start=-WORD)
+        self._env_vars: Dict[int, Dict[int, int]] = {}      # función -> var -> offset
+        for fi, f in enumerate(prog.functions):
+            own = [v for v in f.params + f.locals if v in captured]
+            self._env_vars[fi] = _var_offsets([(v, _captured_slot(prog.vars[v >> 3])) for v in own])
+        self._classes: Dict[str, int] = {}   # clases instanciadas -> nº de su vtable
+        self._tables: List[int] = []         # tablas de salto de 'switch' emitidas
+        self._stubs = 0
+
+    # ---------------- Entrada ----------------
+
+    def generate(self) -> MipsProgram:
+        if self.allocate:
+            for fi in range(len(self.prog.functions)):
+                if not has_try(self.prog, fi):
+                    split_webs(self.prog, fi)
+
+        self.out = self.result.text
+        self.emit("label", "main")
+        self.emit("la", "$gp", "__globals")
+        self.emit("jal", func_label(MAIN))
+        self.emit("li", "$v0", 10)
+        self.emit("syscall")
+        for fi in range(len(self.prog.functions)):
+            self.function(fi)
+        self.result.user_end = len(self.out)
+        self.out.extend(parse_asm(runtime.TEXT))
+
+        data = self.result.data
+        data.append(("__globals", ".space", max(self._globals.values(), default=0) + WORD))
+        data.append(("__htop", ".word", 0))
+        data.append(("__hstack", ".space", runtime.HANDLER_SLOTS * runtime.HANDLER_SIZE))
+        for i, s in enumerate(self.prog.strings):
+            data.append((f"S{i}", ".asciiz", s))
+        for name, n in self._classes.items():
+            # vtable: nombre para imprimir el objeto y luego los métodos por slot
+            cls = self.prog.class_of(name)
+            methods = [func_label(m) for m in cls.methods] if cls is not None else []
+            data.append((f"V{n}", ".word", ", ".join([f"C{n}"] + methods)))
+            data.append((f"C{n}", ".asciiz", f"<{name}>"))
+        for t in self._tables:
+            data.append((f"J{t}", ".word", ", ".join(f"L{x >> 3}" for x in self.prog.tables[t][1:])))
+        data.extend((label, ".asciiz", s) for label, s in runtime.DATA)
+        return self.result
+
+    def emit(self, *ins) -> None:
+        self.out.append(ins)
+
+    # ---------------- Funciones ----------------
+
+    def _layout(self, fi: int) -> _FrameInfo:
+        f = self.prog.functions[fi]
+        fr = _FrameInfo()
+        code = self.prog.code
+        self.body = [i for i in range(f.start, f.end) if code.op[i] != NOP]
+        self.tail = self._find_tail_calls(fi, self.body)
+        # la recursión de cola es un salto: no es una llamada para la asignación ni para ser hoja
+        self_tail = {i for i, callee in self.tail.items() if callee == fi}
+        values = tracked_values(self.prog, fi)
+        stats = FunctionStats(f.name, values=len(values))
+        regs = {}
+        save_all = has_try(self.prog, fi)
+        if self.allocate:
+            live = Liveness(self.prog, fi, values)
+            intervals = live.intervals(ignore=self_tail)
+            spans = {iv.value: iv for iv in intervals}
+            # los que quedaron sin referencias (webs renombradas) no necesitan slot
+            values = [iv.value for iv in intervals]
+            stats.values = len(values)
+            if save_all:
+                # lo que el manejador lee queda en memoria; el resto puede ir en registros
+                code = self.prog.code
+                handlers = {code.a[i] for i in range(f.start, f.end) if code.op[i] == TRY}
+                starts = {i for i in range(f.start, f.end)
+                          if code.op[i] == LABEL and code.a[i] in handlers}
+                forced = live.live_at(starts)
+                intervals = [iv for iv in intervals if iv.value not in forced]
+            scan = LinearScan()
+            scan.allocate(intervals)
+            regs = {iv.value: iv.reg for iv in intervals if iv.reg is not None}
+            # con try se guardan todos los $s: al saltar al manejador, las
+            # funciones desapiladas no restauraron los suyos
+            used_s = list(S_REGS) if save_all else sorted(scan.used_s)
+        else:
+            used_s = []
+            spans = {iv.value: iv for iv in Liveness(self.prog, fi, values).intervals()}
+
+        off = SAVED_REGS
+        if f.parent >= 0:
+            off += WORD
+            fr.link = -off
+        if self._env_vars[fi] or fi in self._nested:
+            if fi in self._heap_envs:
+                off += WORD
+                fr.env = -off
+            else:
+                off += _env_size(self._env_vars[fi])
+                fr.env_frame = -off
+                stats.stack_env = True
+        arg_offsets = {p: WORD * k for k, p in enumerate(f.params)}
+        spilled = [v for v in values if v not in regs and v not in arg_offsets]
+        # con try los saltos al manejador no están en los intervalos: sin compartir
+        placed = {} if save_all else self._frame_slots(spilled, spans)
+        area = off
+        off += max(placed.values(), default=0)
+        for r in used_s:
+            off += WORD
+            fr.saved.append((r, -off))
+        for v in values:
+            if v in regs:
+                fr.reg[v] = regs[v]
+            elif v in arg_offsets:
+                fr.slot[v] = arg_offsets[v]          # un parámetro derramado se queda donde llegó
+            elif v in placed:
+                fr.slot[v] = -(area + placed[v])
+            else:
+                off += WORD
+                fr.slot[v] = -off
+        fr.size = (off + FRAME_ALIGN - 1) // FRAME_ALIGN * FRAME_ALIGN
+        if self.leaves and off == SAVED_REGS and self._is_leaf(fi, self_tail):
+            # nada que guardar ni derramar: $sp no se mueve y los argumentos
+            # se leen respecto de él
+            fr.size = 0
+            fr.base = "$sp"
+            stats.frameless = True
+        stats.in_regs = len(fr.reg)
+        stats.spilled = len(values) - len(fr.reg)
+        stats.saved_s = len(fr.saved)
+        stats.frame = fr.size
+        self.result.functions.append(stats)
+        return fr
+
+    def _frame_slots(self, spilled: List[int], spans: Dict[int, Interval]) -> Dict[int, int]:
+        """
+        Slot (dentro de la zona de locales) de cada local derramado, el que
+        le dio semantic.frames. Dos locales de bloques disjuntos comparten
+        slot solo si además sus intervalos no se cruzan: una optimización
+        (la propagación de copias) puede usar una variable fuera de su
+        bloque. Las que no entran van a un slot propio.
+        """
+        placed: Dict[int, int] = {}
+        users: Dict[int, List[Interval]] = {}
+        for v in spilled:
+            if v & 7 != K_VAR or v not in spans:
+                continue
+            info = self.prog.vars[v >> 3]
+            if info.kind != "local" or info.captured or info.slot is None:
+                continue
+            iv, others = spans[v], users.setdefault(info.slot, [])
+            if any(iv.start <= o.end and o.start <= iv.end for o in others):
+                continue
+            others.append(iv)
+            placed[v] = info.slot
+        return placed
+
+    def _is_leaf(self, fi: int, jumps: Set[int]) -> bool:
+        """
+        Sin llamadas (tampoco al runtime, que pisaría $ra) salvo las de
+        'jumps' (recursión de cola), sin entorno ni enlace estático.
+        """
+        f = self.prog.functions[fi]
+        if f.name == MAIN or f.parent >= 0 or self._env_vars[fi] or fi in self._nested:
+            return False
+        code = self.prog.code
+        for i in range(f.start, f.end):
+            op = code.op[i]
+            if i in jumps:
+                continue
+            if op in _CALLING_OPS or (op == NEWARR and not (code.a[i] & 7 == K_INT and code.a[i] >= 0)):
+                return False
+        return True
+
+    def _find_tail_calls(self, fi: int, body: List[int]) -> Dict[int, int]:
+        """
+        Posición de cada 'call' en posición de cola (seguido de 'return' de
+        su resultado) -> función llamada. El llamado no puede recibir más
+        argumentos que los que llegaron a esta función: reutiliza su área.
+        """
+        f = self.prog.functions[fi]
+        out: Dict[int, int] = {}
+        if not self.tail_calls or f.name == MAIN or has_try(self.prog, fi):
+            return out
+        code = self.prog.code
+        for i, j in zip(body, body[1:]):
+            if code.op[i] != CALL or code.op[j] != RET or code.a[j] != code.d[i]:
+                continue
+            target, n = code.a[i], code.b[i] >> 3
+            if target & 7 != K_NAME or n > len(_ARG_REGS) or n > len(f.params):
+                continue
+            callee = self._funcs.get(self.prog.names[target >> 3])
+            if callee is None:
+                continue
+            if self.prog.functions[callee].parent == fi and fi not in self._heap_envs:
+                continue                # su enlace estático apunta a este marco, que se desarma
+            out[i] = callee
+        return out
+
+    def function(self, fi: int) -> None:
+        prog = self.prog
+        f = prog.functions[fi]
+        self.fi, self.f = fi, f
+        self.fr = fr = self._layout(fi)
+        self.ret_label = "R_" + func_label(f.name)[2:]
+        self.loop_label = "T_" + func_label(f.name)[2:]
+        self.stubs: List[tuple] = []
+        self.pending: List[int] = []
+        start = len(self.out)
+        body = self.body
+        self_tail = fi in self.tail.values()
+        stats = self.result.functions[-1]
+        stats.tail_calls = len(self.tail)
+
+        self.emit("label", func_label(f.name))
+        if stats.frameless:
+            for k, p in enumerate(f.params):
+                if p in fr.reg:
+                    self.emit("lw", fr.reg[p], WORD * k, "$sp")
+            if self_tail:
+                self.emit("label", self.loop_label)
+            self._body(body)
+            if self.out[-1] != ("jr", "$ra"):
+                self.emit("jr", "$ra")
+            self._stubs_out()
+            self._count(stats, start)
+            return
+
+        self.emit("sw", "$ra", -4, "$sp")
+        self.emit("sw", "$fp", -8, "$sp")
+        self.emit("move", "$fp", "$sp")
+        self.emit("addiu", "$sp", "$sp", -fr.size)
+        if fr.link is not None:
+            self.emit("sw", _S3, fr.link, "$fp")
+        for r, off in fr.saved:
+            self.emit("sw", r, off, "$fp")
+        env = self._env_vars[fi]
+        has_env = fr.env is not None or fr.env_frame is not None
+        if self_tail and has_env:
+            self.emit("label", self.loop_label)      # la recursión de cola crea un entorno nuevo
+        if fr.env_frame is not None:
+            self.emit("sw", _S3 if fr.link is not None else "$zero", fr.env_frame, "$fp")
+            for k, p in enumerate(f.params):
+                if p in env:
+                    self.emit("lw", _S1, WORD * k, "$fp")
+                    self.emit("sw", _S1, fr.env_frame + env[p], "$fp")
+        elif fr.env is not None:
+            self.emit("li", "$a0", _env_size(env))
+            self.emit("li", "$v0", 9)
+            self.emit("syscall")
+            self.emit("sw", "$v0", fr.env, "$fp")
+            self.emit("sw", _S3 if fr.link is not None else "$zero", 0, "$v0")
+            for k, p in enumerate(f.params):
+                if p in env:
+                    self.emit("lw", _S1, WORD * k, "$fp")
+                    self.emit("sw", _S1, env[p], "$v0")
+        for k, p in enumerate(f.params):
+            if p in fr.reg:
+                self.emit("lw", fr.reg[p], WORD * k, "$fp")
+        if self_tail and not has_env:
+            self.emit("label", self.loop_label)
+
+        self._body(body)
+        self.emit("label", self.ret_label)
+        self._epilogue()
+        self.emit("jr", "$ra")
+        self._stubs_out()
+        self._count(stats, start)
+
+    def _body(self, body: List[int]) -> None:
+        code = self.prog.code
+        skip = False
+        for n, i in enumerate(body):
+            if skip:
+                skip = False                        # el 'return' de una llamada de cola
+                continue
+            self.is_last = n == len(body) - 1
+            if i in self.tail:
+                self.tail_call(code.a[i], code.b[i] >> 3, self.tail[i])
+                skip = True
+            else:
+                self.instr(*code[i])
+
+    def _epilogue(self) -> None:
+        """Restaura $s, $ra, $sp y $fp (sin el 'jr')."""
+        for r, off in self.fr.saved:
+            self.emit("lw", r, off, "$fp")
+        self.emit("lw", "$ra", -4, "$fp")
+        self.emit("move", "$sp", "$fp")
+        self.emit("lw", "$fp", -8, "$sp")
+
+    def _stubs_out(self) -> None:
+        for label, idx in self.stubs:
+            self.emit("label", label)
+            if isinstance(idx, int):
+                self.emit("li", "$a1", idx)
+            else:
+                self.emit("move", "$a1", idx)
+            self.emit("j", "__err_index")
+
+    def _count(self, stats: FunctionStats, start: int) -> None:
+        for ins in self.out[start:]:
+            if ins[0] != "label":
+                _count(stats, ins)
+
+    # ---------------- Operandos ----------------
+
+    def _env_base(self, owner: int, reg: str) -> None:
+        """Deja en 'reg' el registro de entorno de la función 'owner' (la actual o una que la contiene)."""
+        fi = self.fi
+        if owner == fi:
+            if self.fr.env_frame is not None:
+                self.emit("addiu", reg, "$fp", self.fr.env_frame)
+            else:
+                self.emit("lw", reg, self.fr.env, "$fp")
+            return
+        self.emit("lw", reg, self.fr.link, "$fp")
+        cur = self.prog.functions[fi].parent
+        while cur != owner and cur >= 0:
+            self.emit("lw", reg, 0, reg)
+            cur = self.prog.functions[cur].parent
+
+    def _memory(self, x: int, reg: str) -> Optional[Tuple[int, str]]:
+        """(offset, base) de un operando que vive en memoria; puede usar 'reg' para la base."""
+        if x in self.fr.slot:
+            return self.fr.slot[x], self.fr.base
+        v = x >> 3
+        if v in self._globals:
+            return self._globals[v], "$gp"
+        owner = self.prog.vars[v].func
+        off = self._env_vars.get(owner, {}).get(x)
+        if off is None:
+            return None
+        if owner == self.fi and self.fr.env_frame is not None:
+            return self.fr.env_frame + off, "$fp"
+        self._env_base(owner, reg)
+        return off, reg
+
+    def load(self, x: int, scratch: str) -> str:
+        """Registro con el valor de 'x' (el asignado, $zero o 'scratch' después de cargarlo)."""
+        k, v = x & 7, x >> 3
+        if k in (K_TEMP, K_VAR):
+            r = self.fr.reg.get(x)
+            if r is not None:
+                return r
+            mem = self._memory(x, scratch)
+            if mem is None:
+                return "$zero"
+            self.emit("lw", scratch, mem[0], mem[1])
+            return scratch
+        if k == K_INT:
+            if v == 0:
+                return "$zero"
+            self.emit("li", scratch, v)
+            return scratch
+        if k == K_CONST:
+            if v != C_TRUE:
+                return "$zero"
+            self.emit("li", scratch, 1)
+            return scratch
+        if k == K_STR:
+            self.emit("la", scratch, f"S{v}")
+            return scratch
+        if k == K_NAME:
+            self.emit("la", scratch, func_label(self.prog.names[v]))
+            return scratch
+        return "$zero"
+
+    def load_into(self, x: int, reg: str) -> None:
+        r = self.load(x, reg)
+        if r != reg:
+            self.emit("move", reg, r)
+
+    def target(self, d: int) -> str:
+        return self.fr.reg.get(d, _S1)
+
+    def store(self, d: int, reg: str) -> None:
+        """Termina de escribir 'd' cuyo valor quedó en 'reg'."""
+        r = self.fr.reg.get(d)
+        if r is not None:
+            if r != reg:
+                self.emit("move", r, reg)
+            return
+        mem = self._memory(d, _S2 if reg != _S2 else _S3)
+        if mem is not None:
+            self.emit("sw", reg, mem[0], mem[1])
+
+    # ---------------- Instrucciones ----------------
+
+    def instr(self, op: int, d: int, a: int, b: int) -> None:
+        if op == MOV:
+            r = self.fr.reg.get(d)
+            if r is not None:
+                self.load_into(a, r)
+            else:
+                self.store(d, self.load(a, _S1))
+        elif op in (ADD, SUB, MUL, EQ, NE, LT, LE, GT, GE):
+            self.arith(op, d, a, b)
+        elif op in (DIV, MOD):
+            rb = self.load(b, _S2)
+            if not (b & 7 == K_INT and b >> 3 != 0):
+                self.emit("beq", rb, "$zero", "__err_div")
+            ra = self.load(a, _S1)
+            self.emit("div", ra, rb)
+            t = self.target(d)
+            self.emit("mflo" if op == DIV else "mfhi", t)
+            self.store(d, t)
+        elif op == NEG:
+            t = self.target(d)
+            self.emit("subu", t, "$zero", self.load(a, _S1))
+            self.store(d, t)
+        elif op == NOT:
+            t = self.target(d)
+            self.emit("xori", t, self.load(a, _S1), 1)
+            self.store(d, t)
+        elif op in (CONCAT, STRCMP):
+            self.load_into(a, "$a0")
+            self.load_into(b, "$a1")
+            self.emit("jal", "__concat" if op == CONCAT else "__strcmp")
+            self.store(d, "$v0")
+        elif op == TOSTR:
+            self.load_into(a, "$a0")
+            tag = b >> 3
+            if tag == TAG_INT:
+                self.emit("jal", "__itos")
+            else:
+                self.emit("li", "$a1", tag)
+                self.emit("jal", "__tostr")
+            self.store(d, "$v0")
+        elif op == LABEL:
+            self.emit("label", f"L{a >> 3}")
+        elif op == GOTO:
+            self.emit("j", f"L{a >> 3}")
+        elif op in (IF_FALSE, IF_TRUE):
+            self.emit("beq" if op == IF_FALSE else "bne", self.load(a, _S1), "$zero", f"L{b >> 3}")
+        elif op == SWITCH:
+            self.switch(d >> 3, a, b >> 3)
+        elif op == HASH:
+            self.load_into(a, "$a0")
+            self.emit("li", "$a1", b >> 3)
+            self.emit("jal", "__strhash")
+            self.store(d, "$v0")
+        elif op == PARAM:
+            self.param(a)
+        elif op == CALL:
+            self.call(d, a, b >> 3)
+        elif op == RET:
+            if a != NONE:
+                self.load_into(a, "$v0")
+            if self.fr.base == "$sp":
+                self.emit("jr", "$ra")
+            elif not self.is_last:
+                self.emit("j", self.ret_label)
+        elif op == PRINT:
+            tag = b >> 3 if b & 7 == K_INT else TAG_INT
+            self.load_into(a, "$a0")
+            if tag == TAG_INT:
+                self.emit("jal", "__print_int")
+                return
+            if tag != TAG_STRING:
+                self.emit("li", "$a1", tag)
+                self.emit("jal", "__tostr")
+                self.emit("move", "$a0", "$v0")
+            self.emit("jal", "__print_str")
+        elif op == NEWARR:
+            if a & 7 == K_INT and a >= 0:
+                n = a >> 3
+                self.emit("li", "$a0", WORD * (n + 1))
+                self.emit("li", "$v0", 9)
+                self.emit("syscall")
+                self.emit("li", _S1, n)
+                self.emit("sw", _S1, 0, "$v0")
+            else:
+                self.load_into(a, "$a0")
+                self.emit("jal", "__newarr")
+            self.store(d, "$v0")
+        elif op in (ALOAD, ASTORE):
+            self.element(op, d, a, b)
+        elif op == LEN:
+            ra = self.load(a, _S1)
+            self.emit("beq", ra, "$zero", "__err_null_index")
+            t = self.target(d)
+            self.emit("lw", t, 0, ra)
+            self.store(d, t)
+        elif op == NEW:
+            name = self.prog.names[a >> 3]
+            n = self._classes.setdefault(name, len(self._classes))
+            cls = self.prog.class_of(name)
+            self.emit("li", "$a0", cls.size if cls is not None else WORD)
+            self.emit("li", "$v0", 9)
+            self.emit("syscall")
+            self.emit("la", _S1, f"V{n}")
+            self.emit("sw", _S1, 0, "$v0")
+            self.store(d, "$v0")
+        elif op == GETF:
+            ro = self.load(a, _S1)
+            self.emit("beq", ro, "$zero", "__err_null_field")
+            t = self.target(d)
+            self.emit("lw", t, self.prog.field_offset(b), ro)
+            self.store(d, t)
+        elif op == SETF:
+            ro = self.load(d, _S1)
+            self.emit("beq", ro, "$zero", "__err_null_field")
+            rv = self.load(b, _S2)
+            self.emit("sw", rv, self.prog.field_offset(a), ro)
+        elif op == METHOD:
+            ro = self.load(a, _S1)
+            self.emit("beq", ro, "$zero", "__err_null_field")
+            t = self.target(d)
+            self.emit("lw", t, 0, ro)
+            self.emit("lw", t, WORD * ((b >> 3) + 1), t)
+            self.store(d, t)
+        elif op == TRY:
+            self.emit("la", "$a0", f"L{a >> 3}")
+            self.emit("jal", "__try")
+        elif op == ENDTRY:
+            self.emit("jal", "__endtry")
+        elif op == CATCH:
+            self.store(d, "$v0")
+
+    def arith(self, op: int, d: int, a: int, b: int) -> None:
+        imm = b >> 3 if b & 7 == K_INT else None
+        if imm is None and a & 7 == K_INT and op in (ADD, MUL, EQ, NE):
+            a, b, imm = b, a, a >> 3                # conmutativas: el inmediato a la derecha
+        t = self.target(d)
+        if op == ADD and imm is not None and _small(imm):
+            self.emit("addiu", t, self.load(a, _S1), imm)
+        elif op == SUB and imm is not None and _small(-imm):
+            self.emit("addiu", t, self.load(a, _S1), -imm)
+        elif op == LT and imm is not None and _small(imm):
+            self.emit("slti", t, self.load(a, _S1), imm)
+        elif op in (EQ, NE) and imm == 0:
+            ra = self.load(a, _S1)
+            if op == EQ:
+                self.emit("sltiu", t, ra, 1)
+            else:
+                self.emit("sltu", t, "$zero", ra)
+        else:
+            ra = self.load(a, _S1)
+            rb = self.load(b, _S2)
+            if op == ADD:
+                self.emit("addu", t, ra, rb)
+            elif op == SUB:
+                self.emit("subu", t, ra, rb)
+            elif op == MUL:
+                self.emit("mul", t, ra, rb)
+            elif op in (EQ, NE):
+                self.emit("xor", t, ra, rb)
+                if op == EQ:
+                    self.emit("sltiu", t, t, 1)
+                else:
+                    self.emit("sltu", t, "$zero", t)
+            elif op == LT:
+                self.emit("slt", t, ra, rb)
+            elif op == GT:
+                self.emit("slt", t, rb, ra)
+            elif op == LE:
+                self.emit("slt", t, rb, ra)
+                self.emit("xori", t, t, 1)
+            else:
+                self.emit("slt", t, ra, rb)
+                self.emit("xori", t, t, 1)
+        self.store(d, t)
+
+    def element(self, op: int, d: int, a: int, b: int) -> None:
+        """arr[i] con chequeo de null y de rango; el fallo de rango sale por un stub al final de la función."""
+        arr, idx = (a, b) if op == ALOAD else (d, a)
+        ra = self.load(arr, _S1)
+        self.emit("beq", ra, "$zero", "__err_null_index")
+        const = idx >> 3 if idx & 7 == K_INT and idx >= 0 and _small((idx >> 3) * WORD + WORD) else None
+        self.emit("lw", _S3, 0, ra)
+        stub = f"E{self._stubs}"
+        self._stubs += 1
+        if const is not None:
+            self.emit("slti", _S3, _S3, const + 1)
+            self.emit("bne", _S3, "$zero", stub)
+            self.stubs.append((stub, const))
+            base, off = ra, WORD + WORD * const
+        else:
+            ri = self.load(idx, _S2)
+            self.emit("sltu", _S3, ri, _S3)
+            self.emit("beq", _S3, "$zero", stub)
+            self.stubs.append((stub, ri))
+            self.emit("sll", _S3, ri, 2)
+            self.emit("addu", _S3, _S3, ra)
+            base, off = _S3, WORD
+        if op == ALOAD:
+            t = self.target(d)
+            self.emit("lw", t, off, base)
+            self.store(d, t)
+        else:
+            rv = self.load(b, _S1 if base == _S3 else _S2)
+            self.emit("sw", rv, off, base)
+
+    # ---------------- Llamadas ----------------
+
+    def switch(self, lo: int, a: int, table: int) -> None:
+        """
+        Salto por tabla: (a - lo) sin signo contra el tamaño manda lo que
+        está fuera de rango a la etiqueta por defecto; si no, se lee la
+        dirección de J<tabla> + 4*(a - lo) y se salta a ella.
+        """
+        default, *labels = self.prog.tables[table]
+        r = self.load(a, _S1)
+        if lo:
+            if _small(-lo):
+                self.emit("addiu", _S1, r, -lo)
+            else:
+                self.emit("li", _S2, lo)
+                self.emit("subu", _S1, r, _S2)
+            r = _S1
+        if _small(len(labels)):
+            self.emit("sltiu", _S2, r, len(labels))
+        else:
+            self.emit("li", _S2, len(labels))
+            self.emit("sltu", _S2, r, _S2)
+        self.emit("beq", _S2, "$zero", f"L{default >> 3}")
+        self.emit("sll", _S1, r, 2)
+        self.emit("la", _S2, f"J{table}")
+        self.emit("addu", _S1, _S1, _S2)
+        self.emit("lw", _S1, 0, _S1)
+        self.emit("jr", _S1)
+        self._tables.append(table)
+
+    def param(self, a: int) -> None:
+        # los 'param' de una llamada van juntos justo antes del 'call' (ver TacGenerator.call)
+        self.pending.append(a)
+
+    def call(self, d: int, target: int, n: int) -> None:
+        args = self.pending[len(self.pending) - n:] if n else []
+        del self.pending[len(self.pending) - n:]
+        if args:
+            self.emit("addiu", "$sp", "$sp", -WORD * len(args))
+            for k, x in enumerate(args):
+                self.emit("sw", self.load(x, _S1), WORD * k, "$sp")
+        if target & 7 == K_NAME:
+            name = self.prog.names[target >> 3]
+            callee = self._funcs.get(name)
+            if callee is not None and self.prog.functions[callee].parent >= 0:
+                # enlace estático: el entorno de la función que contiene a la llamada
+                self._env_base(self.prog.functions[callee].parent, _S3)
+            self.emit("jal", func_label(name))
+        else:
+            self.emit("jalr", self.load(target, _S2))
+        if args:
+            self.emit("addiu", "$sp", "$sp", WORD * len(args))
+        if d != NONE:
+            self.store(d, "$v0")
+
+
+    def tail_call(self, target: int, n: int, callee: int) -> None:
+        """
+        'call' seguido de 'return' de su resultado. Los argumentos se
+        calculan en $a0-$a3 antes de tocar el marco. Recursión propia: se
+        escriben en los parámetros y se salta al cuerpo (mismo marco).
+        Otra función: se desarma el marco como en el epílogo, los argumentos
+        van al área donde llegaron los de esta función y se salta al
+        llamado, que retorna directo a nuestro llamador.
+        """
+        args = self.pending[len(self.pending) - n:] if n else []
+        del self.pending[len(self.pending) - n:]
+        fr, f = self.fr, self.f
+        if callee == self.fi and fr.env is None and fr.env_frame is None:
+            self._self_tail_call(args)
+            return
+        for k, x in enumerate(args):
+            self.load_into(x, _ARG_REGS[k])
+        if callee == self.fi:
+            for k in range(n):
+                self.emit("sw", _ARG_REGS[k], WORD * k, fr.base)
+            if fr.link is not None:
+                self.emit("lw", _S3, fr.link, "$fp")  # el entorno nuevo se enlaza al mismo padre
+            self.emit("j", self.loop_label)
+            return
+        parent = self.prog.functions[callee].parent
+        if parent >= 0:
+            self._env_base(parent, _S3)
+        self._epilogue()
+        for k in range(n):
+            self.emit("sw", _ARG_REGS[k], WORD * k, "$sp")
+        self.emit("j", func_label(self.prog.names[target >> 3]))
+
+
+    def _self_tail_call(self, args: List[int]) -> None:
+        """
+        Recursión de cola sin entorno: cada argumento va directo al lugar
+        del parámetro. Lo que está en memoria se lee primero a $a* (un slot
+        de parámetro puede ser a la vez fuente y destino); entre registros
+        es una copia en paralelo, ordenando las 'move' y rompiendo ciclos
+        con $t8; las constantes se cargan al final.
+        """
+        fr = self.fr
+        moves: Dict[str, str] = {}          # registro destino -> registro fuente
+        stores, consts = [], []
+        for k, (p, x) in enumerate(zip(self.f.params, args)):
+            if p not in fr.reg and p not in fr.slot:
+                continue                            # parámetro que no se usa
+            if x & 7 in (K_TEMP, K_VAR):
+                src = fr.reg.get(x)
+                if src is None:
+                    src = _ARG_REGS[k]
+                    self.load_into(x, src)
+            elif p in fr.reg:
+                consts.append((p, x))
+                continue
+            else:
+                src = self.load(x, _ARG_REGS[k])
+            if p in fr.reg:
+                if src != fr.reg[p]:
+                    moves[fr.reg[p]] = src
+            else:
+                stores.append((src, fr.slot[p]))
+        for src, off in stores:
+            self.emit("sw", src, off, fr.base)
+        while moves:
+            free = [d for d in moves if d not in moves.values()]
+            if free:
+                d = free[0]
+                self.emit("move", d, moves.pop(d))
+                continue
+            d = next(iter(moves))                   # ciclo: un destino se guarda aparte
+            self.emit("move", _S1, d)
+            for k in moves:
+                if moves[k] == d:
+                    moves[k] = _S1
+        for p, x in consts:
+            self.load_into(x, fr.reg[p])
+        self.emit("j", self.loop_label)
+
+
+def generate_mips(prog: TacProgram, allocate: bool = True, tail_calls: bool = True,
+                  leaves: bool = True, stack_envs: bool = True) -> MipsProgram:
+    """
+    Código MIPS del programa TAC (ya optimizado o no). 'tail_calls' convierte
+    las llamadas en posición de cola en saltos; 'leaves' deja sin marco a las
+    funciones hoja (requiere asignación de registros); 'stack_envs' pone en
+    el marco los entornos de clausuras que no escapan.
+    """
+    return MipsGenerator(prog, allocate, tail_calls, leaves, stack_envs).generate()
@@ -0,0 +1,460 @@
+from __future__ import annotations
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from codegen.mips import MipsProgram, LOADS, STORES
+
+# Optimización por mirilla sobre la lista de instrucciones MIPS ya emitida.
+# Cada regla mira una ventana que empieza en la posición actual y devuelve
+# (cuántas instrucciones reemplaza, reemplazo) o None. Después de un cambio
+# la ventana retrocede un poco para que las reglas se encadenen, y el
+# recorrido completo se repite hasta que ninguna regla aplica.
+
+BRANCHES = frozenset(("beq", "bne", "beqz", "bnez", "bgez", "bltz", "bgtz", "blez",
+                      "blt", "bge", "bgt", "ble"))
+# instrucciones que escriben su primer operando (registro)
+WRITES_FIRST = frozenset(("addiu", "addi", "addu", "add", "subu", "sub", "mul", "slt", "slti",
+                          "sltu", "sltiu", "xor", "xori", "and", "andi", "or", "ori",
+                          "sll", "srl", "sra", "move", "li", "la", "mflo", "mfhi")) | LOADS
+
+_SCRATCH = frozenset(("$t8", "$t9"))
+_ARGS = frozenset(("$a0", "$a1", "$a2", "$a3"))
+# lo que una llamada a una función del usuario puede cambiar (convención del backend)
+_CALLER_SAVED = frozenset([f"$t{i}" for i in range(10)] + ["$v0", "$v1", "$ra"]) | _ARGS
+_INVERSE = {"beq": "bne", "bne": "beq"}
+_LOOKAHEAD = 24               # instrucciones que mira el análisis de registro muerto
+_WINDOW = 8                   # cuánto mira hacia atrás una regla de tramo recto
+_BOOLEAN = frozenset(("slt", "slti", "sltu", "sltiu"))     # dejan 0 o 1
+
+
+def reads(ins: tuple) -> Tuple[str, ...]:
+    """Registros que lee la instrucción."""
+    op = ins[0]
+    if op == "label":
+        return ()
+    if op in LOADS:
+        return (ins[3],)
+    if op in STORES:
+        return (ins[1], ins[3])
+    if op == "syscall":
+        return ("$v0", "$a0")
+    args = ins[2:] if op in WRITES_FIRST else ins[1:]
+    return tuple(a for a in args if isinstance(a, str) and a.startswith("$"))
+
+
+def writes(ins: tuple) -> Optional[str]:
+    return ins[1] if ins[0] in WRITES_FIRST else None
+
+
+class Context:
+    """
+    Lo que las reglas necesitan saber del programa: dónde está cada etiqueta
+    y cuáles se usan ('keep': las que se nombran desde los datos, como las
+    entradas de una tabla de saltos).
+    """
+
+    def __init__(self, code: List[tuple], keep: Sequence[str] = ()):
+        self.code = code
+        self.keep = keep
+        self.dirty = True
+        self._labels: Dict[str, int] = {}
+        self._used: Dict[str, int] = {}
+
+    def _refresh(self) -> None:
+        self._labels.clear()
+        self._used.clear()
+        for label in self.keep:
+            self._used[label] = self._used.get(label, 0) + 1
+        for i, ins in enumerate(self.code):
+            if ins[0] == "label":
+                self._labels[ins[1]] = i
+            elif ins[0] not in LOADS and ins[0] not in STORES:
+                for a in ins[1:]:
+                    if isinstance(a, str) and not a.startswith("$"):
+                        self._used[a] = self._used.get(a, 0) + 1
+        self.dirty = False
+
+    @property
+    def labels(self) -> Dict[str, int]:
+        """Etiqueta -> posición (se recalcula solo si el código cambió)."""
+        if self.dirty:
+            self._refresh()
+        return self._labels
+
+    @property
+    def used(self) -> Dict[str, int]:
+        """Etiqueta -> cantidad de instrucciones que la nombran."""
+        if self.dirty:
+            self._refresh()
+        return self._used
+
+    def first_real(self, label: str) -> Optional[tuple]:
+        """Primera instrucción (no etiqueta) a partir de 'label'."""
+        i = self.labels.get(label)
+        if i is None:
+            return None
+        code = self.code
+        while i < len(code) and code[i][0] == "label":
+            i += 1
+        return code[i] if i < len(code) else None
+
+    def dead(self, i: int, reg: str, budget: int = _LOOKAHEAD) -> bool:
+        """
+        True si 'reg' no se lee antes de volver a escribirse a partir de la
+        posición i. Sigue saltos y ramas (ambos lados) hasta 'budget'
+        instrucciones; ante la duda responde que está vivo.
+        """
+        code = self.code
+        seen = set()
+        while budget > 0:
+            if i >= len(code) or i in seen:
+                return i in seen
+            seen.add(i)
+            ins = code[i]
+            op = ins[0]
+            budget -= 1
+            if op == "label":
+                i += 1
+                continue
+            if reg in reads(ins):
+                return False
+            if writes(ins) == reg:
+                return True
+            if op in BRANCHES:
+                if not self._dead_at(ins[-1], reg, budget):
+                    return False
+            elif op == "j":
+                return self._dead_at(ins[1], reg, budget)
+            elif op in ("jal", "jalr"):
+                if ins[0] == "jal" and ins[1].startswith("__"):
+                    # rutinas del runtime: leen $a0/$a1, usan $a*, $v*, $t8, $t9
+                    if reg in _ARGS:
+                        return False
+                    if reg in _SCRATCH or reg in ("$v0", "$v1"):
+                        return True
+                else:
+                    if reg in _ARGS or reg == "$v1":
+                        return False                # enlace estático
+                    return reg in _CALLER_SAVED
+            elif op == "jr":
+                if ins[1] != "$ra":
+                    return False                    # salto por tabla: no se sabe a dónde
+                return reg in _SCRATCH or reg in _ARGS or reg.startswith("$t")
+            i += 1
+        return False
+
+    def _dead_at(self, label: str, reg: str, budget: int) -> bool:
+        i = self.labels.get(label)
+        if i is None:
+            # rutina de error del runtime: no vuelve y solo lee $a0/$a1
+            return label.startswith("__") and reg not in _ARGS
+        return self.dead(i, reg, budget)
+
+
+Rule = Callable[[List[tuple], int, Context], Optional[Tuple[int, List[tuple]]]]
+
+
+# ---------------------------------------------------------------------------
+# Reglas
+# ---------------------------------------------------------------------------
+
+def redundant_move(code, i, ctx):
+    """move r, r  /  addiu r, r, 0."""
+    ins = code[i]
+    if ins[0] == "move" and ins[1] == ins[2]:
+        return 1, []
+    if ins[0] == "addiu" and ins[3] == 0:
+        return 1, [] if ins[1] == ins[2] else [("move", ins[1], ins[2])]
+    return None
+
+
+def move_back(code, i, ctx):
+    """move a, b ; move b, a  ->  move a, b."""
+    if i + 1 >= len(code):
+        return None
+    x, y = code[i], code[i + 1]
+    if x[0] == y[0] == "move" and x[1] == y[2] and x[2] == y[1]:
+        return 2, [x]
+    return None
+
+
+def _stops(ins: tuple) -> bool:
+    """Fin de un tramo recto hacia atrás: etiqueta, salto o llamada."""
+    return ins[0] in ("label", "j", "jr", "jal", "jalr", "syscall")
+
+
+def _may_alias(store: tuple, base: str) -> bool:
+    """¿Puede el 'sw'/'sb' escribir la palabra que se lee con otro offset (o base)?"""
+    if store[0] != "sw":
+        return True
+    other = store[3]
+    if other == base:
+        return False                            # misma base sin cambios, otro offset
+    return "$gp" not in (other, base) or not {other, base} <= {"$gp", "$fp", "$sp"}
+
+
+def redundant_load(code, i, ctx):
+    """
+    lw r2, o(b) cuando, en el mismo tramo recto y sin que cambien b ni r,
+    antes hubo 'sw r, o(b)' o 'lw r, o(b)': la palabra ya está en r.
+    """
+    y = code[i]
+    if y[0] != "lw":
+        return None
+    off, base = y[2], y[3]
+    written = set()
+    for k in range(i - 1, max(-1, i - _WINDOW), -1):
+        x = code[k]
+        if _stops(x):
+            return None
+        if x[0] in ("sw", "lw") and x[2] == off and x[3] == base:
+            if x[1] in written or (x[0] == "lw" and x[1] == base):
+                return None                     # el valor ya no está en ningún registro
+            return 1, [] if x[1] == y[1] else [("move", y[1], x[1])]
+        if x[0] in STORES and _may_alias(x, base):
+            return None
+        w = writes(x)
+        if w == base:
+            return None
+        if w is not None:
+            written.add(w)
+    return None
+
+
+def repeated_branch(code, i, ctx):
+    """Una rama igual a otra anterior del mismo tramo recto, con los operandos intactos, nunca salta."""
+    y = code[i]
+    if y[0] not in BRANCHES:
+        return None
+    regs = set(reads(y))
+    for k in range(i - 1, max(-1, i - _WINDOW), -1):
+        x = code[k]
+        if _stops(x) or writes(x) in regs:
+            return None
+        if x == y:
+            return 1, []
+    return None
+
+
+def _dead_after_branch(code, i, ctx, reg):
+    """'reg' muerto en los dos sucesores de la rama code[i]."""
+    return ctx.dead(i + 1, reg) and ctx._dead_at(code[i][-1], reg, _LOOKAHEAD)
+
+
+def compare_branch(code, i, ctx):
+    """
+    Comparación que solo alimenta a 'beq/bne t, $zero, L':
+      sltiu t, a, 1     -> rama invertida sobre a
+      sltu t, $zero, a  -> misma rama sobre a
+      xor t, a, b       -> beq/bne a, b, L
+      xori t, s, 1      -> rama invertida sobre s (si s viene de un slt*)
+    """
+    if i + 1 >= len(code):
+        return None
+    x, y = code[i], code[i + 1]
+    if y[0] not in _INVERSE or y[2] != "$zero" or x[0] not in WRITES_FIRST or x[1] != y[1]:
+        return None
+    t, op, label = x[1], y[0], y[3]
+    if x[0] == "sltiu" and x[3] == 1:
+        new = (_INVERSE[op], x[2], "$zero", label)
+    elif x[0] == "sltu" and x[2] == "$zero":
+        new = (op, x[3], "$zero", label)
+    elif x[0] == "xor":
+        new = (op, x[2], x[3], label)
+    elif x[0] == "xori" and x[3] == 1 and i > 0 and code[i - 1][0] in _BOOLEAN \
+            and code[i - 1][1] == x[2]:
+        new = (_INVERSE[op], x[2], "$zero", label)
+    else:
+        return None
+    if not _dead_after_branch(code, i + 1, ctx, t):
+        return None
+    return 2, [new]
+
+
+def sp_merge(code, i, ctx):
+    """addiu $sp, $sp, a ; addiu $sp, $sp, b  ->  addiu $sp, $sp, a+b."""
+    if i + 1 >= len(code):
+        return None
+    x, y = code[i], code[i + 1]
+    if x[0] == y[0] == "addiu" and x[1:3] == y[1:3] == ("$sp", "$sp"):
+        total = x[3] + y[3]
+        return 2, [("addiu", "$sp", "$sp", total)] if total else []
+    return None
+
+
+def copy_forward(code, i, ctx):
+    """op s, ... ; move r, s  ->  op r, ...   (si s muere ahí)."""
+    if i + 1 >= len(code):
+        return None
+    x, y = code[i], code[i + 1]
+    if y[0] != "move" or x[0] not in WRITES_FIRST or x[1] != y[2] or y[1] == y[2]:
+        return None
+    if y[1] in ("$sp", "$fp", "$zero") or x[1] in ("$sp", "$fp"):
+        return None
+    if not ctx.dead(i + 2, x[1]):
+        return None
+    return 2, [(x[0], y[1], *x[2:])]
+
+
+def jump_to_next(code, i, ctx):
+    """j L ; [etiquetas] ; L:   y   bxx ..., L ; L:   ->   nada."""
+    ins = code[i]
+    if ins[0] != "j" and ins[0] not in BRANCHES:
+        return None
+    k = i + 1
+    while k < len(code) and code[k][0] == "label":
+        if code[k][1] == ins[-1]:
+            return 1, []
+        k += 1
+    return None
+
+
+def jump_threading(code, i, ctx):
+    """Un salto a una etiqueta cuya primera instrucción es 'j M' va directo a M."""
+    ins = code[i]
+    if ins[0] != "j" and ins[0] not in BRANCHES:
+        return None
+    target, seen = ins[-1], {ins[-1]}
+    while True:
+        nxt = ctx.first_real(target)
+        if nxt is None or nxt[0] != "j":
+            break
+        if nxt[1] in seen:
+            return None                         # ciclo de saltos: se deja como está
+        target = nxt[1]
+        seen.add(target)
+    if target == ins[-1]:
+        return None
+    return 1, [(*ins[:-1], target)]
+
+
+def branch_over_jump(code, i, ctx):
+    """beq a, b, L1 ; j L2 ; L1:  ->  bne a, b, L2 ; L1:."""
+    if i + 2 >= len(code):
+        return None
+    x, y, z = code[i], code[i + 1], code[i + 2]
+    if x[0] in _INVERSE and y[0] == "j" and z == ("label", x[3]):
+        return 2, [(_INVERSE[x[0]], x[1], x[2], y[1])]
+    return None
+
+
+def unreachable(code, i, ctx):
+    """Lo que sigue a un salto incondicional hasta la próxima etiqueta no se ejecuta."""
+    if code[i][0] not in ("j", "jr"):
+        return None
+    k = i + 1
+    while k < len(code) and code[k][0] != "label":
+        k += 1
+    if k == i + 1:
+        return None
+    return k - i, [code[i]]
+
+
+def unused_label(code, i, ctx):
+    """Etiquetas internas (L*, R_*) a las que nadie salta."""
+    ins = code[i]
+    if ins[0] != "label" or ctx.used.get(ins[1]):
+        return None
+    if not (ins[1].startswith("L") or ins[1].startswith("R_")):
+        return None
+    return 1, []
+
+
+DEFAULT_RULES: List[Tuple[str, Rule]] = [
+    ("redundant-move", redundant_move),
+    ("move-back", move_back),
+    ("redundant-load", redundant_load),
+    ("repeated-branch", repeated_branch),
+    ("compare-branch", compare_branch),
+    ("sp-merge", sp_merge),
+    ("copy-forward", copy_forward),
+    ("jump-to-next", jump_to_next),
+    ("jump-threading", jump_threading),
+    ("branch-over-jump", branch_over_jump),
+    ("unreachable", unreachable),
+    ("unused-label", unused_label),
+]
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+@dataclass
+class PeepholeReport:
+    before: int
+    after: int = 0
+    rounds: int = 0
+    hits: Dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    def to_text(self) -> str:
+        lines = [f"Mirilla MIPS: {self.before} -> {self.after} instrucciones "
+                 f"({self.before - self.after} eliminadas, {self.rounds} rondas, "
+                 f"{self.seconds * 1000:.2f} ms)",
+                 f"{'regla':<28} {'aplicada':>10}"]
+        for name, n in self.hits.items():
+            lines.append(f"{name:<28} {n:>10}")
+        return "\n".join(lines)
+
+
+def _count(code: Sequence[tuple]) -> int:
+    return sum(1 for ins in code if ins[0] != "label")
+
+
+class PeepholeOptimizer:
+    """
+    Aplica las reglas en orden en cada posición (ventana deslizante) y
+    repite pasadas completas hasta el punto fijo o 'max_rounds'. Solo toca
+    el código del programa: el runtime está escrito a mano.
+    """
+
+    def __init__(self, rules: Optional[List[Tuple[str, Rule]]] = None, max_rounds: int = 10):
+        self.rules = rules if rules is not None else list(DEFAULT_RULES)
+        self.max_rounds = max_rounds
+
+    def run_code(self, code: List[tuple], report: PeepholeReport,
+                 keep: Sequence[str] = ()) -> List[tuple]:
+        for name, _ in self.rules:
+            report.hits.setdefault(name, 0)
+        ctx = Context(code, keep)
+        for rnd in range(self.max_rounds):
+            report.rounds = rnd + 1
+            changed = False
+            i = 0
+            while i < len(code):
+                for name, rule in self.rules:
+                    r = rule(code, i, ctx)
+                    if r is None:
+                        continue
+                    n, repl = r
+                    code[i:i + n] = repl
+                    report.hits[name] += 1
+                    changed = True
+                    ctx.dirty = True
+                    i = max(0, i - 2)
+                    break
+                else:
+                    i += 1
+            if not changed:
+                break
+        return code
+
+    def run(self, program: MipsProgram) -> PeepholeReport:
+        t0 = time.perf_counter()
+        user = program.text[:program.user_end]
+        report = PeepholeReport(before=_count(user))
+        keep = [x.strip() for _, directive, value in program.data if directive == ".word"
+                for x in str(value).split(",")]
+        self.run_code(user, report, keep)
+        program.text[:program.user_end] = user
+        program.user_end = len(user)
+        program.recount()
+        report.after = _count(user)
+        report.seconds = time.perf_counter() - t0
+        return report
+
+
+def peephole(program: MipsProgram, max_rounds: int = 10) -> PeepholeReport:
+    return PeepholeOptimizer(max_rounds=max_rounds).run(program)
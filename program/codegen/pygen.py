@@ -0,0 +1,878 @@
+from __future__ import annotations
+import builtins
+import keyword
+import re
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from CompiscriptParser import CompiscriptParser
+from CompiscriptVisitor import CompiscriptVisitor
+from semantic.cfg import for_parts
+from semantic.symbols import FuncSymbol, ClassSymbol
+from semantic.typesys import ArrayType, ClassType, arithmetic_type
+
+P = CompiscriptParser
+
+# Backend que traduce el árbol ya chequeado a código fuente Python (lo
+# compila y ejecuta codegen/pyrun.py). Todo el programa queda dentro de una
+# función '_main': las globales de Compiscript son locales de '_main', las
+# funciones anidadas y los métodos son clausuras nativas de Python (con
+# 'nonlocal' donde se asigna una variable de afuera) y las clases son
+# clases con __slots__. Cada nombre de Compiscript se vuelve un nombre
+# único en todo el programa, así el alcance por bloque no choca con el
+# alcance por función de Python. Las declaraciones de funciones y clases
+# suben al inicio de la función que las contiene (se pueden llamar antes
+# de su declaración, como en el TAC).
+#
+# Los tipos del TypeChecker eligen la operación: '+' entre enteros es la
+# suma de Python y la concatenación convierte cada lado según su tipo
+# (arithmetic_type da el tipo del resultado parcial); '==' es '==' entre
+# primitivos e 'is' con arreglos, objetos o null; '/' y '%' truncan hacia
+# cero como el TAC. Los errores se reportan con los mismos mensajes que
+# TacInterpreter (ver pyrun.error_message).
+
+_INDENT = "    "
+_SIMPLE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|-?[0-9]+|'[^'\\]*'")
+_INT_CASE = re.compile(r"-?[0-9]+")
+# nombres que el código generado usa (palabras clave y builtins como range, len o str):
+# los de Compiscript que coinciden llevan '_' al final
+_RESERVED = set(keyword.kwlist) | set(keyword.softkwlist) | set(dir(builtins)) | {"self"}
+_LOOPS = (P.WhileStatementContext, P.DoWhileStatementContext, P.ForStatementContext,
+          P.ForeachStatementContext)
+
+
+class _PyFunc:
+    """Función Python en construcción: su cuerpo y lo que va antes de él."""
+
+    def __init__(self, header: str, parent: Optional["_PyFunc"]):
+        self.header = header
+        self.parent = parent
+        self.lines: List[str] = []
+        self.defs: List[str] = []          # funciones y clases declaradas adentro (van primero)
+        self.nonlocals: List[str] = []
+        self.unset: List[str] = []         # declaradas sin valor inicial: empiezan en None
+        self.temps = 0
+        self.nested_assigns: set[str] = set()   # nombres que asigna alguna función declarada adentro
+
+    def render(self) -> List[str]:
+        body = []
+        if self.nonlocals:
+            body.append("nonlocal " + ", ".join(self.nonlocals))
+        body.extend(f"{name} = None" for name in self.unset)
+        body.extend(self.defs)
+        body.extend(self.lines)
+        return [self.header] + [_INDENT + line for line in (body or ["pass"])]
+
+
+class _Loop:
+    """Destino de break/continue: un ciclo o un switch."""
+
+    def __init__(self, switch: bool = False, cont: Optional[List[str]] = None,
+                 wrapped: bool = False, flag: str = ""):
+        self.switch = switch
+        self.cont = cont or []             # ciclos: lo que se ejecuta antes de 'continue'
+        self.wrapped = wrapped             # switch metido en 'while True' (tiene break)
+        self.flag = flag                   # switch envuelto con un 'continue' adentro
+
+
+class PythonGenerator(CompiscriptVisitor):
+    """
+    Traduce el árbol chequeado a un módulo Python. Usa del TypeChecker el
+    índice de posiciones (qué símbolo es cada identificador), los tipos
+    registrados con record_types=True y el layout de cada clase.
+
+    Los visit* de expresiones devuelven el texto de la expresión Python;
+    los de sentencias agregan líneas a la función actual.
+    """
+
+    def __init__(self, checker):
+        super().__init__()
+        self.checker = checker
+        self.types = checker.types or {}
+        self.layouts = checker.scopes.tree.classes
+        self.f: _PyFunc = _PyFunc("def _main():", None)
+        self.depth = 0
+        self.loops: List[_Loop] = []
+        self.consts: List[str] = []                  # tablas de los switch (a nivel de módulo)
+        self._names: Dict[int, tuple] = {}           # id(símbolo) -> (nombre Python, _PyFunc dueña)
+        self._by_text: Dict[str, tuple] = {}         # respaldo si el índice no tiene el símbolo
+        self._taken: set[str] = set()
+        self._classes: Dict[str, str] = {}           # clase de Compiscript -> nombre Python
+        self._class = ""                             # clase cuyos métodos se están generando
+        self._fields = {name for c in self.layouts.values() for name in c.fields}
+
+    # ---------------- Entrada ----------------
+
+    def generate(self, tree) -> str:
+        self.f.nested_assigns = _nested_assigned(tree.statement())
+        self.predeclare(tree.statement())
+        for stmt in tree.statement():
+            self.visit(stmt)
+        out = ["# Generado desde Compiscript por codegen/pygen.py"]
+        out.extend(self.consts)
+        out.extend(self.f.render())
+        return "\n".join(out) + "\n"
+
+    # ---------------- Utilidades ----------------
+
+    def emit(self, line: str) -> None:
+        self.f.lines.append(_INDENT * self.depth + line)
+
+    @contextmanager
+    def indented(self):
+        self.depth += 1
+        start = len(self.f.lines)
+        yield
+        if len(self.f.lines) == start:
+            self.emit("pass")
+        self.depth -= 1
+
+    @contextmanager
+    def captured(self):
+        """Junta las líneas que se emiten adentro (con indentación relativa) sin dejarlas en la función."""
+        saved, depth = self.f.lines, self.depth
+        self.f.lines, self.depth = [], 0
+        out: List[str] = []
+        try:
+            yield out
+        finally:
+            out.extend(self.f.lines)
+            self.f.lines, self.depth = saved, depth
+
+    def splice(self, lines: List[str]) -> None:
+        for line in lines:
+            self.emit(line)
+
+    def temp(self) -> str:
+        self.f.temps += 1
+        return f"_t{self.f.temps}"
+
+    def symbol(self, terminal):
+        tok = terminal.getSymbol()
+        return self.checker.index.symbol_at(tok.line, tok.column)
+
+    def unique(self, name: str) -> str:
+        if name.startswith("_"):
+            name = "u" + name                # lo que empieza con '_' es del código generado
+        if name in _RESERVED:
+            name += "_"
+        base, n = name, 1
+        while name in self._taken:
+            n += 1
+            name = f"{base}_{n}"
+        self._taken.add(name)
+        return name
+
+    def declare(self, terminal) -> str:
+        """Nombre Python de la variable declarada en 'terminal' (dueña: la función actual)."""
+        name = self.unique(terminal.getText())
+        entry = (name, self.f)
+        sym = self.symbol(terminal)
+        if sym is not None:
+            self._names[id(sym)] = entry
+        self._by_text[terminal.getText()] = entry
+        return name
+
+    def name_of(self, terminal, assign: bool = False) -> str:
+        sym = self.symbol(terminal)
+        entry = self._names.get(id(sym)) if sym is not None else None
+        if entry is None:
+            entry = self._by_text.get(terminal.getText())
+        if entry is None:
+            return self.unique(terminal.getText())
+        name, owner = entry
+        if assign and owner is not self.f and name not in self.f.nonlocals:
+            self.f.nonlocals.append(name)
+        return name
+
+    def type_of(self, ctx):
+        """Tipo registrado de la expresión, bajando por los nodos de un solo hijo si no tiene."""
+        while ctx is not None:
+            t = self.types.get(ctx)
+            if t is not None or ctx.getChildCount() != 1:
+                return t
+            ctx = ctx.getChild(0)
+        return None
+
+    @staticmethod
+    def attr(name: str) -> str:
+        if name.startswith("__"):
+            return "u" + name
+        return name + "_" if keyword.iskeyword(name) else name
+
+    def method_attr(self, name: str) -> str:
+        # un método con el nombre de algún campo chocaría con el slot
+        return self.attr(name) + ("_m" if name in self._fields else "")
+
+    def class_name(self, name: str) -> str:
+        return self._classes.get(name, name)
+
+    # ---------------- Sentencias ----------------
+
+    def visitStatement(self, ctx):
+        return self.visit(ctx.getChild(0))
+
+    def visitBlock(self, ctx):
+        for stmt in ctx.statement():
+            self.visit(stmt)
+
+    def suite(self, statements) -> None:
+        with self.indented():
+            for stmt in statements:
+                self.visit(stmt)
+
+    def visitVariableDeclaration(self, ctx):
+        name = self.declare(ctx.Identifier())
+        if ctx.initializer() is not None:
+            self.emit(f"{name} = {self.visit(ctx.initializer().expression())}")
+        else:
+            self.f.unset.append(name)
+
+    def visitConstantDeclaration(self, ctx):
+        name = self.declare(ctx.Identifier())
+        self.emit(f"{name} = {self.visit(ctx.expression())}")
+
+    def visitAssignment(self, ctx):
+        exprs = ctx.expression()
+        if len(exprs) == 1:
+            value = self.visit(exprs[0])
+            self.emit(f"{self.name_of(ctx.Identifier(), assign=True)} = {value}")
+        else:
+            self.store_field(self.visit(exprs[0]), ctx.Identifier().getText(), exprs[1])
+
+    def visitExpressionStatement(self, ctx):
+        self.expression_statement(ctx.expression())
+
+    def visitPrintStatement(self, ctx):
+        v = self.visit(ctx.expression())
+        self.emit(f"_out({v})" if v.startswith("'") else f"_out(_text({v}))")
+
+    def predeclare(self, statements) -> None:
+        """Registra las funciones y clases del cuerpo: se pueden usar antes de su declaración."""
+        for node in statements:
+            if isinstance(node, P.StatementContext):
+                node = node.getChild(0)
+            if isinstance(node, P.FunctionDeclarationContext):
+                self.declare(node.Identifier())
+            elif isinstance(node, P.ClassDeclarationContext):
+                self._classes[node.Identifier(0).getText()] = self.declare(node.Identifier(0))
+            elif isinstance(node, P.BlockContext):
+                self.predeclare(node.statement())
+            elif isinstance(node, (P.IfStatementContext, P.TryCatchStatementContext)) or \
+                    isinstance(node, _LOOPS):
+                blocks = node.block()
+                for b in blocks if isinstance(blocks, list) else [blocks]:
+                    if b is not None:
+                        self.predeclare(b.statement())
+            elif isinstance(node, P.SwitchStatementContext):
+                for case in node.switchCase():
+                    self.predeclare(case.statement())
+                if node.defaultCase() is not None:
+                    self.predeclare(node.defaultCase().statement())
+
+    def visitFunctionDeclaration(self, ctx):
+        self.f.defs.extend(self.function(ctx, self.name_of(ctx.Identifier())))
+
+    def function(self, ctx, name: str, method: bool = False) -> List[str]:
+        params = ctx.parameters().parameter() if ctx.parameters() else ()
+        outer, depth, loops = self.f, self.depth, self.loops
+        self.f = _PyFunc("", outer)
+        self.depth, self.loops = 0, []
+        names = [self.declare(p.Identifier()) for p in params]
+        if method:
+            names.insert(0, "self")
+        self.f.header = f"def {name}({', '.join(names)}):"
+        if name == "__init__":
+            self.f.lines.extend(self.field_inits(self._class))
+        statements = ctx.block().statement()
+        self.f.nested_assigns = _nested_assigned(statements)
+        self.predeclare(statements)
+        for stmt in statements:
+            self.visit(stmt)
+        lines = self.f.render()
+        self.f, self.depth, self.loops = outer, depth, loops
+        return lines
+
+    def field_inits(self, cname: str) -> List[str]:
+        """Todos los campos empiezan en null (en el TAC, un campo sin asignar se lee como null)."""
+        return [f"self.{self.attr(name)} = None" for name in self.layouts[cname].fields]
+
+    def visitClassDeclaration(self, ctx):
+        cname = ctx.Identifier(0).getText()
+        pyname = self.class_name(cname)
+        base = ctx.Identifier(1).getText() if ctx.Identifier(1) is not None else None
+        layout = self.layouts[cname]
+        inherited = self.layouts[base].fields if base in self.layouts else {}
+        own = [self.attr(n) for n in layout.fields if n not in inherited]
+        lines = [f"class {pyname}({self.class_name(base)}):" if base else f"class {pyname}:",
+                 _INDENT + f"__slots__ = ({''.join(repr(n) + ', ' for n in own).rstrip()})",
+                 _INDENT + f"__cps_name__ = {cname!r}"]
+        self._class = cname
+        ctor = None
+        methods = []
+        for member in ctx.classMember():
+            fctx = member.functionDeclaration()
+            if fctx is None:
+                continue
+            name = fctx.Identifier().getText()
+            if name == "constructor":
+                ctor = fctx
+            else:
+                methods.append(self.function(fctx, self.method_attr(name), method=True))
+        if ctor is not None:
+            methods.insert(0, self.function(ctor, "__init__", method=True))
+        elif own or not base:
+            # sin constructor propio: inicializa sus campos y delega en el de la base
+            init = ["def __init__(self, *args):"] + [_INDENT + x for x in self.field_inits(cname)]
+            if base:
+                init.append(_INDENT + f"{self.class_name(base)}.__init__(self, *args)")
+            if len(init) == 1:
+                init.append(_INDENT + "pass")
+            methods.insert(0, init)
+        for m in methods:
+            lines.extend(_INDENT + x for x in m)
+        self.f.defs.extend(lines)
+
+    def visitIfStatement(self, ctx):
+        self.emit(f"if {self.visit(ctx.expression())}:")
+        self.suite(ctx.block(0).statement())
+        if ctx.block(1) is not None:
+            self.emit("else:")
+            self.suite(ctx.block(1).statement())
+
+    def loop_body(self, block, loop: _Loop) -> None:
+        self.loops.append(loop)
+        self.suite(block.statement())
+        self.loops.pop()
+
+    def visitWhileStatement(self, ctx):
+        self.emit(f"while {self.visit(ctx.expression())}:")
+        self.loop_body(ctx.block(), _Loop())
+
+    def visitDoWhileStatement(self, ctx):
+        cond = self.visit(ctx.expression())
+        check = f"if not {cond}:"
+        self.emit("while True:")
+        self.loop_body(ctx.block(), _Loop(cont=[check, _INDENT + "break"]))
+        self.depth += 1
+        self.emit(check)
+        self.emit(_INDENT + "break")
+        self.depth -= 1
+
+    def visitForStatement(self, ctx):
+        cond, update = for_parts(ctx)
+        if self.range_loop(ctx, cond, update):
+            return
+        if ctx.variableDeclaration() is not None:
+            self.visit(ctx.variableDeclaration())
+        elif ctx.assignment() is not None:
+            self.visit(ctx.assignment())
+        with self.captured() as step:
+            if update is not None:
+                self.expression_statement(update)
+        self.emit(f"while {self.visit(cond) if cond is not None else 'True'}:")
+        # 'continue' tiene que pasar por la actualización
+        self.loop_body(ctx.block(), _Loop(cont=step))
+        self.depth += 1
+        self.splice(step)
+        self.depth -= 1
+
+    def range_loop(self, ctx, cond, update) -> bool:
+        """
+        for (let i = a; i < n; i = i + k) -> for i in range(a, n, k), si ni
+        'i' ni 'n' cambian dentro del ciclo (n: literal o variable propia
+        que ninguna función anidada asigna).
+        """
+        decl = ctx.variableDeclaration()
+        if decl is None or decl.initializer() is None or cond is None or update is None:
+            return False
+        init = decl.initializer().expression()
+        if not _is(self.type_of(init), "integer"):
+            return False
+        var = decl.Identifier().getText()
+        m = re.fullmatch(rf"{var}(<=?)(-?[0-9]+|[A-Za-z_][A-Za-z0-9_]*)", cond.getText())
+        step = re.fullmatch(rf"{var}={var}\+([0-9]+)", update.getText())
+        if m is None or step is None or int(step.group(1)) <= 0:
+            return False
+        body = _assigned(ctx.block(), set())
+        if var in body:
+            return False
+        bound = m.group(2)
+        if not _INT_CASE.fullmatch(bound):
+            entry = self._by_text.get(bound)
+            if bound in body or bound in self.f.nested_assigns or entry is None or entry[1] is not self.f:
+                return False
+            bound = self.name_of(_first_identifier(cond, bound))
+        start = self.visit(init)
+        name = self.declare(decl.Identifier())
+        stop = bound if m.group(1) == "<" else (str(int(bound) + 1) if _INT_CASE.fullmatch(bound)
+                                                 else f"{bound} + 1")
+        args = [start, stop] + ([step.group(1)] if step.group(1) != "1" else [])
+        self.emit(f"for {name} in range({', '.join(args)}):")
+        self.loop_body(ctx.block(), _Loop())
+        return True
+
+    def expression_statement(self, expr) -> None:
+        """Una expresión usada como sentencia (asignaciones sin ':=')."""
+        node = expr.assignmentExpr()
+        if isinstance(node, P.AssignExprContext):
+            self.assign_statement(node)
+        elif isinstance(node, P.PropertyAssignExprContext):
+            self.store_field(self.visit(node.lhs), node.Identifier().getText(), node.assignmentExpr())
+        else:
+            self.emit(self.visit(node))
+
+    def visitForeachStatement(self, ctx):
+        arr = self.visit(ctx.expression())
+        item = self.declare(ctx.Identifier())
+        self.emit(f"for {item} in {arr}:")
+        self.loop_body(ctx.block(), _Loop())
+
+    def visitSwitchStatement(self, ctx):
+        cases = ctx.switchCase()
+        default = ctx.defaultCase()
+        arms = [case.statement() for case in cases] + ([default.statement()] if default else [])
+        subject = self.temp()
+        self.emit(f"{subject} = {self.visit(ctx.expression())}")
+        choice = self.temp()
+        self.dispatch(ctx, subject, choice, cases, len(cases) if default else len(arms) + 1)
+
+        if self._exclusive(arms):
+            # ningún caso cae en el siguiente: un if por rango sobre el índice del caso
+            bodies = []
+            self.loops.append(_Loop(switch=True))
+            for stmts in arms:
+                with self.captured() as body:
+                    self.suite(_without_break(stmts))
+                bodies.append(body)
+            self.loops.pop()
+            self._arms(choice, bodies, 0, len(bodies))
+            return
+
+        wrapped = any(_breaks_out(s) for stmts in arms for s in stmts)
+        flag = self.temp() if wrapped and any(_continues_out(s) for stmts in arms for s in stmts) else ""
+        if flag:
+            self.emit(f"{flag} = False")
+        if wrapped:
+            self.emit("while True:")
+            self.depth += 1
+        self.loops.append(_Loop(switch=True, wrapped=wrapped, flag=flag))
+        for k, stmts in enumerate(arms):
+            self.emit(f"if {choice} <= {k}:")
+            self.suite(stmts)
+        self.loops.pop()
+        if wrapped:
+            self.emit("break")
+            self.depth -= 1
+        if flag:
+            self.emit(f"if {flag}:")
+            self.depth += 1
+            self.continue_lines()
+            self.depth -= 1
+
+    def dispatch(self, ctx, subject: str, choice: str, cases, missing: int) -> None:
+        """choice = índice del primer caso igual a subject ('missing' si ninguno)."""
+        keys = [_case_constant(case.expression()) for case in cases]
+        kinds = {type(k) for k in keys}
+        if kinds in ({int}, {str}):
+            table = {}
+            for k, key in enumerate(keys):
+                table.setdefault(key, k)                # con valores repetidos gana el primero
+            name = f"_SWITCH{len(self.consts)}"
+            self.consts.append(f"{name} = {table!r}")
+            self.emit(f"{choice} = {name}.get({subject}, {missing})")
+            return
+        subject_t = self.type_of(ctx.expression())
+        for k, case in enumerate(cases):
+            value = self.visit(case.expression())
+            test = self.equality(subject, value, subject_t, self.types.get(case.expression()), "==")
+            self.emit(f"{'if' if k == 0 else 'elif'} {test}:")
+            self.emit(_INDENT + f"{choice} = {k}")
+        if cases:
+            self.emit("else:")
+            self.emit(_INDENT + f"{choice} = {missing}")
+        else:
+            self.emit(f"{choice} = {missing}")
+
+    @staticmethod
+    def _exclusive(arms) -> bool:
+        for k, stmts in enumerate(arms):
+            body = _without_break(stmts)
+            if any(_breaks_out(s) for s in body):
+                return False
+            last = _kind(stmts[-1]) if stmts else None
+            if k < len(arms) - 1 and last not in (P.BreakStatementContext, P.ReturnStatementContext,
+                                                 P.ContinueStatementContext):
+                return False
+        return True
+
+    def _arms(self, choice: str, bodies: List[List[str]], lo: int, hi: int) -> None:
+        """Búsqueda binaria sobre el índice del caso; un índice fuera de [lo, hi) no entra a ninguno."""
+        if hi - lo <= 3:
+            for k in range(lo, hi):
+                self.emit(f"{'if' if k == lo else 'elif'} {choice} == {k}:")
+                self.splice(bodies[k])
+            return
+        mid = (lo + hi) // 2
+        self.emit(f"if {choice} < {mid}:")
+        self.depth += 1
+        self._arms(choice, bodies, lo, mid)
+        self.depth -= 1
+        self.emit("else:")
+        self.depth += 1
+        self._arms(choice, bodies, mid, hi)
+        self.depth -= 1
+
+    def visitBreakStatement(self, ctx):
+        if self.loops:
+            self.emit("break")
+
+    def visitContinueStatement(self, ctx):
+        self.continue_lines()
+
+    def continue_lines(self) -> None:
+        for loop in reversed(self.loops):
+            if not loop.switch:
+                self.splice(loop.cont)
+                self.emit("continue")
+                return
+            if loop.wrapped:
+                # sale del 'while True' del switch; después del switch se continúa el ciclo
+                self.emit(f"{loop.flag} = True")
+                self.emit("break")
+                return
+
+    def visitReturnStatement(self, ctx):
+        if ctx.expression() is None:
+            self.emit("return")
+        else:
+            self.emit(f"return {self.visit(ctx.expression())}")
+
+    def visitTryCatchStatement(self, ctx):
+        self.emit("try:")
+        self.suite(ctx.block(0).statement())
+        err = self.declare(ctx.Identifier())
+        self.emit("except _ERRORS as _e:")
+        self.depth += 1
+        self.emit(f"{err} = _message(_e)")
+        for stmt in ctx.block(1).statement():
+            self.visit(stmt)
+        self.depth -= 1
+
+    # ---------------- Asignaciones ----------------
+
+    def assign_statement(self, ctx) -> None:
+        lhs = ctx.lhs
+        suffixes = lhs.suffixOp()
+        if not suffixes and isinstance(lhs.primaryAtom(), P.IdentifierExprContext):
+            value = self.visit(ctx.assignmentExpr())
+            self.emit(f"{self.name_of(lhs.primaryAtom().Identifier(), assign=True)} = {value}")
+            return
+        obj = self.lhs_value(lhs, len(suffixes) - 1)
+        last = suffixes[-1]
+        if isinstance(last, P.IndexExprContext):
+            obj, idx = self.simple(obj), self.simple(self.visit(last.expression()))
+            value = self.visit(ctx.assignmentExpr())
+            if not _SIMPLE.fullmatch(value):
+                value = self.simple(value, force=True)
+            self.emit(f"if {obj} is None or not -1 < {idx} < len({obj}): _oob({obj}, {idx})")
+            self.emit(f"{obj}[{idx}] = {value}")
+        else:
+            self.store_field(obj, last.Identifier().getText(), ctx.assignmentExpr())
+
+    def store_field(self, obj: str, name: str, value_ctx) -> None:
+        # el objeto se evalúa antes que el valor (Python lo haría al revés)
+        obj = self.simple(obj)
+        if obj != "self":
+            self.emit(f"if {obj} is None: _null()")
+        self.emit(f"{obj}.{self.attr(name)} = {self.visit(value_ctx)}")
+
+    def simple(self, expr: str, force: bool = False) -> str:
+        """'expr' si es un nombre o literal; si no, la guarda en un temporal."""
+        if _SIMPLE.fullmatch(expr) and not force:
+            return expr
+        t = self.temp()
+        self.emit(f"{t} = {expr}")
+        return t
+
+    # ---------------- Expresiones ----------------
+
+    def visitExpression(self, ctx):
+        return self.visit(ctx.assignmentExpr())
+
+    def visitExprNoAssign(self, ctx):
+        return self.visit(ctx.conditionalExpr())
+
+    def visitAssignExpr(self, ctx):
+        lhs = ctx.lhs
+        suffixes = lhs.suffixOp()
+        if not suffixes and isinstance(lhs.primaryAtom(), P.IdentifierExprContext):
+            name = self.name_of(lhs.primaryAtom().Identifier(), assign=True)
+            return f"({name} := {self.visit(ctx.assignmentExpr())})"
+        obj = self.lhs_value(lhs, len(suffixes) - 1)
+        last = suffixes[-1]
+        if isinstance(last, P.IndexExprContext):
+            return f"_seti({obj}, {self.visit(last.expression())}, {self.visit(ctx.assignmentExpr())})"
+        return f"_setf({obj}, {self.attr(last.Identifier().getText())!r}, {self.visit(ctx.assignmentExpr())})"
+
+    def visitPropertyAssignExpr(self, ctx):
+        return (f"_setf({self.visit(ctx.lhs)}, {self.attr(ctx.Identifier().getText())!r}, "
+                f"{self.visit(ctx.assignmentExpr())})")
+
+    def visitTernaryExpr(self, ctx):
+        if ctx.expression(0) is None:
+            return self.visit(ctx.logicalOrExpr())
+        c = self.visit(ctx.logicalOrExpr())
+        return f"({self.visit(ctx.expression(0))} if {c} else {self.visit(ctx.expression(1))})"
+
+    def visitLogicalOrExpr(self, ctx):
+        return _join(" or ", [self.visit(x) for x in ctx.logicalAndExpr()])
+
+    def visitLogicalAndExpr(self, ctx):
+        return _join(" and ", [self.visit(x) for x in ctx.equalityExpr()])
+
+    def binary_chain(self, ctx, operands) -> str:
+        """a op b op c ... con asociatividad a izquierda, eligiendo la operación por los tipos."""
+        left = self.visit(operands[0])
+        left_t = self.types.get(operands[0])
+        for k, sub in enumerate(operands[1:], start=1):
+            op = ctx.getChild(2 * k - 1).getText()
+            right = self.visit(sub)
+            right_t = self.types.get(sub)
+            if op == "+" and (_is(left_t, "string") or _is(right_t, "string")):
+                left = f"({self.text(left, left_t)} + {self.text(right, right_t)})"
+            elif op in ("==", "!="):
+                left = self.equality(left, right, left_t, right_t, op)
+            elif op == "/" or op == "%":
+                left = self.division(left, right, op)
+            else:
+                left = f"({left} {op} {right})"
+            if left_t is not None and right_t is not None:
+                left_t = arithmetic_type(left_t, right_t) or left_t
+        return left
+
+    def text(self, expr: str, t) -> str:
+        """El operando de una concatenación como string."""
+        if _is(t, "string"):
+            return expr
+        if _is(t, "integer"):
+            return repr(expr) if _INT_CASE.fullmatch(expr) else f"str({expr})"
+        return f"_text({expr})"
+
+    @staticmethod
+    def equality(left: str, right: str, left_t, right_t, op: str) -> str:
+        prims = ("integer", "string", "boolean")
+        if any(_is(t, "null") or isinstance(t, (ArrayType, ClassType)) for t in (left_t, right_t)):
+            return f"({left} {'is' if op == '==' else 'is not'} {right})"
+        if left_t is not None and right_t is not None and left_t.name in prims and right_t.name in prims:
+            return f"({left} {op} {right})"
+        return f"({'' if op == '==' else 'not '}_same({left}, {right}))"
+
+    def division(self, left: str, right: str, op: str) -> str:
+        # divisor constante positivo: truncar hacia cero sin llamar a _div/_mod
+        if _INT_CASE.fullmatch(right) and int(right) > 0:
+            py = "//" if op == "/" else "%"
+            if _SIMPLE.fullmatch(left):
+                return f"({left} {py} {right} if {left} >= 0 else -(-{left} {py} {right}))"
+            t = self.temp()
+            return f"({t} {py} {right} if ({t} := {left}) >= 0 else -(-{t} {py} {right}))"
+        return f"{'_div' if op == '/' else '_mod'}({left}, {right})"
+
+    def visitEqualityExpr(self, ctx):
+        return self.binary_chain(ctx, ctx.relationalExpr())
+
+    def visitRelationalExpr(self, ctx):
+        return self.binary_chain(ctx, ctx.additiveExpr())
+
+    def visitAdditiveExpr(self, ctx):
+        return self.binary_chain(ctx, ctx.multiplicativeExpr())
+
+    def visitMultiplicativeExpr(self, ctx):
+        return self.binary_chain(ctx, ctx.unaryExpr())
+
+    def visitUnaryExpr(self, ctx):
+        if ctx.primaryExpr() is not None:
+            return self.visit(ctx.primaryExpr())
+        v = self.visit(ctx.unaryExpr())
+        if ctx.getChild(0).getText() == "-":
+            return str(-int(v)) if _INT_CASE.fullmatch(v) else f"(-{v})"
+        return f"(not {v})"
+
+    def visitPrimaryExpr(self, ctx):
+        if ctx.literalExpr() is not None:
+            return self.visit(ctx.literalExpr())
+        if ctx.leftHandSide() is not None:
+            return self.visit(ctx.leftHandSide())
+        return self.visit(ctx.expression())
+
+    def visitLiteralExpr(self, ctx):
+        if ctx.arrayLiteral() is not None:
+            return self.visit(ctx.arrayLiteral())
+        text = ctx.getText()
+        if text in ("null", "true", "false"):
+            return {"null": "None", "true": "True", "false": "False"}[text]
+        if text.startswith('"'):
+            return repr(text[1:-1])
+        return str(int(text))
+
+    def visitArrayLiteral(self, ctx):
+        return "[" + ", ".join(self.visit(e) for e in ctx.expression()) + "]"
+
+    def visitLeftHandSide(self, ctx):
+        return self.lhs_value(ctx, len(ctx.suffixOp()))
+
+    def lhs_value(self, ctx, upto: int) -> str:
+        """Expresión de primaryAtom seguido de los primeros 'upto' sufijos."""
+        atom = ctx.primaryAtom()
+        suffixes = ctx.suffixOp()[:upto]
+        cur = self.visit(atom)
+        i = 0
+        while i < len(suffixes):
+            s = suffixes[i]
+            if isinstance(s, P.PropertyAccessExprContext):
+                name = s.Identifier().getText()
+                if i + 1 < len(suffixes) and isinstance(suffixes[i + 1], P.CallExprContext):
+                    # llamada a método: el despacho dinámico de Python hace de vtable
+                    cur = f"{self.not_null(cur)}.{self.method_attr(name)}({self.arguments(suffixes[i + 1])})"
+                    i += 2
+                    continue
+                cur = f"{self.not_null(cur)}.{self.attr(name)}"
+            elif isinstance(s, P.IndexExprContext):
+                cur = self.index(cur, self.visit(s.expression()))
+            else:
+                cur = f"{cur}({self.arguments(s)})"
+            i += 1
+        return cur
+
+    def arguments(self, call) -> str:
+        args = call.arguments()
+        return ", ".join(self.visit(e) for e in args.expression()) if args is not None else ""
+
+    @staticmethod
+    def not_null(obj: str) -> str:
+        """'obj' listo para leerle un campo; null da el error de ejecución de Compiscript."""
+        if obj == "self":
+            return obj
+        if _SIMPLE.fullmatch(obj):
+            return f"({obj} if {obj} is not None else _null())"
+        return f"_nn({obj})"
+
+    @staticmethod
+    def index(arr: str, idx: str) -> str:
+        if _SIMPLE.fullmatch(arr) and _SIMPLE.fullmatch(idx):
+            return f"({arr}[{idx}] if {arr} is not None and -1 < {idx} < len({arr}) else _oob({arr}, {idx}))"
+        return f"_at({arr}, {idx})"
+
+    def visitIdentifierExpr(self, ctx):
+        sym = self.symbol(ctx.Identifier())
+        if isinstance(sym, FuncSymbol) and id(sym) not in self._names:
+            return self.unique(sym.name)
+        if isinstance(sym, ClassSymbol):
+            return self.class_name(sym.name)
+        return self.name_of(ctx.Identifier())
+
+    def visitThisExpr(self, ctx):
+        return "self"
+
+    def visitNewExpr(self, ctx):
+        args = ctx.arguments()
+        args = ", ".join(self.visit(e) for e in args.expression()) if args is not None else ""
+        return f"{self.class_name(ctx.Identifier().getText())}({args})"
+
+
+def _is(t, name: str) -> bool:
+    return t is not None and t.name == name
+
+
+def _join(sep: str, parts: List[str]) -> str:
+    return parts[0] if len(parts) == 1 else "(" + sep.join(parts) + ")"
+
+
+def _kind(stmt):
+    return type(stmt.getChild(0)) if isinstance(stmt, P.StatementContext) else type(stmt)
+
+
+def _without_break(stmts) -> list:
+    stmts = list(stmts)
+    if stmts and _kind(stmts[-1]) is P.BreakStatementContext:
+        stmts.pop()
+    return stmts
+
+
+def _breaks_out(node) -> bool:
+    """Hay un 'break' que sale del switch (no de un ciclo o switch anidado)."""
+    if isinstance(node, P.BreakStatementContext):
+        return True
+    if isinstance(node, _LOOPS + (P.SwitchStatementContext, P.FunctionDeclarationContext)):
+        return False
+    return any(_breaks_out(node.getChild(i)) for i in range(node.getChildCount())
+               if not hasattr(node.getChild(i), "symbol"))
+
+
+def _continues_out(node) -> bool:
+    """Hay un 'continue' de un ciclo de afuera (atraviesa el switch)."""
+    if isinstance(node, P.ContinueStatementContext):
+        return True
+    if isinstance(node, _LOOPS + (P.FunctionDeclarationContext,)):
+        return False
+    return any(_continues_out(node.getChild(i)) for i in range(node.getChildCount())
+               if not hasattr(node.getChild(i), "symbol"))
+
+
+def _assigned(node, out: set) -> set:
+    """Nombres (texto) a los que se asigna dentro de 'node', incluidas funciones anidadas."""
+    if isinstance(node, P.AssignExprContext):
+        lhs = node.lhs
+        if not lhs.suffixOp() and isinstance(lhs.primaryAtom(), P.IdentifierExprContext):
+            out.add(lhs.primaryAtom().getText())
+    elif isinstance(node, P.AssignmentContext) and len(node.expression()) == 1:
+        out.add(node.Identifier().getText())
+    for i in range(node.getChildCount()):
+        child = node.getChild(i)
+        if not hasattr(child, "symbol"):
+            _assigned(child, out)
+    return out
+
+
+def _nested_assigned(statements) -> set:
+    """Nombres que asignan las funciones (y métodos) declaradas en 'statements'."""
+    out: set = set()
+
+    def walk(node):
+        if isinstance(node, (P.FunctionDeclarationContext, P.ClassDeclarationContext)):
+            _assigned(node, out)
+            return
+        for i in range(node.getChildCount()):
+            child = node.getChild(i)
+            if not hasattr(child, "symbol"):
+                walk(child)
+
+    for stmt in statements:
+        walk(stmt)
+    return out
+
+
+def _first_identifier(node, text: str):
+    """Terminal del primer identificador 'text' dentro de 'node'."""
+    if hasattr(node, "symbol"):
+        return node if node.getText() == text else None
+    for i in range(node.getChildCount()):
+        found = _first_identifier(node.getChild(i), text)
+        if found is not None:
+            return found
+    return None
+
+
+def _case_constant(expr):
+    """Valor de un 'case' que es un literal entero (con signo) o string; None si no."""
+    text = expr.getText()
+    if _INT_CASE.fullmatch(text):
+        return int(text)
+    if len(text) >= 2 and text[0] == text[-1] == '"' and '"' not in text[1:-1]:
+        return text[1:-1]
+    return None
+
+
+def generate_python(tree, checker) -> str:
+    """Código Python de un programa ya chequeado (el checker debe crearse con record_types=True)."""
+    return PythonGenerator(checker).generate(tree)
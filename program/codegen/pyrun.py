@@ -0,0 +1,154 @@
+from __future__ import annotations
+import hashlib
+import sys
+import threading
+from types import CodeType
+from typing import Dict, List
+
+from intermediate.interp import TacRuntimeError, int_div, int_mod, same_value
+
+# Ejecuta el Python que genera codegen/pygen.py. El código se compila una
+# sola vez por texto dentro del proceso: los code objects quedan en un caché
+# indexado por el hash del código fuente, así que volver a correr el mismo
+# programa solo paga el exec. Lo que el código generado usa y no es Python
+# puro (_text, _div, _oob, ...) vive en este módulo.
+
+# errores de Python que el programa puede provocar y que Compiscript ve como
+# errores de ejecución; los accesos a null se revisan en el código generado
+_ERRORS = (TacRuntimeError, IndexError, ZeroDivisionError, RecursionError)
+
+# TacInterpreter y la VM guardan los marcos en el heap y solo los corta el
+# límite de pasos; aquí cada llamada es un marco de Python, así que _main
+# corre en un hilo con pila propia y un límite de recursión del mismo orden
+RECURSION_LIMIT = 1_000_000
+STACK_BYTES = 512 * 1024 * 1024
+
+_CODE_CACHE: Dict[str, CodeType] = {}
+
+
+def error_message(e: BaseException) -> str:
+    """Mensaje de un error de ejecución, con el texto que usa TacInterpreter."""
+    if isinstance(e, TacRuntimeError):
+        return str(e)
+    if isinstance(e, ZeroDivisionError):
+        return "División por cero"
+    if isinstance(e, RecursionError):
+        return "Recursión demasiado profunda"
+    return str(e)
+
+
+def _text(v) -> str:
+    """Como interp.to_text, con objetos que son instancias de las clases generadas."""
+    if v is True:
+        return "true"
+    if v is False:
+        return "false"
+    if v is None:
+        return "null"
+    if isinstance(v, (int, str)):
+        return str(v)
+    if isinstance(v, list):
+        return "[" + ", ".join(_text(x) for x in v) + "]"
+    return f"<{type(v).__cps_name__}>"
+
+
+def _oob(arr, i):
+    if arr is None:
+        raise TacRuntimeError("Acceso a índice de null")
+    raise TacRuntimeError(f"Índice fuera de rango: {i}")
+
+
+def _null_field():
+    raise TacRuntimeError("Acceso a campo de null")
+
+
+def _nn(obj):
+    if obj is None:
+        _null_field()
+    return obj
+
+
+def _at(arr, i):
+    if arr is None or not 0 <= i < len(arr):
+        _oob(arr, i)
+    return arr[i]
+
+
+def _seti(arr, i, value):
+    if arr is None or not 0 <= i < len(arr):
+        _oob(arr, i)
+    arr[i] = value
+    return value
+
+
+def _setf(obj, name, value):
+    if obj is None:
+        raise TacRuntimeError("Acceso a campo de null")
+    setattr(obj, name, value)
+    return value
+
+
+def _runtime(output: List[str], echo: bool) -> dict:
+    def out(line: str) -> None:
+        output.append(line)
+        if echo:
+            print(line)
+
+    return {
+        "__name__": "__compiscript__",
+        "_out": out if echo else output.append,
+        "_text": _text, "_same": same_value, "_div": int_div, "_mod": int_mod,
+        "_oob": _oob, "_nn": _nn, "_null": _null_field, "_at": _at, "_seti": _seti, "_setf": _setf,
+        "_ERRORS": _ERRORS, "_message": error_message,
+    }
+
+
+def compile_python(source: str) -> CodeType:
+    """Code object del módulo generado, compilado una vez por cada texto distinto."""
+    key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    code = _CODE_CACHE.get(key)
+    if code is None:
+        code = _CODE_CACHE[key] = compile(source, f"<compiscript {key[:12]}>", "exec")
+    return code
+
+
+class PythonRunner:
+    """Corre el módulo generado y junta lo que imprime (como TacInterpreter.run)."""
+
+    def __init__(self, source: str, echo: bool = False):
+        self.source = source
+        self.echo = echo
+        self.output: List[str] = []
+
+    def run(self) -> List[str]:
+        namespace = _runtime(self.output, self.echo)
+        exec(compile_python(self.source), namespace)
+        failure: List[BaseException] = []
+
+        def main() -> None:
+            try:
+                namespace["_main"]()
+            except BaseException as e:      # se relanza en el hilo que llamó
+                failure.append(e)
+
+        limit, stack = sys.getrecursionlimit(), threading.stack_size()
+        sys.setrecursionlimit(max(limit, RECURSION_LIMIT))
+        threading.stack_size(STACK_BYTES)
+        try:
+            worker = threading.Thread(target=main, daemon=True)
+            worker.start()
+        finally:
+            threading.stack_size(stack)
+        worker.join()
+        sys.setrecursionlimit(limit)
+        if failure:
+            e = failure[0]
+            if isinstance(e, _ERRORS):
+                raise TacRuntimeError(error_message(e)) from e
+            raise e
+        return self.output
+
+
+def run_python(source: str, **kwargs) -> List[str]:
+    """Ejecuta el código generado y devuelve las líneas impresas."""
+    return PythonRunner(source, **kwargs).run()
@@ -0,0 +1,290 @@
+from __future__ import annotations
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence, Set
+
+from intermediate.tac import TacProgram, CALL, DEST_OPS, READS, K_TEMP, operand
+from intermediate.tac_cfg import build_tac_cfg
+from semantic.dataflow import solve
+
+# $t8/$t9 quedan libres para cargar operandos en memoria y armar direcciones
+T_REGS = tuple(f"$t{i}" for i in range(8))
+S_REGS = tuple(f"$s{i}" for i in range(8))
+
+
+class Interval:
+    """
+    Intervalo de vida de un valor (temporal o variable local) como un solo
+    rango [start, end] de posiciones de instrucción, sin huecos. 'crosses_call'
+    indica que sigue vivo después de alguna llamada que empieza dentro del
+    rango: en un registro $t se perdería.
+    """
+
+    __slots__ = ("value", "start", "end", "crosses_call", "reg")
+
+    def __init__(self, value: int, start: int, end: int):
+        self.value = value
+        self.start = start
+        self.end = end
+        self.crosses_call = False
+        self.reg: Optional[str] = None      # None = en memoria (spill)
+
+    def __repr__(self) -> str:
+        return f"Interval({self.value}, {self.start}-{self.end}, {self.reg or 'spill'})"
+
+
+def tracked_values(prog: TacProgram, fi: int) -> List[int]:
+    """Candidatos a registro: temporales y variables propias que ninguna función anidada captura."""
+    f = prog.functions[fi]
+    captured = {v for g in prog.functions for v in g.captures}
+    own = [v for v in f.params + f.locals if v not in captured]
+    return own + [operand(K_TEMP, t) for t in range(f.temps)]
+
+
+class Liveness:
+    """
+    Liveness por bloques (bit vectors sobre el CFG TAC) de los valores
+    'values' de una función. Da los intervalos de vida y lo vivo a la entrada
+    de un bloque.
+    """
+
+    def __init__(self, prog: TacProgram, fi: int, values: Sequence[int]):
+        self.prog = prog
+        self.f = f = prog.functions[fi]
+        self.values = list(values)
+        code = prog.code
+        ops, arrays = code.op, (code.d, code.a, code.b)
+        ds = code.d
+        self.bit = bit = {v: k for k, v in enumerate(self.values)}
+        self.cfg = cfg = build_tac_cfg(prog, f)
+        n = len(cfg)
+        gen, kill = [0] * n, [0] * n
+        self.lo: Dict[int, int] = {}
+        self.hi: Dict[int, int] = {}
+        self.bounds: List[Optional[tuple]] = []
+        for blk in range(n):
+            r = cfg.item_range(blk)
+            if not r:
+                self.bounds.append(None)
+                continue
+            items = cfg.items[r.start:r.stop]
+            self.bounds.append((items[0], items[-1]))
+            g = k = 0
+            for i in reversed(items):
+                op = ops[i]
+                if op in DEST_OPS:
+                    x = bit.get(ds[i])
+                    if x is not None:
+                        g &= ~(1 << x)
+                        k |= 1 << x
+                        self._touch(ds[i], i)
+                for slot in READS[op]:
+                    v = arrays[slot][i]
+                    x = bit.get(v)
+                    if x is not None:
+                        g |= 1 << x
+                        self._touch(v, i)
+            gen[blk], kill[blk] = g, k
+        self.live = solve(cfg, gen, kill, forward=False) if bit else None
+
+    def _touch(self, v: int, pos: int) -> None:
+        if pos < self.lo.get(v, pos + 1):
+            self.lo[v] = pos
+        if pos > self.hi.get(v, -1):
+            self.hi[v] = pos
+
+    def _values(self, mask: int):
+        while mask:
+            low = mask & -mask
+            yield self.values[low.bit_length() - 1]
+            mask ^= low
+
+    def live_at(self, positions: Set[int]) -> Set[int]:
+        """Valores vivos a la entrada de los bloques que empiezan en 'positions'."""
+        out: Set[int] = set()
+        if self.live is None:
+            return out
+        for blk, b in enumerate(self.bounds):
+            if b is not None and b[0] in positions:
+                out.update(self._values(self.live.in_[blk]))
+        return out
+
+    def intervals(self, ignore: Set[int] = frozenset()) -> List[Interval]:
+        """
+        Un valor vive en la envoltura de: sus definiciones y usos, el inicio
+        de cada bloque donde está vivo a la entrada y el final de cada bloque
+        donde está vivo a la salida. Los parámetros nacen en la entrada.
+        Las llamadas en 'ignore' (las que se generan como salto) no cuentan
+        para 'crosses_call'.
+        """
+        if self.live is None:
+            return []
+        f = self.f
+        for blk, b in enumerate(self.bounds):
+            if b is None:
+                continue
+            for v in self._values(self.live.in_[blk]):
+                self._touch(v, b[0])
+            for v in self._values(self.live.out[blk]):
+                self._touch(v, b[1])
+        for p in f.params:
+            if p in self.bit:
+                self._touch(p, f.start)
+
+        ops = self.prog.code.op
+        calls = [i for i in range(f.start, f.end) if ops[i] == CALL and i not in ignore]
+        out = []
+        for v in self.values:
+            if v not in self.lo:
+                continue
+            iv = Interval(v, self.lo[v], self.hi[v])
+            # alguna llamada en (start, end): el valor se usa después de ella
+            k = bisect_right(calls, iv.start)
+            iv.crosses_call = k < len(calls) and calls[k] < iv.end
+            out.append(iv)
+        return out
+
+
+def split_webs(prog: TacProgram, fi: int) -> int:
+    """
+    Separa cada valor en sus webs (definiciones unidas por los usos que
+    alcanzan) y le da a cada web un temporal propio; la web que incluye la
+    entrada de la función conserva el operando original (los parámetros
+    siguen llegando donde se espera). Con temporales reciclados por el
+    generador, un mismo t0 tiene muchas vidas independientes: separadas, sus
+    intervalos son cortos y dejan de cruzar llamadas. Reescribe el código de
+    la función; devuelve cuántas webs nuevas se crearon.
+    """
+    f = prog.functions[fi]
+    code = prog.code
+    ops, arrays = code.op, (code.d, code.a, code.b)
+    ds = code.d
+    values = tracked_values(prog, fi)
+    if not values:
+        return 0
+    index = {v: k for k, v in enumerate(values)}
+    # definiciones: primero una ficticia por valor (la entrada), luego las reales
+    def_value = list(values)
+    def_at: Dict[int, int] = {}
+    for i in range(f.start, f.end):
+        if ops[i] in DEST_OPS and ds[i] in index:
+            def_at[i] = len(def_value)
+            def_value.append(ds[i])
+    masks: Dict[int, int] = {v: 1 << k for k, v in enumerate(values)}
+    for k in range(len(values), len(def_value)):
+        masks[def_value[k]] |= 1 << k
+
+    cfg = build_tac_cfg(prog, f)
+    n = len(cfg)
+    gen, kill = [0] * n, [0] * n
+    blocks = []
+    for blk in range(n):
+        r = cfg.item_range(blk)
+        items = cfg.items[r.start:r.stop] if r else []
+        blocks.append(items)
+        g = kl = 0
+        for i in items:
+            k = def_at.get(i)
+            if k is not None:
+                m = masks[def_value[k]]
+                g = (g & ~m) | (1 << k)
+                kl |= m
+        gen[blk], kill[blk] = g, kl
+    reach = solve(cfg, gen, kill, forward=True, boundary=(1 << len(values)) - 1)
+
+    parent = list(range(len(def_value)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    uses: List[tuple] = []          # (posición, slot, una definición que la alcanza)
+    for blk in range(n):
+        cur = reach.in_[blk]
+        for i in blocks[blk]:
+            for slot in READS[ops[i]]:
+                v = arrays[slot][i]
+                k0 = index.get(v)
+                if k0 is None:
+                    continue
+                m = cur & masks[v]
+                first = None
+                while m:
+                    low = m & -m
+                    k = low.bit_length() - 1
+                    m ^= low
+                    if first is None:
+                        first = k
+                    else:
+                        ra, rb = find(first), find(k)
+                        if ra != rb:
+                            parent[rb] = ra
+                uses.append((i, slot, k0 if first is None else first))
+            k = def_at.get(i)
+            if k is not None:
+                cur = (cur & ~masks[def_value[k]]) | (1 << k)
+
+    webs: Dict[int, int] = {}
+    for k in range(len(values)):
+        webs[find(k)] = values[k]
+    created = 0
+    for k in range(len(values), len(def_value)):
+        root = find(k)
+        if root not in webs:
+            webs[root] = operand(K_TEMP, f.temps)
+            f.temps += 1
+            created += 1
+    for i, k in def_at.items():
+        ds[i] = webs[find(k)]
+    for i, slot, k in uses:
+        arrays[slot][i] = webs[find(k)]
+    return created
+
+
+class LinearScan:
+    """
+    Asignación de registros por linear scan (Poletto y Sarkar). Los
+    intervalos se recorren por inicio; los que cruzan una llamada solo
+    pueden ir a registros $s (los guarda la función llamada), el resto
+    prefiere $t (no hay que guardarlos en el prólogo) y usa $s si no queda
+    ninguno. Sin registro libre se derrama el intervalo que termina más
+    tarde entre el actual y los activos que podrían cederle el suyo.
+    """
+
+    def __init__(self, t_regs: Sequence[str] = T_REGS, s_regs: Sequence[str] = S_REGS):
+        self.t_regs = tuple(t_regs)
+        self.s_regs = tuple(s_regs)
+        self.spilled: List[Interval] = []
+        self.used_s: Set[str] = set()
+
+    def allocate(self, intervals: List[Interval]) -> List[Interval]:
+        """Asigna 'reg' en cada intervalo (None = spill) y devuelve la misma lista."""
+        free_t = list(reversed(self.t_regs))
+        free_s = list(reversed(self.s_regs))
+        active: List[Interval] = []              # ordenados por 'end'
+        self.spilled = []
+        for iv in sorted(intervals, key=lambda x: (x.start, x.end)):
+            while active and active[0].end < iv.start:
+                done = active.pop(0)
+                (free_s if done.reg in self.s_regs else free_t).append(done.reg)
+            if not iv.crosses_call and free_t:
+                iv.reg = free_t.pop()
+            elif free_s:
+                iv.reg = free_s.pop()
+            else:
+                victims = [a for a in active if a.reg in self.s_regs or not iv.crosses_call]
+                victim = max(victims, key=lambda a: a.end, default=None)
+                if victim is None or victim.end <= iv.end:
+                    self.spilled.append(iv)
+                    continue
+                iv.reg, victim.reg = victim.reg, None
+                active.remove(victim)
+                self.spilled.append(victim)
+            if iv.reg in self.s_regs:
+                self.used_s.add(iv.reg)
+            k = 0
+            while k < len(active) and active[k].end <= iv.end:
+                k += 1
+            active.insert(k, iv)
+        return intervals
@@ -0,0 +1,315 @@
+# Rutinas de soporte que se agregan al final de todo programa MIPS.
+#
+# Convención: argumentos en $a0/$a1, resultado en $v0. Solo modifican $a0-$a3,
+# $v0, $v1, $t8 y $t9 (más la pila, que dejan como estaba), así que llamar a
+# una rutina no obliga a guardar los registros que asigna el linear scan.
+# Los errores saltan a __raise con el mensaje en $a0: si hay un try activo se
+# restauran su $fp/$sp y se sigue en el manejador con el mensaje en $v0.
+
+HANDLER_SLOTS = 64            # try anidados (dinámicamente) como máximo
+HANDLER_SIZE = 12             # manejador, $fp, $sp
+
+DATA = (
+    ("__s_null", "null"),
+    ("__s_true", "true"),
+    ("__s_false", "false"),
+    ("__s_lbracket", "["),
+    ("__s_comma", ", "),
+    ("__s_rbracket", "]"),
+    ("__s_error", "Error: "),
+    ("__s_div", "División por cero"),
+    ("__s_null_index", "Acceso a índice de null"),
+    ("__s_null_field", "Acceso a campo de null"),
+    ("__s_index", "Índice fuera de rango: "),
+)
+
+TEXT = """
+__print_int:
+    li $v0, 1
+    syscall
+    li $a0, 10
+    li $v0, 11
+    syscall
+    jr $ra
+__print_str:
+    bne $a0, $zero, __print_str_go
+    la $a0, __s_null
+__print_str_go:
+    li $v0, 4
+    syscall
+    li $a0, 10
+    li $v0, 11
+    syscall
+    jr $ra
+
+# $v0 = largo del string en $a0 (usa $t8)
+__strlen:
+    move $v0, $a0
+__strlen_loop:
+    lbu $t8, 0($v0)
+    beq $t8, $zero, __strlen_done
+    addiu $v0, $v0, 1
+    j __strlen_loop
+__strlen_done:
+    subu $v0, $v0, $a0
+    jr $ra
+
+# $v0 = $a0 ++ $a1 (null se concatena como "null")
+__concat:
+    bne $a0, $zero, __concat_a
+    la $a0, __s_null
+__concat_a:
+    bne $a1, $zero, __concat_b
+    la $a1, __s_null
+__concat_b:
+    move $a2, $a0
+    move $a3, $ra
+    jal __strlen
+    move $t9, $v0
+    move $a0, $a1
+    jal __strlen
+    move $ra, $a3
+    addu $a0, $t9, $v0
+    addiu $a0, $a0, 4
+    li $t8, -4
+    and $a0, $a0, $t8
+    li $v0, 9
+    syscall
+    move $t9, $v0
+__concat_copy_a:
+    lbu $t8, 0($a2)
+    beq $t8, $zero, __concat_copy_b
+    sb $t8, 0($t9)
+    addiu $a2, $a2, 1
+    addiu $t9, $t9, 1
+    j __concat_copy_a
+__concat_copy_b:
+    lbu $t8, 0($a1)
+    sb $t8, 0($t9)
+    beq $t8, $zero, __concat_done
+    addiu $a1, $a1, 1
+    addiu $t9, $t9, 1
+    j __concat_copy_b
+__concat_done:
+    jr $ra
+
+# $v0 = texto decimal del entero en $a0
+__itos:
+    move $a2, $a0
+    li $a0, 12
+    li $v0, 9
+    syscall
+    addiu $t9, $v0, 11
+    sb $zero, 0($t9)
+    move $a3, $a2
+    bgez $a2, __itos_loop
+    subu $a2, $zero, $a2
+__itos_loop:
+    li $t8, 10
+    divu $a2, $t8
+    mfhi $t8
+    mflo $a2
+    addiu $t8, $t8, 48
+    addiu $t9, $t9, -1
+    sb $t8, 0($t9)
+    bne $a2, $zero, __itos_loop
+    bgez $a3, __itos_done
+    li $t8, 45
+    addiu $t9, $t9, -1
+    sb $t8, 0($t9)
+__itos_done:
+    move $v0, $t9
+    jr $ra
+
+# $v0 = -1, 0 o 1 comparando los strings $a0 y $a1 byte a byte
+__strcmp:
+    bne $a0, $zero, __strcmp_a
+    la $a0, __s_null
+__strcmp_a:
+    bne $a1, $zero, __strcmp_loop
+    la $a1, __s_null
+__strcmp_loop:
+    lbu $t8, 0($a0)
+    lbu $t9, 0($a1)
+    bne $t8, $t9, __strcmp_diff
+    beq $t8, $zero, __strcmp_eq
+    addiu $a0, $a0, 1
+    addiu $a1, $a1, 1
+    j __strcmp_loop
+__strcmp_diff:
+    sltu $v0, $t9, $t8
+    sltu $t8, $t8, $t9
+    subu $v0, $v0, $t8
+    jr $ra
+__strcmp_eq:
+    move $v0, $zero
+    jr $ra
+
+# $v0 = hash del string $a0 (h = 31*h + byte) módulo $a1, potencia de 2 (ver str_hash en tac.py)
+__strhash:
+    bne $a0, $zero, __strhash_go
+    la $a0, __s_null
+__strhash_go:
+    move $v0, $zero
+__strhash_loop:
+    lbu $t8, 0($a0)
+    beq $t8, $zero, __strhash_done
+    sll $t9, $v0, 5
+    subu $t9, $t9, $v0
+    addu $v0, $t9, $t8
+    addiu $a0, $a0, 1
+    j __strhash_loop
+__strhash_done:
+    addiu $a1, $a1, -1
+    and $v0, $v0, $a1
+    jr $ra
+
+# $v0 = texto del valor $a0 con tag $a1 (ver TAG_* en tac.py)
+__tostr:
+    srl $t8, $a1, 3
+    bne $t8, $zero, __tostr_array
+    andi $t8, $a1, 7
+    beq $t8, $zero, __tostr_string
+    li $t9, 1
+    beq $t8, $t9, __itos
+    li $t9, 2
+    beq $t8, $t9, __tostr_bool
+    li $t9, 3
+    beq $t8, $t9, __tostr_null
+    beq $a0, $zero, __tostr_null
+    lw $v0, 0($a0)
+    lw $v0, 0($v0)
+    jr $ra
+__tostr_string:
+    beq $a0, $zero, __tostr_null
+    move $v0, $a0
+    jr $ra
+__tostr_bool:
+    la $v0, __s_true
+    bne $a0, $zero, __tostr_ret
+    la $v0, __s_false
+__tostr_ret:
+    jr $ra
+__tostr_null:
+    la $v0, __s_null
+    jr $ra
+__tostr_array:
+    beq $a0, $zero, __tostr_null
+    addiu $sp, $sp, -20
+    sw $ra, 16($sp)
+    sw $a0, 12($sp)
+    addiu $a1, $a1, -8
+    sw $a1, 8($sp)
+    sw $zero, 4($sp)
+    la $t8, __s_lbracket
+    sw $t8, 0($sp)
+__tostr_array_loop:
+    lw $t8, 12($sp)
+    lw $t9, 4($sp)
+    lw $a0, 0($t8)
+    beq $t9, $a0, __tostr_array_end
+    beq $t9, $zero, __tostr_array_elem
+    lw $a0, 0($sp)
+    la $a1, __s_comma
+    jal __concat
+    sw $v0, 0($sp)
+    lw $t8, 12($sp)
+    lw $t9, 4($sp)
+__tostr_array_elem:
+    sll $t9, $t9, 2
+    addu $t8, $t8, $t9
+    lw $a0, 4($t8)
+    lw $a1, 8($sp)
+    jal __tostr
+    lw $a0, 0($sp)
+    move $a1, $v0
+    jal __concat
+    sw $v0, 0($sp)
+    lw $t9, 4($sp)
+    addiu $t9, $t9, 1
+    sw $t9, 4($sp)
+    j __tostr_array_loop
+__tostr_array_end:
+    lw $a0, 0($sp)
+    la $a1, __s_rbracket
+    jal __concat
+    lw $ra, 16($sp)
+    addiu $sp, $sp, 20
+    jr $ra
+
+# $v0 = arreglo de $a0 elementos: [largo, e0, e1, ...]
+__newarr:
+    bgez $a0, __newarr_ok
+    move $a0, $zero
+__newarr_ok:
+    move $a1, $a0
+    sll $a0, $a0, 2
+    addiu $a0, $a0, 4
+    li $v0, 9
+    syscall
+    sw $a1, 0($v0)
+    jr $ra
+
+# apila el manejador $a0 con el $fp y $sp actuales
+__try:
+    la $t8, __htop
+    lw $t9, 0($t8)
+    addiu $a1, $t9, 12
+    sw $a1, 0($t8)
+    la $t8, __hstack
+    addu $t8, $t8, $t9
+    sw $a0, 0($t8)
+    sw $fp, 4($t8)
+    sw $sp, 8($t8)
+    jr $ra
+__endtry:
+    la $t8, __htop
+    lw $t9, 0($t8)
+    addiu $t9, $t9, -12
+    sw $t9, 0($t8)
+    jr $ra
+
+__err_div:
+    la $a0, __s_div
+    j __raise
+__err_null_index:
+    la $a0, __s_null_index
+    j __raise
+__err_null_field:
+    la $a0, __s_null_field
+    j __raise
+# índice fuera de rango: el índice llega en $a1
+__err_index:
+    move $a0, $a1
+    jal __itos
+    la $a0, __s_index
+    move $a1, $v0
+    jal __concat
+    move $a0, $v0
+__raise:
+    la $t8, __htop
+    lw $t9, 0($t8)
+    beq $t9, $zero, __uncaught
+    addiu $t9, $t9, -12
+    sw $t9, 0($t8)
+    la $t8, __hstack
+    addu $t8, $t8, $t9
+    lw $fp, 4($t8)
+    lw $sp, 8($t8)
+    lw $t9, 0($t8)
+    move $v0, $a0
+    jr $t9
+__uncaught:
+    move $t9, $a0
+    la $a0, __s_error
+    li $v0, 4
+    syscall
+    move $a0, $t9
+    li $v0, 4
+    syscall
+    li $a0, 10
+    li $v0, 11
+    syscall
+    li $v0, 10
+    syscall
+"""
@@ -0,0 +1,432 @@
+from __future__ import annotations
+from typing import Dict, List, Sequence
+
+from codegen.mips import MipsProgram, parse_asm
+
+# Memoria: un solo bytearray con los datos al principio, el heap (sbrk) a
+# continuación y la pila al final, creciendo hacia abajo. Se accede por
+# bytes o por palabras (memoryview 'i' sobre el mismo buffer). Las
+# direcciones de código son índices en el arreglo de instrucciones: $ra, la
+# de una etiqueta de código y jr trabajan con esos índices (también los
+# '.word' con etiquetas de código, como las tablas de salto de un switch;
+# las vtables además llevan etiquetas de datos).
+
+DATA_BASE = 0x10010000
+MEMORY_SIZE = 8 << 20
+
+REGS = {f"${n}": i for i, n in enumerate((
+    "zero", "at", "v0", "v1", "a0", "a1", "a2", "a3",
+    "t0", "t1", "t2", "t3", "t4", "t5", "t6", "t7",
+    "s0", "s1", "s2", "s3", "s4", "s5", "s6", "s7",
+    "t8", "t9", "k0", "k1", "gp", "sp", "fp", "ra"))}
+REGS.update({f"${i}": i for i in range(32)})
+
+# Opcodes internos, en orden de frecuencia aproximada (el ciclo principal los
+# prueba en ese orden)
+(OP_ADDIU, OP_LW, OP_SW, OP_ADDU, OP_MOVE, OP_LI, OP_BEQ, OP_BNE, OP_J, OP_SLT,
+ OP_SLTI, OP_SUBU, OP_MUL, OP_JAL, OP_JR, OP_LA, OP_SLTU, OP_SLTIU, OP_XOR, OP_XORI,
+ OP_SLL, OP_SRL, OP_SRA, OP_AND, OP_ANDI, OP_OR, OP_ORI, OP_DIV, OP_DIVU, OP_MFLO,
+ OP_MFHI, OP_LB, OP_LBU, OP_SB, OP_BGEZ, OP_BLTZ, OP_BGTZ, OP_BLEZ, OP_BLT, OP_BGE,
+ OP_BGT, OP_BLE, OP_JALR, OP_SYSCALL, OP_NOP) = range(45)
+
+# mnemónico -> (opcode, forma de los operandos)
+#   r: registro   i: inmediato   l: etiqueta   m: offset(base)
+DISPATCH = {
+    "addiu": (OP_ADDIU, "rri"), "addi": (OP_ADDIU, "rri"),
+    "lw": (OP_LW, "rm"), "sw": (OP_SW, "rm"),
+    "addu": (OP_ADDU, "rrr"), "add": (OP_ADDU, "rrr"),
+    "move": (OP_MOVE, "rr"), "li": (OP_LI, "ri"),
+    "beq": (OP_BEQ, "rrl"), "bne": (OP_BNE, "rrl"),
+    "beqz": (OP_BEQ, "r0l"), "bnez": (OP_BNE, "r0l"),
+    "j": (OP_J, "l"), "b": (OP_J, "l"),
+    "slt": (OP_SLT, "rrr"), "slti": (OP_SLTI, "rri"),
+    "subu": (OP_SUBU, "rrr"), "sub": (OP_SUBU, "rrr"), "mul": (OP_MUL, "rrr"),
+    "jal": (OP_JAL, "l"), "jr": (OP_JR, "r"), "jalr": (OP_JALR, "r"), "la": (OP_LA, "rl"),
+    "sltu": (OP_SLTU, "rrr"), "sltiu": (OP_SLTIU, "rri"),
+    "xor": (OP_XOR, "rrr"), "xori": (OP_XORI, "rri"),
+    "sll": (OP_SLL, "rri"), "srl": (OP_SRL, "rri"), "sra": (OP_SRA, "rri"),
+    "and": (OP_AND, "rrr"), "andi": (OP_ANDI, "rri"), "or": (OP_OR, "rrr"), "ori": (OP_ORI, "rri"),
+    "div": (OP_DIV, "rr"), "divu": (OP_DIVU, "rr"), "mflo": (OP_MFLO, "r"), "mfhi": (OP_MFHI, "r"),
+    "lb": (OP_LB, "rm"), "lbu": (OP_LBU, "rm"), "sb": (OP_SB, "rm"),
+    "bgez": (OP_BGEZ, "rl"), "bltz": (OP_BLTZ, "rl"), "bgtz": (OP_BGTZ, "rl"), "blez": (OP_BLEZ, "rl"),
+    "blt": (OP_BLT, "rrl"), "bge": (OP_BGE, "rrl"), "bgt": (OP_BGT, "rrl"), "ble": (OP_BLE, "rrl"),
+    "syscall": (OP_SYSCALL, ""), "nop": (OP_NOP, ""),
+}
+
+# Estimación de ciclos por instrucción (pipeline simple de 5 etapas): las
+# cargas pagan un ciclo más por el uso posterior típico, los saltos tomados
+# uno más por la burbuja, mul y div lo que tardan en la unidad de multiplicación.
+CYCLES = [1] * (OP_NOP + 1)
+CYCLES[OP_LW] = CYCLES[OP_LB] = CYCLES[OP_LBU] = 2
+CYCLES[OP_MUL] = 4
+CYCLES[OP_DIV] = CYCLES[OP_DIVU] = 35
+TAKEN_PENALTY = 1
+
+_LOADS = (OP_LW, OP_LB, OP_LBU)
+_STORES = (OP_SW, OP_SB)
+
+
+class SimulatorError(Exception):
+    """Instrucción inválida, acceso fuera de memoria o límite de pasos."""
+
+
+def _wrap(v: int) -> int:
+    return ((v + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+class MipsSimulator:
+    """
+    Ejecuta el subconjunto de MIPS que emite codegen.mips. El programa se
+    predecodifica a tuplas (opcode, x, y, z) con registros como índices y
+    etiquetas resueltas; el ciclo principal despacha por opcode entero.
+    Cuenta instrucciones ejecutadas (total y por mnemónico), lw/sw y una
+    estimación de ciclos.
+    """
+
+    def __init__(self, program: MipsProgram, max_steps: int = 50_000_000, echo: bool = False):
+        self.program = program
+        self.max_steps = max_steps
+        self.echo = echo
+        self.memory = bytearray(MEMORY_SIZE)
+        self.words = memoryview(self.memory).cast("i")
+        self.symbols: Dict[str, int] = {}
+        self._fixups: List[tuple] = []
+        self._load_data(program.data)
+        self.code = self._predecode(program.text)
+        for pos, name in self._fixups:
+            addr = self.labels.get(name, self.symbols.get(name))
+            if addr is None:
+                raise SimulatorError(f"Etiqueta no definida: {name}")
+            self.words[pos >> 2] = addr
+        self.regs = [0] * 32
+        self.out: List[str] = []
+        self.steps = 0
+        self.loads = 0
+        self.stores = 0
+        self.cycles = 0
+        self.exit_code = 0
+        self.stack_bytes = 0                    # profundidad máxima de la pila
+        self.counts = [0] * len(self.code)      # ejecuciones de cada instrucción
+
+    # ---------------- Carga ----------------
+
+    def _load_data(self, data: Sequence[tuple]) -> None:
+        pos = 0
+        for label, directive, value in data:
+            if directive == ".asciiz":
+                raw = value.encode("utf-8") + b"\0"
+            elif directive == ".word":
+                pos = (pos + 3) & ~3
+                raw = bytearray()
+                for k, item in enumerate(str(value).split(",")):
+                    item = item.strip()
+                    try:
+                        raw += int(item, 0).to_bytes(4, "little", signed=True)
+                    except ValueError:
+                        self._fixups.append((pos + 4 * k, item))    # se resuelve al ver el código
+                        raw += bytes(4)
+            elif directive == ".space":
+                pos = (pos + 3) & ~3
+                raw = bytes(int(value))
+            else:
+                raise SimulatorError(f"Directiva no soportada: {directive}")
+            self.symbols[label] = DATA_BASE + pos
+            self.memory[pos:pos + len(raw)] = raw
+            pos += len(raw)
+        self.brk = DATA_BASE + ((pos + 7) & ~7)
+
+    def _predecode(self, text: Sequence[tuple]) -> List[tuple]:
+        labels: Dict[str, int] = {}
+        body = []
+        for ins in text:
+            if ins[0] == "label":
+                labels[ins[1]] = len(body)
+            else:
+                body.append(ins)
+        self.labels = labels
+        self.source = body
+
+        def target(name):
+            if name in labels:
+                return labels[name]
+            if name in self.symbols:
+                return self.symbols[name]
+            raise SimulatorError(f"Etiqueta no definida: {name}")
+
+        code = []
+        for ins in body:
+            entry = DISPATCH.get(ins[0])
+            if entry is None:
+                raise SimulatorError(f"Instrucción no soportada: {ins[0]}")
+            opcode, form = entry
+            args = []
+            k = 1
+            for f in form:
+                if f == "0":
+                    args.append(0)
+                    continue
+                x = ins[k]
+                k += 1
+                if f == "r":
+                    args.append(REGS[x])
+                elif f == "i":
+                    args.append(int(x))
+                elif f == "l":
+                    args.append(target(x))
+                else:                                   # m: offset(base) ya separados
+                    args.append(REGS[ins[k]])
+                    args.append(int(x))
+                    k += 1
+            while len(args) < 3:
+                args.append(0)
+            code.append((opcode, *args))
+        return code
+
+    # ---------------- Ejecución ----------------
+
+    def run(self, entry: str = "main") -> List[str]:
+        code = self.code
+        regs = self.regs
+        mem, words = self.memory, self.words
+        base = DATA_BASE
+        cycles_of = CYCLES
+        counts = self.counts
+        regs[29] = base + MEMORY_SIZE - 16          # $sp
+        regs[30] = regs[29]
+        regs[28] = self.symbols.get("__globals", base)
+        pc = self.labels[entry]
+        steps = 0
+        lo = hi = 0
+        loads = stores = extra = 0
+        low_sp = top = regs[29]
+        limit = self.max_steps
+        n = len(code)
+        try:
+            while pc < n:
+                op, x, y, z = code[pc]
+                counts[pc] += 1
+                pc += 1
+                steps += 1
+                if op == OP_ADDIU:
+                    regs[x] = _wrap(regs[y] + z)
+                    if x == 29 and regs[29] < low_sp:
+                        low_sp = regs[29]
+                elif op == OP_LW:
+                    regs[x] = words[(regs[y] + z - base) >> 2]
+                    loads += 1
+                elif op == OP_SW:
+                    words[(regs[y] + z - base) >> 2] = regs[x]
+                    stores += 1
+                elif op == OP_ADDU:
+                    regs[x] = _wrap(regs[y] + regs[z])
+                elif op == OP_MOVE:
+                    regs[x] = regs[y]
+                elif op == OP_LI:
+                    regs[x] = _wrap(y)
+                elif op == OP_BEQ:
+                    if regs[x] == regs[y]:
+                        pc = z
+                        extra += 1
+                elif op == OP_BNE:
+                    if regs[x] != regs[y]:
+                        pc = z
+                        extra += 1
+                elif op == OP_J:
+                    pc = x
+                elif op == OP_SLT:
+                    regs[x] = 1 if regs[y] < regs[z] else 0
+                elif op == OP_SLTI:
+                    regs[x] = 1 if regs[y] < z else 0
+                elif op == OP_SUBU:
+                    regs[x] = _wrap(regs[y] - regs[z])
+                elif op == OP_MUL:
+                    regs[x] = _wrap(regs[y] * regs[z])
+                elif op == OP_JAL:
+                    regs[31] = pc
+                    pc = x
+                elif op == OP_JR:
+                    pc = regs[x]
+                elif op == OP_LA:
+                    regs[x] = y
+                elif op == OP_SLTU:
+                    regs[x] = 1 if regs[y] & 0xFFFFFFFF < regs[z] & 0xFFFFFFFF else 0
+                elif op == OP_SLTIU:
+                    regs[x] = 1 if regs[y] & 0xFFFFFFFF < z & 0xFFFFFFFF else 0
+                elif op == OP_XOR:
+                    regs[x] = regs[y] ^ regs[z]
+                elif op == OP_XORI:
+                    regs[x] = regs[y] ^ (z & 0xFFFF)
+                elif op == OP_SLL:
+                    regs[x] = _wrap(regs[y] << z)
+                elif op == OP_SRL:
+                    regs[x] = _wrap((regs[y] & 0xFFFFFFFF) >> z)
+                elif op == OP_SRA:
+                    regs[x] = regs[y] >> z
+                elif op == OP_AND:
+                    regs[x] = regs[y] & regs[z]
+                elif op == OP_ANDI:
+                    regs[x] = regs[y] & (z & 0xFFFF)
+                elif op == OP_OR:
+                    regs[x] = regs[y] | regs[z]
+                elif op == OP_ORI:
+                    regs[x] = regs[y] | (z & 0xFFFF)
+                elif op == OP_DIV:
+                    a, b = regs[x], regs[y]
+                    if b != 0:
+                        q = abs(a) // abs(b)
+                        q = q if (a >= 0) == (b >= 0) else -q
+                        lo, hi = _wrap(q), _wrap(a - b * q)
+                elif op == OP_DIVU:
+                    a, b = regs[x] & 0xFFFFFFFF, regs[y] & 0xFFFFFFFF
+                    if b != 0:
+                        lo, hi = _wrap(a // b), _wrap(a % b)
+                elif op == OP_MFLO:
+                    regs[x] = lo
+                elif op == OP_MFHI:
+                    regs[x] = hi
+                elif op == OP_LB:
+                    v = mem[regs[y] + z - base]
+                    regs[x] = v - 256 if v > 127 else v
+                    loads += 1
+                elif op == OP_LBU:
+                    regs[x] = mem[regs[y] + z - base]
+                    loads += 1
+                elif op == OP_SB:
+                    mem[regs[y] + z - base] = regs[x] & 0xFF
+                    stores += 1
+                elif op == OP_BGEZ:
+                    if regs[x] >= 0:
+                        pc = y
+                        extra += 1
+                elif op == OP_BLTZ:
+                    if regs[x] < 0:
+                        pc = y
+                        extra += 1
+                elif op == OP_BGTZ:
+                    if regs[x] > 0:
+                        pc = y
+                        extra += 1
+                elif op == OP_BLEZ:
+                    if regs[x] <= 0:
+                        pc = y
+                        extra += 1
+                elif op == OP_BLT:
+                    if regs[x] < regs[y]:
+                        pc = z
+                        extra += 1
+                elif op == OP_BGE:
+                    if regs[x] >= regs[y]:
+                        pc = z
+                        extra += 1
+                elif op == OP_BGT:
+                    if regs[x] > regs[y]:
+                        pc = z
+                        extra += 1
+                elif op == OP_BLE:
+                    if regs[x] <= regs[y]:
+                        pc = z
+                        extra += 1
+                elif op == OP_JALR:
+                    regs[31] = pc
+                    pc = regs[x]
+                elif op == OP_SYSCALL:
+                    if not self._syscall(regs):
+                        break
+                regs[0] = 0
+                if steps > limit:
+                    raise SimulatorError("Límite de pasos excedido")
+        except (IndexError, ValueError) as e:
+            raise SimulatorError(f"Acceso inválido a memoria en la instrucción {pc - 1}: "
+                                 f"{self.source[pc - 1]}") from e
+        finally:
+            self.steps = steps
+            self.loads, self.stores = loads, stores
+            self.stack_bytes = top - low_sp
+            self.cycles = sum(c * cycles_of[code[i][0]] for i, c in enumerate(counts) if c) + extra
+        return self.lines()
+
+    def _syscall(self, regs: List[int]) -> bool:
+        """Devuelve False cuando el programa termina."""
+        service = regs[2]
+        if service == 1:
+            self._write(str(regs[4]))
+        elif service == 4:
+            start = regs[4] - DATA_BASE
+            end = self.memory.index(0, start)
+            self._write(self.memory[start:end].decode("utf-8", errors="replace"))
+        elif service == 11:
+            self._write(chr(regs[4] & 0xFF))
+        elif service == 9:
+            addr = self.brk
+            self.brk = (self.brk + regs[4] + 7) & ~7
+            if self.brk - DATA_BASE > MEMORY_SIZE - (1 << 20):
+                raise SimulatorError("Heap agotado")
+            regs[2] = addr
+        elif service in (10, 17):
+            self.exit_code = regs[4] if service == 17 else 0
+            return False
+        else:
+            raise SimulatorError(f"Syscall no soportada: {service}")
+        return True
+
+    def _write(self, s: str) -> None:
+        self.out.append(s)
+        if self.echo:
+            print(s, end="")
+
+    def lines(self) -> List[str]:
+        """La salida como líneas (igual que TacInterpreter.output)."""
+        text = "".join(self.out)
+        if text.endswith("\n"):
+            text = text[:-1]
+        return text.split("\n") if text else []
+
+    def op_counts(self) -> Dict[str, int]:
+        """Instrucciones ejecutadas por mnemónico."""
+        out: Dict[str, int] = {}
+        for ins, c in zip(self.source, self.counts):
+            if c:
+                out[ins[0]] = out.get(ins[0], 0) + c
+        return out
+
+
+def load_asm(text: str) -> MipsProgram:
+    """MipsProgram a partir del texto de un .s (secciones .data y .text)."""
+    prog = MipsProgram()
+    section = ".text"
+    code_lines = []
+    for line in text.splitlines():
+        s = line.strip()
+        if s in (".data", ".text"):
+            section = s
+            continue
+        if section == ".data" and s and not s.startswith("#"):
+            label, _, rest = s.partition(":")
+            directive, _, value = rest.strip().partition(" ")
+            value = value.strip()
+            if directive == ".asciiz":
+                value = _unquote(value)
+            prog.data.append((label.strip(), directive, value))
+        elif section == ".text":
+            code_lines.append(line)
+    prog.text = parse_asm("\n".join(code_lines))
+    return prog
+
+
+def _unquote(s: str) -> str:
+    body = s[1:-1]
+    out = []
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if c == "\\" and i + 1 < len(body):
+            i += 1
+            c = {"n": "\n", "t": "\t", "0": "\0"}.get(body[i], body[i])
+        out.append(c)
+        i += 1
+    return "".join(out)
+
+
+def run_mips(program: MipsProgram, **kwargs) -> List[str]:
+    """Ejecuta el programa y devuelve las líneas impresas."""
+    return MipsSimulator(program, **kwargs).run()
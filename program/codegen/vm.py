@@ -0,0 +1,309 @@
+from __future__ import annotations
+from typing import List
+
+from intermediate.tac import str_hash
+from intermediate.interp import TacRuntimeError, to_text, int_div, int_mod, same_value
+from codegen.bytecode import (
+    BytecodeProgram,
+    B_LOAD, B_STORE, B_CONST, B_LOAD_GLOBAL, B_STORE_GLOBAL, B_LOAD_OUTER, B_STORE_OUTER,
+    B_MOVE, B_ADD, B_SUB, B_MUL, B_DIV, B_MOD, B_CONCAT,
+    B_EQ, B_NE, B_LT, B_LE, B_GT, B_GE, B_NEG, B_NOT, B_TOSTR, B_STRCMP, B_HASH,
+    B_JUMP, B_JUMP_IF_FALSE, B_JUMP_IF_TRUE, B_SWITCH,
+    B_CALL, B_CALL_VALUE, B_RETURN, B_RETURN_NONE, B_POP,
+    B_PRINT, B_NEWARR, B_ALOAD, B_ASTORE, B_LEN, B_NEW, B_GETF, B_SETF, B_METHOD,
+    B_TRY, B_ENDTRY, B_CATCH, B_ADD_CONST,
+)
+
+
+class _Frame:
+    __slots__ = ("func", "slots", "ret", "handlers")
+
+    def __init__(self, func: int, slots: list, ret: int):
+        self.func = func
+        self.slots = slots
+        self.ret = ret                     # pc al que vuelve el 'return'
+        self.handlers: List[tuple] = []    # (pc del catch, altura de la pila) de los try activos
+
+
+class StackVM:
+    """
+    Ejecuta un BytecodeProgram con un solo ciclo de despacho: el pc, los
+    slots del marco actual y la pila de operandos son variables locales, y
+    los opcodes van ordenados por frecuencia. Misma semántica que
+    TacInterpreter (salida, errores y try/catch), pensada para correr
+    programas y no para contar instrucciones: solo los saltos tomados y
+    las llamadas descuentan del límite de pasos.
+    """
+
+    def __init__(self, bc: BytecodeProgram, max_steps: int = 10_000_000, echo: bool = False):
+        self.bc = bc
+        self.max_steps = max_steps
+        self.echo = echo
+        self.output: List[str] = []
+        self.steps = 0
+        self.globals: list = [None] * bc.globals
+        self._funcs = {f.name: i for i, f in enumerate(bc.functions)}
+
+    def _callee(self, name) -> int:
+        fi = self._funcs.get(name)
+        if fi is None:
+            raise TacRuntimeError(f"Función no definida: {name}")
+        return fi
+
+    def run(self) -> List[str]:
+        bc = self.bc
+        code, consts, tables, vtables = bc.code, bc.consts, bc.tables, bc.vtables
+        funcs = bc.functions
+        glob = self.globals
+        output, echo = self.output, self.echo
+        # marcos activos de cada función: las variables capturadas se leen del último
+        active: List[List[list]] = [[] for _ in funcs]
+        main = funcs[bc.main]
+        slots = [None] * main.slots
+        frame = _Frame(bc.main, slots, -1)
+        frames = [frame]
+        active[bc.main].append(slots)
+        stack: list = []
+        push, pop = stack.append, stack.pop
+        pc = main.entry
+        budget = self.max_steps
+        error = None
+
+        while True:
+            try:
+                while True:
+                    op = code[pc]
+                    if op == B_LOAD:
+                        push(slots[code[pc + 1]])
+                        pc += 2
+                    elif op == B_STORE:
+                        slots[code[pc + 1]] = pop()
+                        pc += 2
+                    elif op == B_CONST:
+                        push(consts[code[pc + 1]])
+                        pc += 2
+                    elif op == B_JUMP_IF_FALSE:
+                        if pop():
+                            pc += 2
+                        else:
+                            pc = code[pc + 1]
+                            budget -= 1
+                            if budget < 0:
+                                raise TacRuntimeError("Límite de pasos excedido")
+                    elif op == B_MOVE:
+                        slots[code[pc + 1]] = slots[code[pc + 2]]
+                        pc += 3
+                    elif op == B_ADD_CONST:
+                        slots[code[pc + 1]] = slots[code[pc + 2]] + consts[code[pc + 3]]
+                        pc += 4
+                    elif op == B_ADD:
+                        y = pop()
+                        stack[-1] += y
+                        pc += 1
+                    elif op == B_LT:
+                        y = pop()
+                        stack[-1] = stack[-1] < y
+                        pc += 1
+                    elif op == B_JUMP:
+                        pc = code[pc + 1]
+                        budget -= 1
+                        if budget < 0:
+                            raise TacRuntimeError("Límite de pasos excedido")
+                    elif op == B_LOAD_GLOBAL:
+                        push(glob[code[pc + 1]])
+                        pc += 2
+                    elif op == B_STORE_GLOBAL:
+                        glob[code[pc + 1]] = pop()
+                        pc += 2
+                    elif op == B_ALOAD:
+                        i = pop()
+                        arr = stack[-1]
+                        if arr is None:
+                            raise TacRuntimeError("Acceso a índice de null")
+                        if not 0 <= i < len(arr):
+                            raise TacRuntimeError(f"Índice fuera de rango: {i}")
+                        stack[-1] = arr[i]
+                        pc += 1
+                    elif op == B_SUB:
+                        y = pop()
+                        stack[-1] -= y
+                        pc += 1
+                    elif op == B_MUL:
+                        y = pop()
+                        stack[-1] *= y
+                        pc += 1
+                    elif op == B_LE:
+                        y = pop()
+                        stack[-1] = stack[-1] <= y
+                        pc += 1
+                    elif op == B_GT:
+                        y = pop()
+                        stack[-1] = stack[-1] > y
+                        pc += 1
+                    elif op == B_GE:
+                        y = pop()
+                        stack[-1] = stack[-1] >= y
+                        pc += 1
+                    elif op == B_EQ:
+                        y = pop()
+                        stack[-1] = same_value(stack[-1], y)
+                        pc += 1
+                    elif op == B_NE:
+                        y = pop()
+                        stack[-1] = not same_value(stack[-1], y)
+                        pc += 1
+                    elif op == B_CALL or op == B_CALL_VALUE:
+                        if op == B_CALL:
+                            fi, n = code[pc + 1], code[pc + 2]
+                            ret = pc + 3
+                        else:
+                            fi, n = self._callee(pop()), code[pc + 1]
+                            ret = pc + 2
+                        budget -= 1
+                        if budget < 0:
+                            raise TacRuntimeError("Límite de pasos excedido")
+                        f = funcs[fi]
+                        slots = [None] * f.slots
+                        if n:
+                            k = min(n, f.params)
+                            slots[:k] = stack[len(stack) - n:len(stack) - n + k]
+                            del stack[len(stack) - n:]
+                        frame = _Frame(fi, slots, ret)
+                        frames.append(frame)
+                        active[fi].append(slots)
+                        pc = f.entry
+                    elif op == B_RETURN or op == B_RETURN_NONE:
+                        if op == B_RETURN_NONE:
+                            push(None)
+                        frames.pop()
+                        active[frame.func].pop()
+                        if not frames:
+                            return output
+                        pc = frame.ret
+                        frame = frames[-1]
+                        slots = frame.slots
+                    elif op == B_POP:
+                        pop()
+                        pc += 1
+                    elif op == B_LOAD_OUTER:
+                        owner = active[code[pc + 1]]
+                        push(owner[-1][code[pc + 2]] if owner else None)
+                        pc += 3
+                    elif op == B_STORE_OUTER:
+                        owner = active[code[pc + 1]]
+                        value = pop()
+                        if owner:
+                            owner[-1][code[pc + 2]] = value
+                        pc += 3
+                    elif op == B_JUMP_IF_TRUE:
+                        if pop():
+                            pc = code[pc + 1]
+                            budget -= 1
+                            if budget < 0:
+                                raise TacRuntimeError("Límite de pasos excedido")
+                        else:
+                            pc += 2
+                    elif op == B_CONCAT:
+                        y = pop()
+                        stack[-1] = to_text(stack[-1]) + to_text(y)
+                        pc += 1
+                    elif op == B_DIV:
+                        y = pop()
+                        stack[-1] = int_div(stack[-1], y)
+                        pc += 1
+                    elif op == B_MOD:
+                        y = pop()
+                        stack[-1] = int_mod(stack[-1], y)
+                        pc += 1
+                    elif op == B_ASTORE:
+                        value, i, arr = pop(), pop(), pop()
+                        if arr is None:
+                            raise TacRuntimeError("Acceso a índice de null")
+                        if not 0 <= i < len(arr):
+                            raise TacRuntimeError(f"Índice fuera de rango: {i}")
+                        arr[i] = value
+                        pc += 1
+                    elif op == B_LEN:
+                        stack[-1] = len(stack[-1])
+                        pc += 1
+                    elif op == B_GETF:
+                        obj = stack[-1]
+                        if obj is None:
+                            raise TacRuntimeError("Acceso a campo de null")
+                        stack[-1] = obj.get(code[pc + 1])
+                        pc += 2
+                    elif op == B_SETF:
+                        value, obj = pop(), pop()
+                        if obj is None:
+                            raise TacRuntimeError("Acceso a campo de null")
+                        obj[code[pc + 1]] = value
+                        pc += 2
+                    elif op == B_METHOD:
+                        obj = stack[-1]
+                        if obj is None:
+                            raise TacRuntimeError("Acceso a campo de null")
+                        stack[-1] = vtables[obj["__class__"]][code[pc + 1]]
+                        pc += 2
+                    elif op == B_NEW:
+                        push({"__class__": consts[code[pc + 1]]})
+                        pc += 2
+                    elif op == B_NEWARR:
+                        stack[-1] = [None] * stack[-1]
+                        pc += 1
+                    elif op == B_PRINT:
+                        line = to_text(pop())
+                        output.append(line)
+                        if echo:
+                            print(line)
+                        pc += 1
+                    elif op == B_SWITCH:
+                        table = tables[code[pc + 2]]
+                        k = pop() - consts[code[pc + 1]] + 1
+                        pc = table[k if 0 < k < len(table) else 0]
+                    elif op == B_NEG:
+                        stack[-1] = -stack[-1]
+                        pc += 1
+                    elif op == B_NOT:
+                        stack[-1] = not stack[-1]
+                        pc += 1
+                    elif op == B_TOSTR:
+                        stack[-1] = to_text(stack[-1])
+                        pc += 1
+                    elif op == B_STRCMP:
+                        y = pop()
+                        x = stack[-1]
+                        stack[-1] = (x > y) - (x < y)
+                        pc += 1
+                    elif op == B_HASH:
+                        stack[-1] = str_hash(to_text(stack[-1]), code[pc + 1])
+                        pc += 2
+                    elif op == B_TRY:
+                        frame.handlers.append((code[pc + 1], len(stack)))
+                        pc += 2
+                    elif op == B_ENDTRY:
+                        frame.handlers.pop()
+                        pc += 1
+                    elif op == B_CATCH:
+                        push(error)
+                        pc += 1
+                    else:
+                        raise TacRuntimeError(f"Opcode desconocido: {op}")
+            except TacRuntimeError as e:
+                # al catch más interno, desapilando marcos si hace falta
+                while frames and not frames[-1].handlers:
+                    active[frames.pop().func].pop()
+                if not frames:
+                    self.steps = self.max_steps - budget
+                    raise
+                frame = frames[-1]
+                slots = frame.slots
+                pc, height = frame.handlers.pop()
+                del stack[height:]
+                error = str(e)
+            finally:
+                self.steps = self.max_steps - budget
+
+
+def run_bytecode(bc: BytecodeProgram, **kwargs) -> List[str]:
+    """Ejecuta el bytecode y devuelve las líneas impresas."""
+    return StackVM(bc, **kwargs).run()
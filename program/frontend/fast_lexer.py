@@ -0,0 +1,151 @@
+from __future__ import annotations
+import re
+
+from antlr4 import InputStream
+from antlr4.Recognizer import Recognizer
+from antlr4.Token import Token, CommonToken
+from antlr4.CommonTokenFactory import CommonTokenFactory
+
+from CompiscriptLexer import CompiscriptLexer
+
+
+LEXERS = ("antlr", "fast")
+
+
+def _token_tables():
+    """Tipos de token de keywords y operadores, tomados de la gramática generada."""
+    keywords: dict[str, int] = {}
+    operators: dict[str, int] = {}
+    for ttype, lit in enumerate(CompiscriptLexer.literalNames):
+        if not (lit.startswith("'") and lit.endswith("'")):
+            continue
+        text = lit[1:-1]
+        (keywords if text[0].isalpha() else operators)[text] = ttype
+    return keywords, operators
+
+
+KEYWORDS, OPERATORS = _token_tables()
+T_LITERAL = CompiscriptLexer.Literal
+T_IDENTIFIER = CompiscriptLexer.Identifier
+
+# Un único regex maestro. El orden de las alternativas reproduce la regla de
+# ANTLR (match más largo; a igual largo gana la regla declarada primero):
+#   - comentarios antes que el operador '/'
+#   - identificadores/keywords juntos (la keyword se decide con un dict)
+#   - operadores de dos caracteres antes que los de uno
+_OPS = "|".join(re.escape(op) for op in sorted(OPERATORS, key=len, reverse=True))
+MASTER = re.compile(
+    r"(?P<WS>[ \t\r\n]+)"
+    r"|(?P<COMMENT>//[^\r\n]*)"
+    r"|(?P<ML>/\*.*?\*/)"
+    r'|(?P<STR>"[^"\r\n]*")'
+    r"|(?P<INT>[0-9]+)"
+    r"|(?P<ID>[a-zA-Z_][a-zA-Z0-9_]*)"
+    rf"|(?P<OP>{_OPS})",
+    re.DOTALL,
+)
+_UNTERMINATED_STR = re.compile(r'"[^\r\n]*[\r\n]?')
+
+
+class FastLexer(Recognizer):
+    """
+    Lexer alternativo basado en un regex compilado. Emite CommonToken con los
+    mismos tipos, texto, línea, columna e índices que CompiscriptLexer, así
+    que puede alimentar a un CommonTokenStream y al parser generado sin cambios.
+    """
+
+    literalNames = CompiscriptLexer.literalNames
+    symbolicNames = CompiscriptLexer.symbolicNames
+    ruleNames = CompiscriptLexer.ruleNames
+
+    def __init__(self, input_stream: InputStream):
+        super().__init__()
+        self._input = input_stream
+        self._text: str = input_stream.strdata
+        self._pos = 0
+        self.line = 1
+        self.column = 0
+        self._factory = CommonTokenFactory.DEFAULT
+        self._source = (self, input_stream)
+
+    @property
+    def inputStream(self):
+        return self._input
+
+    def getSourceName(self) -> str:
+        return self._input.getSourceName() if hasattr(self._input, "getSourceName") else "<fast>"
+
+    def _advance(self, chunk: str) -> None:
+        nl = chunk.count("\n")
+        if nl:
+            self.line += nl
+            self.column = len(chunk) - chunk.rfind("\n") - 1
+        else:
+            self.column += len(chunk)
+        self._pos += len(chunk)
+
+    def _error_chunk(self, pos: int) -> str:
+        """Texto que el lexer de ANTLR descarta al no reconocer un token en 'pos'."""
+        text = self._text
+        c = text[pos]
+        if c == '"':
+            # string sin cerrar: ANTLR consume hasta el salto de línea (incluido) o EOF
+            return _UNTERMINATED_STR.match(text, pos).group(0)
+        if c in "&|" and pos + 1 < len(text):
+            return text[pos:pos + 2]
+        return c
+
+    def _report(self, chunk: str) -> None:
+        shown = chunk.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+        self.getErrorListenerDispatch().syntaxError(
+            self, None, self.line, self.column, f"token recognition error at: '{shown}'", None)
+
+    def nextToken(self) -> Token:
+        text = self._text
+        match = MASTER.match
+        while True:
+            pos = self._pos
+            if pos >= len(text):
+                return self._factory.create(self._source, Token.EOF, None, Token.DEFAULT_CHANNEL,
+                                            pos, pos - 1, self.line, self.column)
+            m = match(text, pos)
+            if m is None:
+                chunk = self._error_chunk(pos)
+                self._report(chunk)
+                self._advance(chunk)
+                continue
+            kind = m.lastgroup
+            value = m.group(kind)
+            if kind == "WS" or kind == "COMMENT" or kind == "ML":
+                self._advance(value)
+                continue
+            if kind == "ID":
+                ttype = KEYWORDS.get(value, T_IDENTIFIER)
+            elif kind == "OP":
+                ttype = OPERATORS[value]
+            else:
+                ttype = T_LITERAL
+            tok = CommonToken(self._source, ttype, Token.DEFAULT_CHANNEL, pos, pos + len(value) - 1)
+            tok.line = self.line
+            tok.column = self.column
+            tok.text = value
+            self.column += len(value)      # los tokens emitidos nunca contienen saltos de línea
+            self._pos = pos + len(value)
+            return tok
+
+    def getAllTokens(self) -> list[Token]:
+        tokens = []
+        t = self.nextToken()
+        while t.type != Token.EOF:
+            tokens.append(t)
+            t = self.nextToken()
+        return tokens
+
+
+def create_lexer(input_stream: InputStream, kind: str = "antlr"):
+    """Crea el lexer pedido: 'antlr' (CompiscriptLexer generado) o 'fast' (FastLexer)."""
+    if kind == "fast":
+        return FastLexer(input_stream)
+    if kind == "antlr":
+        return CompiscriptLexer(input_stream)
+    raise ValueError(f"Lexer desconocido: {kind}")
@@ -0,0 +1,87 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+from antlr4 import CommonTokenStream
+from antlr4.Token import Token
+
+from frontend.syntax_errors import SyntaxErrorCollector, SYNTAX_MODES
+
+
+class SlidingTokenStream(CommonTokenStream):
+    """
+    CommonTokenStream que puede soltar los tokens ya consumidos. Se llama a
+    release_consumed() solo entre sentencias de nivel superior, cuando el
+    parser no tiene marcas ni retrocesos pendientes. Los tokenIndex quedan
+    relativos a la ventana actual (consistentes con self.tokens).
+    """
+
+    def __init__(self, lexer):
+        super().__init__(lexer)
+        self.released = 0           # tokens descartados en total
+        self.max_window = 0         # mayor cantidad de tokens retenidos a la vez
+
+    def release_consumed(self) -> None:
+        self.max_window = max(self.max_window, len(self.tokens))
+        if self.index <= 0:
+            return
+        keep = self.tokens[self.index:]
+        for i, t in enumerate(keep):
+            t.tokenIndex = i
+        self.released += self.index
+        self.tokens = keep
+        self.index = 0
+
+
+@dataclass
+class StreamStats:
+    statements: int = 0
+    checked: int = 0
+    skipped: int = 0            # sentencias no chequeadas por errores sintácticos
+    tokens: int = 0
+    max_window: int = 0
+
+
+def stream_check(parser, stream: SlidingTokenStream, checker,
+                 syntax: SyntaxErrorCollector, mode: str = "skip") -> StreamStats:
+    """
+    Parsea y chequea una sentencia de nivel superior a la vez. Las
+    declaraciones quedan en la tabla de símbolos persistente del checker y el
+    subárbol y sus tokens se sueltan antes de parsear la siguiente sentencia,
+    así que la memoria pico depende de la sentencia más grande y no del archivo.
+
+    Con errores sintácticos: 'full' chequea todo; 'partial' salta solo las
+    sentencias afectadas; 'skip' deja de chequear a partir del primer error
+    (los errores sintácticos restantes se siguen recolectando).
+    """
+    if mode not in SYNTAX_MODES:
+        raise ValueError(f"Modo de errores sintácticos inválido: {mode}")
+    stats = StreamStats()
+    semantic_on = True
+    while stream.LA(1) != Token.EOF:
+        before = syntax.count()
+        start = stream.index
+        stmt = parser.statement()
+        if stream.index == start:
+            parser.consume()        # la recuperación no avanzó: evita un ciclo infinito
+        stats.statements += 1
+
+        broken = syntax.count() > before
+        if broken and mode == "skip":
+            semantic_on = False
+        if semantic_on and (not broken or mode == "full"):
+            checker.visit(stmt)
+            checker.finish()
+            checker.cfgs.clear()    # los CFG apuntan al subárbol que se va a soltar
+            stats.checked += 1
+        else:
+            stats.skipped += 1
+
+        # Soltar el subárbol y sus tokens antes de la siguiente sentencia.
+        stmt = None
+        parser._ctx = None
+        parser._errHandler.reset(parser)
+        stats.tokens += stream.index
+        stream.release_consumed()
+
+    stats.max_window = stream.max_window
+    return stats
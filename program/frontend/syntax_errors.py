@@ -0,0 +1,89 @@
+from __future__ import annotations
+from antlr4.error.ErrorListener import ErrorListener
+
+from semantic.error_reporter import ErrorReporter
+
+
+E_SYNTAX = "E_SYNTAX"
+
+# Qué hacer con el análisis semántico cuando hubo errores sintácticos:
+#   skip    -> no se corre el TypeChecker (falla rápido)
+#   partial -> solo se chequean las sentencias de nivel superior no afectadas
+#   full    -> se chequea todo el árbol recuperado (comportamiento anterior)
+SYNTAX_MODES = ("skip", "partial", "full")
+
+
+class SyntaxErrorCollector(ErrorListener):
+    """
+    Listener de ANTLR que envía los errores léxicos/sintácticos al ErrorReporter
+    con el código E_SYNTAX, en lugar de imprimirlos en consola.
+    """
+
+    def __init__(self, reporter: ErrorReporter):
+        super().__init__()
+        self.reporter = reporter
+        self.positions: list[tuple[int, int]] = []   # (línea, columna) de cada error
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.reporter.report(line, column, E_SYNTAX, msg)
+        self.positions.append((line, column))
+
+    def has_errors(self) -> bool:
+        return bool(self.positions)
+
+    def count(self) -> int:
+        return len(self.positions)
+
+
+def attach_syntax_listener(lexer, parser, reporter: ErrorReporter) -> SyntaxErrorCollector:
+    """Reemplaza los listeners de consola del lexer y del parser por un colector."""
+    collector = SyntaxErrorCollector(reporter)
+    for recognizer in (lexer, parser):
+        if recognizer is None:
+            continue
+        recognizer.removeErrorListeners()
+        recognizer.addErrorListener(collector)
+    return collector
+
+
+def _span(stmt):
+    start, stop = stmt.start, stmt.stop
+    if start is None or stop is None:
+        return None
+    end_col = stop.column + len(stop.text or "")
+    return (start.line, start.column), (stop.line, end_col)
+
+
+def is_affected(stmt, positions) -> bool:
+    """True si la sentencia tiene un error de recuperación o contiene alguna posición de error."""
+    if stmt.exception is not None:
+        return True
+    span = _span(stmt)
+    if span is None:
+        return True
+    lo, hi = span
+    return any(lo <= p <= hi for p in positions)
+
+
+def clean_statements(tree, collector: SyntaxErrorCollector) -> list:
+    """Sentencias de nivel superior del programa que no fueron tocadas por errores sintácticos."""
+    positions = sorted(collector.positions)
+    return [s for s in tree.statement() if not is_affected(s, positions)]
+
+
+def run_checker(checker, tree, collector: SyntaxErrorCollector, mode: str = "skip") -> bool:
+    """
+    Corre el TypeChecker según el modo elegido. Devuelve True si se hizo algún
+    análisis semántico.
+    """
+    if mode not in SYNTAX_MODES:
+        raise ValueError(f"Modo de errores sintácticos inválido: {mode}")
+    if not collector.has_errors() or mode == "full":
+        checker.visit(tree)
+        return True
+    if mode == "skip":
+        return False
+    for stmt in clean_statements(tree, collector):
+        checker.visit(stmt)
+    checker.finish()
+    return True
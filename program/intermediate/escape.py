@@ -0,0 +1,40 @@
+from __future__ import annotations
+from typing import Set
+
+from intermediate.tac import TacProgram, CALL, K_NAME
+
+# Análisis de escape de las clausuras. Una función anidada 'escapa' si su
+# valor sale de la activación que la define: se devuelve, se guarda en una
+# variable, arreglo o campo, o se pasa como argumento. Si solo aparece como
+# destino de 'call', toda llamada ocurre mientras la función que la
+# contiene sigue viva, así que el entorno de esa función (y el de las que
+# la rodean) puede vivir en su marco en lugar del heap.
+
+
+def escaping_functions(prog: TacProgram) -> Set[int]:
+    """Funciones anidadas cuyo nombre se usa como valor y no solo como destino de 'call'."""
+    nested = {f.name: fi for fi, f in enumerate(prog.functions) if f.parent >= 0}
+    out: Set[int] = set()
+    for op, d, a, b in prog.code:
+        for k, x in enumerate((d, a, b)):
+            if x & 7 != K_NAME or (op == CALL and k == 1):
+                continue
+            fi = nested.get(prog.names[x >> 3])
+            if fi is not None:
+                out.add(fi)
+    return out
+
+
+def heap_environments(prog: TacProgram) -> Set[int]:
+    """
+    Funciones cuyo registro de entorno tiene que ir al heap: las que
+    contienen (a cualquier profundidad) una función anidada que escapa. Una
+    clausura que escapa llega por su cadena de enlaces a todos esos entornos.
+    """
+    out: Set[int] = set()
+    for fi in escaping_functions(prog):
+        parent = prog.functions[fi].parent
+        while parent >= 0 and parent not in out:
+            out.add(parent)
+            parent = prog.functions[parent].parent
+    return out
@@ -0,0 +1,651 @@
+from __future__ import annotations
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from intermediate.tac import (
+    TacProgram, TacBuffer,
+    MOV, ADD, SUB, MUL, DIV, MOD, CONCAT, EQ, NE, LT, LE, GT, GE, NEG, NOT, TOSTR, STRCMP, HASH,
+    GOTO, IF_FALSE, IF_TRUE, SWITCH, DEST_OPS, K_TEMP, K_VAR, K_INT, NONE, const_int, operand,
+)
+from intermediate.ssa import SsaFunction, Block, Phi, reads_of, has_try, switch_successor
+from intermediate.optimize import (
+    PassManager, PassStats, OptReport, is_const, const_value, make_const, fold_binary, _removable,
+)
+
+_BINARY = (ADD, SUB, MUL, DIV, MOD, CONCAT, EQ, NE, LT, LE, GT, GE, TOSTR, STRCMP, HASH)
+_COMMUTATIVE = (ADD, MUL, EQ, NE)
+_BOTTOM = -1                   # valor no constante en SCCP (los operandos son >= 0)
+
+
+def _is_memory(sf: SsaFunction, x: int) -> bool:
+    """Globales y variables capturadas: pueden cambiar en cualquier llamada."""
+    return x & 7 == K_VAR and x not in sf.own
+
+
+def _ssa_defs(sf: SsaFunction) -> Dict[int, Tuple[int, object]]:
+    defs: Dict[int, Tuple[int, object]] = {}
+    for b in sf.live_blocks():
+        for phi in b.phis:
+            defs[phi.dest] = (b.id, phi)
+        for ins in b.code:
+            if ins[0] in DEST_OPS and sf.tracked(ins[1]):
+                defs[ins[1]] = (b.id, ins)
+    return defs
+
+
+# ---------------------------------------------------------------------------
+# Propagación de constantes condicional dispersa (Wegman-Zadeck)
+# ---------------------------------------------------------------------------
+
+def sccp(sf: SsaFunction) -> Tuple[int, int]:
+    """
+    Propaga constantes por las aristas SSA marcando solo los arcos que
+    pueden ejecutarse: una phi cuyos argumentos constantes vienen solo de
+    arcos vivos sigue siendo constante aunque haya otros caminos. Al final
+    reemplaza los usos, fija los saltos con condición constante y borra los
+    bloques que nunca se ejecutan.
+    """
+    prog = sf.prog
+    defs = _ssa_defs(sf)
+    uses: Dict[int, List[Tuple[int, object]]] = {}
+    for b in sf.live_blocks():
+        for phi in b.phis:
+            for a in phi.args.values():
+                uses.setdefault(a, []).append((b.id, phi))
+        for ins in b.code:
+            for k in reads_of(ins):
+                uses.setdefault(ins[k], []).append((b.id, ins))
+        uses.setdefault(b.cond, []).append((b.id, b))
+
+    val: Dict[int, int] = {}                  # ausente = TOP
+
+    def value(x: int) -> Optional[int]:
+        if is_const(x):
+            return x
+        if x in defs:
+            return val.get(x)
+        return _BOTTOM
+
+    ssa_work: List[int] = []
+
+    def set_val(name: int, v: Optional[int]) -> None:
+        if v is not None and val.get(name) != v and val.get(name) != _BOTTOM:
+            val[name] = v
+            ssa_work.append(name)
+
+    edges: Set[Tuple[int, int]] = set()
+    executable: Set[int] = set()
+    flow: List[Tuple[int, int]] = [(-1, 0)]
+
+    def visit_phi(b: Block, phi: Phi) -> None:
+        v = None
+        for p, a in phi.args.items():
+            if (p, b.id) not in edges:
+                continue
+            x = value(a)
+            if x is None:
+                continue
+            if x == _BOTTOM or (v is not None and v != x):
+                v = _BOTTOM
+                break
+            v = x
+        set_val(phi.dest, v)
+
+    def visit_ins(ins: list) -> None:
+        op, d = ins[0], ins[1]
+        if op not in DEST_OPS or d not in defs:
+            return
+        if op == MOV:
+            set_val(d, value(ins[2]))
+            return
+        if op in _BINARY or op in (NEG, NOT):
+            args = [value(ins[k]) for k in reads_of(ins)]
+            if _BOTTOM in args:
+                set_val(d, _BOTTOM)
+                return
+            if None in args:
+                return
+            if op == NEG:
+                v = const_value(prog, args[0])
+                r = -v if type(v) is int else ...
+            elif op == NOT:
+                v = const_value(prog, args[0])
+                r = (not v) if type(v) is bool else ...
+            else:
+                r = fold_binary(op, const_value(prog, args[0]), const_value(prog, args[1]))
+            c = make_const(prog, r) if r is not ... else None
+            set_val(d, c if c is not None else _BOTTOM)
+            return
+        set_val(d, _BOTTOM)
+
+    def visit_term(b: Block) -> None:
+        if b.term in (IF_FALSE, IF_TRUE):
+            v = value(b.cond)
+            if v is None:
+                return
+            if v == _BOTTOM:
+                targets = b.succ
+            else:
+                taken = bool(const_value(prog, v)) == (b.term == IF_TRUE)
+                targets = [b.succ[0] if taken else b.succ[1]]
+        elif b.term == SWITCH:
+            v = value(b.cond)
+            if v is None:
+                return
+            known = v != _BOTTOM and v & 7 == K_INT
+            targets = [switch_successor(prog, b, v >> 3)] if known else b.succ
+        else:
+            targets = b.succ
+        for s in targets:
+            if (b.id, s) not in edges:
+                flow.append((b.id, s))
+
+    while flow or ssa_work:
+        if flow:
+            e = flow.pop()
+            if e in edges:
+                continue
+            edges.add(e)
+            b = sf.blocks[e[1]]
+            for phi in b.phis:
+                visit_phi(b, phi)
+            if b.id not in executable:
+                executable.add(b.id)
+                for ins in b.code:
+                    visit_ins(ins)
+                visit_term(b)
+        else:
+            name = ssa_work.pop()
+            for b_id, obj in uses.get(name, ()):
+                if b_id not in executable:
+                    continue
+                b = sf.blocks[b_id]
+                if isinstance(obj, Phi):
+                    visit_phi(b, obj)
+                elif isinstance(obj, Block):
+                    visit_term(b)
+                else:
+                    visit_ins(obj)
+
+    # aplicar
+    removed = sum(len(sf.blocks[i].code) + 1 for i in sf.order if i not in executable)
+    rewritten = 0
+
+    def const_of(x: int) -> Optional[int]:
+        v = val.get(x) if x in defs else None
+        return v if v is not None and v != _BOTTOM else None
+
+    for i in sf.order:
+        if i not in executable:
+            sf.blocks[i].succ = []
+    for b in sf.live_blocks():
+        if b.id not in executable:
+            continue
+        for phi in b.phis:
+            for p, a in phi.args.items():
+                c = const_of(a)
+                if c is not None:
+                    phi.args[p] = c
+                    rewritten += 1
+        for ins in b.code:
+            for k in reads_of(ins):
+                c = const_of(ins[k])
+                if c is not None:
+                    ins[k] = c
+                    rewritten += 1
+            if ins[0] in DEST_OPS and ins[0] != MOV:
+                c = const_of(ins[1])
+                if c is not None and _removable(ins[0], ins[3]):
+                    ins[:] = [MOV, ins[1], c, NONE]
+                    rewritten += 1
+        c = const_of(b.cond) if b.cond != NONE else None
+        if c is not None:
+            b.cond = c
+        if b.term in (IF_FALSE, IF_TRUE) and is_const(b.cond):
+            taken = bool(const_value(prog, b.cond)) == (b.term == IF_TRUE)
+            b.succ = [b.succ[0] if taken else b.succ[1]]
+            b.term, b.cond = GOTO, NONE
+            rewritten += 1
+        elif b.term == SWITCH and b.cond & 7 == K_INT:
+            b.succ = [switch_successor(prog, b, b.cond >> 3)]
+            b.term, b.cond, b.table = GOTO, NONE, None
+            rewritten += 1
+    sf.prune()
+    return removed, rewritten
+
+
+# ---------------------------------------------------------------------------
+# Numeración global de valores
+# ---------------------------------------------------------------------------
+
+def gvn(sf: SsaFunction) -> Tuple[int, int]:
+    """
+    Numeración de valores sobre el árbol de dominadores: una expresión ya
+    calculada en un bloque dominante se reutiliza, las copias se propagan y
+    las phi con un único valor se reemplazan por él. Solo entran expresiones
+    puras sobre valores SSA o inmutables (no globales ni capturadas).
+    """
+    sf.dominators()
+    repl: Dict[int, int] = {}
+
+    def res(x: int) -> int:
+        while x in repl:
+            x = repl[x]
+        return x
+
+    removed = 0
+    table: Dict[tuple, int] = {}
+    work: List[Tuple[int, Optional[list]]] = [(0, None)]
+    while work:
+        b_id, undo = work.pop()
+        if undo is not None:
+            for key in undo:
+                del table[key]
+            continue
+        b = sf.blocks[b_id]
+        undo = []
+        keep_phis = []
+        for phi in b.phis:
+            args = {p: res(a) for p, a in phi.args.items()}
+            phi.args = args
+            distinct = {a for a in args.values() if a != phi.dest}
+            if len(distinct) == 1:
+                repl[phi.dest] = distinct.pop()
+                removed += 1
+                continue
+            key = ("phi", b_id, tuple(sorted(args.items())))
+            if key in table:
+                repl[phi.dest] = table[key]
+                removed += 1
+                continue
+            table[key] = phi.dest
+            undo.append(key)
+            keep_phis.append(phi)
+        b.phis = keep_phis
+
+        keep = []
+        for ins in b.code:
+            for k in reads_of(ins):
+                ins[k] = res(ins[k])
+            op, d = ins[0], ins[1]
+            if op in DEST_OPS and sf.tracked(d):
+                if op == MOV and not _is_memory(sf, ins[2]):
+                    repl[d] = ins[2]
+                    removed += 1
+                    continue
+                if (op in _BINARY or op in (NEG, NOT)) and not any(
+                        _is_memory(sf, ins[k]) for k in reads_of(ins)):
+                    a, bb = ins[2], ins[3]
+                    if op in _COMMUTATIVE and bb < a:
+                        a, bb = bb, a
+                    key = (op, a, bb)
+                    if key in table:
+                        repl[d] = table[key]
+                        removed += 1
+                        continue
+                    table[key] = d
+                    undo.append(key)
+            keep.append(ins)
+        b.code = keep
+        b.cond = res(b.cond)
+        work.append((b_id, undo))
+        for c in reversed(sf.children.get(b_id, ())):
+            work.append((c, None))
+
+    # los argumentos de phi que llegan por arcos de retorno se resuelven al final
+    for b in sf.live_blocks():
+        for phi in b.phis:
+            phi.args = {p: res(a) for p, a in phi.args.items()}
+        for ins in b.code:
+            for k in reads_of(ins):
+                ins[k] = res(ins[k])
+        b.cond = res(b.cond)
+    return removed, 0
+
+
+# ---------------------------------------------------------------------------
+# Movimiento de código invariante de ciclos
+# ---------------------------------------------------------------------------
+
+def _hoistable(ins: list) -> bool:
+    """Puras y sin posibilidad de fallar: se pueden ejecutar aunque el ciclo no itere."""
+    op = ins[0]
+    if op in (MOV, ADD, SUB, MUL, CONCAT, EQ, NE, LT, LE, GT, GE, NEG, NOT, TOSTR, STRCMP):
+        return True
+    return op in (DIV, MOD) and ins[3] & 7 == K_INT and ins[3] != const_int(0)
+
+
+def natural_loops(sf: SsaFunction) -> Dict[int, Set[int]]:
+    """Cabecera -> bloques del ciclo natural (uniendo los arcos de retorno a la misma cabecera)."""
+    loops: Dict[int, Set[int]] = {}
+    for b in sf.live_blocks():
+        for h in b.succ:
+            if h in sf.idom and b.id in sf.idom and sf.dominates(h, b.id):
+                body = loops.setdefault(h, {h})
+                stack = [b.id]
+                while stack:
+                    n = stack.pop()
+                    if n not in body:
+                        body.add(n)
+                        stack.extend(sf.blocks[n].pred)
+    return loops
+
+
+def _preheader(sf: SsaFunction, h: int, body: Set[int]) -> Block:
+    """Bloque nuevo justo antes de la cabecera por el que entran todos los arcos de fuera del ciclo."""
+    header = sf.blocks[h]
+    outside = [p for p in header.pred if p not in body]
+    pre = sf.new_block()
+    pre.succ = [h]
+    pre.pred = outside
+    for p in outside:
+        pb = sf.blocks[p]
+        pb.succ = [pre.id if s == h else s for s in pb.succ]
+    header.pred = [p for p in header.pred if p in body] + [pre.id]
+    for phi in header.phis:
+        if len(outside) == 1:
+            phi.args[pre.id] = phi.args.pop(outside[0])
+        else:
+            q = Phi(phi.var)
+            q.dest = sf.new_temp()
+            q.args = {p: phi.args.pop(p) for p in outside}
+            pre.phis.append(q)
+            phi.args[pre.id] = q.dest
+    sf.order.insert(sf.order.index(h), pre.id)
+    return pre
+
+
+def licm(sf: SsaFunction) -> Tuple[int, int]:
+    """
+    Saca a un preheader las instrucciones puras cuyos operandos no cambian
+    dentro del ciclo. Los ciclos internos se procesan primero, así lo que sale
+    de un ciclo interno puede seguir saliendo del externo.
+    """
+    sf.dominators()
+    loops = natural_loops(sf)
+    if not loops:
+        return 0, 0
+    pos = {b: float(i) for i, b in enumerate(sf.rpo_order)}
+    where: Dict[int, int] = {}
+    for b in sf.live_blocks():
+        for phi in b.phis:
+            where[phi.dest] = b.id
+        for ins in b.code:
+            if ins[0] in DEST_OPS:
+                where[ins[1]] = b.id
+
+    hoisted = 0
+    for h in sorted(loops, key=lambda x: len(loops[x])):
+        body = loops[h]
+        pre = _preheader(sf, h, body)
+        pos[pre.id] = pos[h] - 0.5
+        for other, ob in loops.items():
+            if other != h and h in ob:
+                ob.add(pre.id)
+        for phi in pre.phis:
+            where[phi.dest] = pre.id
+
+        def invariant(x: int) -> bool:
+            if is_const(x):
+                return True
+            if _is_memory(sf, x):
+                return False
+            return where.get(x) not in body
+
+        for b_id in sorted(body, key=lambda x: pos[x]):
+            b = sf.blocks[b_id]
+            keep = []
+            for ins in b.code:
+                if (_hoistable(ins) and sf.tracked(ins[1]) and where.get(ins[1]) == b_id
+                        and all(invariant(ins[k]) for k in reads_of(ins))):
+                    pre.code.append(ins)
+                    where[ins[1]] = pre.id
+                    hoisted += 1
+                else:
+                    keep.append(ins)
+            b.code = keep
+    return 0, hoisted
+
+
+# ---------------------------------------------------------------------------
+# Código muerto en SSA
+# ---------------------------------------------------------------------------
+
+def ssa_dce(sf: SsaFunction) -> Tuple[int, int]:
+    """Borra definiciones puras (y phi) cuyo valor nadie usa, en cascada."""
+    count: Dict[int, int] = {}
+
+    def use(x: int, n: int = 1) -> None:
+        count[x] = count.get(x, 0) + n
+
+    for b in sf.live_blocks():
+        for phi in b.phis:
+            for a in phi.args.values():
+                if a != phi.dest:
+                    use(a)
+        for ins in b.code:
+            for k in reads_of(ins):
+                use(ins[k])
+        use(b.cond)
+
+    defs = _ssa_defs(sf)
+    dead: Set[int] = set()
+    work = [x for x in defs if not count.get(x)]
+    while work:
+        x = work.pop()
+        if x in dead or count.get(x):
+            continue
+        b_id, obj = defs[x]
+        if isinstance(obj, Phi):
+            reads = [a for a in obj.args.values() if a != obj.dest]
+        elif _removable(obj[0], obj[3]):
+            reads = [obj[k] for k in reads_of(obj)]
+        else:
+            continue
+        dead.add(x)
+        for r in reads:
+            use(r, -1)
+            if not count[r] and r in defs:
+                work.append(r)
+
+    removed = 0
+    for b in sf.live_blocks():
+        n = len(b.phis) + len(b.code)
+        b.phis = [phi for phi in b.phis if phi.dest not in dead]
+        b.code = [ins for ins in b.code
+                  if not (ins[0] in DEST_OPS and ins[1] in dead and ins[1] in defs
+                          and defs[ins[1]][1] is ins)]
+        removed += n - len(b.phis) - len(b.code)
+    return removed, 0
+
+
+# ---------------------------------------------------------------------------
+# Reasignación de temporales
+# ---------------------------------------------------------------------------
+
+def recolor_temps(sf: SsaFunction) -> int:
+    """
+    Después de salir de SSA cada valor tiene su propio temporal. Se
+    reasignan con liveness + coloreo greedy del grafo de interferencia,
+    uniendo antes los dos lados de cada copia que no interfieren: la copia
+    queda como 'x = x' y la borra la limpieza local. Devuelve la cantidad de
+    temporales.
+    """
+    blocks = sf.live_blocks()
+    is_t = lambda x: x & 7 == K_TEMP
+
+    def reads(ins):
+        return [ins[k] for k in reads_of(ins) if is_t(ins[k])]
+
+    gen: Dict[int, Set[int]] = {}
+    kill: Dict[int, Set[int]] = {}
+    for b in blocks:
+        g, k = set(), set()
+        if is_t(b.cond):
+            g.add(b.cond)
+        for ins in reversed(b.code):
+            if ins[0] in DEST_OPS and is_t(ins[1]):
+                g.discard(ins[1])
+                k.add(ins[1])
+            g.update(reads(ins))
+        gen[b.id], kill[b.id] = g, k
+
+    live_in: Dict[int, Set[int]] = {b.id: set() for b in blocks}
+    changed = True
+    while changed:
+        changed = False
+        for b in reversed(blocks):
+            out = set()
+            for s in b.succ:
+                out |= live_in[s]
+            new = gen[b.id] | (out - kill[b.id])
+            if new != live_in[b.id]:
+                live_in[b.id] = new
+                changed = True
+
+    adj: Dict[int, Set[int]] = {}
+    moves: List[Tuple[int, int]] = []
+    first: Dict[int, int] = {}
+    n = 0
+    for b in blocks:
+        for ins in b.code:
+            for x in [ins[1]] + reads(ins):
+                if is_t(x) and x not in first:
+                    first[x] = n
+                    n += 1
+        if is_t(b.cond) and b.cond not in first:
+            first[b.cond] = n
+            n += 1
+    for x in first:
+        adj[x] = set()
+    for b in blocks:
+        live = set()
+        for s in b.succ:
+            live |= live_in[s]
+        if is_t(b.cond):
+            live.add(b.cond)
+        for ins in reversed(b.code):
+            if ins[0] in DEST_OPS and is_t(ins[1]):
+                d = ins[1]
+                src = ins[2] if ins[0] == MOV and is_t(ins[2]) else None
+                if src is not None:
+                    moves.append((d, src))
+                for y in live:
+                    if y != d and y != src:
+                        adj[d].add(y)
+                        adj[y].add(d)
+                live.discard(d)
+            live.update(reads(ins))
+
+    # coalescing: se unen los extremos de una copia si no interfieren
+    rep = {x: x for x in first}
+
+    def find(x: int) -> int:
+        while rep[x] != x:
+            rep[x] = rep[rep[x]]
+            x = rep[x]
+        return x
+
+    for d, src in moves:
+        a, b_ = find(d), find(src)
+        if a != b_ and b_ not in adj[a]:
+            rep[b_] = a
+            for y in adj.pop(b_):
+                adj[y].discard(b_)
+                adj[y].add(a)
+                adj[a].add(y)
+
+    color: Dict[int, int] = {}
+    for x in sorted(first, key=first.get):
+        r = find(x)
+        if r in color:
+            color[x] = color[r]
+            continue
+        taken = {color[y] for y in adj[r] if y in color}
+        c = 0
+        while c in taken:
+            c += 1
+        color[r] = color[x] = c
+
+    for b in blocks:
+        for ins in b.code:
+            if ins[0] in DEST_OPS and is_t(ins[1]):
+                ins[1] = operand(K_TEMP, color[ins[1]])
+            for k in reads_of(ins):
+                if is_t(ins[k]):
+                    ins[k] = operand(K_TEMP, color[ins[k]])
+        if is_t(b.cond):
+            b.cond = operand(K_TEMP, color[b.cond])
+    return max(color.values(), default=-1) + 1
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+GLOBAL_PASSES = [
+    ("ssa-sccp", sccp),
+    ("ssa-gvn", gvn),
+    ("ssa-licm", licm),
+    ("ssa-dce", ssa_dce),
+]
+
+
+def _merge(into: Dict[str, PassStats], stats: List[PassStats]) -> None:
+    for st in stats:
+        acc = into.setdefault(st.name, PassStats(st.name))
+        acc.removed += st.removed
+        acc.rewritten += st.rewritten
+        acc.runs += st.runs
+        acc.seconds += st.seconds
+
+
+def optimize_global(prog: TacProgram, max_rounds: int = 5) -> OptReport:
+    """
+    -O2: limpieza local, luego por función SSA -> SCCP -> GVN -> LICM -> DCE
+    -> salida de SSA, y otra vez la limpieza local (que se encarga de las
+    copias que deja la destrucción de las phi). Las funciones con try/catch
+    solo reciben la optimización local.
+    """
+    report = OptReport(before=len(prog.code))
+    local = PassManager(max_rounds=max_rounds)
+    stats: Dict[str, PassStats] = {}
+    first = local.run(prog)
+    _merge(stats, first.passes)
+
+    glob = {name: PassStats(name) for name, _ in GLOBAL_PASSES}
+    bodies: List[Optional[List[tuple]]] = []
+    for fi in range(len(prog.functions)):
+        if has_try(prog, fi):
+            bodies.append(None)
+            continue
+        t0 = time.perf_counter()
+        sf = SsaFunction(prog, fi)
+        sf.construct()
+        for name, fn in GLOBAL_PASSES:
+            t1 = time.perf_counter()
+            removed, rewritten = fn(sf)
+            st = glob[name]
+            st.removed += removed
+            st.rewritten += rewritten
+            st.runs += 1
+            st.seconds += time.perf_counter() - t1
+        sf.destruct()
+        prog.functions[fi].temps = recolor_temps(sf)
+        bodies.append(sf.emit())
+    _merge(stats, list(glob.values()))
+
+    old, new = prog.code, TacBuffer()
+    for f, body in zip(prog.functions, bodies):
+        start = len(new)
+        for ins in (body if body is not None else (old[i] for i in range(f.start, f.end))):
+            new.emit(*ins)
+        f.start, f.end = start, len(new)
+    prog.code = new
+
+    second = local.run(prog)
+    _merge(stats, second.passes)
+    report.passes = list(stats.values())
+    report.rounds = first.rounds + second.rounds
+    report.after = len(prog.code)
+    return report
@@ -0,0 +1,325 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from intermediate.tac import (
+    TacProgram, TacBuffer,
+    MOV, LABEL, GOTO, IF_FALSE, IF_TRUE, PARAM, CALL, RET, TRY, NOP, SWITCH,
+    K_TEMP, K_VAR, K_LABEL, K_NAME, NONE, operand,
+)
+from intermediate.tac_gen import MAIN
+
+# Inlining de funciones chicas sobre el TAC. Una llamada 'param a1 .. param
+# an ; d = call g, n' se reemplaza por copias a temporales nuevos (los
+# parámetros), el cuerpo de g con sus variables, temporales y etiquetas
+# renombrados, y cada 'return x' como 'd = x ; goto fin'. Las variables de
+# funciones externas que g usa (sus capturas) se siguen nombrando igual: la
+# llamadora está dentro de la función dueña (si no, no vería a g), así que
+# las alcanza por la misma cadena de entornos.
+
+SMALL_SIZE = 8                # (+ nº de argumentos) se inlinea en cualquier sitio
+SINGLE_SITE_SIZE = 60         # con un único sitio de llamada (la función desaparece)
+LOOP_FACTOR = 2               # dentro de un ciclo el límite se multiplica
+
+
+@dataclass
+class InlineSite:
+    caller: str
+    callee: str
+    size: int                 # instrucciones del cuerpo copiado
+    in_loop: bool
+
+
+@dataclass
+class InlineReport:
+    before: int
+    after: int = 0
+    sites: List[InlineSite] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)       # funciones que quedaron sin uso
+    skipped: Dict[str, str] = field(default_factory=dict)  # función -> motivo
+
+    @property
+    def growth(self) -> float:
+        return (self.after - self.before) / self.before if self.before else 0.0
+
+    def to_text(self) -> str:
+        lines = [f"Inlining: {len(self.sites)} llamadas, {self.before} -> {self.after} "
+                 f"instrucciones ({self.growth:+.1%})"]
+        for s in self.sites:
+            where = " (en ciclo)" if s.in_loop else ""
+            lines.append(f"  {s.caller} <- {s.callee}: {s.size} instrucciones{where}")
+        if self.removed:
+            lines.append("  sin uso tras inlinear: " + ", ".join(self.removed))
+        for name, why in self.skipped.items():
+            lines.append(f"  {name}: no ({why})")
+        return "\n".join(lines)
+
+
+def _size(body: List[tuple]) -> int:
+    return sum(1 for ins in body if ins[0] not in (LABEL, NOP))
+
+
+def _loop_positions(body: List[tuple]) -> Set[int]:
+    """Posiciones dentro de algún ciclo: entre una etiqueta y un salto hacia atrás a ella."""
+    at = {ins[2]: i for i, ins in enumerate(body) if ins[0] == LABEL}
+    out: Set[int] = set()
+    for j, ins in enumerate(body):
+        target = ins[2] if ins[0] == GOTO else ins[3] if ins[0] in (IF_FALSE, IF_TRUE) else None
+        i = at.get(target)
+        if i is not None and i < j:
+            out.update(range(i, j + 1))
+    return out
+
+
+class Inliner:
+    """
+    Recorre las funciones de abajo hacia arriba en el grafo de llamadas
+    (cada llamada ve el cuerpo ya inlineado de la llamada) y decide cada
+    sitio con el modelo de costo: tamaño del cuerpo contra el límite del
+    sitio, y un tope de crecimiento total del programa. No se inlinean
+    funciones recursivas, con try/catch, ni las que tienen funciones
+    anidadas o variables capturadas (su entorno es por activación).
+    """
+
+    def __init__(self, prog: TacProgram, max_growth: float = 0.5,
+                 small: int = SMALL_SIZE, single_site: int = SINGLE_SITE_SIZE):
+        self.prog = prog
+        self.max_growth = max_growth
+        self.small = small
+        self.single_site = single_site
+        code = prog.code
+        self.bodies = [[code[i] for i in range(f.start, f.end) if code.op[i] != NOP]
+                       for f in prog.functions]
+        self.index = {f.name: i for i, f in enumerate(prog.functions)}
+
+    # ---------------- Grafo de llamadas ----------------
+
+    def _callees(self, fi: int) -> Set[int]:
+        out = set()
+        for ins in self.bodies[fi]:
+            if ins[0] == CALL and ins[2] & 7 == K_NAME:
+                g = self.index.get(self.prog.names[ins[2] >> 3])
+                if g is not None:
+                    out.add(g)
+        return out
+
+    def _sccs(self) -> List[List[int]]:
+        """Componentes fuertes (Tarjan): salen con las llamadas antes que las llamadoras."""
+        n = len(self.bodies)
+        graph = [self._callees(fi) for fi in range(n)]
+        index: Dict[int, int] = {}
+        low: Dict[int, int] = {}
+        stack: List[int] = []
+        on: Set[int] = set()
+        out: List[List[int]] = []
+
+        def visit(v: int) -> None:
+            index[v] = low[v] = len(index)
+            stack.append(v)
+            on.add(v)
+            for w in graph[v]:
+                if w not in index:
+                    visit(w)
+                    low[v] = min(low[v], low[w])
+                elif w in on:
+                    low[v] = min(low[v], index[w])
+            if low[v] == index[v]:
+                comp = []
+                while True:
+                    w = stack.pop()
+                    on.discard(w)
+                    comp.append(w)
+                    if w == v:
+                        break
+                out.append(comp)
+
+        for v in range(n):
+            if v not in index:
+                visit(v)
+        self.recursive = {v for comp in out for v in comp
+                          if len(comp) > 1 or v in graph[v]}
+        return out
+
+    def _reason(self, gi: int) -> Optional[str]:
+        """Por qué 'gi' no se puede inlinear (None si se puede)."""
+        f = self.prog.functions[gi]
+        if f.name == MAIN:
+            return "programa principal"
+        if gi in self.recursive:
+            return "recursiva"
+        if any(ins[0] == TRY for ins in self.bodies[gi]):
+            return "try/catch"
+        if gi in self.parents:
+            return "tiene funciones anidadas"
+        if any(v in self.captured for v in f.params + f.locals):
+            return "variables capturadas"
+        return None
+
+    # ---------------- Transformación ----------------
+
+    def run(self) -> InlineReport:
+        prog = self.prog
+        report = InlineReport(before=len(prog.code))
+        self.parents = {f.parent for f in prog.functions if f.parent >= 0}
+        self.captured = {v for f in prog.functions for v in f.captures}
+        order = [v for comp in self._sccs() for v in comp]
+        sites = self._site_counts()
+        budget = int(sum(_size(b) for b in self.bodies) * self.max_growth)
+        reasons = {gi: self._reason(gi) for gi in range(len(self.bodies))}
+
+        for fi in order:
+            body = self.bodies[fi]
+            loops = _loop_positions(body)
+            out: List[tuple] = []
+            for pos, ins in enumerate(body):
+                gi = self._target(ins)
+                if gi is None or gi == fi:
+                    out.append(ins)
+                    continue
+                why = reasons[gi]
+                size = _size(self.bodies[gi])
+                n = ins[3] >> 3
+                in_loop = pos in loops
+                # las 'param' y la secuencia de llamada desaparecen: un cuerpo de ese tamaño es gratis
+                limit = self.single_site if sites.get(gi) == 1 else self.small + n
+                if in_loop:
+                    limit *= LOOP_FACTOR
+                if why is None and size > limit:
+                    why = f"{size} instrucciones"
+                cost = size - n - 1
+                if why is None and cost > budget:
+                    why = "tope de crecimiento"
+                if why is None and (len(out) < n or any(x[0] != PARAM for x in out[len(out) - n:])):
+                    why = "argumentos separados de la llamada"
+                if why is not None:
+                    report.skipped.setdefault(prog.functions[gi].name, why)
+                    out.append(ins)
+                    continue
+                args = [x[2] for x in out[len(out) - n:]] if n else []
+                del out[len(out) - n:]
+                out.extend(self._expand(fi, gi, ins[1], args))
+                budget -= cost
+                report.sites.append(InlineSite(prog.functions[fi].name, prog.functions[gi].name,
+                                               size, in_loop))
+            self.bodies[fi] = out
+
+        report.removed = self._remove_unused()
+        self._rebuild()
+        report.after = len(prog.code)
+        for name in report.removed:
+            report.skipped.pop(name, None)
+        return report
+
+    def _target(self, ins: tuple) -> Optional[int]:
+        if ins[0] != CALL or ins[2] & 7 != K_NAME:
+            return None
+        return self.index.get(self.prog.names[ins[2] >> 3])
+
+    def _site_counts(self) -> Dict[int, int]:
+        """Sitios de llamada por función; las usadas como valor cuentan de más (no desaparecen)."""
+        out: Dict[int, int] = {}
+        for body in self.bodies:
+            for ins in body:
+                for k in (1, 2, 3):
+                    x = ins[k]
+                    if x & 7 == K_NAME:
+                        gi = self.index.get(self.prog.names[x >> 3])
+                        if gi is not None:
+                            out[gi] = out.get(gi, 0) + (1 if ins[0] == CALL and k == 2 else 2)
+        return out
+
+    def _expand(self, fi: int, gi: int, dest: int, args: List[int]) -> List[tuple]:
+        prog = self.prog
+        f, g = prog.functions[fi], prog.functions[gi]
+        base = f.temps
+        own: Dict[int, int] = {}
+        for v in g.params + g.locals:
+            own[v] = operand(K_TEMP, base + g.temps + len(own))
+        f.temps = base + g.temps + len(own)
+        labels: Dict[int, int] = {}
+        end = prog.new_label()
+
+        def rename(x: int) -> int:
+            k = x & 7
+            if k == K_TEMP:
+                return operand(K_TEMP, base + (x >> 3))
+            if k == K_VAR:
+                if x in own:
+                    return own[x]
+                owner = prog.vars[x >> 3].func
+                if owner not in (-1, fi) and x not in f.captures:
+                    f.captures.append(x)
+                return x
+            if k == K_LABEL:
+                if x not in labels:
+                    labels[x] = prog.new_label()
+                return labels[x]
+            return x
+
+        out: List[tuple] = [(MOV, own[p], a, NONE) for p, a in zip(g.params, args)]
+        body = self.bodies[gi]
+        for k, (op, d, a, b) in enumerate(body):
+            if op == RET:
+                if dest != NONE and a != NONE:
+                    out.append((MOV, dest, rename(a), NONE))
+                if k != len(body) - 1:
+                    out.append((GOTO, NONE, end, NONE))
+                continue
+            if op == SWITCH:
+                # cada copia lleva su tabla con las etiquetas renombradas
+                b = prog.new_table([rename(x) for x in prog.tables[b >> 3]])
+            out.append((op, rename(d), rename(a), rename(b)))
+        out.append((LABEL, NONE, end, NONE))
+        return out
+
+    def _remove_unused(self) -> List[str]:
+        """Quita las funciones (no métodos) a las que ya nadie nombra."""
+        prog = self.prog
+        removed: List[str] = []
+        while True:
+            used = {MAIN}
+            for fi, body in enumerate(self.bodies):
+                if self.bodies[fi] is None:
+                    continue
+                for ins in body:
+                    for x in ins[1:]:
+                        if x & 7 == K_NAME:
+                            used.add(prog.names[x >> 3])
+            dead = [fi for fi, f in enumerate(prog.functions)
+                    if self.bodies[fi] is not None and f.name not in used and not f.class_name
+                    and fi not in self.parents]
+            if not dead:
+                break
+            for fi in dead:
+                self.bodies[fi] = None
+                removed.append(prog.functions[fi].name)
+        if not removed:
+            return removed
+        keep = [fi for fi in range(len(prog.functions)) if self.bodies[fi] is not None]
+        remap = {old: new for new, old in enumerate(keep)}
+        for var in prog.vars:
+            if var.func >= 0:
+                var.func = remap.get(var.func, -1)
+        funcs = []
+        for old in keep:
+            f = prog.functions[old]
+            f.parent = remap.get(f.parent, -1)
+            funcs.append(f)
+        prog.functions = funcs
+        self.bodies = [self.bodies[old] for old in keep]
+        self.index = {f.name: i for i, f in enumerate(funcs)}
+        return removed
+
+    def _rebuild(self) -> None:
+        code = TacBuffer()
+        for f, body in zip(self.prog.functions, self.bodies):
+            f.start = len(code)
+            for ins in body:
+                code.emit(*ins)
+            f.end = len(code)
+        self.prog.code = code
+
+
+def inline_calls(prog: TacProgram, max_growth: float = 0.5) -> InlineReport:
+    """Inlinea las llamadas que el modelo de costo acepta; modifica 'prog'."""
+    return Inliner(prog, max_growth).run()
@@ -0,0 +1,294 @@
+from __future__ import annotations
+from typing import List, Optional
+
+from intermediate.tac import (
+    TacProgram, OPCODES,
+    MOV, ADD, SUB, MUL, DIV, MOD, CONCAT, EQ, NE, LT, LE, GT, GE, NEG, NOT,
+    LABEL, GOTO, IF_FALSE, IF_TRUE, PARAM, CALL, RET, PRINT,
+    NEWARR, ALOAD, ASTORE, LEN, NEW, GETF, SETF, TRY, ENDTRY, CATCH, TOSTR, STRCMP, NOP,
+    SWITCH, HASH, METHOD, str_hash,
+    K_TEMP, K_VAR, K_INT, K_STR, K_NAME, K_CONST, NONE,
+)
+from intermediate.tac_gen import MAIN
+
+
+class TacRuntimeError(Exception):
+    """Error en tiempo de ejecución del programa (índice fuera de rango, división por cero, ...)."""
+
+
+def to_text(v) -> str:
+    """Representación de un valor como la imprime Compiscript."""
+    if v is True:
+        return "true"
+    if v is False:
+        return "false"
+    if v is None:
+        return "null"
+    if isinstance(v, list):
+        return "[" + ", ".join(to_text(x) for x in v) + "]"
+    if isinstance(v, dict):
+        return f"<{v.get('__class__', 'object')}>"
+    return str(v)
+
+
+def int_div(a: int, b: int) -> int:
+    if b == 0:
+        raise TacRuntimeError("División por cero")
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b >= 0) else -q
+
+
+def int_mod(a: int, b: int) -> int:
+    if b == 0:
+        raise TacRuntimeError("División por cero")
+    return a - b * int_div(a, b)
+
+
+def same_value(a, b) -> bool:
+    if isinstance(a, (list, dict)) or isinstance(b, (list, dict)):
+        return a is b
+    return a == b
+
+
+class _Frame:
+    __slots__ = ("func", "temps", "locals", "pc", "handlers", "ret_dst")
+
+    def __init__(self, func: int, ntemps: int, pc: int, ret_dst: int):
+        self.func = func
+        self.temps: list = [None] * ntemps
+        self.locals: dict[int, object] = {}
+        self.pc = pc
+        self.handlers: List[int] = []      # posiciones de los manejadores (try activos)
+        self.ret_dst = ret_dst
+
+
+class TacInterpreter:
+    """
+    Ejecuta un TacProgram. Sirve para validar que las optimizaciones no
+    cambian la salida y para contar instrucciones ejecutadas ('steps').
+    Las variables capturadas se buscan en el marco activo más reciente de la
+    función dueña.
+    """
+
+    def __init__(self, prog: TacProgram, max_steps: int = 10_000_000, echo: bool = False):
+        self.prog = prog
+        self.max_steps = max_steps
+        self.echo = echo
+        self.output: List[str] = []
+        self.steps = 0
+        self.op_counts = [0] * len(OPCODES)
+        self.globals: dict[int, object] = {}
+        self._labels = {}
+        code = prog.code
+        for i in range(len(code)):
+            if code.op[i] == LABEL:
+                self._labels[code.a[i] >> 3] = i
+        self._funcs = {f.name: i for i, f in enumerate(prog.functions)}
+        self._vtables = {c.name: c.methods for c in prog.classes}
+
+    # ---------------- Operandos ----------------
+
+    def _frame_of(self, func: int) -> Optional[_Frame]:
+        for fr in reversed(self.stack):
+            if fr.func == func:
+                return fr
+        return None
+
+    def read(self, op: int):
+        k, v = op & 7, op >> 3
+        if k == K_TEMP:
+            return self.frame.temps[v]
+        if k == K_VAR:
+            owner = self.prog.vars[v].func
+            if owner == -1:
+                return self.globals.get(v)
+            fr = self.frame if owner == self.frame.func else self._frame_of(owner)
+            return fr.locals.get(v) if fr is not None else None
+        if k == K_INT:
+            return v
+        if k == K_STR:
+            return self.prog.strings[v]
+        if k == K_CONST:
+            return (None, False, True)[v]
+        if k == K_NAME:
+            return self.prog.names[v]
+        return None
+
+    def write(self, op: int, value) -> None:
+        k, v = op & 7, op >> 3
+        if k == K_TEMP:
+            self.frame.temps[v] = value
+        elif k == K_VAR:
+            owner = self.prog.vars[v].func
+            if owner == -1:
+                self.globals[v] = value
+            else:
+                fr = self.frame if owner == self.frame.func else self._frame_of(owner)
+                if fr is not None:
+                    fr.locals[v] = value
+
+    # ---------------- Ejecución ----------------
+
+    def run(self, entry: str = MAIN) -> List[str]:
+        prog, code = self.prog, self.prog.code
+        ops, ds, as_, bs = code.op, code.d, code.a, code.b
+        f = prog.functions[self._funcs[entry]]
+        self.stack: List[_Frame] = [_Frame(self._funcs[entry], f.temps, f.start, NONE)]
+        self.frame = self.stack[0]
+        args: list = []
+        read, write = self.read, self.write
+        counts = self.op_counts
+
+        while self.stack:
+            fr = self.frame
+            pc = fr.pc
+            op = ops[pc]
+            d, a, b = ds[pc], as_[pc], bs[pc]
+            fr.pc = pc + 1
+            if op != LABEL and op != NOP:
+                self.steps += 1
+                counts[op] += 1
+                if self.steps > self.max_steps:
+                    raise TacRuntimeError("Límite de pasos excedido")
+            try:
+                if op == MOV:
+                    write(d, read(a))
+                elif op == ADD:
+                    write(d, read(a) + read(b))
+                elif op == SUB:
+                    write(d, read(a) - read(b))
+                elif op == MUL:
+                    write(d, read(a) * read(b))
+                elif op == DIV:
+                    write(d, int_div(read(a), read(b)))
+                elif op == MOD:
+                    write(d, int_mod(read(a), read(b)))
+                elif op == CONCAT:
+                    write(d, to_text(read(a)) + to_text(read(b)))
+                elif op == TOSTR:
+                    write(d, to_text(read(a)))
+                elif op == STRCMP:
+                    x, y = read(a), read(b)
+                    write(d, (x > y) - (x < y))
+                elif op == HASH:
+                    write(d, str_hash(to_text(read(a)), b >> 3))
+                elif op == EQ:
+                    write(d, same_value(read(a), read(b)))
+                elif op == NE:
+                    write(d, not same_value(read(a), read(b)))
+                elif op == LT:
+                    write(d, read(a) < read(b))
+                elif op == LE:
+                    write(d, read(a) <= read(b))
+                elif op == GT:
+                    write(d, read(a) > read(b))
+                elif op == GE:
+                    write(d, read(a) >= read(b))
+                elif op == NEG:
+                    write(d, -read(a))
+                elif op == NOT:
+                    write(d, not read(a))
+                elif op == GOTO:
+                    fr.pc = self._labels[a >> 3]
+                elif op == IF_FALSE:
+                    if not read(a):
+                        fr.pc = self._labels[b >> 3]
+                elif op == IF_TRUE:
+                    if read(a):
+                        fr.pc = self._labels[b >> 3]
+                elif op == SWITCH:
+                    table = prog.tables[b >> 3]
+                    k = read(a) - (d >> 3) + 1
+                    fr.pc = self._labels[table[k if 0 < k < len(table) else 0] >> 3]
+                elif op == PARAM:
+                    args.append(read(a))
+                elif op == CALL:
+                    n = b >> 3
+                    call_args = args[len(args) - n:] if n else []
+                    del args[len(args) - n:]
+                    self._call(read(a) if a & 7 != K_NAME else prog.names[a >> 3], call_args, d)
+                elif op == RET:
+                    value = read(a) if a != NONE else None
+                    done = self.stack.pop()
+                    if not self.stack:
+                        break
+                    self.frame = self.stack[-1]
+                    if done.ret_dst != NONE:
+                        write(done.ret_dst, value)
+                elif op == PRINT:
+                    line = to_text(read(a))
+                    self.output.append(line)
+                    if self.echo:
+                        print(line)
+                elif op == NEWARR:
+                    write(d, [None] * read(a))
+                elif op == ALOAD:
+                    arr, i = read(a), read(b)
+                    if arr is None:
+                        raise TacRuntimeError("Acceso a índice de null")
+                    if not 0 <= i < len(arr):
+                        raise TacRuntimeError(f"Índice fuera de rango: {i}")
+                    write(d, arr[i])
+                elif op == ASTORE:
+                    arr, i = read(d), read(a)
+                    if arr is None:
+                        raise TacRuntimeError("Acceso a índice de null")
+                    if not 0 <= i < len(arr):
+                        raise TacRuntimeError(f"Índice fuera de rango: {i}")
+                    arr[i] = read(b)
+                elif op == LEN:
+                    write(d, len(read(a)))
+                elif op == NEW:
+                    write(d, {"__class__": prog.names[a >> 3]})
+                elif op == GETF:
+                    obj = read(a)
+                    if obj is None:
+                        raise TacRuntimeError("Acceso a campo de null")
+                    write(d, obj.get(prog.fields[b >> 3][1]))
+                elif op == SETF:
+                    obj = read(d)
+                    if obj is None:
+                        raise TacRuntimeError("Acceso a campo de null")
+                    obj[prog.fields[a >> 3][1]] = read(b)
+                elif op == METHOD:
+                    obj = read(a)
+                    if obj is None:
+                        raise TacRuntimeError("Acceso a campo de null")
+                    write(d, self._vtables[obj["__class__"]][b >> 3])
+                elif op == TRY:
+                    fr.handlers.append(self._labels[a >> 3])
+                elif op == ENDTRY:
+                    fr.handlers.pop()
+                elif op == CATCH:
+                    write(d, self._error)
+            except TacRuntimeError as e:
+                self._unwind(e)
+        return self.output
+
+    def _call(self, name: str, call_args: list, dst: int) -> None:
+        fi = self._funcs.get(name)
+        if fi is None:
+            raise TacRuntimeError(f"Función no definida: {name}")
+        f = self.prog.functions[fi]
+        fr = _Frame(fi, f.temps, f.start, dst)
+        for p, v in zip(f.params, call_args):
+            fr.locals[p >> 3] = v
+        self.stack.append(fr)
+        self.frame = fr
+
+    def _unwind(self, err: TacRuntimeError) -> None:
+        """Salta al catch más interno, desapilando marcos si hace falta."""
+        while self.stack:
+            fr = self.stack[-1]
+            if fr.handlers:
+                fr.pc = fr.handlers.pop()
+                self.frame = fr
+                self._error = str(err)
+                return
+            self.stack.pop()
+        raise err
+
+
+def run_tac(prog: TacProgram, **kwargs) -> List[str]:
+    """Ejecuta el programa y devuelve las líneas impresas."""
+    return TacInterpreter(prog, **kwargs).run()
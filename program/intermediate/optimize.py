@@ -0,0 +1,535 @@
+from __future__ import annotations
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from intermediate.tac import (
+    TacProgram, TacFunction, TacBuffer,
+    MOV, ADD, SUB, MUL, DIV, MOD, CONCAT, EQ, NE, LT, LE, GT, GE, NEG, NOT, TOSTR, STRCMP,
+    LABEL, GOTO, IF_FALSE, IF_TRUE, CALL, TRY, NOP, SWITCH, HASH, DEST_OPS, READS, PURE_OPS,
+    K_TEMP, K_VAR, K_INT, K_STR, K_CONST, NONE, TRUE, FALSE, NULL,
+    INT_MIN, INT_MAX, const_int, operand, str_hash,
+)
+from intermediate.interp import int_div, int_mod, to_text, same_value
+from intermediate.tac_cfg import build_tac_cfg
+from semantic.dataflow import solve
+
+# binarias que se pliegan con fold_binary (en 'tostr' b es el tag, siempre constante)
+_FOLDABLE = (ADD, SUB, MUL, DIV, MOD, CONCAT, EQ, NE, LT, LE, GT, GE, TOSTR, STRCMP, HASH)
+
+
+# ---------------------------------------------------------------------------
+# Constantes
+# ---------------------------------------------------------------------------
+
+def is_const(op: int) -> bool:
+    k = op & 7
+    return k == K_INT or k == K_STR or k == K_CONST
+
+
+def const_value(prog: TacProgram, op: int):
+    k, v = op & 7, op >> 3
+    if k == K_INT:
+        return v
+    if k == K_STR:
+        return prog.strings[v]
+    return (None, False, True)[v]
+
+
+def make_const(prog: TacProgram, value) -> Optional[int]:
+    if value is True:
+        return TRUE
+    if value is False:
+        return FALSE
+    if value is None:
+        return NULL
+    if isinstance(value, int):
+        return const_int(value) if INT_MIN <= value <= INT_MAX else None
+    if isinstance(value, str):
+        return prog.string(value)
+    return None
+
+
+def _is_int(v) -> bool:
+    return type(v) is int
+
+
+def switch_target(prog: TacProgram, lo: int, table: int, value: int) -> int:
+    """Etiqueta a la que salta 'switch value, lo' con la tabla 'table'."""
+    labels = prog.tables[table >> 3]
+    k = value - (lo >> 3) + 1
+    return labels[k if 0 < k < len(labels) else 0]
+
+
+def fold_binary(op: int, x, y):
+    """Valor de 'x op y' con la semántica del intérprete, o ... si no se puede plegar."""
+    if op in (EQ, NE):
+        r = same_value(x, y)
+        return r if op == EQ else not r
+    if op == CONCAT:
+        return to_text(x) + to_text(y)
+    if op == TOSTR:
+        return to_text(x)
+    if op == STRCMP:
+        return (x > y) - (x < y) if type(x) is str and type(y) is str else ...
+    if op == HASH:
+        return str_hash(to_text(x), y)
+    if _is_int(x) and _is_int(y):
+        if op == ADD:
+            return x + y
+        if op == SUB:
+            return x - y
+        if op == MUL:
+            return x * y
+        if op in (DIV, MOD):
+            if y == 0:
+                return ...                       # el error de ejecución se conserva
+            return int_div(x, y) if op == DIV else int_mod(x, y)
+    if (_is_int(x) and _is_int(y)) or (type(x) is str and type(y) is str):
+        if op == LT:
+            return x < y
+        if op == LE:
+            return x <= y
+        if op == GT:
+            return x > y
+        if op == GE:
+            return x >= y
+    return ...
+
+
+# ---------------------------------------------------------------------------
+# Pasadas (cada una recibe el programa y una función; devuelve (eliminadas, reescritas))
+# ---------------------------------------------------------------------------
+
+def _kill_vars(env: dict) -> None:
+    """Una llamada puede modificar globales y variables capturadas: solo sobreviven los temporales."""
+    for k in [k for k in env if k & 7 == K_VAR]:
+        del env[k]
+
+
+def constant_folding(prog: TacProgram, f: TacFunction) -> Tuple[int, int]:
+    """
+    Plegado y propagación de constantes dentro de cada bloque básico:
+    sustituye lecturas de variables/temporales con valor constante conocido,
+    evalúa operaciones con operandos constantes y resuelve saltos condicionales
+    con condición constante.
+    """
+    code = prog.code
+    ops, ds, as_, bs = code.op, code.d, code.a, code.b
+    removed = rewritten = 0
+    env: Dict[int, int] = {}
+    for i in range(f.start, f.end):
+        op = ops[i]
+        if op == NOP:
+            continue
+        if op == LABEL:
+            env.clear()
+            continue
+        for slot in READS[op]:
+            arr = (ds, as_, bs)[slot]
+            c = env.get(arr[i])
+            if c is not None:
+                arr[i] = c
+                rewritten += 1
+
+        a, b = as_[i], bs[i]
+        if op in _FOLDABLE and is_const(a) and is_const(b):
+            value = fold_binary(op, const_value(prog, a), const_value(prog, b))
+            c = make_const(prog, value) if value is not ... else None
+            if c is not None:
+                code.set(i, MOV, ds[i], c)
+                rewritten += 1
+        elif op in (NEG, NOT) and is_const(a):
+            v = const_value(prog, a)
+            value = -v if op == NEG and _is_int(v) else (not v if op == NOT and type(v) is bool else ...)
+            c = make_const(prog, value) if value is not ... else None
+            if c is not None:
+                code.set(i, MOV, ds[i], c)
+                rewritten += 1
+        elif op in (IF_FALSE, IF_TRUE) and is_const(a):
+            taken = bool(const_value(prog, a)) == (op == IF_TRUE)
+            if taken:
+                code.set(i, GOTO, NONE, b)
+                rewritten += 1
+            else:
+                code.set(i, NOP)
+                removed += 1
+            env.clear()
+            continue
+        elif op == SWITCH and a & 7 == K_INT:
+            code.set(i, GOTO, NONE, switch_target(prog, ds[i], b, a >> 3))
+            rewritten += 1
+            env.clear()
+            continue
+
+        op = ops[i]
+        if op in DEST_OPS:
+            d = ds[i]
+            env.pop(d, None)
+            if op == MOV and is_const(as_[i]):
+                env[d] = as_[i]
+        if op == CALL:
+            _kill_vars(env)
+        if op in (GOTO, IF_FALSE, IF_TRUE, SWITCH):
+            env.clear()
+    return removed, rewritten
+
+
+def copy_propagation(prog: TacProgram, f: TacFunction) -> Tuple[int, int]:
+    """Dentro de cada bloque, reemplaza lecturas de 'x' por 'y' después de 'x = y'."""
+    code = prog.code
+    ops, ds, as_ = code.op, code.d, code.a
+    arrays = (code.d, code.a, code.b)
+    rewritten = 0
+    env: Dict[int, int] = {}
+    for i in range(f.start, f.end):
+        op = ops[i]
+        if op == NOP:
+            continue
+        if op == LABEL:
+            env.clear()
+            continue
+        for slot in READS[op]:
+            arr = arrays[slot]
+            src = env.get(arr[i])
+            if src is not None:
+                arr[i] = src
+                rewritten += 1
+        if op in DEST_OPS:
+            d = ds[i]
+            env.pop(d, None)
+            for k in [k for k, v in env.items() if v == d]:
+                del env[k]
+            src = as_[i]
+            if op == MOV and src != d and src & 7 in (K_TEMP, K_VAR):
+                env[d] = src
+        if op == CALL:
+            for k in [k for k, v in env.items() if k & 7 == K_VAR or v & 7 == K_VAR]:
+                del env[k]
+        if op in (GOTO, IF_FALSE, IF_TRUE, SWITCH):
+            env.clear()
+    return 0, rewritten
+
+
+def algebraic_simplification(prog: TacProgram, f: TacFunction) -> Tuple[int, int]:
+    """Identidades: x+0, x-0, x*1, x/1 -> x; x*0 -> 0; x-x -> 0; x*2 -> x+x; x==x -> true."""
+    code = prog.code
+    ops, ds, as_, bs = code.op, code.d, code.a, code.b
+    zero, one, two = const_int(0), const_int(1), const_int(2)
+    rewritten = 0
+    for i in range(f.start, f.end):
+        op, d, a, b = ops[i], ds[i], as_[i], bs[i]
+        new = None
+        if op == ADD:
+            if b == zero:
+                new = (MOV, d, a, NONE)
+            elif a == zero:
+                new = (MOV, d, b, NONE)
+        elif op == SUB:
+            if b == zero:
+                new = (MOV, d, a, NONE)
+            elif a == b:
+                new = (MOV, d, zero, NONE)
+        elif op == MUL:
+            if b == one:
+                new = (MOV, d, a, NONE)
+            elif a == one:
+                new = (MOV, d, b, NONE)
+            elif b == zero or a == zero:
+                new = (MOV, d, zero, NONE)
+            elif b == two:
+                new = (ADD, d, a, a)
+            elif a == two:
+                new = (ADD, d, b, b)
+        elif op == DIV and b == one:
+            new = (MOV, d, a, NONE)
+        elif op in (EQ, LE, GE) and a == b and not is_const(a):
+            new = (MOV, d, TRUE, NONE)
+        elif op in (NE, LT, GT) and a == b and not is_const(a):
+            new = (MOV, d, FALSE, NONE)
+        if new is not None:
+            code.set(i, *new)
+            rewritten += 1
+    return 0, rewritten
+
+
+def _captured_vars(prog: TacProgram) -> set:
+    return {v for g in prog.functions for v in g.captures}
+
+
+def dead_code_elimination(prog: TacProgram, f: TacFunction) -> Tuple[int, int]:
+    """
+    - bloques inalcanzables (después de return/break, ramas con condición constante)
+    - saltos a la instrucción siguiente y etiquetas que nadie referencia
+    - asignaciones puras a temporales o locales que nunca se leen
+    """
+    code = prog.code
+    ops, ds, as_, bs = code.op, code.d, code.a, code.b
+    removed = 0
+
+    cfg = build_tac_cfg(prog, f)
+    seen = cfg.reachable()
+    for blk in range(len(cfg)):
+        if not seen[blk]:
+            for _, i in cfg.block_items(blk):
+                if ops[i] != NOP:
+                    code.set(i, NOP)
+                    removed += 1
+
+    def next_labels(i: int) -> Tuple[int, set]:
+        """Primera instrucción real después de i y las etiquetas que hay antes de ella."""
+        j = i + 1
+        here = set()
+        while j < f.end and ops[j] in (NOP, LABEL):
+            if ops[j] == LABEL:
+                here.add(as_[j])
+            j += 1
+        return j, here
+
+    for i in range(f.start, f.end):
+        op = ops[i]
+        if op in (IF_FALSE, IF_TRUE):
+            # 'if c goto A; goto B; A:' -> 'ifFalse c goto B; A:'
+            j = i + 1
+            while j < f.end and ops[j] == NOP:
+                j += 1
+            if j < f.end and ops[j] == GOTO and bs[i] in next_labels(j)[1]:
+                code.set(i, IF_TRUE if op == IF_FALSE else IF_FALSE, NONE, as_[i], as_[j])
+                code.set(j, NOP)
+                removed += 1
+                op = ops[i]
+        if op in (GOTO, IF_FALSE, IF_TRUE):
+            # goto/if a la etiqueta que sigue inmediatamente
+            target = as_[i] if op == GOTO else bs[i]
+            if target in next_labels(i)[1]:
+                code.set(i, NOP)
+                removed += 1
+
+    # etiquetas sin referencias
+    used = set()
+    for i in range(f.start, f.end):
+        if ops[i] == TRY:
+            used.add(as_[i])
+        else:
+            used.update(prog.targets(i))
+    for i in range(f.start, f.end):
+        if ops[i] == LABEL and as_[i] not in used:
+            code.set(i, NOP)
+            removed += 1
+
+    # asignaciones muertas según liveness (los temporales se reciclan, así que
+    # contar lecturas no basta)
+    for i in range(f.start, f.end):
+        if ops[i] == MOV and ds[i] == as_[i]:
+            code.set(i, NOP)
+            removed += 1
+    removed += _remove_dead_stores(prog, f)
+    return removed, 0
+
+
+def _removable(op: int, b: int) -> bool:
+    """Sin efectos además de escribir 'd' (una división por constante no nula no falla)."""
+    return op in PURE_OPS or (op in (DIV, MOD) and b & 7 == K_INT and b != const_int(0))
+
+
+def _remove_dead_stores(prog: TacProgram, f: TacFunction) -> int:
+    code = prog.code
+    ops, ds, as_, bs = code.op, code.d, code.a, code.b
+    arrays = (ds, as_, bs)
+    captured = _captured_vars(prog)
+    # operandos seguidos: temporales y variables propias no capturadas; el
+    # resto (globales, capturadas) se considera siempre vivo
+    bit: Dict[int, int] = {}
+    for v in f.locals + f.params:
+        if v not in captured:
+            bit[v] = 1 << len(bit)
+    for t in range(f.temps):
+        bit[operand(K_TEMP, t)] = 1 << len(bit)
+    if not bit:
+        return 0
+
+    cfg = build_tac_cfg(prog, f)
+    n = len(cfg)
+    gen, kill = [0] * n, [0] * n
+    for blk in range(n):
+        g = k = 0
+        for _, i in reversed(list(cfg.block_items(blk))):
+            op = ops[i]
+            if op in DEST_OPS:
+                m = bit.get(ds[i], 0)
+                g &= ~m
+                k |= m
+            for slot in READS[op]:
+                g |= bit.get(arrays[slot][i], 0)
+        gen[blk], kill[blk] = g, k
+    live = solve(cfg, gen, kill, forward=False)
+
+    # dentro de un try cualquier instrucción puede saltar al manejador: lo
+    # vivo a la entrada del manejador está vivo en todo el bloque
+    handlers = {code.a[i] for i in range(f.start, f.end) if ops[i] == TRY}
+    handler_blocks = set()
+    if handlers:
+        for blk in range(n):
+            r = cfg.item_range(blk)
+            if r and ops[cfg.items[r.start]] == LABEL and as_[cfg.items[r.start]] in handlers:
+                handler_blocks.add(blk)
+
+    removed = 0
+    for blk in range(n):
+        items = [i for _, i in cfg.block_items(blk)]
+        if not items:
+            continue
+        exc = 0
+        for s in cfg.successors(blk):
+            if s in handler_blocks:
+                exc |= live.in_[s]
+        now = live.out[blk] | exc
+        for i in reversed(items):
+            op = ops[i]
+            if op in DEST_OPS:
+                m = bit.get(ds[i])
+                if m is not None:
+                    if not now & m and _removable(op, bs[i]):
+                        code.set(i, NOP)
+                        removed += 1
+                        continue
+                    now &= ~m
+            for slot in READS[op]:
+                now |= bit.get(arrays[slot][i], 0)
+            now |= exc
+    return removed
+
+
+def propagate_global_constants(prog: TacProgram) -> Tuple[int, int]:
+    """
+    'const' globales asignadas una sola vez con un literal: se reemplazan
+    sus lecturas en todas las funciones y se borra la asignación.
+    """
+    code = prog.code
+    ops, ds, as_ = code.op, code.d, code.a
+    writes: Dict[int, List[int]] = {}
+    for i in range(len(code)):
+        if ops[i] in DEST_OPS and ds[i] & 7 == K_VAR:
+            writes.setdefault(ds[i], []).append(i)
+    values = {}
+    for var, where in writes.items():
+        info = prog.vars[var >> 3]
+        if info.const and info.kind == "global" and len(where) == 1:
+            i = where[0]
+            if ops[i] == MOV and is_const(as_[i]):
+                values[var] = (i, as_[i])
+    if not values:
+        return 0, 0
+    rewritten = removed = 0
+    arrays = (code.d, code.a, code.b)
+    for i in range(len(code)):
+        for slot in READS[ops[i]]:
+            arr = arrays[slot]
+            hit = values.get(arr[i])
+            if hit is not None:
+                arr[i] = hit[1]
+                rewritten += 1
+    for i, _ in values.values():
+        code.set(i, NOP)
+        removed += 1
+    return removed, rewritten
+
+
+# ---------------------------------------------------------------------------
+# Pass manager
+# ---------------------------------------------------------------------------
+
+@dataclass
+class PassStats:
+    name: str
+    removed: int = 0          # instrucciones eliminadas
+    rewritten: int = 0        # operandos/instrucciones reescritos
+    runs: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class OptReport:
+    before: int
+    after: int = 0
+    rounds: int = 0
+    passes: List[PassStats] = field(default_factory=list)
+
+    def to_text(self) -> str:
+        lines = [f"Optimización TAC: {self.before} -> {self.after} instrucciones "
+                 f"({self.before - self.after} eliminadas, {self.rounds} rondas)",
+                 f"{'pasada':<28} {'eliminadas':>10} {'reescritas':>10} {'ms':>8}"]
+        for p in self.passes:
+            lines.append(f"{p.name:<28} {p.removed:>10} {p.rewritten:>10} {p.seconds * 1000:>8.2f}")
+        return "\n".join(lines)
+
+
+FunctionPass = Callable[[TacProgram, TacFunction], Tuple[int, int]]
+
+DEFAULT_PASSES: List[Tuple[str, FunctionPass]] = [
+    ("constant-folding", constant_folding),
+    ("copy-propagation", copy_propagation),
+    ("algebraic-simplification", algebraic_simplification),
+    ("dead-code-elimination", dead_code_elimination),
+]
+
+
+class PassManager:
+    """
+    Corre las pasadas sobre cada función hasta que ninguna cambia nada (o
+    'max_rounds'), acumulando estadísticas por pasada, y al final compacta el
+    buffer quitando los NOP.
+    """
+
+    def __init__(self, passes: Optional[List[Tuple[str, FunctionPass]]] = None, max_rounds: int = 5):
+        self.passes = passes if passes is not None else list(DEFAULT_PASSES)
+        self.max_rounds = max_rounds
+
+    def run(self, prog: TacProgram) -> OptReport:
+        report = OptReport(before=len(prog.code))
+        stats = {name: PassStats(name) for name, _ in self.passes}
+
+        g = PassStats("global-constants")
+        for rnd in range(self.max_rounds):
+            report.rounds = rnd + 1
+            t0 = time.perf_counter()
+            removed, rewritten = propagate_global_constants(prog)
+            g.removed += removed
+            g.rewritten += rewritten
+            g.runs += 1
+            g.seconds += time.perf_counter() - t0
+            changed = bool(removed or rewritten)
+            for name, fn in self.passes:
+                st = stats[name]
+                t0 = time.perf_counter()
+                for f in prog.functions:
+                    removed, rewritten = fn(prog, f)
+                    st.removed += removed
+                    st.rewritten += rewritten
+                    changed |= bool(removed or rewritten)
+                st.runs += 1
+                st.seconds += time.perf_counter() - t0
+            if not changed:
+                break
+        report.passes.append(g)
+        report.passes.extend(stats.values())
+        compact(prog)
+        report.after = len(prog.code)
+        return report
+
+
+def compact(prog: TacProgram) -> None:
+    """Quita los NOP del buffer y corrige los rangos de las funciones."""
+    old = prog.code
+    new = TacBuffer()
+    for f in prog.functions:
+        start = len(new)
+        for i in range(f.start, f.end):
+            if old.op[i] != NOP:
+                new.emit(*old[i])
+        f.start, f.end = start, len(new)
+    prog.code = new
+
+
+def optimize(prog: TacProgram, max_rounds: int = 5) -> OptReport:
+    return PassManager(max_rounds=max_rounds).run(prog)
@@ -0,0 +1,384 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Set
+
+from intermediate.tac import (
+    TacProgram, MOV, LABEL, GOTO, IF_FALSE, IF_TRUE, RET, TRY, NOP, SWITCH, DEST_OPS, READS,
+    K_TEMP, NONE, operand,
+)
+
+_JUMPS_OR_RET = (GOTO, IF_FALSE, IF_TRUE, SWITCH, RET)
+
+
+class Phi:
+    __slots__ = ("dest", "var", "args")
+
+    def __init__(self, var: int):
+        self.var = var                    # variable original
+        self.dest = var                   # nombre SSA (se asigna al renombrar)
+        self.args: Dict[int, int] = {}    # bloque predecesor -> operando
+
+
+class Block:
+    """
+    Bloque básico mutable. 'code' son listas [op, d, a, b] sin la etiqueta ni
+    el salto final; el salto está en 'term' (GOTO, IF_FALSE, IF_TRUE, SWITCH,
+    RET o None = sigue al siguiente) con su operando en 'cond'. Para los IF,
+    succ[0] es el destino del salto y succ[1] el que sigue. Un SWITCH guarda
+    en 'table' (lo, índice de la tabla, posición en succ de cada entrada).
+    """
+
+    __slots__ = ("id", "label", "phis", "code", "term", "cond", "succ", "pred", "table")
+
+    def __init__(self, id: int, label: int = NONE):
+        self.id = id
+        self.label = label
+        self.phis: List[Phi] = []
+        self.code: List[list] = []
+        self.term: Optional[int] = None
+        self.cond = NONE
+        self.succ: List[int] = []
+        self.pred: List[int] = []
+        self.table = None
+
+
+def switch_successor(prog: TacProgram, b: Block, value: int) -> int:
+    """Bloque al que salta el SWITCH de 'b' con el valor entero 'value'."""
+    lo, _, entries = b.table
+    k = value - (lo >> 3) + 1
+    return b.succ[entries[k if 0 < k < len(entries) else 0]]
+
+
+def reads_of(ins: list):
+    """Índices (en la lista [op, d, a, b]) de los operandos que lee la instrucción."""
+    return [s + 1 for s in READS[ins[0]]]
+
+
+class SsaFunction:
+    """
+    Una función TAC en forma SSA. Se renombran los temporales y las
+    variables propias que ninguna función anidada captura; las globales y
+    las capturadas siguen siendo memoria (se leen y escriben tal cual). Cada
+    definición recibe un temporal nuevo; la versión inicial de una variable
+    es el operando original (para un parámetro, el valor recibido).
+    Las funciones con try/catch no se convierten: una excepción puede saltar
+    al manejador desde la mitad de un bloque.
+    """
+
+    def __init__(self, prog: TacProgram, fi: int):
+        self.prog = prog
+        self.fi = fi
+        f = prog.functions[fi]
+        captured = {v for g in prog.functions for v in g.captures}
+        self.own: Set[int] = {v for v in f.locals + f.params if v not in captured}
+        self.ntemps = f.temps
+        self.blocks: List[Optional[Block]] = []
+        self.order: List[int] = []        # orden de emisión
+        self.idom: Dict[int, int] = {}
+        self.children: Dict[int, List[int]] = {}
+        self.rpo_order: List[int] = []
+        self._build()
+
+    # ---------------- Utilidades ----------------
+
+    def tracked(self, op: int) -> bool:
+        return op & 7 == K_TEMP or op in self.own
+
+    def new_temp(self) -> int:
+        self.ntemps += 1
+        return operand(K_TEMP, self.ntemps - 1)
+
+    def new_block(self) -> Block:
+        b = Block(len(self.blocks))
+        self.blocks.append(b)
+        return b
+
+    def live_blocks(self) -> List[Block]:
+        return [self.blocks[i] for i in self.order]
+
+    # ---------------- Construcción ----------------
+
+    def _build(self) -> None:
+        code = self.prog.code
+        ops = code.op
+        f = self.prog.functions[self.fi]
+        idx = [i for i in range(f.start, f.end) if ops[i] != NOP]
+
+        entry = self.new_block()            # bloque 0 vacío: la entrada no tiene predecesores
+        segments: List[List[int]] = []
+        for i in idx:
+            if not segments or ops[i] == LABEL or ops[segments[-1][-1]] in _JUMPS_OR_RET:
+                segments.append([])
+            segments[-1].append(i)
+
+        by_label: Dict[int, int] = {}
+        blocks = []
+        for seg in segments:
+            b = self.new_block()
+            blocks.append(b)
+            for i in seg:
+                op, d, a, bb = code[i]
+                if op == LABEL:
+                    b.label = a
+                    by_label[a] = b.id
+                elif op in _JUMPS_OR_RET:
+                    b.term = op
+                    b.cond = a if op in (IF_FALSE, IF_TRUE, SWITCH, RET) else NONE
+                    b.succ = [bb if op in (IF_FALSE, IF_TRUE) else a] if op != RET else []
+                    if op == SWITCH:
+                        b.table = (d, bb, [])
+                else:
+                    b.code.append([op, d, a, bb])
+
+        entry.succ = [blocks[0].id] if blocks else []
+        for k, b in enumerate(blocks):
+            nxt = blocks[k + 1].id if k + 1 < len(blocks) else None
+            if b.term == GOTO:
+                b.succ = [by_label[b.succ[0]]]
+            elif b.term in (IF_FALSE, IF_TRUE):
+                target = by_label[b.succ[0]]
+                if target == nxt:
+                    b.term, b.cond = None, NONE
+                    b.succ = [target]
+                else:
+                    b.succ = [target, nxt]
+            elif b.term == SWITCH:
+                targets = [by_label[lbl] for lbl in self.prog.tables[b.table[1] >> 3]]
+                b.succ = list(dict.fromkeys(targets))
+                b.table[2][:] = [b.succ.index(t) for t in targets]
+            elif b.term is None:
+                b.succ = [nxt] if nxt is not None else []
+        self.order = [entry.id] + [b.id for b in blocks]
+        self.prune()
+
+    def prune(self) -> None:
+        """Quita los bloques inalcanzables y recalcula los predecesores."""
+        seen = {0}
+        stack = [0]
+        while stack:
+            for s in self.blocks[stack.pop()].succ:
+                if s not in seen:
+                    seen.add(s)
+                    stack.append(s)
+        for i in self.order:
+            if i not in seen:
+                self.blocks[i] = None
+        self.order = [i for i in self.order if i in seen]
+        for b in self.live_blocks():
+            b.pred = []
+        for b in self.live_blocks():
+            for s in b.succ:
+                sb = self.blocks[s]
+                if b.id not in sb.pred:
+                    sb.pred.append(b.id)
+        for b in self.live_blocks():
+            for phi in b.phis:
+                for p in [p for p in phi.args if p not in b.pred]:
+                    del phi.args[p]
+
+    # ---------------- Dominadores ----------------
+
+    def rpo(self) -> List[int]:
+        post: List[int] = []
+        seen = {0}
+        stack = [(0, 0)]
+        while stack:
+            b, k = stack.pop()
+            succ = self.blocks[b].succ
+            if k < len(succ):
+                stack.append((b, k + 1))
+                s = succ[k]
+                if s not in seen:
+                    seen.add(s)
+                    stack.append((s, 0))
+            else:
+                post.append(b)
+        post.reverse()
+        return post
+
+    def dominators(self) -> None:
+        """Árbol de dominadores (Cooper, Harvey y Kennedy)."""
+        order = self.rpo()
+        pos = {b: i for i, b in enumerate(order)}
+        idom = {0: 0}
+        changed = True
+        while changed:
+            changed = False
+            for b in order[1:]:
+                new = -1
+                for p in self.blocks[b].pred:
+                    if p not in idom:
+                        continue
+                    if new == -1:
+                        new = p
+                        continue
+                    x, y = p, new
+                    while x != y:
+                        while pos[x] > pos[y]:
+                            x = idom[x]
+                        while pos[y] > pos[x]:
+                            y = idom[y]
+                    new = x
+                if idom.get(b) != new:
+                    idom[b] = new
+                    changed = True
+        self.idom = idom
+        self.children = {b: [] for b in order}
+        for b in order[1:]:
+            self.children[idom[b]].append(b)
+        self.rpo_order = order
+
+    def dominates(self, a: int, b: int) -> bool:
+        while b != a and b != 0:
+            b = self.idom[b]
+        return b == a
+
+    def frontiers(self) -> Dict[int, Set[int]]:
+        df: Dict[int, Set[int]] = {b: set() for b in self.idom}
+        for b in self.idom:
+            preds = self.blocks[b].pred
+            if len(preds) < 2:
+                continue
+            for p in preds:
+                runner = p
+                while runner != self.idom[b]:
+                    df[runner].add(b)
+                    runner = self.idom[runner]
+        return df
+
+    # ---------------- SSA ----------------
+
+    def construct(self) -> None:
+        """Inserta las phi (semi-podadas) y renombra recorriendo el árbol de dominadores."""
+        self.dominators()
+        df = self.frontiers()
+        defsites: Dict[int, Set[int]] = {}
+        crossing: Set[int] = set()        # leídas en un bloque antes de escribirse en él
+        for b in self.live_blocks():
+            killed = set()
+            for ins in b.code:
+                for k in reads_of(ins):
+                    x = ins[k]
+                    if self.tracked(x) and x not in killed:
+                        crossing.add(x)
+                if ins[0] in DEST_OPS and self.tracked(ins[1]):
+                    killed.add(ins[1])
+                    defsites.setdefault(ins[1], set()).add(b.id)
+            if self.tracked(b.cond) and b.cond not in killed:
+                crossing.add(b.cond)
+
+        for v in crossing:
+            sites = defsites.get(v, set())
+            work = list(sites)
+            has: Set[int] = set()
+            while work:
+                n = work.pop()
+                for y in df.get(n, ()):
+                    if y not in has:
+                        has.add(y)
+                        self.blocks[y].phis.append(Phi(v))
+                        if y not in sites:
+                            work.append(y)
+
+        stacks: Dict[int, List[int]] = {}
+
+        def top(v: int) -> int:
+            s = stacks.get(v)
+            return s[-1] if s else v
+
+        work = [(0, None)]
+        while work:
+            b_id, pushed = work.pop()
+            if pushed is not None:
+                for v in pushed:
+                    stacks[v].pop()
+                continue
+            b = self.blocks[b_id]
+            pushed = []
+            for phi in b.phis:
+                phi.dest = self.new_temp()
+                stacks.setdefault(phi.var, []).append(phi.dest)
+                pushed.append(phi.var)
+            for ins in b.code:
+                for k in reads_of(ins):
+                    if self.tracked(ins[k]):
+                        ins[k] = top(ins[k])
+                if ins[0] in DEST_OPS and self.tracked(ins[1]):
+                    v = ins[1]
+                    ins[1] = self.new_temp()
+                    stacks.setdefault(v, []).append(ins[1])
+                    pushed.append(v)
+            if self.tracked(b.cond):
+                b.cond = top(b.cond)
+            for s in b.succ:
+                for phi in self.blocks[s].phis:
+                    phi.args[b_id] = top(phi.var)
+            work.append((b_id, pushed))
+            for c in reversed(self.children[b_id]):
+                work.append((c, None))
+
+    def destruct(self) -> None:
+        """
+        Saca las phi: cada phi 'd = φ(a1..an)' recibe un temporal propio p;
+        cada predecesor termina con 'p = ai' y el bloque empieza con 'd = p'.
+        Como p solo vive en el arco no hace falta partir arcos críticos ni
+        ordenar copias paralelas.
+        """
+        for b in self.live_blocks():
+            head = []
+            for phi in b.phis:
+                p = self.new_temp()
+                for pred, arg in phi.args.items():
+                    self.blocks[pred].code.append([MOV, p, arg, NONE])
+                head.append([MOV, phi.dest, p, NONE])
+            b.phis = []
+            b.code[:0] = head
+
+    # ---------------- Emisión ----------------
+
+    def emit(self) -> List[tuple]:
+        """Instrucciones lineales: etiquetas donde hacen falta y saltos explícitos."""
+        order = self.order
+        nxt = {b: order[k + 1] if k + 1 < len(order) else None for k, b in enumerate(order)}
+        for b in self.live_blocks():
+            if b.term in (IF_FALSE, IF_TRUE) and b.succ[0] == nxt[b.id] != b.succ[1]:
+                # se invierte la condición para caer en el bloque siguiente
+                b.term = IF_TRUE if b.term == IF_FALSE else IF_FALSE
+                b.succ.reverse()
+        needs = set()
+        for b in self.live_blocks():
+            if b.term == SWITCH:
+                needs.update(b.succ)
+            elif b.term in (IF_FALSE, IF_TRUE):
+                needs.add(b.succ[0])
+                if b.succ[1] != nxt[b.id]:
+                    needs.add(b.succ[1])
+            elif b.succ and b.succ[0] != nxt[b.id]:
+                needs.add(b.succ[0])
+        for i in needs:
+            if self.blocks[i].label == NONE:
+                self.blocks[i].label = self.prog.new_label()
+
+        out: List[tuple] = []
+        for b in self.live_blocks():
+            if b.id in needs:
+                out.append((LABEL, NONE, b.label, NONE))
+            out.extend(tuple(ins) for ins in b.code)
+            if b.term == RET:
+                out.append((RET, NONE, b.cond, NONE))
+            elif b.term == SWITCH:
+                lo, table, entries = b.table
+                self.prog.tables[table >> 3] = [self.blocks[b.succ[k]].label for k in entries]
+                out.append((SWITCH, lo, b.cond, table))
+            elif b.term in (IF_FALSE, IF_TRUE):
+                out.append((b.term, NONE, b.cond, self.blocks[b.succ[0]].label))
+                if b.succ[1] != nxt[b.id]:
+                    out.append((GOTO, NONE, self.blocks[b.succ[1]].label, NONE))
+            elif b.succ and b.succ[0] != nxt[b.id]:
+                out.append((GOTO, NONE, self.blocks[b.succ[0]].label, NONE))
+        return out
+
+
+def has_try(prog: TacProgram, fi: int) -> bool:
+    f = prog.functions[fi]
+    ops = prog.code.op
+    return any(ops[i] == TRY for i in range(f.start, f.end))
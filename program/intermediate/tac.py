@@ -0,0 +1,457 @@
+from __future__ import annotations
+import json
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field, asdict
+from typing import Iterator, List, Optional
+
+
+# ---------------------------------------------------------------------------
+# Opcodes
+# ---------------------------------------------------------------------------
+# Cada instrucción es (op, d, a, b). 'd' suele ser el destino; en ASTORE y
+# SETF es el objeto que se modifica.
+
+OPCODES = (
+    "NOP", "MOV",
+    "ADD", "SUB", "MUL", "DIV", "MOD", "CONCAT",
+    "EQ", "NE", "LT", "LE", "GT", "GE",
+    "NEG", "NOT",
+    "LABEL", "GOTO", "IF_FALSE", "IF_TRUE",
+    "PARAM", "CALL", "RET",
+    "PRINT",
+    "NEWARR", "ALOAD", "ASTORE", "LEN",
+    "NEW", "GETF", "SETF",
+    "TRY", "ENDTRY", "CATCH",
+    "TOSTR", "STRCMP",
+    "SWITCH", "HASH",
+    "METHOD",
+)
+(NOP, MOV,
+ ADD, SUB, MUL, DIV, MOD, CONCAT,
+ EQ, NE, LT, LE, GT, GE,
+ NEG, NOT,
+ LABEL, GOTO, IF_FALSE, IF_TRUE,
+ PARAM, CALL, RET,
+ PRINT,
+ NEWARR, ALOAD, ASTORE, LEN,
+ NEW, GETF, SETF,
+ TRY, ENDTRY, CATCH,
+ TOSTR, STRCMP,
+ SWITCH, HASH,
+ METHOD) = range(len(OPCODES))
+
+BINARY_OPS = {ADD: "+", SUB: "-", MUL: "*", DIV: "/", MOD: "%",
+              EQ: "==", NE: "!=", LT: "<", LE: "<=", GT: ">", GE: ">="}
+JUMPS = (GOTO, IF_FALSE, IF_TRUE, SWITCH)
+# instrucciones cuyo operando 'd' es un destino escrito
+DEST_OPS = frozenset((MOV, ADD, SUB, MUL, DIV, MOD, CONCAT, EQ, NE, LT, LE, GT, GE,
+                      NEG, NOT, CALL, NEWARR, ALOAD, LEN, NEW, GETF, CATCH, TOSTR, STRCMP, HASH,
+                      METHOD))
+# operandos que cada instrucción lee (0 = d, 1 = a, 2 = b)
+READS = [()] * len(OPCODES)
+for _op in (MOV, NEG, NOT, IF_FALSE, IF_TRUE, PARAM, CALL, RET, PRINT, NEWARR, LEN, GETF,
+            SWITCH, HASH, METHOD):
+    READS[_op] = (1,)
+for _op in (ADD, SUB, MUL, DIV, MOD, CONCAT, EQ, NE, LT, LE, GT, GE, ALOAD, TOSTR, STRCMP):
+    READS[_op] = (1, 2)
+READS[ASTORE] = (0, 1, 2)
+READS[SETF] = (0, 2)
+READS = tuple(READS)
+# sin efectos además de escribir 'd' (se pueden borrar si 'd' no se usa)
+PURE_OPS = frozenset((MOV, ADD, SUB, MUL, CONCAT, EQ, NE, LT, LE, GT, GE, NEG, NOT, NEW,
+                      TOSTR, STRCMP, HASH))
+
+# 'switch a' salta por una tabla: d = K_INT con el menor valor (lo), b = K_INT
+# con el índice en TacProgram.tables. La tabla es [por defecto, L(lo),
+# L(lo+1), ...]; un valor fuera de rango va a la etiqueta por defecto.
+# 'd = hash a, m' es el hash del texto del string a (31*h + byte, sobre
+# UTF-8, en 32 bits) módulo m, una potencia de 2: la cubeta de un switch de strings.
+#
+# Objetos (ver semantic/frames.py): en 'new' a es el nombre de la clase; en
+# GETF/SETF el campo es un K_INT con el índice en TacProgram.fields, que
+# guarda (nombre, offset). 'd = method a, k' lee el método del slot k de la
+# vtable del objeto a; la llamada virtual es un 'call d' sobre ese valor.
+
+
+def str_hash(s: str, m: int) -> int:
+    h = 0
+    for byte in s.encode("utf-8"):
+        h = (h * 31 + byte) & 0xFFFFFFFF
+    return h & (m - 1)
+
+# Tipo estático de un valor para 'print' y 'tostr' (operando b, como K_INT):
+# la clase base en los 3 bits bajos y las dimensiones de arreglo encima.
+# El intérprete no lo necesita, pero un backend sin tipos en tiempo de
+# ejecución (MIPS) sí.
+TAG_STRING, TAG_INT, TAG_BOOL, TAG_NULL, TAG_OBJECT = range(5)
+
+
+# ---------------------------------------------------------------------------
+# Operandos: un entero con el tipo en los 3 bits bajos
+# ---------------------------------------------------------------------------
+
+K_NONE, K_TEMP, K_VAR, K_INT, K_STR, K_LABEL, K_NAME, K_CONST = range(8)
+_KBITS = 3
+_KMASK = (1 << _KBITS) - 1
+
+NONE = 0
+C_NULL, C_FALSE, C_TRUE = 0, 1, 2
+
+# rango de un K_INT: el valor va corrido _KBITS bits dentro de un int64
+INT_MIN, INT_MAX = -(1 << (63 - _KBITS)), (1 << (63 - _KBITS)) - 1
+
+
+def operand(kind: int, value: int) -> int:
+    return (value << _KBITS) | kind
+
+
+def kind_of(op: int) -> int:
+    return op & _KMASK
+
+
+def value_of(op: int) -> int:
+    return op >> _KBITS
+
+
+def temp(i: int) -> int:
+    return operand(K_TEMP, i)
+
+
+def const_int(v: int) -> int:
+    return operand(K_INT, v)
+
+
+NULL = operand(K_CONST, C_NULL)
+FALSE = operand(K_CONST, C_FALSE)
+TRUE = operand(K_CONST, C_TRUE)
+
+
+def is_temp(op: int) -> bool:
+    return op & _KMASK == K_TEMP
+
+
+# ---------------------------------------------------------------------------
+# Buffer de instrucciones
+# ---------------------------------------------------------------------------
+
+class TacBuffer:
+    """
+    Instrucciones en cuatro arreglos paralelos (opcode + tres operandos
+    codificados como enteros), sin un objeto por instrucción.
+    """
+
+    __slots__ = ("op", "d", "a", "b")
+
+    def __init__(self) -> None:
+        self.op = array("B")
+        self.d = array("q")
+        self.a = array("q")
+        self.b = array("q")
+
+    def emit(self, op: int, d: int = NONE, a: int = NONE, b: int = NONE) -> int:
+        self.op.append(op)
+        self.d.append(d)
+        self.a.append(a)
+        self.b.append(b)
+        return len(self.op) - 1
+
+    def __len__(self) -> int:
+        return len(self.op)
+
+    def __getitem__(self, i: int) -> tuple[int, int, int, int]:
+        return self.op[i], self.d[i], self.a[i], self.b[i]
+
+    def __iter__(self) -> Iterator[tuple[int, int, int, int]]:
+        return zip(self.op, self.d, self.a, self.b)
+
+    def set(self, i: int, op: int, d: int = NONE, a: int = NONE, b: int = NONE) -> None:
+        self.op[i], self.d[i], self.a[i], self.b[i] = op, d, a, b
+
+
+# ---------------------------------------------------------------------------
+# Programa TAC
+# ---------------------------------------------------------------------------
+
+@dataclass
+class TacVar:
+    name: str              # nombre para mostrar (único en el programa)
+    kind: str              # 'global' | 'local' | 'param'
+    func: int              # función dueña (-1 para globales)
+    type: str = ""
+    const: bool = False    # declarada con 'const' (se asigna una sola vez)
+    # posición que le dio semantic/frames.py (None si no hay símbolo): offset
+    # respecto de $gp (globales), dentro del registro de entorno de su dueña
+    # (captured) o, para los locales, dentro de la zona de locales del marco
+    slot: Optional[int] = None
+    captured: bool = False
+
+
+@dataclass
+class TacFunction:
+    name: str
+    start: int             # rango de instrucciones [start, end) en el buffer
+    end: int = 0
+    params: List[int] = field(default_factory=list)     # operandos K_VAR
+    locals: List[int] = field(default_factory=list)
+    temps: int = 0         # temporales distintos que necesita (tras reciclar)
+    class_name: str = ""   # métodos: clase dueña ('this' es params[0])
+    parent: int = -1       # funciones anidadas: función que la contiene
+    captures: List[int] = field(default_factory=list)   # variables (K_VAR) de funciones externas
+
+
+@dataclass
+class TacClass:
+    name: str
+    size: int              # bytes del objeto (palabra 0 = vtable)
+    methods: List[str] = field(default_factory=list)    # vtable: slot -> función
+
+
+class TacProgram:
+    """Código de todas las funciones en un solo TacBuffer más sus tablas."""
+
+    MAGIC = b"CTAC"
+    VERSION = 1
+
+    def __init__(self) -> None:
+        self.code = TacBuffer()
+        self.functions: List[TacFunction] = []
+        self.vars: List[TacVar] = []
+        self.strings: List[str] = []
+        self.names: List[str] = []        # funciones, clases y campos
+        self.tables: List[List[int]] = [] # tablas de salto de 'switch' (etiquetas)
+        self.classes: List[TacClass] = []
+        self.fields: List[List] = []      # [nombre, offset] de cada campo accedido
+        self.labels = 0
+        self._string_ids: dict[str, int] = {}
+        self._name_ids: dict[str, int] = {}
+        self._var_names: dict[tuple[int, str], int] = {}
+        self._field_ids: dict[tuple[str, int], int] = {}
+
+    # ---------------- Tablas ----------------
+
+    def string(self, s: str) -> int:
+        i = self._string_ids.get(s)
+        if i is None:
+            i = len(self.strings)
+            self.strings.append(s)
+            self._string_ids[s] = i
+        return operand(K_STR, i)
+
+    def name(self, s: str) -> int:
+        i = self._name_ids.get(s)
+        if i is None:
+            i = len(self.names)
+            self.names.append(s)
+            self._name_ids[s] = i
+        return operand(K_NAME, i)
+
+    def new_table(self, labels: List[int]) -> int:
+        self.tables.append(list(labels))
+        return operand(K_INT, len(self.tables) - 1)
+
+    def field(self, name: str, offset: int) -> int:
+        key = (name, offset)
+        i = self._field_ids.get(key)
+        if i is None:
+            i = len(self.fields)
+            self.fields.append([name, offset])
+            self._field_ids[key] = i
+        return operand(K_INT, i)
+
+    def field_offset(self, op: int) -> int:
+        return self.fields[op >> _KBITS][1]
+
+    def class_of(self, name: str) -> Optional[TacClass]:
+        for c in self.classes:
+            if c.name == name:
+                return c
+        return None
+
+    def targets(self, i: int) -> List[int]:
+        """Etiquetas a las que puede saltar la instrucción i (vacío si no es un salto)."""
+        op = self.code.op[i]
+        if op == GOTO:
+            return [self.code.a[i]]
+        if op in (IF_FALSE, IF_TRUE):
+            return [self.code.b[i]]
+        if op == SWITCH:
+            return self.tables[self.code.b[i] >> _KBITS]
+        return []
+
+    def new_label(self) -> int:
+        self.labels += 1
+        return operand(K_LABEL, self.labels - 1)
+
+    def new_var(self, name: str, kind: str, func: int, type_name: str = "", const: bool = False) -> int:
+        """
+        Crea una variable. Si el nombre ya existe en la misma función o entre
+        las globales (sombra) se le agrega un sufijo para que el texto no sea ambiguo.
+        """
+        n = max(self._var_names.get((func, name), 0), self._var_names.get((-1, name), 0))
+        self._var_names[(func, name)] = n + 1
+        shown = name if n == 0 else f"{name}.{n}"
+        self.vars.append(TacVar(shown, kind, func, type_name, const))
+        return operand(K_VAR, len(self.vars) - 1)
+
+    def function(self, name: str) -> Optional[TacFunction]:
+        for f in self.functions:
+            if f.name == name:
+                return f
+        return None
+
+    # ---------------- Texto ----------------
+
+    def fmt(self, op: int) -> str:
+        k, v = op & _KMASK, op >> _KBITS
+        if k == K_TEMP:
+            return f"t{v}"
+        if k == K_VAR:
+            return self.vars[v].name
+        if k == K_INT:
+            return str(v)
+        if k == K_STR:
+            return json.dumps(self.strings[v], ensure_ascii=False)
+        if k == K_LABEL:
+            return f"L{v}"
+        if k == K_NAME:
+            return self.names[v]
+        if k == K_CONST:
+            return ("null", "false", "true")[v]
+        return "_"
+
+    def format_instr(self, i: int) -> str:
+        return format_instr(self, *self.code[i])
+
+    def to_text(self) -> str:
+        lines = []
+        for f in self.functions:
+            params = ", ".join(self.vars[value_of(p)].name for p in f.params)
+            lines.append(f"function {f.name}({params}):   # temps={f.temps}")
+            for i in range(f.start, f.end):
+                text = self.format_instr(i)
+                lines.append(text if text.endswith(":") else "    " + text)
+            lines.append("")
+        return "\n".join(lines)
+
+    # ---------------- Binario ----------------
+
+    def to_bytes(self) -> bytes:
+        """Encabezado + metadatos (JSON) + los cuatro arreglos del buffer, todo little-endian."""
+        meta = json.dumps({
+            "functions": [asdict(f) for f in self.functions],
+            "vars": [asdict(v) for v in self.vars],
+            "strings": self.strings,
+            "names": self.names,
+            "tables": self.tables,
+            "classes": [asdict(c) for c in self.classes],
+            "fields": self.fields,
+            "labels": self.labels,
+        }, ensure_ascii=False).encode("utf-8")
+        n = len(self.code)
+        parts = [self.MAGIC, struct.pack("<HII", self.VERSION, len(meta), n), meta, self.code.op.tobytes()]
+        parts.extend(_little_endian(arr).tobytes() for arr in (self.code.d, self.code.a, self.code.b))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TacProgram":
+        if data[:4] != cls.MAGIC:
+            raise ValueError("No es un archivo TAC binario")
+        version, meta_len, n = struct.unpack_from("<HII", data, 4)
+        if version != cls.VERSION:
+            raise ValueError(f"Versión de TAC no soportada: {version}")
+        pos = 4 + struct.calcsize("<HII")
+        meta = json.loads(data[pos:pos + meta_len].decode("utf-8"))
+        pos += meta_len
+        prog = cls()
+        for name, width in (("op", 1), ("d", 8), ("a", 8), ("b", 8)):
+            arr = getattr(prog.code, name)
+            arr.frombytes(data[pos:pos + n * width])
+            if width > 1 and sys.byteorder == "big":
+                arr.byteswap()
+            pos += n * width
+        prog.functions = [TacFunction(**f) for f in meta["functions"]]
+        prog.vars = [TacVar(**v) for v in meta["vars"]]
+        prog.strings = meta["strings"]
+        prog.names = meta["names"]
+        prog.tables = meta.get("tables", [])
+        prog.classes = [TacClass(**c) for c in meta.get("classes", [])]
+        prog.fields = meta.get("fields", [])
+        prog._field_ids = {(n, o): i for i, (n, o) in enumerate(prog.fields)}
+        prog.labels = meta["labels"]
+        prog._string_ids = {s: i for i, s in enumerate(prog.strings)}
+        prog._name_ids = {s: i for i, s in enumerate(prog.names)}
+        return prog
+
+
+def _little_endian(arr: array) -> array:
+    """'arr' con sus elementos en little-endian (una copia si la máquina es big-endian)."""
+    if sys.byteorder == "little":
+        return arr
+    swapped = array(arr.typecode, arr)
+    swapped.byteswap()
+    return swapped
+
+
+def format_instr(prog: TacProgram, op: int, d: int, a: int, b: int) -> str:
+    f = prog.fmt
+    if op == MOV:
+        return f"{f(d)} = {f(a)}"
+    if op in BINARY_OPS:
+        return f"{f(d)} = {f(a)} {BINARY_OPS[op]} {f(b)}"
+    if op == CONCAT:
+        return f"{f(d)} = concat {f(a)}, {f(b)}"
+    if op == TOSTR:
+        return f"{f(d)} = tostr {f(a)}"
+    if op == STRCMP:
+        return f"{f(d)} = strcmp {f(a)}, {f(b)}"
+    if op == NEG:
+        return f"{f(d)} = -{f(a)}"
+    if op == NOT:
+        return f"{f(d)} = !{f(a)}"
+    if op == LABEL:
+        return f"{f(a)}:"
+    if op == GOTO:
+        return f"goto {f(a)}"
+    if op == IF_FALSE:
+        return f"ifFalse {f(a)} goto {f(b)}"
+    if op == IF_TRUE:
+        return f"if {f(a)} goto {f(b)}"
+    if op == PARAM:
+        return f"param {f(a)}"
+    if op == CALL:
+        call = f"call {f(a)}, {value_of(b)}"
+        return f"{f(d)} = {call}" if d != NONE else call
+    if op == RET:
+        return f"return {f(a)}" if a != NONE else "return"
+    if op == PRINT:
+        return f"print {f(a)}"
+    if op == NEWARR:
+        return f"{f(d)} = newarray {f(a)}"
+    if op == ALOAD:
+        return f"{f(d)} = {f(a)}[{f(b)}]"
+    if op == ASTORE:
+        return f"{f(d)}[{f(a)}] = {f(b)}"
+    if op == LEN:
+        return f"{f(d)} = len {f(a)}"
+    if op == NEW:
+        return f"{f(d)} = new {f(a)}"
+    if op == GETF:
+        return f"{f(d)} = {f(a)}.{prog.fields[value_of(b)][0]}"
+    if op == SETF:
+        return f"{f(d)}.{prog.fields[value_of(a)][0]} = {f(b)}"
+    if op == TRY:
+        return f"try {f(a)}"
+    if op == ENDTRY:
+        return "endtry"
+    if op == CATCH:
+        return f"{f(d)} = catch"
+    if op == SWITCH:
+        default, *table = prog.tables[value_of(b)]
+        return f"switch {f(a)}, {f(d)} [{', '.join(f(x) for x in table)}] else {f(default)}"
+    if op == HASH:
+        return f"{f(d)} = hash {f(a)}, {f(b)}"
+    if op == METHOD:
+        return f"{f(d)} = method {f(a)}, {f(b)}"
+    return "nop"
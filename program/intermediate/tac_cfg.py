@@ -0,0 +1,78 @@
+from __future__ import annotations
+from typing import Dict
+
+from semantic.cfg import CFG, CFGBuilder, IT_STMT
+from intermediate.tac import (
+    TacProgram, TacFunction, LABEL, GOTO, IF_FALSE, IF_TRUE, RET, TRY, NOP, SWITCH,
+)
+
+
+def label_positions(prog: TacProgram, f: TacFunction) -> Dict[int, int]:
+    """Etiqueta (operando) -> posición de su LABEL dentro de la función."""
+    code = prog.code
+    return {code.a[i]: i for i in range(f.start, f.end) if code.op[i] == LABEL}
+
+
+def build_tac_cfg(prog: TacProgram, f: TacFunction) -> CFG:
+    """
+    CFG de una función TAC con el mismo CFGBuilder que usa el checker: los
+    ítems son índices de instrucción. Un bloque empieza en la primera
+    instrucción, en cada LABEL y después de cada salto (también 'switch') o return. Los bloques
+    dentro de un try (entre TRY y su etiqueta de manejador) tienen además un
+    arco al manejador.
+    """
+    code = prog.code
+    ops = code.op
+    labels = label_positions(prog, f)
+
+    leaders = {f.start}
+    for i in range(f.start, f.end):
+        op = ops[i]
+        if op == LABEL:
+            leaders.add(i)
+        elif op in (GOTO, IF_FALSE, IF_TRUE, SWITCH, RET) and i + 1 < f.end:
+            leaders.add(i + 1)
+    starts = sorted(leaders)
+
+    b = CFGBuilder()
+    block_of: Dict[int, int] = {}
+    for s in starts:
+        block_of[s] = b.new_block("L" if ops[s] == LABEL else "B")
+    b.add_edge(b.entry, block_of[f.start])
+
+    # regiones de try: [TRY, etiqueta del manejador)
+    regions = []
+    for i in range(f.start, f.end):
+        if ops[i] == TRY and code.a[i] in labels:
+            regions.append((i, labels[code.a[i]]))
+
+    for k, s in enumerate(starts):
+        e = starts[k + 1] if k + 1 < len(starts) else f.end
+        blk = block_of[s]
+        for i in range(s, e):
+            if ops[i] != NOP:
+                b.add_item(blk, IT_STMT, i)
+        last = e - 1
+        op = ops[last]
+        if op == GOTO:
+            b.add_edge(blk, block_of[labels[code.a[last]]])
+        elif op in (IF_FALSE, IF_TRUE):
+            b.add_edge(blk, block_of[labels[code.b[last]]])
+            if e < f.end:
+                b.add_edge(blk, block_of[e])
+        elif op == SWITCH:
+            for lbl in prog.targets(last):
+                b.add_edge(blk, block_of[labels[lbl]])
+        elif op == RET:
+            b.add_edge(blk, b.exit)
+        elif e < f.end:
+            b.add_edge(blk, block_of[e])
+        else:
+            b.add_edge(blk, b.end)
+        for i in range(s, e):
+            if ops[i] == TRY and code.a[i] in labels:
+                b.add_edge(blk, block_of[labels[code.a[i]]])
+        for t, h in regions:
+            if t < s < h:
+                b.add_edge(blk, block_of[h])
+    return b.freeze()
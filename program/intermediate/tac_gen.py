@@ -0,0 +1,909 @@
+from __future__ import annotations
+import re
+from collections import deque
+from typing import List, Optional
+
+from CompiscriptParser import CompiscriptParser
+from CompiscriptVisitor import CompiscriptVisitor
+from semantic.cfg import for_parts
+from semantic.symbols import VarSymbol, ParamSymbol, FuncSymbol, ClassSymbol
+from semantic.typesys import FunctionType, arithmetic_type, T_VOID
+from intermediate.tac import (
+    TacProgram, TacFunction, TacClass,
+    MOV, ADD, SUB, MUL, DIV, MOD, CONCAT, EQ, NE, LT, LE, GT, GE, NEG, NOT,
+    LABEL, GOTO, IF_FALSE, IF_TRUE, PARAM, CALL, RET, PRINT,
+    NEWARR, ALOAD, ASTORE, LEN, NEW, GETF, SETF, TRY, ENDTRY, CATCH, TOSTR, STRCMP, DEST_OPS,
+    SWITCH, HASH, METHOD, str_hash,
+    TAG_STRING, TAG_INT, TAG_BOOL, TAG_NULL, TAG_OBJECT,
+    NONE, NULL, TRUE, FALSE, K_INT, K_STR, INT_MIN, INT_MAX, const_int, temp, is_temp, kind_of, value_of,
+)
+
+P = CompiscriptParser
+
+MAIN = "__main__"
+_ARITH = {"+": ADD, "-": SUB, "*": MUL, "/": DIV, "%": MOD}
+_COMPARE = {"==": EQ, "!=": NE, "<": LT, "<=": LE, ">": GT, ">=": GE}
+
+# switch con casos constantes: hasta SWITCH_LINEAR valores se comparan en
+# secuencia; más que eso, tabla de saltos si ocupan al menos SWITCH_DENSITY
+# del rango y si no búsqueda binaria (que vuelve a probar la tabla en cada mitad)
+SWITCH_LINEAR = 3
+SWITCH_DENSITY = 0.4
+_INT_CASE = re.compile(r"-?[0-9]+")
+
+
+class TempPool:
+    """
+    Temporales de una función. Los liberados vuelven a una free list (pila)
+    y se reutilizan antes de crear uno nuevo, así que 'count' termina siendo
+    el máximo de temporales vivos a la vez y no el total de subexpresiones.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._free: List[int] = []
+        self._is_free: set[int] = set()
+
+    def new(self) -> int:
+        if self._free:
+            i = self._free.pop()
+            self._is_free.discard(i)
+            return temp(i)
+        self.count += 1
+        return temp(self.count - 1)
+
+    def release(self, *ops: int) -> None:
+        for op in ops:
+            if is_temp(op):
+                i = value_of(op)
+                if i not in self._is_free:
+                    self._is_free.add(i)
+                    self._free.append(i)
+
+
+class _Job:
+    """Función pendiente de generar (las anidadas y los métodos se generan después de su contenedor)."""
+
+    def __init__(self, name: str, ctx, sym, class_name: str = "", parent: int = -1):
+        self.name = name
+        self.ctx = ctx
+        self.sym = sym
+        self.class_name = class_name
+        self.parent = parent
+
+
+class TacGenerator(CompiscriptVisitor):
+    """
+    Traduce el árbol ya chequeado a TAC. Usa del TypeChecker el índice de
+    posiciones (qué símbolo es cada identificador) y los tipos registrados
+    con record_types=True (concatenación de strings, clase de un objeto).
+
+    Los métodos visit* de expresiones devuelven un operando; si es un
+    temporal, quien lo recibe es responsable de liberarlo.
+    """
+
+    def __init__(self, checker):
+        super().__init__()
+        self.checker = checker
+        self.types = checker.types or {}
+        self.prog = TacProgram()
+        self.code = self.prog.code
+        self.layouts = checker.scopes.tree.classes     # nombre -> ClassLayout (semantic/frames.py)
+        self._vars: dict[int, int] = {}          # id(símbolo) -> operando K_VAR
+        self._func_names: dict[int, str] = {}    # id(FuncSymbol) -> nombre TAC
+        self._jobs: deque[_Job] = deque()
+        self._taken: set[str] = {MAIN}           # nombres de función ya asignados
+        self.fn = -1
+        self.frame = None                               # FrameLayout de la función que se genera
+        self.temps = TempPool()
+        self.breaks: List[tuple[int, int]] = []      # (label, profundidad de try)
+        self.continues: List[tuple[int, int]] = []
+        self.try_depth = 0
+        self.this_op = NONE
+
+    # ---------------- Entrada ----------------
+
+    def generate(self, tree) -> TacProgram:
+        self.prog.classes = [TacClass(c.name, c.size, list(c.methods)) for c in self.layouts.values()]
+        self._function(MAIN, tree.statement(), params=(), class_name="", parent=-1,
+                       frame=self.checker.scopes.tree.frames.get(0))
+        while self._jobs:
+            job = self._jobs.popleft()
+            fctx = job.ctx
+            params = fctx.parameters().parameter() if fctx.parameters() else ()
+            self._function(job.name, fctx.block().statement(), params, job.class_name, job.parent,
+                           frame=getattr(job.sym, "frame", None))
+        return self.prog
+
+    def _function(self, name, statements, params, class_name, parent, frame=None) -> None:
+        fi = len(self.prog.functions)
+        self.frame = frame
+        f = TacFunction(name, start=len(self.code), class_name=class_name, parent=parent)
+        self.prog.functions.append(f)
+        self.fn, self.temps, self.try_depth = fi, TempPool(), 0
+        self.breaks, self.continues = [], []
+        self.this_op = NONE
+        if class_name:
+            self.this_op = self.prog.new_var("this", "param", fi, class_name)
+            f.params.append(self.this_op)
+        for p in params:
+            sym = self.symbol(p.Identifier())
+            op = self.prog.new_var(p.Identifier().getText(), "param", fi, _type_name(sym))
+            if sym is not None:
+                self._vars[id(sym)] = op
+                self.place(op, sym)
+            f.params.append(op)
+
+        for stmt in statements:
+            self.visit(stmt)
+        if len(self.code) == f.start or self.code.op[-1] != RET:
+            self.code.emit(RET)
+        f.end = len(self.code)
+        f.temps = self.temps.count
+
+    # ---------------- Utilidades ----------------
+
+    def symbol(self, terminal):
+        tok = terminal.getSymbol()
+        return self.checker.index.symbol_at(tok.line, tok.column)
+
+    def emit(self, op: int, d: int = NONE, a: int = NONE, b: int = NONE) -> int:
+        return self.code.emit(op, d, a, b)
+
+    def label(self, lbl: int) -> None:
+        self.emit(LABEL, a=lbl)
+
+    def var_of(self, sym) -> int:
+        op = self._vars.get(id(sym))
+        if op is None:
+            return self.prog.name(sym.name)
+        info = self.prog.vars[value_of(op)]
+        if info.func not in (-1, self.fn):
+            caps = self.prog.functions[self.fn].captures
+            if op not in caps:
+                caps.append(op)
+        return op
+
+    def declare(self, terminal, const: bool = False) -> int:
+        """Crea la variable TAC de la declaración cuyo identificador es 'terminal'."""
+        sym = self.symbol(terminal)
+        kind = "global" if self.fn == 0 and self._at_top_level(terminal) else "local"
+        op = self.prog.new_var(terminal.getText(), kind, -1 if kind == "global" else self.fn,
+                               _type_name(sym), const)
+        if sym is not None:
+            self._vars[id(sym)] = op
+            self.place(op, sym)
+        if kind == "local":
+            self.prog.functions[self.fn].locals.append(op)
+        return op
+
+    def place(self, op: int, sym) -> None:
+        """Copia a la variable TAC la posición que le dio semantic/frames.py."""
+        info = self.prog.vars[value_of(op)]
+        if sym.offset is None:
+            return
+        if sym.captured:
+            info.slot, info.captured = sym.offset, True
+        elif info.kind == "global":
+            info.slot = sym.offset
+        elif info.kind == "local" and self.frame is not None:
+            info.slot = -sym.offset - self.frame.locals_base
+        # los parámetros no capturados llegan donde los deja el llamador
+
+    @staticmethod
+    def _at_top_level(terminal) -> bool:
+        """True si es un let/const que es sentencia directa del programa (variable global)."""
+        decl = terminal.parentCtx
+        if not isinstance(decl, (P.VariableDeclarationContext, P.ConstantDeclarationContext)):
+            return False
+        stmt = decl.parentCtx
+        return isinstance(stmt, P.StatementContext) and isinstance(stmt.parentCtx, P.ProgramContext)
+
+    def assign(self, dst: int, value: int) -> None:
+        """dst = value, reapuntando la última instrucción si fue la que produjo el temporal."""
+        code = self.code
+        if is_temp(value) and len(code) and code.d[-1] == value and code.op[-1] in DEST_OPS:
+            code.d[-1] = dst
+        else:
+            self.emit(MOV, dst, value)
+        self.temps.release(value)
+
+    def tag(self, t) -> int:
+        return type_tag(t, lambda name: isinstance(self.checker.scopes.stack[0].resolve(name), ClassSymbol))
+
+    def value_tag(self, v: int, t) -> int:
+        """
+        Tag para 'print'/'tostr' de un valor de tipo 't'. Si el checker dejó
+        'void' (o nada) para la expresión se deduce de la instrucción que
+        produjo el valor: concat/tostr dan string y las comparaciones boolean.
+        """
+        if t is not None and t.name != T_VOID:
+            return self.tag(t)
+        code = self.code
+        i = len(code)
+        while is_temp(v):
+            i -= 1
+            while i >= 0 and (code.d[i] != v or code.op[i] not in DEST_OPS):
+                i -= 1
+            if i < 0:
+                return TAG_INT
+            op = code.op[i]
+            if op in (CONCAT, TOSTR):
+                return TAG_STRING
+            if op in _COMPARE.values() or op == NOT:
+                return TAG_BOOL
+            if op != MOV:
+                return TAG_INT
+            v = code.a[i]                      # copia: se sigue hacia su origen
+        if v == TRUE or v == FALSE:
+            return TAG_BOOL
+        if v == NULL:
+            return TAG_NULL
+        return TAG_STRING if kind_of(v) == K_STR else TAG_INT
+
+    def type_of(self, ctx):
+        """Tipo registrado de la expresión, bajando por los nodos de un solo hijo si no tiene."""
+        while ctx is not None:
+            t = self.types.get(ctx)
+            if t is not None or ctx.getChildCount() != 1:
+                return t
+            ctx = ctx.getChild(0)
+        return None
+
+    def func_name(self, sym) -> str:
+        return self._func_names.get(id(sym), sym.name)
+
+    def class_symbol(self, type_) -> Optional[ClassSymbol]:
+        if type_ is None:
+            return None
+        sym = self.checker.scopes.stack[0].resolve(type_.name)
+        return sym if isinstance(sym, ClassSymbol) else None
+
+    def find_method(self, cls: Optional[ClassSymbol], name: str):
+        """(clase que lo define, FuncSymbol) buscando en la jerarquía."""
+        while isinstance(cls, ClassSymbol):
+            if name in cls.methods:
+                return cls.name, cls.methods[name]
+            cls = self.checker.scopes.stack[0].resolve(cls.base) if cls.base else None
+        return None, None
+
+    def field(self, type_, name: str) -> int:
+        """Operando del campo 'name' con el offset que tiene en la clase estática 'type_'."""
+        layout = self.layouts.get(type_.name) if type_ is not None else None
+        offset = layout.fields.get(name) if layout is not None else None
+        if offset is None:
+            offset = next((c.fields[name] for c in self.layouts.values() if name in c.fields), 0)
+        return self.prog.field(name, offset)
+
+    def overridden(self, cname: str, method: str) -> bool:
+        """Alguna subclase de 'cname' redefine 'method' (la llamada tiene que ser virtual)."""
+        layout = self.layouts[cname]
+        slot = layout.slots[method]
+        for other in self.layouts.values():
+            base = other.base
+            while base is not None and base != cname:
+                base = self.layouts[base].base if base in self.layouts else None
+            if base == cname and other.methods[slot] != layout.methods[slot]:
+                return True
+        return False
+
+    def call(self, target: int, pre_args: List[int], args_ctx, returns: bool, keep: int = NONE) -> int:
+        """
+        Evalúa todos los argumentos y luego emite los 'param' juntos (no se
+        intercalan con llamadas anidadas). 'keep' es un argumento que sigue
+        vivo después de la llamada (el objeto recién creado en 'new').
+        """
+        args = list(pre_args)
+        if args_ctx is not None:
+            args.extend(self.visit(e) for e in args_ctx.expression())
+        for a in args:
+            self.emit(PARAM, a=a)
+        self.temps.release(*(a for a in args if a != keep))
+        dst = self.temps.new() if returns else NONE
+        self.emit(CALL, dst, target, const_int(len(args)))
+        return dst
+
+    # ---------------- Sentencias ----------------
+
+    def visitStatement(self, ctx):
+        return self.visit(ctx.getChild(0))
+
+    def visitBlock(self, ctx):
+        for stmt in ctx.statement():
+            self.visit(stmt)
+
+    def visitVariableDeclaration(self, ctx):
+        var = self.declare(ctx.Identifier())
+        if ctx.initializer() is not None:
+            self.assign(var, self.visit(ctx.initializer().expression()))
+
+    def visitConstantDeclaration(self, ctx):
+        var = self.declare(ctx.Identifier(), const=True)
+        self.assign(var, self.visit(ctx.expression()))
+
+    def visitAssignment(self, ctx):
+        exprs = ctx.expression()
+        if len(exprs) == 1:
+            sym = self.symbol(ctx.Identifier())
+            self.assign(self.var_of(sym), self.visit(exprs[0]))
+        else:
+            obj = self.visit(exprs[0])
+            value = self.visit(exprs[1])
+            self.emit(SETF, obj, self.field(self.type_of(exprs[0]), ctx.Identifier().getText()), value)
+            self.temps.release(obj, value)
+
+    def visitExpressionStatement(self, ctx):
+        self.temps.release(self.visit(ctx.expression()))
+
+    def visitPrintStatement(self, ctx):
+        v = self.visit(ctx.expression())
+        self.emit(PRINT, a=v, b=const_int(self.value_tag(v, self.type_of(ctx.expression()))))
+        self.temps.release(v)
+
+    def visitFunctionDeclaration(self, ctx):
+        sym = self.symbol(ctx.Identifier())
+        name = ctx.Identifier().getText()
+        if self.fn > 0:
+            name = f"{self.prog.functions[self.fn].name}.{name}"
+        base, n = name, 1
+        while name in self._taken:
+            n += 1
+            name = f"{base}.{n}"
+        self._taken.add(name)
+        if sym is not None:
+            self._func_names[id(sym)] = name
+        self._jobs.append(_Job(name, ctx, sym, parent=self.fn if self.fn > 0 else -1))
+
+    def visitClassDeclaration(self, ctx):
+        cname = ctx.Identifier(0).getText()
+        for member in ctx.classMember():
+            fctx = member.functionDeclaration()
+            if fctx is not None:
+                name = f"{cname}.{fctx.Identifier().getText()}"
+                self._jobs.append(_Job(name, fctx, self.symbol(fctx.Identifier()), class_name=cname))
+
+    def visitIfStatement(self, ctx):
+        else_lbl = self.prog.new_label()
+        c = self.visit(ctx.expression())
+        self.emit(IF_FALSE, a=c, b=else_lbl)
+        self.temps.release(c)
+        self.visit(ctx.block(0))
+        if ctx.block(1) is not None:
+            end_lbl = self.prog.new_label()
+            self.emit(GOTO, a=end_lbl)
+            self.label(else_lbl)
+            self.visit(ctx.block(1))
+            self.label(end_lbl)
+        else:
+            self.label(else_lbl)
+
+    def _loop_body(self, block, brk: int, cont: int) -> None:
+        self.breaks.append((brk, self.try_depth))
+        self.continues.append((cont, self.try_depth))
+        self.visit(block)
+        self.breaks.pop()
+        self.continues.pop()
+
+    def visitWhileStatement(self, ctx):
+        cond_lbl, end_lbl = self.prog.new_label(), self.prog.new_label()
+        self.label(cond_lbl)
+        c = self.visit(ctx.expression())
+        self.emit(IF_FALSE, a=c, b=end_lbl)
+        self.temps.release(c)
+        self._loop_body(ctx.block(), end_lbl, cond_lbl)
+        self.emit(GOTO, a=cond_lbl)
+        self.label(end_lbl)
+
+    def visitDoWhileStatement(self, ctx):
+        body_lbl, cond_lbl, end_lbl = (self.prog.new_label() for _ in range(3))
+        self.label(body_lbl)
+        self._loop_body(ctx.block(), end_lbl, cond_lbl)
+        self.label(cond_lbl)
+        c = self.visit(ctx.expression())
+        self.emit(IF_TRUE, a=c, b=body_lbl)
+        self.temps.release(c)
+        self.label(end_lbl)
+
+    def visitForStatement(self, ctx):
+        if ctx.variableDeclaration() is not None:
+            self.visit(ctx.variableDeclaration())
+        elif ctx.assignment() is not None:
+            self.visit(ctx.assignment())
+        cond, update = for_parts(ctx)
+        cond_lbl, upd_lbl, end_lbl = (self.prog.new_label() for _ in range(3))
+        self.label(cond_lbl)
+        if cond is not None:
+            c = self.visit(cond)
+            self.emit(IF_FALSE, a=c, b=end_lbl)
+            self.temps.release(c)
+        self._loop_body(ctx.block(), end_lbl, upd_lbl)
+        self.label(upd_lbl)
+        if update is not None:
+            self.temps.release(self.visit(update))
+        self.emit(GOTO, a=cond_lbl)
+        self.label(end_lbl)
+
+    def visitForeachStatement(self, ctx):
+        arr = self.visit(ctx.expression())
+        if not is_temp(arr):
+            t = self.temps.new()
+            self.emit(MOV, t, arr)
+            arr = t
+        i, n = self.temps.new(), self.temps.new()
+        self.emit(MOV, i, const_int(0))
+        self.emit(LEN, n, arr)
+        cond_lbl, next_lbl, end_lbl = (self.prog.new_label() for _ in range(3))
+        self.label(cond_lbl)
+        c = self.temps.new()
+        self.emit(LT, c, i, n)
+        self.emit(IF_FALSE, a=c, b=end_lbl)
+        self.temps.release(c)
+        item = self.declare(ctx.Identifier())
+        self.emit(ALOAD, item, arr, i)
+        self._loop_body(ctx.block(), end_lbl, next_lbl)
+        self.label(next_lbl)
+        self.emit(ADD, i, i, const_int(1))
+        self.emit(GOTO, a=cond_lbl)
+        self.label(end_lbl)
+        self.temps.release(arr, i, n)
+
+    def visitSwitchStatement(self, ctx):
+        cases = ctx.switchCase()
+        subject = self.visit(ctx.expression())
+        end_lbl = self.prog.new_label()
+        case_lbls = [self.prog.new_label() for _ in cases]
+        default_lbl = self.prog.new_label() if ctx.defaultCase() is not None else end_lbl
+        string = _is_string(self.types.get(ctx.expression()))
+        keys = [self._case_constant(case.expression()) for case in cases]
+        first = {}                                   # con valores repetidos gana el primero
+        for k, lbl in zip(keys, case_lbls):
+            if k is not None:
+                first.setdefault(k, lbl)
+        kinds = {None if k is None else kind_of(k) for k in keys}
+        if len(first) <= SWITCH_LINEAR or kinds not in ({K_INT}, {K_STR}) or (kinds == {K_STR}) != string:
+            for case, lbl in zip(cases, case_lbls):
+                v = self.visit(case.expression())
+                self._jump_if_equal(subject, v, lbl,
+                                    string and _is_string(self.types.get(case.expression())))
+            self.emit(GOTO, a=default_lbl)
+        elif kinds == {K_INT}:
+            self._switch_ints(subject, sorted((value_of(k), lbl) for k, lbl in first.items()),
+                              default_lbl)
+        else:
+            self._switch_strings(subject, list(first.items()), default_lbl)
+        self.temps.release(subject)
+
+        self.breaks.append((end_lbl, self.try_depth))
+        for case, lbl in zip(ctx.switchCase(), case_lbls):
+            self.label(lbl)
+            for stmt in case.statement():
+                self.visit(stmt)
+        if ctx.defaultCase() is not None:
+            self.label(default_lbl)
+            for stmt in ctx.defaultCase().statement():
+                self.visit(stmt)
+        self.breaks.pop()
+        self.label(end_lbl)
+
+    def _case_constant(self, expr) -> Optional[int]:
+        """Operando de un 'case' que es un literal entero (con signo) o string; None si no."""
+        text = expr.getText()
+        if _INT_CASE.fullmatch(text):
+            return self.int_literal(expr, text)
+        if len(text) >= 2 and text[0] == text[-1] == '"' and '"' not in text[1:-1]:
+            return self.prog.string(text[1:-1])
+        return None
+
+    def _jump_if_equal(self, subject: int, v: int, lbl: int, string: bool) -> None:
+        self.temps.release(v)
+        t = self.temps.new()
+        if string:
+            self.emit(STRCMP, t, subject, v)
+            self.emit(IF_FALSE, a=t, b=lbl)          # strcmp == 0
+        else:
+            self.emit(EQ, t, subject, v)
+            self.emit(IF_TRUE, a=t, b=lbl)
+        self.temps.release(t)
+
+    def _switch_ints(self, subject: int, items: List[tuple], default: int) -> None:
+        """Despacho sobre (valor, etiqueta) ordenados por valor."""
+        self._dispatch(subject, _clusters(items), default)
+
+    def _dispatch(self, subject: int, clusters: List[list], default: int) -> None:
+        """
+        Búsqueda binaria sobre grupos de casos: un grupo denso termina en
+        una tabla de saltos y unos pocos valores sueltos en comparaciones.
+        """
+        if len(clusters) == 1 and len(clusters[0]) > SWITCH_LINEAR:
+            items = clusters[0]
+            lo, hi = items[0][0], items[-1][0]
+            table = [default] * (hi - lo + 1)
+            for v, lbl in items:
+                table[v - lo] = lbl
+            self.emit(SWITCH, const_int(lo), subject, self.prog.new_table([default] + table))
+            return
+        if sum(len(c) for c in clusters) <= SWITCH_LINEAR:
+            for v, lbl in (x for c in clusters for x in c):
+                self._jump_if_equal(subject, const_int(v), lbl, False)
+            self.emit(GOTO, a=default)
+            return
+        mid = len(clusters) // 2
+        upper = self.prog.new_label()
+        t = self.temps.new()
+        self.emit(LT, t, subject, const_int(clusters[mid][0][0]))
+        self.emit(IF_FALSE, a=t, b=upper)
+        self.temps.release(t)
+        self._dispatch(subject, clusters[:mid], default)
+        self.label(upper)
+        self._dispatch(subject, clusters[mid:], default)
+
+    def _switch_strings(self, subject: int, items: List[tuple], default: int) -> None:
+        """
+        Despacho por hash: la cubeta (hash módulo una potencia de 2 >= casos)
+        se despacha como un switch de enteros y en cada cubeta se comparan
+        solo sus strings.
+        """
+        m = 1
+        while m < len(items):
+            m *= 2
+        buckets = {}
+        for k, lbl in items:
+            buckets.setdefault(str_hash(self.prog.strings[value_of(k)], m), []).append((k, lbl))
+        bucket_lbls = {h: self.prog.new_label() for h in buckets}
+        h = self.temps.new()
+        self.emit(HASH, h, subject, const_int(m))
+        self._switch_ints(h, sorted(bucket_lbls.items()), default)
+        self.temps.release(h)
+        for b, lbl in bucket_lbls.items():
+            self.label(lbl)
+            for k, target in buckets[b]:
+                self._jump_if_equal(subject, k, target, True)
+            self.emit(GOTO, a=default)
+
+    def _leave_tries(self, depth: int) -> None:
+        for _ in range(self.try_depth - depth):
+            self.emit(ENDTRY)
+
+    def visitBreakStatement(self, ctx):
+        if self.breaks:
+            lbl, depth = self.breaks[-1]
+            self._leave_tries(depth)
+            self.emit(GOTO, a=lbl)
+
+    def visitContinueStatement(self, ctx):
+        if self.continues:
+            lbl, depth = self.continues[-1]
+            self._leave_tries(depth)
+            self.emit(GOTO, a=lbl)
+
+    def visitReturnStatement(self, ctx):
+        v = self.visit(ctx.expression()) if ctx.expression() is not None else NONE
+        self._leave_tries(0)
+        self.emit(RET, a=v)
+        self.temps.release(v)
+
+    def visitTryCatchStatement(self, ctx):
+        handler, end_lbl = self.prog.new_label(), self.prog.new_label()
+        self.emit(TRY, a=handler)
+        self.try_depth += 1
+        self.visit(ctx.block(0))
+        self.try_depth -= 1
+        self.emit(ENDTRY)
+        self.emit(GOTO, a=end_lbl)
+        self.label(handler)
+        err = self.declare(ctx.Identifier())
+        self.emit(CATCH, err)
+        self.visit(ctx.block(1))
+        self.label(end_lbl)
+
+    # ---------------- Expresiones ----------------
+
+    def visitExpression(self, ctx):
+        return self.visit(ctx.assignmentExpr())
+
+    def visitExprNoAssign(self, ctx):
+        return self.visit(ctx.conditionalExpr())
+
+    def visitAssignExpr(self, ctx):
+        lhs = ctx.lhs
+        suffixes = lhs.suffixOp()
+        if not suffixes and isinstance(lhs.primaryAtom(), P.IdentifierExprContext):
+            var = self.var_of(self.symbol(lhs.primaryAtom().Identifier()))
+            self.assign(var, self.visit(ctx.assignmentExpr()))
+            return var
+        last = suffixes[-1]
+        obj = self.lhs_value(lhs, len(suffixes) - 1)
+        if isinstance(last, P.IndexExprContext):
+            idx = self.visit(last.expression())
+            value = self.visit(ctx.assignmentExpr())
+            self.emit(ASTORE, obj, idx, value)
+            self.temps.release(obj, idx)
+        else:
+            value = self.visit(ctx.assignmentExpr())
+            owner_t = self.types.get(suffixes[-2]) if len(suffixes) > 1 else self.type_of(lhs.primaryAtom())
+            self.emit(SETF, obj, self.field(owner_t, last.Identifier().getText()), value)
+            self.temps.release(obj)
+        return value
+
+    def visitPropertyAssignExpr(self, ctx):
+        obj = self.visit(ctx.lhs)
+        value = self.visit(ctx.assignmentExpr())
+        self.emit(SETF, obj, self.field(self.type_of(ctx.lhs), ctx.Identifier().getText()), value)
+        self.temps.release(obj)
+        return value
+
+    def visitTernaryExpr(self, ctx):
+        if ctx.expression(0) is None:
+            return self.visit(ctx.logicalOrExpr())
+        else_lbl, end_lbl = self.prog.new_label(), self.prog.new_label()
+        c = self.visit(ctx.logicalOrExpr())
+        self.emit(IF_FALSE, a=c, b=else_lbl)
+        self.temps.release(c)
+        result = self.temps.new()
+        self.assign(result, self.visit(ctx.expression(0)))
+        self.emit(GOTO, a=end_lbl)
+        self.label(else_lbl)
+        self.assign(result, self.visit(ctx.expression(1)))
+        self.label(end_lbl)
+        return result
+
+    def _short_circuit(self, operands, exit_op: int):
+        if len(operands) == 1:
+            return self.visit(operands[0])
+        end_lbl = self.prog.new_label()
+        result = self.temps.new()
+        self.assign(result, self.visit(operands[0]))
+        for sub in operands[1:]:
+            self.emit(exit_op, a=result, b=end_lbl)
+            self.assign(result, self.visit(sub))
+        self.label(end_lbl)
+        return result
+
+    def visitLogicalOrExpr(self, ctx):
+        return self._short_circuit(ctx.logicalAndExpr(), IF_TRUE)
+
+    def visitLogicalAndExpr(self, ctx):
+        return self._short_circuit(ctx.equalityExpr(), IF_FALSE)
+
+    def _binary_chain(self, ctx, operands, table):
+        """
+        a op b op c ... con asociatividad a izquierda; los operadores son los
+        terminales entre operandos. En la concatenación los operandos que no
+        son string pasan por 'tostr'; las comparaciones de strings se hacen
+        con 'strcmp' contra 0.
+        """
+        left = self.visit(operands[0])
+        left_t = self.types.get(operands[0])
+        for k, sub in enumerate(operands[1:], start=1):
+            op_text = ctx.getChild(2 * k - 1).getText()
+            right_t = self.types.get(sub)
+            op = table[op_text]
+            if op == ADD and (_is_string(left_t) or _is_string(right_t)):
+                op = CONCAT
+                left = self.to_string(left, left_t)
+                right = self.to_string(self.visit(sub), right_t)
+            else:
+                right = self.visit(sub)
+                if op in _COMPARE.values() and _is_string(left_t) and _is_string(right_t):
+                    self.temps.release(left, right)
+                    cmp = self.temps.new()
+                    self.emit(STRCMP, cmp, left, right)
+                    left, right = cmp, const_int(0)
+            self.temps.release(left, right)
+            dst = self.temps.new()
+            self.emit(op, dst, left, right)
+            left = dst
+            if left_t is not None and right_t is not None:
+                left_t = arithmetic_type(left_t, right_t) or left_t
+        return left
+
+    def to_string(self, v: int, t) -> int:
+        if _is_string(t):
+            return v
+        if kind_of(v) == K_INT:
+            return self.prog.string(str(value_of(v)))
+        self.temps.release(v)
+        dst = self.temps.new()
+        self.emit(TOSTR, dst, v, const_int(self.value_tag(v, t)))
+        return dst
+
+    def visitEqualityExpr(self, ctx):
+        return self._binary_chain(ctx, ctx.relationalExpr(), _COMPARE)
+
+    def visitRelationalExpr(self, ctx):
+        return self._binary_chain(ctx, ctx.additiveExpr(), _COMPARE)
+
+    def visitAdditiveExpr(self, ctx):
+        return self._binary_chain(ctx, ctx.multiplicativeExpr(), _ARITH)
+
+    def visitMultiplicativeExpr(self, ctx):
+        return self._binary_chain(ctx, ctx.unaryExpr(), _ARITH)
+
+    def visitUnaryExpr(self, ctx):
+        if ctx.primaryExpr() is not None:
+            return self.visit(ctx.primaryExpr())
+        v = self.visit(ctx.unaryExpr())
+        if ctx.getChild(0).getText() == "-":
+            if kind_of(v) == K_INT:
+                return const_int(-value_of(v))
+            op = NEG
+        else:
+            if v in (TRUE, FALSE):
+                return FALSE if v == TRUE else TRUE
+            op = NOT
+        self.temps.release(v)
+        dst = self.temps.new()
+        self.emit(op, dst, v)
+        return dst
+
+    def visitPrimaryExpr(self, ctx):
+        if ctx.literalExpr() is not None:
+            return self.visit(ctx.literalExpr())
+        if ctx.leftHandSide() is not None:
+            return self.visit(ctx.leftHandSide())
+        return self.visit(ctx.expression())
+
+    def visitLiteralExpr(self, ctx):
+        if ctx.arrayLiteral() is not None:
+            return self.visit(ctx.arrayLiteral())
+        text = ctx.getText()
+        if text == "null":
+            return NULL
+        if text == "true":
+            return TRUE
+        if text == "false":
+            return FALSE
+        if text.startswith('"'):
+            return self.prog.string(text[1:-1])
+        return self.int_literal(ctx, text)
+
+    def int_literal(self, ctx, text: str) -> int:
+        """Operando de un literal entero; si no cabe en un K_INT se reporta y vale 0."""
+        value = int(text)
+        if not INT_MIN <= value <= INT_MAX:
+            tok = ctx.start
+            self.checker.reporter.report(tok.line, tok.column, "E_INT_RANGE",
+                                         f"Literal entero fuera de rango: {text} "
+                                         f"(debe estar entre {INT_MIN} y {INT_MAX})")
+            value = 0
+        return const_int(value)
+
+    def visitArrayLiteral(self, ctx):
+        elems = ctx.expression()
+        arr = self.temps.new()
+        self.emit(NEWARR, arr, const_int(len(elems)))
+        for i, e in enumerate(elems):
+            v = self.visit(e)
+            self.emit(ASTORE, arr, const_int(i), v)
+            self.temps.release(v)
+        return arr
+
+    def visitLeftHandSide(self, ctx):
+        return self.lhs_value(ctx, len(ctx.suffixOp()))
+
+    def lhs_value(self, ctx, upto: int) -> int:
+        """Valor de primaryAtom seguido de los primeros 'upto' sufijos."""
+        atom = ctx.primaryAtom()
+        suffixes = ctx.suffixOp()[:upto]
+        i = 0
+        cur_t = self.types.get(atom)
+        if isinstance(atom, P.IdentifierExprContext) and suffixes and isinstance(suffixes[0], P.CallExprContext):
+            sym = self.symbol(atom.Identifier())
+            if isinstance(sym, FuncSymbol):
+                cur = self.call(self.prog.name(self.func_name(sym)), [], suffixes[0].arguments(),
+                                _returns(sym))
+                cur_t = self.types.get(suffixes[0])
+                i = 1
+            else:
+                cur = self.visit(atom)
+        else:
+            cur = self.visit(atom)
+
+        while i < len(suffixes):
+            s = suffixes[i]
+            if isinstance(s, P.PropertyAccessExprContext):
+                name = s.Identifier().getText()
+                if i + 1 < len(suffixes) and isinstance(suffixes[i + 1], P.CallExprContext):
+                    cls = self.class_symbol(cur_t)
+                    owner, msym = self.find_method(cls, name)
+                    returns = _returns(msym) if msym is not None else True
+                    layout = self.layouts.get(cls.name) if owner is not None else None
+                    if layout is not None and name in layout.slots and self.overridden(cls.name, name):
+                        # llamada virtual: el método sale del slot de la vtable del objeto
+                        method = self.temps.new()
+                        self.emit(METHOD, method, cur, const_int(layout.slots[name]))
+                        result = self.call(method, [cur], suffixes[i + 1].arguments(), returns)
+                        self.temps.release(method)
+                        cur = result
+                    else:
+                        target = self.prog.name(f"{owner}.{name}" if owner else name)
+                        cur = self.call(target, [cur], suffixes[i + 1].arguments(), returns)
+                    cur_t = self.types.get(suffixes[i + 1])
+                    i += 2
+                    continue
+                self.temps.release(cur)
+                dst = self.temps.new()
+                self.emit(GETF, dst, cur, self.field(cur_t, name))
+                cur = dst
+            elif isinstance(s, P.IndexExprContext):
+                idx = self.visit(s.expression())
+                self.temps.release(cur, idx)
+                dst = self.temps.new()
+                self.emit(ALOAD, dst, cur, idx)
+                cur = dst
+            else:
+                # llamada sobre un valor (no es el patrón nombre(...) ni obj.metodo(...))
+                cur = self.call(cur, [], s.arguments(), True)
+            cur_t = self.types.get(s)
+            i += 1
+        return cur
+
+    def visitIdentifierExpr(self, ctx):
+        sym = self.symbol(ctx.Identifier())
+        if isinstance(sym, (VarSymbol, ParamSymbol)):
+            return self.var_of(sym)
+        if isinstance(sym, FuncSymbol):
+            return self.prog.name(self.func_name(sym))
+        return self.prog.name(ctx.getText())
+
+    def visitThisExpr(self, ctx):
+        return self.this_op
+
+    def visitNewExpr(self, ctx):
+        cname = ctx.Identifier().getText()
+        obj = self.temps.new()
+        self.emit(NEW, obj, self.prog.name(cname))
+        cls = self.checker.scopes.stack[0].resolve(cname)
+        owner, ctor = self.find_method(cls, "constructor")
+        if ctor is not None:
+            self.call(self.prog.name(f"{owner}.constructor"), [obj], ctx.arguments(), False, keep=obj)
+        return obj
+
+
+def _type_name(sym) -> str:
+    t = getattr(sym, "type", None)
+    return str(t) if t is not None else ""
+
+
+def type_tag(t, is_class=lambda name: True) -> int:
+    """Tag (TAG_* de tac.py) del tipo estático 't'; sin tipo conocido se asume entero."""
+    name = t.name if t is not None else "integer"
+    dims = 0
+    while name.endswith("[]"):          # 'integer[]' (también los Type sueltos de foreach)
+        name, dims = name[:-2], dims + 1
+    base = {"integer": TAG_INT, "string": TAG_STRING, "boolean": TAG_BOOL,
+            "null": TAG_NULL}.get(name, TAG_OBJECT if is_class(name) else TAG_INT)
+    return base | (dims << 3)
+
+
+def _clusters(items: List[tuple]) -> List[list]:
+    """
+    Parte los casos ordenados en tramos densos (más de SWITCH_LINEAR valores
+    que ocupan al menos SWITCH_DENSITY de su rango: van a una tabla) y
+    valores sueltos, tomando siempre el tramo denso más largo posible.
+    """
+    out = []
+    i = 0
+    while i < len(items):
+        j = len(items)
+        while j - i > SWITCH_LINEAR and (j - i) < SWITCH_DENSITY * (items[j - 1][0] - items[i][0] + 1):
+            j -= 1
+        if j - i <= SWITCH_LINEAR:
+            j = i + 1
+        out.append(items[i:j])
+        i = j
+    return out
+
+
+def _is_string(t) -> bool:
+    return t is not None and t.name == "string"
+
+
+def _returns(sym) -> bool:
+    t = getattr(sym, "type", None)
+    return not (isinstance(t, FunctionType) and t.ret.name == "void")
+
+
+def generate_tac(tree, checker) -> TacProgram:
+    """Genera el TAC de un programa ya chequeado (el checker debe crearse con record_types=True)."""
+    return TacGenerator(checker).generate(tree)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+import io
+import json
+import sys
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass, field, asdict
+
+
+@dataclass
+class AllocationSite:
+    location: str          # "archivo:línea"
+    size_bytes: int        # bytes retenidos al final de la fase (diferencia)
+    count: int
+
+
+@dataclass
+class PhaseMemory:
+    name: str
+    peak_bytes: int        # pico durante la fase, sobre lo que ya estaba vivo al empezar
+    retained_bytes: int    # lo que la fase deja vivo al terminar
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+
+class MemoryProfiler:
+    """
+    Mide memoria por fase con tracemalloc: antes y después de cada fase se toma
+    un snapshot, y el pico se reinicia al entrar (tracemalloc.reset_peak), así
+    que cada fase reporta su propio pico y lo que retiene.
+    """
+
+    def __init__(self, top: int = 5, frames: int = 1):
+        self.top = top
+        self.frames = frames
+        self.phases: list[PhaseMemory] = []
+        self._started_here = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_here = True
+
+    def stop(self) -> None:
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+
+    @staticmethod
+    def _snapshot():
+        # Se excluyen las asignaciones del propio tracemalloc.
+        return tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),))
+
+    @contextmanager
+    def phase(self, name: str):
+        self.start()
+        before = self._snapshot()
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            after = self._snapshot()
+            sites = []
+            for stat in after.compare_to(before, "lineno")[: self.top]:
+                if stat.size_diff <= 0:
+                    continue
+                frame = stat.traceback[0]
+                sites.append(AllocationSite(f"{frame.filename}:{frame.lineno}",
+                                            stat.size_diff, stat.count_diff))
+            self.phases.append(PhaseMemory(name, max(peak - base, 0), current - base, sites))
+
+    # ---------------- Reportes ----------------
+
+    def to_dict(self) -> dict:
+        return {"phases": [asdict(p) for p in self.phases],
+                "total_retained_bytes": sum(p.retained_bytes for p in self.phases)}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_text(self) -> str:
+        lines = ["Reporte de memoria por fase",
+                 f"{'fase':<16} {'pico KB':>10} {'retenido KB':>12}",
+                 "-" * 40]
+        for p in self.phases:
+            lines.append(f"{p.name:<16} {p.peak_bytes / 1024:>10.1f} {p.retained_bytes / 1024:>12.1f}")
+        for p in self.phases:
+            if not p.top_sites:
+                continue
+            lines.append(f"\nPrincipales sitios de asignación en '{p.name}':")
+            for s in p.top_sites:
+                lines.append(f"  {s.size_bytes / 1024:>9.1f} KB  {s.count:>7} bloques  {s.location}")
+        return "\n".join(lines)
+
+
+def profile_source(source: str, lexer: str = "antlr", top: int = 5,
+                   syntax_mode: str = "skip") -> MemoryProfiler:
+    """
+    Hook para benchmarks: corre lexer, parser, TypeChecker e impresión de la
+    tabla de símbolos sobre 'source' midiendo cada fase. Si hay errores
+    sintácticos, el chequeo sigue 'syntax_mode' como en el Driver.
+    """
+    from antlr4 import InputStream, CommonTokenStream
+    from CompiscriptParser import CompiscriptParser
+    from frontend.fast_lexer import create_lexer
+    from frontend.syntax_errors import attach_syntax_listener, run_checker
+    from semantic.type_checker import TypeChecker
+    from semantic.error_reporter import ErrorReporter
+    from semantic.table import print_symbol_table
+
+    mem = MemoryProfiler(top=top)
+    mem.start()
+    try:
+        reporter = ErrorReporter()
+        with mem.phase("lexing"):
+            lex = create_lexer(InputStream(source), lexer)
+            stream = CommonTokenStream(lex)
+            stream.fill()
+        with mem.phase("parsing"):
+            parser = CompiscriptParser(stream)
+            syntax = attach_syntax_listener(lex, parser, reporter)
+            tree = parser.program()
+        with mem.phase("checking"):
+            checker = TypeChecker(reporter)
+            run_checker(checker, tree, syntax, syntax_mode)
+        with mem.phase("symbol-table"):
+            with redirect_stdout(io.StringIO()):
+                print_symbol_table(checker.scopes)
+    finally:
+        mem.stop()
+    return mem
+
+
+def main(argv):
+    if len(argv) < 2:
+        print("Uso: python -m perf.memory_report <archivo.cps> [--json] [--fast] [--syntax-mode MODO]")
+        return
+    with open(argv[1], encoding="utf-8") as f:
+        source = f.read()
+    mode = argv[argv.index("--syntax-mode") + 1] if "--syntax-mode" in argv[:-1] else "skip"
+    mem = profile_source(source, lexer="fast" if "--fast" in argv else "antlr", syntax_mode=mode)
+    print(mem.to_json() if "--json" in argv else mem.to_text())
+
+
+if __name__ == "__main__":
+    main(sys.argv)
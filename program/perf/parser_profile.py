@@ -0,0 +1,159 @@
+from __future__ import annotations
+import json
+import time
+from dataclasses import dataclass, asdict, field
+
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.dfa.DFA import DFA
+from antlr4.PredictionContext import PredictionContextCache
+
+
+@dataclass
+class DecisionInfo:
+    """Estadísticas de una decisión de predicción (adaptivePredict) del parser."""
+    decision: int
+    rule: str
+    invocations: int = 0
+    time_ns: int = 0
+    sll_lookahead_total: int = 0       # tokens examinados en modo SLL
+    sll_max_lookahead: int = 0
+    sll_dfa_hits: int = 0              # transiciones resueltas con la DFA cacheada
+    sll_atn_transitions: int = 0       # transiciones que requirieron simular el ATN
+    ll_fallbacks: int = 0              # veces que SLL tuvo conflicto y se pasó a LL completo
+    ll_lookahead_total: int = 0
+    ll_max_lookahead: int = 0
+    ll_atn_transitions: int = 0
+    ambiguities: int = 0
+    context_sensitivities: int = 0
+    errors: int = 0
+
+    @property
+    def avg_sll_lookahead(self) -> float:
+        return self.sll_lookahead_total / self.invocations if self.invocations else 0.0
+
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """
+    Equivalente en Python del ProfilingATNSimulator de ANTLR (el runtime de
+    Python no lo trae). Envuelve adaptivePredict para medir, por decisión,
+    invocaciones, tiempo, profundidad de lookahead y fallbacks SLL -> LL.
+    """
+
+    def __init__(self, parser, decision_to_dfa=None, context_cache=None):
+        atn = parser.atn
+        if decision_to_dfa is None:
+            # DFA nueva: el perfil no depende de lo que otros parsers ya cachearon
+            decision_to_dfa = [DFA(ds, i) for i, ds in enumerate(atn.decisionToState)]
+        super().__init__(parser, atn, decision_to_dfa, context_cache or PredictionContextCache())
+        rule_names = parser.ruleNames
+        self.decisions = [
+            DecisionInfo(i, rule_names[ds.ruleIndex] if 0 <= ds.ruleIndex < len(rule_names) else "?")
+            for i, ds in enumerate(atn.decisionToState)
+        ]
+        self._current = -1
+        self._sll_stop = -1
+        self._ll_stop = -1
+
+    def adaptivePredict(self, input, decision, outerContext):
+        self._current = decision
+        self._sll_stop = -1
+        self._ll_stop = -1
+        start = input.index
+        t0 = time.perf_counter_ns()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            info = self.decisions[decision]
+            info.time_ns += time.perf_counter_ns() - t0
+            info.invocations += 1
+            if self._sll_stop >= 0:
+                k = self._sll_stop - start + 1
+                info.sll_lookahead_total += k
+                info.sll_max_lookahead = max(info.sll_max_lookahead, k)
+            if self._ll_stop >= 0:
+                k = self._ll_stop - start + 1
+                info.ll_lookahead_total += k
+                info.ll_max_lookahead = max(info.ll_max_lookahead, k)
+            self._current = -1
+
+    def getExistingTargetState(self, previousD, t):
+        self._sll_stop = self._input.index
+        existing = super().getExistingTargetState(previousD, t)
+        if existing is not None:
+            self.decisions[self._current].sll_dfa_hits += 1
+        return existing
+
+    def computeTargetState(self, dfa, previousD, t):
+        state = super().computeTargetState(dfa, previousD, t)
+        self.decisions[self._current].sll_atn_transitions += 1
+        return state
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if fullCtx:
+            self._ll_stop = self._input.index
+        reach = super().computeReachSet(closure, t, fullCtx)
+        if self._current >= 0:
+            if fullCtx:
+                self.decisions[self._current].ll_atn_transitions += 1
+            if reach is None:
+                self.decisions[self._current].errors += 1
+        return reach
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex, stopIndex):
+        self.decisions[dfa.decision].ll_fallbacks += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex, stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        self.decisions[dfa.decision].context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self.decisions[dfa.decision].ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+def enable_profiling(parser) -> ProfilingATNSimulator:
+    """Instala el simulador con perfilado en 'parser' (antes de llamar a parser.program())."""
+    sim = ProfilingATNSimulator(parser)
+    parser._interp = sim
+    return sim
+
+
+@dataclass
+class ParseProfile:
+    decisions: list[DecisionInfo] = field(default_factory=list)
+
+    @classmethod
+    def from_simulator(cls, sim: ProfilingATNSimulator) -> "ParseProfile":
+        return cls([d for d in sim.decisions if d.invocations])
+
+    def by_rule(self) -> dict[str, list[DecisionInfo]]:
+        out: dict[str, list[DecisionInfo]] = {}
+        for d in self.decisions:
+            out.setdefault(d.rule, []).append(d)
+        return out
+
+    def hottest(self, n: int = 10) -> list[DecisionInfo]:
+        """Decisiones más costosas: primero por fallbacks a LL, luego por tiempo."""
+        return sorted(self.decisions, key=lambda d: (d.ll_fallbacks, d.time_ns), reverse=True)[:n]
+
+    def to_json(self) -> str:
+        return json.dumps([dict(asdict(d), avg_sll_lookahead=round(d.avg_sll_lookahead, 2))
+                           for d in self.decisions], indent=2)
+
+    def to_text(self, limit: int | None = None) -> str:
+        rows = self.hottest(limit or len(self.decisions))
+        header = (f"{'dec':>4} {'regla':<20} {'invoc':>7} {'ms':>8} {'SLL k':>6} {'SLL max':>7} "
+                  f"{'DFA hit':>8} {'ATN':>6} {'LL fb':>6} {'LL max':>6} {'ambig':>6}")
+        lines = ["Perfil de decisiones del parser", header, "-" * len(header)]
+        for d in rows:
+            lines.append(
+                f"{d.decision:>4} {d.rule:<20} {d.invocations:>7} {d.time_ns / 1e6:>8.2f} "
+                f"{d.avg_sll_lookahead:>6.2f} {d.sll_max_lookahead:>7} {d.sll_dfa_hits:>8} "
+                f"{d.sll_atn_transitions:>6} {d.ll_fallbacks:>6} {d.ll_max_lookahead:>6} {d.ambiguities:>6}"
+            )
+        total_ms = sum(d.time_ns for d in self.decisions) / 1e6
+        fallbacks = sum(d.ll_fallbacks for d in self.decisions)
+        lines.append(f"Total: {len(self.decisions)} decisiones, {total_ms:.2f} ms en predicción, "
+                     f"{fallbacks} fallbacks a LL")
+        return "\n".join(lines)
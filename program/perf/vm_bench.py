@@ -0,0 +1,145 @@
+from __future__ import annotations
+import sys
+import time
+from dataclasses import dataclass, replace
+
+# Compara el throughput de la VM de pila (codegen/vm.py) contra el
+# intérprete de TAC, que recorre las instrucciones una a una resolviendo
+# cada operando por su tipo en cada paso. Ambos corren el mismo TAC, así
+# que la diferencia es la del bytecode (slots resueltos, constantes en
+# tabla, saltos a posiciones) y la del ciclo de despacho.
+#
+# La línea base NO es un intérprete que recorra el árbol de ANTLR: el repo
+# no tiene uno, y el intérprete de TAC (intermediate/interp.py) es lo más
+# cercano a una ejecución ingenua que existe. La aceleración que se reporta
+# es contra ese intérprete.
+
+
+@dataclass
+class VmBench:
+    tac_instructions: int      # instrucciones TAC ejecutadas (steps del intérprete)
+    interp_seconds: float      # mejor de 'repeat' corridas
+    vm_seconds: float
+    compile_seconds: float     # TAC -> bytecode
+    bytecode_words: int
+    vm_dispatches: int = 0     # instrucciones de bytecode despachadas
+
+    @property
+    def dispatches_per_instruction(self) -> float:
+        return self.vm_dispatches / self.tac_instructions if self.tac_instructions else 0.0
+
+    @property
+    def speedup(self) -> float:
+        return self.interp_seconds / self.vm_seconds if self.vm_seconds else 0.0
+
+    def to_text(self) -> str:
+        rate = lambda s: self.tac_instructions / s / 1e6 if s else 0.0
+        return "\n".join([
+            "Benchmark VM vs intérprete de TAC (línea base: intérprete de TAC, no un recorrido del árbol):",
+            f"  instrucciones TAC ejecutadas  {self.tac_instructions}",
+            f"  intérprete TAC   {self.interp_seconds * 1000:>9.1f} ms  ({rate(self.interp_seconds):.2f} M instr/s)",
+            f"  VM de pila       {self.vm_seconds * 1000:>9.1f} ms  ({rate(self.vm_seconds):.2f} M instr/s)",
+            f"  compilación      {self.compile_seconds * 1000:>9.1f} ms  ({self.bytecode_words} palabras)",
+            f"  despachos VM     {self.vm_dispatches:>9}     ({self.dispatches_per_instruction:.2f} por instrucción TAC)",
+            f"  aceleración      {self.speedup:>9.2f}x",
+        ])
+
+
+class _CountingCode(list):
+    """Vista del bytecode que cuenta las lecturas del opcode de cada instrucción."""
+
+    def __init__(self, code, starts):
+        super().__init__(code)
+        self.starts = starts
+        self.count = 0
+
+    def __getitem__(self, i):
+        if i in self.starts:
+            self.count += 1
+        return list.__getitem__(self, i)
+
+
+def count_dispatches(bc) -> int:
+    """
+    Cuántas instrucciones de bytecode despacha la VM al correr 'bc'. Usa una
+    copia del programa con el código envuelto, así que el ciclo de la VM no
+    cambia; la corrida es más lenta y solo sirve para contar.
+    """
+    from codegen.bytecode import ARGS
+    from codegen.vm import StackVM
+
+    starts, pc = set(), 0
+    while pc < len(bc.code):
+        starts.add(pc)
+        pc += 1 + ARGS[bc.code[pc]]
+    code = _CountingCode(bc.code, starts)
+    StackVM(replace(bc, code=code)).run()
+    return code.count
+
+
+def _best(run, repeat: int):
+    best, out = None, None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        out = run()
+        elapsed = time.perf_counter() - t
+        best = elapsed if best is None else min(best, elapsed)
+    return best, out
+
+
+def benchmark(prog, repeat: int = 3) -> VmBench:
+    """
+    Corre 'prog' (un TacProgram) en el intérprete y en la VM y devuelve los
+    mejores tiempos. Falla si las salidas no coinciden.
+    """
+    from intermediate.interp import TacInterpreter
+    from codegen.bytecode import compile_bytecode
+    from codegen.vm import StackVM
+
+    t = time.perf_counter()
+    bc = compile_bytecode(prog)
+    compile_seconds = time.perf_counter() - t
+    steps = []
+
+    def interp():
+        it = TacInterpreter(prog)
+        out = it.run()
+        steps.append(it.steps)
+        return out
+
+    slow, expected = _best(interp, repeat)
+    fast, out = _best(lambda: StackVM(bc).run(), repeat)
+    if out != expected:
+        raise AssertionError(f"la VM imprimió {out[:5]}, el intérprete {expected[:5]}")
+    return VmBench(steps[-1], slow, fast, compile_seconds, len(bc.code), count_dispatches(bc))
+
+
+def main(argv):
+    if len(argv) < 2:
+        print("Uso: python -m perf.vm_bench <archivo.cps> [-O]")
+        return
+    from antlr4 import FileStream, CommonTokenStream
+    from CompiscriptLexer import CompiscriptLexer
+    from CompiscriptParser import CompiscriptParser
+    from semantic.type_checker import TypeChecker
+    from semantic.error_reporter import ErrorReporter
+    from intermediate.tac_gen import generate_tac
+    from intermediate.global_opt import optimize_global
+
+    reporter = ErrorReporter()
+    parser = CompiscriptParser(CommonTokenStream(CompiscriptLexer(FileStream(argv[1], encoding="utf-8"))))
+    tree = parser.program()
+    checker = TypeChecker(reporter, record_types=True)
+    checker.visit(tree)
+    if reporter.has_errors():
+        for e in reporter:
+            print(e)
+        return
+    prog = generate_tac(tree, checker)
+    if "-O" in argv:
+        optimize_global(prog)
+    print(benchmark(prog).to_text())
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -9,6 +9,8 @@ from semantic.type_checker import TypeChecker
 from semantic.error_reporter import ErrorReporter
 from semantic.scopes import GlobalScope
 from semantic.symbols import FuncSymbol, ClassSymbol, VarSymbol
+from frontend.syntax_errors import attach_syntax_listener, run_checker, SYNTAX_MODES, E_SYNTAX
+from frontend.fast_lexer import create_lexer, LEXERS
 
 
 # --- Graphviz helpers ---
@@ -48,19 +50,21 @@ def build_parse_tree_dot(parser, tree, max_nodes: int = 2000) -> str:
     return "\n".join(lines)
 
 
-def compile_code(source: str):
+def compile_code(source: str, syntax_mode: str = "skip", lexer_kind: str = "antlr"):
+    reporter = ErrorReporter()
+
     input_stream = InputStream(source)
-    lexer = CompiscriptLexer(input_stream)
+    lexer = create_lexer(input_stream, lexer_kind)
     stream = CommonTokenStream(lexer)
     parser = CompiscriptParser(stream)
+    syntax = attach_syntax_listener(lexer, parser, reporter)
 
     tree = parser.program()
 
-    reporter = ErrorReporter()
     checker = TypeChecker(reporter)
-    checker.visit(tree)
+    run_checker(checker, tree, syntax, syntax_mode)
 
-    return reporter, checker.scopes, parser, tree
+    return reporter, checker.scopes, parser, tree, checker.index
 
 def render_scope(scope, container, indent=0):
     pad = " " * (indent * 2)
@@ -189,32 +193,63 @@ code = st.text_area("Editor", default_code, height=400)
 
 
 # Controles
-col_a, col_b, col_c = st.columns([1,1,2])
+col_a, col_b, col_c, col_d, col_e = st.columns([1,1,1,1,2])
 with col_a:
     do_compile = st.button("Compile 🚀", key="compile_main")
 with col_b:
     show_tree = st.checkbox("Árbol sintáctico", value=True)
 with col_c:
+    syntax_mode = st.selectbox("Si hay errores sintácticos", SYNTAX_MODES, index=0)
+with col_d:
+    lexer_kind = st.selectbox("Lexer", LEXERS, index=0)
+with col_e:
     max_nodes = st.slider("Límite de nodos del árbol", min_value=200, max_value=5000, value=2000, step=100)
 
 if do_compile:
-    reporter, scopes, parser, tree = compile_code(code)
+    reporter, scopes, parser, tree, index = compile_code(code, syntax_mode, lexer_kind)
 
-    if reporter.has_errors():
+    syntax_errors = [e for e in reporter if e.code == E_SYNTAX]
+    semantic_errors = [e for e in reporter if e.code != E_SYNTAX]
+    if syntax_errors:
+        st.error(" Errores sintácticos encontrados:")
+        for e in syntax_errors:
+            st.write(f"- {e}")
+    if semantic_errors:
         st.error(" Errores semánticos encontrados:")
-        for e in reporter:
+        for e in semantic_errors:
             st.write(f"- {e}")
-    else:
+    elif not syntax_errors:
         st.success(" Compilación completada sin errores")
 
+    # Navegación: hover / ir a definición / referencias
+    st.subheader("Navegación de símbolos")
+    nav_a, nav_b = st.columns(2)
+    with nav_a:
+        nav_line = st.number_input("Línea", min_value=1, value=1, step=1)
+    with nav_b:
+        nav_col = st.number_input("Columna (0-based)", min_value=0, value=0, step=1)
+    occ = index.at(int(nav_line), int(nav_col))
+    if occ is None:
+        st.info("No hay un identificador en esa posición.")
+    else:
+        st.markdown(f"`{index.hover(int(nav_line), int(nav_col))}`")
+        d = index.definition(occ.symbol)
+        if d is not None:
+            st.write(f"Definición: línea {d.line}, columna {d.col}")
+        refs = index.references(occ.symbol)
+        if refs:
+            st.table([{"Línea": r.line, "Col": r.col} for r in refs])
+
     if show_tree:
         st.subheader("Árbol sintáctico")
         dot = build_parse_tree_dot(parser, tree, max_nodes=max_nodes)
         st.graphviz_chart(dot, use_container_width=True)
 
-    # Tabla de símbolos por scope
-    for scope in scopes.stack:
-        st.subheader(f"Scope: {scope.kind}")
+    # Tabla de símbolos por scope (árbol completo retenido por el checker)
+    tree = scopes.tree
+    for sid, depth in tree.walk(0):
+        name = tree.name(sid)
+        st.subheader(f"{'↳ ' * depth}Scope: {tree.kind(sid)}{f' ({name})' if name else ''}")
         rows = [
             {
                 "Category": sym.category,
@@ -223,9 +258,10 @@ if do_compile:
                 "Line": sym.line,
                 "Col": sym.col
             }
-            for _, sym in scope.items()
+            for _, sym in tree.symbols(sid)
         ]
-        st.table(rows)
+        if rows:
+            st.table(rows)
 
     # mostrar parámetros de cada función declarada en el scope global
     # ---- Mostrar clases y sus miembros (en el global)
@@ -0,0 +1,457 @@
+from __future__ import annotations
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from CompiscriptParser import CompiscriptParser
+
+
+# Tipos de ítem dentro de un bloque básico (cfg.item_kind[i])
+IT_STMT = 0   # sentencia simple (declaración, asignación, print, return, break, ...)
+IT_MARK = 1   # cabecera de una sentencia compuesta (if, while, switch, bloque, ...): no evalúa nada
+IT_EXPR = 2   # expresión evaluada en ese punto (condición, sujeto de switch, update de for, ...)
+IT_BIND = 3   # variable ligada implícitamente (variable de foreach, variable de catch)
+
+
+class CFG:
+    """
+    Grafo de flujo de control compacto.
+
+    Los bloques son enteros. El bloque 0 es la entrada, 'exit' recibe los
+    'return' y 'end' recibe el flujo que cae al final del cuerpo sin return.
+    Los ítems de todos los bloques viven en una lista plana y cada bloque
+    guarda su rango; sucesores y predecesores están en formato CSR (arreglos
+    de offsets + arreglo de destinos). Así, alcanzabilidad y "todos los
+    caminos retornan" son recorridos lineales sobre arreglos.
+
+    Los ítems son genéricos: el checker guarda contextos de ANTLR y la
+    generación de código guarda índices de instrucciones TAC.
+    """
+
+    ENTRY = 0
+
+    def __init__(self, n_blocks: int, exit_block: int, end_block: int,
+                 items: list, item_kind: array, item_start: array,
+                 succ_off: array, succ: array, labels: List[str]):
+        self.n = n_blocks
+        self.exit = exit_block
+        self.end = end_block
+        self.items = items
+        self.item_kind = item_kind
+        self.item_start = item_start          # n + 1 offsets
+        self.succ_off = succ_off              # n + 1 offsets
+        self.succ = succ
+        self.labels = labels
+        # predecesores en CSR
+        counts = array("i", [0]) * (n_blocks + 1)
+        for t in succ:
+            counts[t + 1] += 1
+        for i in range(n_blocks):
+            counts[i + 1] += counts[i]
+        self.pred_off = array("i", counts)
+        self.pred = array("i", [0]) * len(succ)
+        fill = array("i", counts[:n_blocks])
+        for b in range(n_blocks):
+            for k in range(succ_off[b], succ_off[b + 1]):
+                t = succ[k]
+                self.pred[fill[t]] = b
+                fill[t] += 1
+
+    def __len__(self) -> int:
+        return self.n
+
+    def successors(self, b: int) -> Sequence[int]:
+        return self.succ[self.succ_off[b]:self.succ_off[b + 1]]
+
+    def predecessors(self, b: int) -> Sequence[int]:
+        return self.pred[self.pred_off[b]:self.pred_off[b + 1]]
+
+    def block_items(self, b: int) -> Iterator[tuple[int, object]]:
+        """Pares (kind, ítem) del bloque 'b' en orden de ejecución."""
+        for i in range(self.item_start[b], self.item_start[b + 1]):
+            yield self.item_kind[i], self.items[i]
+
+    def item_range(self, b: int) -> range:
+        return range(self.item_start[b], self.item_start[b + 1])
+
+    # ---------------- Consultas ----------------
+
+    def reachable(self, start: int = ENTRY) -> bytearray:
+        """Marca (1/0) de los bloques alcanzables desde 'start'. O(V + E)."""
+        seen = bytearray(self.n)
+        seen[start] = 1
+        stack = [start]
+        succ, off = self.succ, self.succ_off
+        while stack:
+            b = stack.pop()
+            for k in range(off[b], off[b + 1]):
+                t = succ[k]
+                if not seen[t]:
+                    seen[t] = 1
+                    stack.append(t)
+        return seen
+
+    def all_paths_return(self) -> bool:
+        """True si ningún camino desde la entrada llega al final del cuerpo sin pasar por un return."""
+        return not self.reachable()[self.end]
+
+    def unreachable_regions(self) -> List[int]:
+        """
+        Raíces de las regiones inalcanzables: bloques sin predecesores (salvo
+        la entrada) que contienen o conducen a algún ítem. Reportar una vez
+        por raíz evita repetir el mismo código muerto en cascada.
+        """
+        seen = self.reachable()
+        roots = []
+        for b in range(self.n):
+            if seen[b] or b in (self.ENTRY, self.exit, self.end):
+                continue
+            if self.pred_off[b] == self.pred_off[b + 1]:
+                roots.append(b)
+        return roots
+
+    def first_item(self, b: int, kinds: Iterable[int] = (IT_STMT, IT_MARK)) -> Optional[object]:
+        """Primer ítem de los tipos pedidos en 'b' o en sus sucesores inalcanzables (en orden de bloque)."""
+        kinds = set(kinds)
+        seen = self.reachable()
+        visited = set()
+        stack = [b]
+        while stack:
+            cur = stack.pop()
+            if cur in visited:
+                continue
+            visited.add(cur)
+            for kind, item in self.block_items(cur):
+                if kind in kinds:
+                    return item
+            for t in sorted(self.successors(cur), reverse=True):
+                if not seen[t]:
+                    stack.append(t)
+        return None
+
+    def postorder(self) -> List[int]:
+        """Postorden (iterativo) desde la entrada; su reverso es el orden típico de dataflow hacia adelante."""
+        seen = bytearray(self.n)
+        order: List[int] = []
+        stack = [(self.ENTRY, 0)]
+        seen[self.ENTRY] = 1
+        while stack:
+            b, k = stack[-1]
+            start, end = self.succ_off[b], self.succ_off[b + 1]
+            if start + k < end:
+                stack[-1] = (b, k + 1)
+                t = self.succ[start + k]
+                if not seen[t]:
+                    seen[t] = 1
+                    stack.append((t, 0))
+            else:
+                stack.pop()
+                order.append(b)
+        return order
+
+    def dump(self) -> str:
+        lines = []
+        for b in range(self.n):
+            succ = ", ".join(str(s) for s in self.successors(b))
+            lines.append(f"B{b} [{self.labels[b]}] -> {succ or '-'}")
+            for kind, item in self.block_items(b):
+                text = item.getText() if hasattr(item, "getText") else str(item)
+                lines.append(f"    {('stmt', 'mark', 'expr', 'bind')[kind]:<4} {text[:60]}")
+        return "\n".join(lines)
+
+
+class CFGBuilder:
+    """Construcción incremental de un CFG; freeze() lo compacta en arreglos."""
+
+    def __init__(self) -> None:
+        self._items: List[list] = []
+        self._succ: List[list] = []
+        self.labels: List[str] = []
+        self.entry = self.new_block("entry")
+        self.exit = self.new_block("exit")
+        self.end = self.new_block("end")
+
+    def new_block(self, label: str = "") -> int:
+        self._items.append([])
+        self._succ.append([])
+        self.labels.append(label)
+        return len(self._succ) - 1
+
+    def add_item(self, b: int, kind: int, item) -> None:
+        self._items[b].append((kind, item))
+
+    def add_edge(self, a: int, b: int) -> None:
+        if b not in self._succ[a]:
+            self._succ[a].append(b)
+
+    def __len__(self) -> int:
+        return len(self._succ)
+
+    def freeze(self) -> CFG:
+        n = len(self._succ)
+        items: list = []
+        kinds = array("B")
+        item_start = array("i", [0])
+        succ_off = array("i", [0])
+        succ = array("i")
+        for b in range(n):
+            for kind, item in self._items[b]:
+                kinds.append(kind)
+                items.append(item)
+            item_start.append(len(items))
+            succ.extend(self._succ[b])
+            succ_off.append(len(succ))
+        return CFG(n, self.exit, self.end, items, kinds, item_start, succ_off, succ, list(self.labels))
+
+
+# ---------------------------------------------------------------------------
+# Construcción desde el árbol de ANTLR
+# ---------------------------------------------------------------------------
+
+P = CompiscriptParser
+
+
+def const_bool(expr) -> Optional[bool]:
+    """Valor de una condición literal 'true'/'false' (o None si no es constante)."""
+    if expr is None:
+        return None
+    text = expr.getText()
+    if text == "true":
+        return True
+    if text == "false":
+        return False
+    return None
+
+
+class _StatementCFGBuilder:
+    def __init__(self) -> None:
+        self.b = CFGBuilder()
+        self.cur = self.b.entry
+        self.breaks: List[int] = []
+        self.continues: List[int] = []
+        self.handlers: List[int] = []
+
+    def new(self, label: str) -> int:
+        blk = self.b.new_block(label)
+        if self.handlers:
+            # cualquier instrucción dentro de un try puede saltar al catch
+            self.b.add_edge(blk, self.handlers[-1])
+        return blk
+
+    def jump(self, target: int) -> None:
+        self.b.add_edge(self.cur, target)
+
+    def terminate(self, target: int) -> None:
+        """Salto incondicional (return/break/continue): lo que sigue queda en un bloque sin predecesores."""
+        self.jump(target)
+        self.cur = self.new("dead")
+
+    def stmts(self, statements) -> None:
+        for s in statements:
+            self.stmt(s)
+
+    def stmt(self, s) -> None:
+        add = self.b.add_item
+        if s.block() is not None:
+            add(self.cur, IT_MARK, s)
+            self.stmts(s.block().statement())
+        elif s.ifStatement() is not None:
+            self.if_(s, s.ifStatement())
+        elif s.whileStatement() is not None:
+            self.while_(s, s.whileStatement())
+        elif s.doWhileStatement() is not None:
+            self.do_while(s, s.doWhileStatement())
+        elif s.forStatement() is not None:
+            self.for_(s, s.forStatement())
+        elif s.foreachStatement() is not None:
+            self.foreach(s, s.foreachStatement())
+        elif s.switchStatement() is not None:
+            self.switch(s, s.switchStatement())
+        elif s.tryCatchStatement() is not None:
+            self.try_(s, s.tryCatchStatement())
+        elif s.returnStatement() is not None:
+            add(self.cur, IT_STMT, s)
+            self.terminate(self.b.exit)
+        elif s.breakStatement() is not None:
+            add(self.cur, IT_STMT, s)
+            if self.breaks:
+                self.terminate(self.breaks[-1])
+        elif s.continueStatement() is not None:
+            add(self.cur, IT_STMT, s)
+            if self.continues:
+                self.terminate(self.continues[-1])
+        else:
+            add(self.cur, IT_STMT, s)
+
+    def if_(self, s, ctx) -> None:
+        self.b.add_item(self.cur, IT_MARK, s)
+        self.b.add_item(self.cur, IT_EXPR, ctx.expression())
+        c = const_bool(ctx.expression())
+        then_b = self.new("if.then")
+        after = self.new("if.end")
+        if c is not False:
+            self.jump(then_b)
+        if ctx.block(1) is not None:
+            else_b = self.new("if.else")
+            if c is not True:
+                self.jump(else_b)
+            self.cur = else_b
+            self.stmts(ctx.block(1).statement())
+            self.jump(after)
+        elif c is not True:
+            self.jump(after)
+        self.cur = then_b
+        self.stmts(ctx.block(0).statement())
+        self.jump(after)
+        self.cur = after
+
+    def _loop_body(self, block_ctx, break_to: int, continue_to: int) -> None:
+        self.breaks.append(break_to)
+        self.continues.append(continue_to)
+        self.stmts(block_ctx.statement())
+        self.breaks.pop()
+        self.continues.pop()
+
+    def while_(self, s, ctx) -> None:
+        cond = self.new("while.cond")
+        body = self.new("while.body")
+        after = self.new("while.end")
+        self.jump(cond)
+        self.b.add_item(cond, IT_MARK, s)
+        self.b.add_item(cond, IT_EXPR, ctx.expression())
+        c = const_bool(ctx.expression())
+        if c is not False:
+            self.b.add_edge(cond, body)
+        if c is not True:
+            self.b.add_edge(cond, after)
+        self.cur = body
+        self._loop_body(ctx.block(), after, cond)
+        self.jump(cond)
+        self.cur = after
+
+    def do_while(self, s, ctx) -> None:
+        body = self.new("do.body")
+        cond = self.new("do.cond")
+        after = self.new("do.end")
+        self.jump(body)
+        self.b.add_item(body, IT_MARK, s)
+        self.cur = body
+        self._loop_body(ctx.block(), after, cond)
+        self.jump(cond)
+        self.b.add_item(cond, IT_EXPR, ctx.expression())
+        c = const_bool(ctx.expression())
+        if c is not False:
+            self.b.add_edge(cond, body)
+        if c is not True:
+            self.b.add_edge(cond, after)
+        self.cur = after
+
+    def for_(self, s, ctx) -> None:
+        self.b.add_item(self.cur, IT_MARK, s)
+        if ctx.variableDeclaration() is not None:
+            self.b.add_item(self.cur, IT_STMT, ctx.variableDeclaration())
+        elif ctx.assignment() is not None:
+            self.b.add_item(self.cur, IT_STMT, ctx.assignment())
+        # for '(' init cond? ';' update? ')': las expresiones se distinguen por el ';' que las separa
+        cond_expr, update_expr = for_parts(ctx)
+        cond = self.new("for.cond")
+        body = self.new("for.body")
+        update = self.new("for.update")
+        after = self.new("for.end")
+        self.jump(cond)
+        c = True if cond_expr is None else const_bool(cond_expr)
+        if cond_expr is not None:
+            self.b.add_item(cond, IT_EXPR, cond_expr)
+        if c is not False:
+            self.b.add_edge(cond, body)
+        if c is not True:
+            self.b.add_edge(cond, after)
+        self.cur = body
+        self._loop_body(ctx.block(), after, update)
+        self.jump(update)
+        if update_expr is not None:
+            self.b.add_item(update, IT_EXPR, update_expr)
+        self.b.add_edge(update, cond)
+        self.cur = after
+
+    def foreach(self, s, ctx) -> None:
+        self.b.add_item(self.cur, IT_MARK, s)
+        self.b.add_item(self.cur, IT_EXPR, ctx.expression())
+        head = self.new("foreach.head")
+        body = self.new("foreach.body")
+        after = self.new("foreach.end")
+        self.jump(head)
+        self.b.add_edge(head, body)
+        self.b.add_edge(head, after)
+        self.b.add_item(body, IT_BIND, ctx)
+        self.cur = body
+        self._loop_body(ctx.block(), after, head)
+        self.jump(head)
+        self.cur = after
+
+    def switch(self, s, ctx) -> None:
+        self.b.add_item(self.cur, IT_MARK, s)
+        self.b.add_item(self.cur, IT_EXPR, ctx.expression())
+        dispatch = self.cur
+        after = self.new("switch.end")
+        cases = ctx.switchCase()
+        entries = [self.new("switch.case") for _ in cases]
+        default = self.new("switch.default") if ctx.defaultCase() is not None else None
+        for case, entry in zip(cases, entries):
+            self.b.add_item(dispatch, IT_EXPR, case.expression())
+            self.b.add_edge(dispatch, entry)
+        self.b.add_edge(dispatch, default if default is not None else after)
+
+        bodies = [(e, c.statement()) for e, c in zip(entries, cases)]
+        if default is not None:
+            bodies.append((default, ctx.defaultCase().statement()))
+        self.breaks.append(after)
+        for i, (entry, statements) in enumerate(bodies):
+            self.cur = entry
+            self.stmts(statements)
+            # fall-through al siguiente case (o al final)
+            self.jump(bodies[i + 1][0] if i + 1 < len(bodies) else after)
+        self.breaks.pop()
+        self.cur = after
+
+    def try_(self, s, ctx) -> None:
+        self.b.add_item(self.cur, IT_MARK, s)
+        handler = self.new("catch")
+        after = self.new("try.end")
+        self.handlers.append(handler)
+        body = self.new("try.body")
+        self.jump(body)
+        self.cur = body
+        self.stmts(ctx.block(0).statement())
+        self.handlers.pop()
+        self.jump(after)
+        self.cur = handler
+        self.b.add_item(handler, IT_BIND, ctx)
+        self.stmts(ctx.block(1).statement())
+        self.jump(after)
+        self.cur = after
+
+
+def for_parts(ctx):
+    """(condición, update) de un forStatement; cualquiera puede faltar."""
+    cond = update = None
+    semis = 0
+    for i in range(ctx.getChildCount()):
+        ch = ctx.getChild(i)
+        if isinstance(ch, (P.VariableDeclarationContext, P.AssignmentContext)):
+            semis += 1          # la inicialización trae su propio ';'
+        elif ch.getText() == ";" and not isinstance(ch, P.ExpressionContext):
+            semis += 1
+        elif isinstance(ch, P.ExpressionContext):
+            if semis == 1:
+                cond = ch
+            else:
+                update = ch
+    return cond, update
+
+
+def build_cfg(statements) -> CFG:
+    """CFG de una lista de StatementContext (cuerpo de función o programa)."""
+    sb = _StatementCFGBuilder()
+    sb.stmts(statements)
+    sb.jump(sb.b.end)
+    return sb.b.freeze()
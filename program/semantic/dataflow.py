@@ -0,0 +1,325 @@
+from __future__ import annotations
+from collections import deque
+from typing import Callable, List, Optional
+
+from antlr4.tree.Tree import TerminalNode
+
+from CompiscriptParser import CompiscriptParser
+from semantic.cfg import CFG, IT_STMT, IT_EXPR, IT_BIND
+from semantic.symbols import VarSymbol, ParamSymbol
+
+P = CompiscriptParser
+
+# Eventos que produce un ítem del CFG sobre una variable
+USE = 0      # lectura
+DEF = 1      # escritura (inicializador, asignación, variable de foreach/catch)
+DECL = 2     # declaración sin inicializador: la variable nace sin valor
+INIT = 3     # declaración con valor (let/const con inicializador, foreach, catch)
+
+
+class DataflowResult:
+    """Conjuntos IN/OUT por bloque, como enteros usados de bit vector."""
+
+    def __init__(self, n: int, init: int):
+        self.in_: List[int] = [init] * n
+        self.out: List[int] = [init] * n
+        self.iterations = 0          # bloques procesados por el worklist
+
+
+def solve(cfg: CFG, gen: List[int], kill: List[int], forward: bool = True,
+          intersect: bool = False, boundary: int = 0, universe: int = 0) -> DataflowResult:
+    """
+    Resuelve un problema gen/kill sobre 'cfg' con un worklist.
+
+    transfer(b) = gen[b] | (entrada & ~kill[b]); la reunión es unión o, con
+    intersect=True, intersección (el valor inicial de los bloques es entonces
+    'universe'). 'boundary' es el valor en la entrada (forward) o en los
+    bloques de salida (backward). Los bloques se encolan en postorden reverso
+    (forward) o postorden (backward), así que los problemas sin ciclos
+    convergen en una sola pasada.
+    """
+    n = len(cfg)
+    res = DataflowResult(n, universe if intersect else 0)
+    order = cfg.postorder()
+    if forward:
+        order.reverse()
+        preds_off, preds = cfg.pred_off, cfg.pred
+        sources = (CFG.ENTRY,)
+    else:
+        preds_off, preds = cfg.succ_off, cfg.succ
+        sources = (cfg.exit, cfg.end)
+    # 'src' es de donde llega la información; 'dst' lo que produce el bloque
+    src, dst = (res.in_, res.out) if forward else (res.out, res.in_)
+    reachable = cfg.reachable()
+
+    queue = deque(order)
+    queued = bytearray(n)
+    for b in order:
+        queued[b] = 1
+    # dependientes de b: sucesores (forward) o predecesores (backward)
+    dep_off, dep = (cfg.succ_off, cfg.succ) if forward else (cfg.pred_off, cfg.pred)
+
+    while queue:
+        b = queue.popleft()
+        queued[b] = 0
+        res.iterations += 1
+        if b in sources:
+            value = boundary
+        else:
+            start, end = preds_off[b], preds_off[b + 1]
+            if intersect:
+                value = universe
+                for k in range(start, end):
+                    p = preds[k]
+                    if reachable[p]:
+                        value &= dst[p]
+            else:
+                value = 0
+                for k in range(start, end):
+                    value |= dst[preds[k]]
+        src[b] = value
+        new = gen[b] | (value & ~kill[b])
+        if new != dst[b]:
+            dst[b] = new
+            for k in range(dep_off[b], dep_off[b + 1]):
+                t = dep[k]
+                if not queued[t] and reachable[t]:
+                    queued[t] = 1
+                    queue.append(t)
+    return res
+
+
+# ---------------------------------------------------------------------------
+# Extracción de usos y definiciones de los ítems del CFG
+# ---------------------------------------------------------------------------
+
+_SKIP = (P.FunctionDeclarationContext, P.ClassDeclarationContext,
+         P.TypeAnnotationContext, P.TypeContext, P.PropertyAccessExprContext)
+
+
+def item_events(kind: int, item) -> list:
+    """
+    Eventos (USE/DEF/DECL/INIT, token) de un ítem en orden de evaluación: en
+    'x = e' primero se leen las variables de 'e' y luego se escribe 'x'.
+    Las funciones anidadas tienen su propio CFG y no se recorren.
+    """
+    events: list = []
+    if kind == IT_BIND:
+        # foreach (x in ...) / catch (x): la variable queda asignada
+        events.append((INIT, item.Identifier().getSymbol()))
+        return events
+    if kind not in (IT_STMT, IT_EXPR):
+        return events
+
+    stack = [item]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, tuple):          # evento diferido (DEF después del lado derecho)
+            events.append(node)
+            continue
+        if isinstance(node, TerminalNode):
+            if node.getSymbol().type == P.Identifier:
+                events.append((USE, node.getSymbol()))
+            continue
+        if isinstance(node, _SKIP):
+            continue
+        if isinstance(node, P.StatementContext) and node is not item:
+            continue                          # sentencias compuestas: las cubre el CFG
+
+        if isinstance(node, P.VariableDeclarationContext):
+            tok = node.Identifier().getSymbol()
+            if node.initializer() is not None:
+                stack.append((INIT, tok))
+                stack.append(node.initializer().expression())
+            else:
+                events.append((DECL, tok))
+            continue
+        if isinstance(node, P.ConstantDeclarationContext):
+            stack.append((INIT, node.Identifier().getSymbol()))
+            stack.append(node.expression())
+            continue
+        if isinstance(node, P.AssignmentContext):
+            exprs = node.expression()
+            if len(exprs) == 1:                   # Identifier '=' expression ';'
+                stack.append((DEF, node.Identifier().getSymbol()))
+                stack.append(exprs[0])
+            else:                                 # expr '.' Identifier '=' expr ';'
+                stack.append(exprs[1])
+                stack.append(exprs[0])
+            continue
+        if isinstance(node, P.AssignExprContext):
+            target = _bare_identifier(node.lhs)
+            if target is not None:
+                stack.append((DEF, target))
+                stack.append(node.assignmentExpr())
+                continue
+        if isinstance(node, P.PropertyAssignExprContext):
+            stack.append(node.assignmentExpr())
+            stack.append(node.lhs)
+            continue
+        if isinstance(node, P.NewExprContext):
+            if node.arguments() is not None:
+                stack.append(node.arguments())
+            continue
+
+        for i in range(node.getChildCount() - 1, -1, -1):
+            stack.append(node.getChild(i))
+    return events
+
+
+def _bare_identifier(lhs) -> Optional[object]:
+    """Token del identificador si 'lhs' es solo 'x' (sin llamadas, índices ni propiedades)."""
+    if lhs.suffixOp():
+        return None
+    atom = lhs.primaryAtom()
+    if isinstance(atom, P.IdentifierExprContext):
+        return atom.Identifier().getSymbol()
+    return None
+
+
+class FunctionFlow:
+    """
+    Vista de un CFG para dataflow: eventos por bloque con las variables ya
+    numeradas (bit i <-> vars[i]). 'resolve(token)' devuelve el símbolo al
+    que apunta un identificador (p. ej. vía el PositionIndex del checker).
+    """
+
+    def __init__(self, cfg: CFG, resolve: Callable):
+        self.cfg = cfg
+        self.vars: list = []
+        self._bit: dict[int, int] = {}
+        self.declared = 0             # variables declaradas dentro del cuerpo
+        self.params = 0
+        # por bloque: lista de (evento, bit, token)
+        self.events: List[list] = []
+        for b in range(len(cfg)):
+            block = []
+            for kind, item in cfg.block_items(b):
+                for ev, tok in item_events(kind, item):
+                    sym = resolve(tok)
+                    if not isinstance(sym, (VarSymbol, ParamSymbol)):
+                        continue
+                    bit = self._number(sym)
+                    if ev == DECL or ev == INIT:
+                        self.declared |= 1 << bit
+                        ev = DEF if ev == INIT else DECL
+                    block.append((ev, bit, tok))
+            self.events.append(block)
+
+    def _number(self, sym) -> int:
+        bit = self._bit.get(id(sym))
+        if bit is None:
+            bit = len(self.vars)
+            self.vars.append(sym)
+            self._bit[id(sym)] = bit
+            if isinstance(sym, ParamSymbol):
+                self.params |= 1 << bit
+        return bit
+
+    def bit(self, sym) -> Optional[int]:
+        return self._bit.get(id(sym))
+
+    def mask(self, bits: int) -> list:
+        """Símbolos presentes en un bit vector."""
+        return [self.vars[i] for i in range(len(self.vars)) if bits >> i & 1]
+
+
+# ---------------------------------------------------------------------------
+# Clientes
+# ---------------------------------------------------------------------------
+
+def definite_assignment(flow: FunctionFlow) -> List[tuple]:
+    """
+    Asignación definida (forward, intersección). Devuelve (símbolo, token) de
+    cada lectura de una variable local que no está asignada en todos los
+    caminos que llegan a ella. Los parámetros entran asignados.
+    """
+    cfg = flow.cfg
+    n = len(cfg)
+    gen, kill = [0] * n, [0] * n
+    for b, events in enumerate(flow.events):
+        g = k = 0
+        for ev, bit, _ in events:
+            m = 1 << bit
+            if ev == DEF:
+                g |= m
+                k &= ~m
+            elif ev == DECL:
+                k |= m
+                g &= ~m
+        gen[b], kill[b] = g, k
+    universe = (1 << len(flow.vars)) - 1
+    # las variables no declaradas aquí (globales, capturadas) se asumen asignadas
+    res = solve(cfg, gen, kill, forward=True, intersect=True,
+                boundary=universe & ~flow.declared, universe=universe)
+
+    reachable = cfg.reachable()
+    uses = []
+    for b, events in enumerate(flow.events):
+        if not reachable[b]:
+            continue
+        state = res.in_[b]
+        for ev, bit, tok in events:
+            m = 1 << bit
+            if ev == USE:
+                if flow.declared & m and not state & m:
+                    uses.append((flow.vars[bit], tok))
+            elif ev == DEF:
+                state |= m
+            else:
+                state &= ~m
+    return uses
+
+
+def liveness(flow: FunctionFlow) -> DataflowResult:
+    """Variables vivas (backward, unión): in_[b] vivas al entrar a b, out[b] al salir."""
+    n = len(flow.cfg)
+    gen, kill = [0] * n, [0] * n
+    for b, events in enumerate(flow.events):
+        g = k = 0
+        for ev, bit, _ in reversed(events):
+            m = 1 << bit
+            if ev == USE:
+                g |= m
+            else:
+                g &= ~m
+                k |= m
+        gen[b], kill[b] = g, k
+    return solve(flow.cfg, gen, kill, forward=False)
+
+
+class ReachingDefinitions:
+    """
+    Definiciones que alcanzan cada bloque (forward, unión). Cada DEF/DECL es
+    una definición numerada: defs[i] = (símbolo, token).
+    """
+
+    def __init__(self, flow: FunctionFlow):
+        self.flow = flow
+        self.defs: List[tuple] = []
+        by_var: dict[int, int] = {}
+        block_defs: List[list] = []
+        for events in flow.events:
+            ds = []
+            for ev, bit, tok in events:
+                if ev != USE:
+                    d = len(self.defs)
+                    self.defs.append((flow.vars[bit], tok))
+                    by_var[bit] = by_var.get(bit, 0) | (1 << d)
+                    ds.append((bit, d))
+            block_defs.append(ds)
+        n = len(flow.cfg)
+        gen, kill = [0] * n, [0] * n
+        for b, ds in enumerate(block_defs):
+            g = k = 0
+            for bit, d in ds:
+                others = by_var[bit] & ~(1 << d)
+                g = (g & ~others) | (1 << d)
+                k |= others
+            gen[b], kill[b] = g, k
+        self.result = solve(flow.cfg, gen, kill, forward=True)
+
+    def reaching(self, b: int) -> List[tuple]:
+        """Definiciones (símbolo, token) que llegan a la entrada del bloque b."""
+        bits = self.result.in_[b]
+        return [self.defs[i] for i in range(len(self.defs)) if bits >> i & 1]
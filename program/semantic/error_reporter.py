@@ -8,9 +8,11 @@ class SemanticError:
     col: int
     code: str
     msg: str
+    count: int = 1      # ocurrencias agrupadas en este error (p.ej. usos de un nombre no definido)
 
     def __str__(self):
-        return f"[{self.line}:{self.col}] {self.code}: {self.msg}"
+        refs = f" ({self.count} referencias)" if self.count > 1 else ""
+        return f"[{self.line}:{self.col}] {self.code}: {self.msg}{refs}"
 
 
 class ErrorReporter:
@@ -24,9 +26,11 @@ class ErrorReporter:
 
     def report(self, line: int, col: int, code: str, msg: str):
         """
-        Registra un error con su posición, código y mensaje.
+        Registra un error con su posición, código y mensaje. Devuelve el error creado.
         """
-        self.errors.append(SemanticError(line, col, code, msg))
+        err = SemanticError(line, col, code, msg)
+        self.errors.append(err)
+        return err
 
     def has_errors(self) -> bool:
         """True si se registraron errores."""
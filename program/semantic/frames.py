@@ -0,0 +1,231 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from semantic.scope_tree import ScopeTree
+from semantic.symbols import Symbol, VarSymbol, ParamSymbol, ClassSymbol
+
+# Registro de activación (crece hacia abajo, offsets respecto de $fp):
+#
+#   fp + 4k     argumento k        (en métodos 'this' es el argumento 0)
+#   fp + 0      argumento 0
+#   fp - 4      $ra guardado
+#   fp - 8      $fp del llamador
+#   fp - 12     enlace estático     (funciones anidadas: entorno de la que la contiene)
+#   ...         puntero al entorno  (si alguna variable propia es capturada)
+#   ...         locales             (bloques disjuntos comparten slots)
+#   ...         temporales
+#
+# Las variables capturadas por funciones anidadas no viven en los slots de
+# locales sino en un registro de entorno: [enlace al entorno padre, var1, var2, ...].
+# Así una clausura puede seguir usándolas después de que la función retorna.
+# Si ninguna clausura escapa, el generador de MIPS pone ese registro dentro
+# del marco en lugar del heap (ver intermediate/escape.py).
+#
+# Los offsets de las variables (globales, locales y posiciones en el
+# entorno) son los que usa el código generado: tac_gen los copia a cada
+# TacVar y codegen/mips.py los respeta. El generador solo agrega lo que
+# este layout no conoce: $s guardados y slots de temporales derramados.
+
+WORD = 4
+SAVED_REGS = 2 * WORD          # $ra y $fp
+FRAME_ALIGN = 8
+
+
+def slot_size(sym: Symbol) -> int:
+    """Enteros, booleanos y referencias (string, arreglos, objetos) ocupan una palabra."""
+    return WORD
+
+
+def _align(n: int, a: int) -> int:
+    return (n + a - 1) // a * a
+
+
+@dataclass
+class FrameLayout:
+    name: str
+    params: List[ParamSymbol] = field(default_factory=list)
+    param_offsets: List[int] = field(default_factory=list)   # posición de llegada de cada parámetro
+    has_this: bool = False
+    link_slot: Optional[int] = None      # offset del enlace estático
+    env_slot: Optional[int] = None       # offset del puntero al entorno propio
+    captured: List[Symbol] = field(default_factory=list)     # en el entorno, en orden
+    env_size: int = 0                    # bytes del registro de entorno (0 = no hay)
+    locals_size: int = 0                 # bytes de enlace + entorno + locales (con reutilización)
+    locals_total: int = 0                # bytes que harían falta sin reutilizar slots
+    globals_size: int = 0                # solo __main__: bytes de la zona de datos
+
+    @property
+    def this_offset(self) -> Optional[int]:
+        return 0 if self.has_this else None
+
+    @property
+    def locals_base(self) -> int:
+        """Bytes del marco antes del primer local: $ra, $fp, enlace y puntero al entorno."""
+        return SAVED_REGS + WORD * ((self.link_slot is not None) + (self.env_slot is not None))
+
+    def temp_offset(self, i: int) -> int:
+        return -(SAVED_REGS + self.locals_size + WORD * (i + 1))
+
+    def frame_size(self, temps: int = 0) -> int:
+        """Bytes que reserva el prólogo (sin contar los argumentos, que apila el llamador)."""
+        return _align(SAVED_REGS + self.locals_size + WORD * temps, FRAME_ALIGN)
+
+    def describe(self) -> str:
+        parts = [f"frame {self.frame_size()} bytes", f"locales {self.locals_size}"]
+        if self.locals_total > self.locals_size:
+            parts[-1] += f" (sin reutilizar {self.locals_total})"
+        if self.env_size:
+            parts.append(f"entorno {self.env_size} bytes")
+        if self.link_slot is not None:
+            parts.append("enlace estático")
+        return ", ".join(parts)
+
+
+def _is_block(tree: ScopeTree, sid: int) -> bool:
+    """Bloques, ciclos, switch, catch...: todo lo que no abre un registro propio."""
+    return tree.kind(sid) not in ("global", "function", "class")
+
+
+def _allocate(tree: ScopeTree, sid: int, base: int, start: int, layout: FrameLayout) -> int:
+    """
+    Asigna los locales del bloque 'sid' a partir de 'base' bytes y devuelve
+    el máximo usado. Los bloques hermanos empiezan en el mismo 'base': nunca
+    están vivos a la vez, así que comparten slots. Las funciones y clases
+    anidadas tienen su propio registro y no se recorren.
+    """
+    for _, sym in tree.symbols(sid):
+        if not isinstance(sym, VarSymbol):
+            continue
+        if sym.captured:
+            layout.captured.append(sym)
+            continue
+        size = slot_size(sym)
+        base += size
+        layout.locals_total += size
+        sym.offset = -(start + base)
+    top = base
+    for child in tree.children(sid):
+        if _is_block(tree, child):
+            top = max(top, _allocate(tree, child, base, start, layout))
+    return top
+
+
+def _finish(tree: ScopeTree, layout: FrameLayout, body_scopes: List[int], nested: bool) -> FrameLayout:
+    reserved = 0
+    if nested:
+        reserved += WORD
+        layout.link_slot = -(SAVED_REGS + reserved)
+    captured_params = [p for p in layout.params if p.captured]
+    env_slot_at = reserved
+    reserved += WORD                          # se libera abajo si no hay nada capturado
+    top = reserved
+    for sid in body_scopes:
+        top = max(top, _allocate(tree, sid, reserved, SAVED_REGS, layout))
+
+    layout.captured[:0] = captured_params
+    if layout.captured:
+        layout.env_slot = -(SAVED_REGS + env_slot_at + WORD)
+        for i, sym in enumerate(layout.captured):
+            sym.offset = WORD * (i + 1)      # el 0 es el enlace al entorno padre
+        layout.env_size = WORD * (len(layout.captured) + 1)
+    else:
+        # sin entorno: se corre todo una palabra hacia arriba
+        for sid in body_scopes:
+            _shift(tree, sid, WORD)
+        top -= WORD
+    layout.locals_size = top
+    return layout
+
+
+def _shift(tree: ScopeTree, sid: int, delta: int) -> None:
+    for _, sym in tree.symbols(sid):
+        if isinstance(sym, VarSymbol) and not sym.captured and sym.offset is not None:
+            sym.offset += delta
+    for child in tree.children(sid):
+        if _is_block(tree, child):
+            _shift(tree, child, delta)
+
+
+def layout_function(tree: ScopeTree, sid: int, name: str, has_this: bool = False) -> FrameLayout:
+    """Registro de activación de la función cuyo scope (ya cerrado) es 'sid'."""
+    layout = FrameLayout(name, has_this=has_this)
+    layout.params = sorted((s for _, s in tree.symbols(sid) if isinstance(s, ParamSymbol)),
+                           key=lambda p: p.index)
+    first = 1 if has_this else 0
+    layout.param_offsets = [WORD * (first + p.index) for p in layout.params]
+    for p, off in zip(layout.params, layout.param_offsets):
+        p.offset = off                        # los capturados se mueven al entorno en _finish
+    parent = tree.parent[sid]
+    nested = parent >= 0 and _is_block(tree, parent)
+    body = [c for c in tree.children(sid) if _is_block(tree, c)]
+    return _finish(tree, layout, body, nested)
+
+
+def layout_main(tree: ScopeTree, name: str = "__main__") -> FrameLayout:
+    """
+    Variables del programa principal: las declaradas en el scope global van a
+    la zona de datos (offset respecto de $gp); las de bloques de nivel
+    superior (while, if, ...) son locales del marco de __main__.
+    """
+    offset = 0
+    for _, sym in tree.symbols(0):
+        if isinstance(sym, VarSymbol):
+            sym.offset = offset
+            offset += slot_size(sym)
+    layout = FrameLayout(name, globals_size=offset)
+    body = [c for c in tree.children(0) if _is_block(tree, c)]
+    return _finish(tree, layout, body, nested=False)
+
+
+# Objetos (en el heap, offsets respecto del puntero al objeto):
+#
+#   obj + 0      puntero a la vtable de su clase
+#   obj + 4k     campo k-1          (los heredados primero, en el orden de la base)
+#
+# La vtable es [nombre para imprimir, método 0, método 1, ...]. Una subclase
+# empieza con una copia de la de su base y cada redefinición reemplaza el
+# slot heredado: el mismo offset y el mismo slot sirven para cualquier
+# objeto cuyo tipo estático sea la base. El constructor no entra en la
+# vtable (siempre se llama por nombre).
+
+@dataclass
+class ClassLayout:
+    name: str
+    base: Optional[str] = None
+    fields: Dict[str, int] = field(default_factory=dict)    # campo -> offset
+    methods: List[str] = field(default_factory=list)        # slot -> "Dueña.metodo"
+    slots: Dict[str, int] = field(default_factory=dict)     # método -> slot
+
+    @property
+    def size(self) -> int:
+        return WORD * (len(self.fields) + 1)
+
+    def method_offset(self, name: str) -> int:
+        """Offset del método 'name' dentro de la vtable (la palabra 0 es el nombre)."""
+        return WORD * (self.slots[name] + 1)
+
+    def describe(self) -> str:
+        return f"objeto {self.size} bytes, vtable {len(self.methods)} métodos"
+
+
+def layout_class(csym: ClassSymbol, base: Optional[ClassLayout] = None) -> ClassLayout:
+    """Offsets de los campos y vtable de 'csym', extendiendo la de su base."""
+    layout = ClassLayout(csym.name, base.name if base is not None else None)
+    if base is not None:
+        layout.fields = dict(base.fields)
+        layout.methods = list(base.methods)
+        layout.slots = dict(base.slots)
+    for name, sym in csym.fields.items():
+        # un campo redeclarado en la subclase reutiliza el offset heredado
+        sym.offset = layout.fields.setdefault(name, WORD * (len(layout.fields) + 1))
+    for name in csym.methods:
+        if name == "constructor":
+            continue
+        slot = layout.slots.setdefault(name, len(layout.methods))
+        entry = f"{csym.name}.{name}"
+        if slot == len(layout.methods):
+            layout.methods.append(entry)
+        else:
+            layout.methods[slot] = entry
+    return layout
@@ -0,0 +1,185 @@
+from __future__ import annotations
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from array import array
+
+from semantic.symbols import Symbol
+
+
+# Las columnas se empaquetan junto con la línea en un solo entero para poder
+# ordenar y buscar con bisect sin construir tuplas en cada consulta.
+_COL_BITS = 20
+_COL_MASK = (1 << _COL_BITS) - 1
+
+
+def _key(line: int, col: int) -> int:
+    return (line << _COL_BITS) | (col & _COL_MASK)
+
+
+@dataclass(frozen=True)
+class Span:
+    """Rango de un token: línea (1-based), columna inicial y final (0-based, exclusiva)."""
+    line: int
+    col: int
+    end_col: int
+
+    def __str__(self) -> str:
+        return f"{self.line}:{self.col}-{self.end_col}"
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    """Aparición de un símbolo en el código fuente."""
+    symbol: Symbol
+    span: Span
+    is_definition: bool
+
+
+class PositionIndex:
+    """
+    Índice ordenado de definiciones y referencias.
+
+    El TypeChecker registra cada token de identificador con el símbolo al que
+    resuelve. Al consultar por primera vez se ordenan los spans en arreglos
+    paralelos, de modo que "qué símbolo hay en línea L, columna C" se responde
+    con una búsqueda binaria: O(log n).
+    """
+
+    def __init__(self) -> None:
+        self._symbols: List[Symbol] = []
+        self._sym_ids: Dict[int, int] = {}           # id(sym) -> índice en _symbols
+        self._pending: List[tuple[int, int, int]] = []  # (key, end_col, sym_id << 1 | is_def)
+        self._frozen = False
+        # Arreglos compactos ordenados por posición (se llenan en freeze()).
+        self._starts = array("q")
+        self._ends = array("i")
+        self._entries = array("q")
+        self._definitions: Dict[int, int] = {}       # sym_id -> posición en los arreglos
+        self._references: Dict[int, array] = {}      # sym_id -> posiciones en los arreglos
+
+    # ---------------- Registro ----------------
+
+    def _sym_id(self, sym: Symbol) -> int:
+        sid = self._sym_ids.get(id(sym))
+        if sid is None:
+            sid = len(self._symbols)
+            self._symbols.append(sym)
+            self._sym_ids[id(sym)] = sid
+        return sid
+
+    def _add(self, sym: Symbol, line: int, col: int, length: int, is_def: bool) -> None:
+        if sym is None or line <= 0:
+            return
+        sid = self._sym_id(sym)
+        self._pending.append((_key(line, col), col + max(length, 1), (sid << 1) | int(is_def)))
+        self._frozen = False
+
+    def add_definition(self, sym: Symbol, line: int, col: int, length: int) -> None:
+        self._add(sym, line, col, length, True)
+
+    def add_reference(self, sym: Symbol, line: int, col: int, length: int) -> None:
+        self._add(sym, line, col, length, False)
+
+    def add_token(self, sym: Symbol, token, is_definition: bool = False) -> None:
+        """Registra un token de ANTLR (usa su línea, columna y longitud de texto)."""
+        if token is None:
+            return
+        self._add(sym, token.line, token.column, len(token.text or ""), is_definition)
+
+    # ---------------- Construcción ----------------
+
+    def freeze(self) -> None:
+        """Ordena los spans registrados y elimina duplicados (el checker a veces visita dos veces)."""
+        if self._frozen:
+            return
+        done = len(self._starts)
+        added = sorted(set(self._pending[done:]))
+        if done and added and added[0][0] > self._starts[-1]:
+            # Solo se agregaron posiciones posteriores (chequeo por sentencias): se anexan.
+            self._append_sorted(added)
+            return
+        entries = sorted(set(self._pending))
+        self._pending = entries
+        self._starts = array("q", (e[0] for e in entries))
+        self._ends = array("i", (e[1] for e in entries))
+        self._entries = array("q", (e[2] for e in entries))
+        self._definitions = {}
+        self._references = {}
+        for pos, packed in enumerate(self._entries):
+            sid = packed >> 1
+            if packed & 1:
+                self._definitions.setdefault(sid, pos)
+            else:
+                self._references.setdefault(sid, array("i")).append(pos)
+        self._frozen = True
+
+    def _append_sorted(self, added: list) -> None:
+        del self._pending[len(self._starts):]
+        for e in added:
+            pos = len(self._starts)
+            self._pending.append(e)
+            self._starts.append(e[0])
+            self._ends.append(e[1])
+            self._entries.append(e[2])
+            sid = e[2] >> 1
+            if e[2] & 1:
+                self._definitions.setdefault(sid, pos)
+            else:
+                self._references.setdefault(sid, array("i")).append(pos)
+        self._frozen = True
+
+    def _occurrence(self, pos: int) -> Occurrence:
+        start = self._starts[pos]
+        packed = self._entries[pos]
+        span = Span(start >> _COL_BITS, start & _COL_MASK, self._ends[pos])
+        return Occurrence(self._symbols[packed >> 1], span, bool(packed & 1))
+
+    # ---------------- Consultas ----------------
+
+    def __len__(self) -> int:
+        self.freeze()
+        return len(self._starts)
+
+    def at(self, line: int, col: int) -> Optional[Occurrence]:
+        """Ocurrencia cuyo span contiene (line, col), o None."""
+        self.freeze()
+        pos = bisect_right(self._starts, _key(line, col)) - 1
+        if pos < 0:
+            return None
+        start = self._starts[pos]
+        if start >> _COL_BITS != line or col >= self._ends[pos]:
+            return None
+        return self._occurrence(pos)
+
+    def symbol_at(self, line: int, col: int) -> Optional[Symbol]:
+        occ = self.at(line, col)
+        return occ.symbol if occ else None
+
+    def definition(self, sym: Symbol) -> Optional[Span]:
+        """Span del identificador en la declaración de 'sym' (si se registró)."""
+        self.freeze()
+        sid = self._sym_ids.get(id(sym))
+        if sid is None or sid not in self._definitions:
+            return None
+        return self._occurrence(self._definitions[sid]).span
+
+    def definition_at(self, line: int, col: int) -> Optional[Span]:
+        """Go-to-definition: span de la declaración del símbolo en (line, col)."""
+        sym = self.symbol_at(line, col)
+        return self.definition(sym) if sym is not None else None
+
+    def references(self, sym: Symbol) -> List[Span]:
+        """Find-references: spans de todos los usos de 'sym' en orden de aparición."""
+        self.freeze()
+        sid = self._sym_ids.get(id(sym))
+        if sid is None:
+            return []
+        return [self._occurrence(p).span for p in self._references.get(sid, ())]
+
+    def hover(self, line: int, col: int) -> Optional[str]:
+        """Texto corto para hover: categoría, nombre y tipo del símbolo en (line, col)."""
+        sym = self.symbol_at(line, col)
+        if sym is None:
+            return None
+        return f"{sym.category} {sym.name}: {sym.type}"
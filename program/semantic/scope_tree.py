@@ -0,0 +1,143 @@
+from __future__ import annotations
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from semantic.symbols import Symbol
+
+
+class ScopeTree:
+    """
+    Árbol de scopes retenido en una arena compacta.
+
+    Cada scope que abre el ScopeStack recibe un id (en preorden, así que el
+    padre siempre tiene un id menor que sus hijos). Al cerrarse, sus símbolos
+    se copian a una lista plana y el scope guarda solo el rango [inicio, fin).
+    No se retienen contextos de ANTLR ni objetos Scope cerrados, de modo que el
+    árbol completo puede consultarse después del chequeo en O(tamaño).
+    """
+
+    def __init__(self) -> None:
+        self._kinds: List[str] = []                 # tabla de kinds internados
+        self._kind_ids: Dict[str, int] = {}
+        self.parent = array("i")                    # id del padre (-1 = raíz)
+        self.kind_id = array("B")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self._last_child = array("i")
+        self.sym_start = array("i")
+        self.sym_end = array("i")
+        self.names: List[Optional[str]] = []        # nombre de función/clase dueña
+        self.owners: List[Optional[Symbol]] = []
+        self._symbols: List[Tuple[str, Symbol]] = []
+        self._open: Dict[int, object] = {}          # scopes aún abiertos (p.ej. global)
+        self._scope_of: Dict[int, int] = {}         # id(sym) -> id de scope
+        self.frames: Dict[int, object] = {}          # scope de función (0 = __main__) -> FrameLayout
+        self.classes: Dict[str, object] = {}         # nombre de clase -> ClassLayout
+
+    # ---------------- Construcción (usada por ScopeStack) ----------------
+
+    def open(self, scope, parent_id: int = -1) -> int:
+        kind = scope.kind
+        kid = self._kind_ids.get(kind)
+        if kid is None:
+            kid = len(self._kinds)
+            self._kinds.append(kind)
+            self._kind_ids[kind] = kid
+
+        sid = len(self.parent)
+        self.parent.append(parent_id)
+        self.kind_id.append(kid)
+        self.first_child.append(-1)
+        self.next_sibling.append(-1)
+        self._last_child.append(-1)
+        self.sym_start.append(0)
+        self.sym_end.append(0)
+        self.names.append(getattr(scope, "func_name", None) or getattr(scope, "class_name", None))
+        self.owners.append(scope.owner)
+
+        if parent_id >= 0:
+            last = self._last_child[parent_id]
+            if last < 0:
+                self.first_child[parent_id] = sid
+            else:
+                self.next_sibling[last] = sid
+            self._last_child[parent_id] = sid
+
+        self._open[sid] = scope
+        return sid
+
+    def close(self, sid: int) -> None:
+        scope = self._open.pop(sid, None)
+        if scope is None:
+            return
+        self.owners[sid] = scope.owner
+        self.sym_start[sid] = len(self._symbols)
+        for name, sym in scope.items():
+            self._symbols.append((name, sym))
+            self._scope_of[id(sym)] = sid
+        self.sym_end[sid] = len(self._symbols)
+
+    # ---------------- Consultas ----------------
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def kind(self, sid: int) -> str:
+        return self._kinds[self.kind_id[sid]]
+
+    def name(self, sid: int) -> Optional[str]:
+        return self.names[sid]
+
+    def symbols(self, sid: int) -> List[Tuple[str, Symbol]]:
+        """Pares (nombre, símbolo) declarados directamente en el scope 'sid'."""
+        scope = self._open.get(sid)
+        if scope is not None:
+            return list(scope.items())
+        return self._symbols[self.sym_start[sid]:self.sym_end[sid]]
+
+    def children(self, sid: int) -> Iterator[int]:
+        c = self.first_child[sid]
+        while c >= 0:
+            yield c
+            c = self.next_sibling[c]
+
+    def walk(self, sid: int = 0) -> Iterator[Tuple[int, int]]:
+        """Recorrido en preorden desde 'sid'; produce (id, profundidad relativa)."""
+        if not len(self):
+            return
+        stack = [(sid, 0)]
+        while stack:
+            cur, depth = stack.pop()
+            yield cur, depth
+            kids = list(self.children(cur))
+            for c in reversed(kids):
+                stack.append((c, depth + 1))
+
+    def ancestors(self, sid: int) -> Iterator[int]:
+        while sid >= 0:
+            yield sid
+            sid = self.parent[sid]
+
+    def lookup(self, sid: int, name: str) -> Optional[Symbol]:
+        """Resolución post-hoc: busca 'name' desde 'sid' hacia la raíz."""
+        for s in self.ancestors(sid):
+            for n, sym in self.symbols(s):
+                if n == name:
+                    return sym
+        return None
+
+    def scope_of(self, sym: Symbol) -> Optional[int]:
+        """Id del scope (ya cerrado) donde se declaró 'sym'."""
+        sid = self._scope_of.get(id(sym))
+        if sid is None:
+            for osid, scope in self._open.items():
+                if scope.symbols.get(sym.name) is sym:
+                    return osid
+        return sid
+
+    def enclosing(self, sid: int, kind: str) -> Optional[int]:
+        """Primer ancestro (incluyéndose) del tipo 'kind'."""
+        for s in self.ancestors(sid):
+            if self.kind(s) == kind:
+                return s
+        return None
@@ -2,6 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Iterable
 from semantic.symbols import Symbol
+from semantic.scope_tree import ScopeTree
 
 @dataclass
 class Scope:
@@ -10,7 +11,17 @@ class Scope:
     parent: Optional['Scope'] = None
     symbols: Dict[str, Symbol] = field(default_factory=dict)
     owner: Symbol | None = None   
-
+    tree_id: int = field(default=-1, repr=False, compare=False)   # id en el ScopeTree
+    # Caché negativa: nombre -> época en que se confirmó que no resuelve desde aquí.
+    _misses: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+    # Época por nombre: cada define(name) la incrementa e invalida las entradas
+    # negativas de ese nombre. La tabla es del scope raíz y la comparten todos
+    # sus descendientes, así que cada árbol (cada TypeChecker) lleva la suya.
+    _define_epoch: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.parent is not None:
+            self._define_epoch = self.parent._define_epoch
 
     def define(self, sym: Symbol) -> bool:
         """
@@ -20,17 +31,24 @@ class Scope:
         if sym.name in self.symbols:
             return False
         self.symbols[sym.name] = sym
+        epochs = self._define_epoch
+        epochs[sym.name] = epochs.get(sym.name, 0) + 1
         return True
 
     def resolve(self, name: str) -> Optional[Symbol]:
         """
         Busca el símbolo por 'name' en este scope y, si no está, recorre la cadena de padres.
+        Los fallos se cachean por scope hasta que alguien vuelva a definir 'name'.
         """
+        epoch = self._define_epoch.get(name, 0)
+        if self._misses.get(name, -1) == epoch:
+            return None
         s: Optional[Scope] = self
         while s is not None:
             if name in s.symbols:
                 return s.symbols[name]
             s = s.parent
+        self._misses[name] = epoch
         return None
 
     # Utilidades
@@ -56,6 +74,7 @@ class FunctionScope(Scope):
         self.func_name = name
         self.return_type = return_type
         self.has_return = False  
+        self.frame = None        # FrameLayout, se calcula al cerrar el scope
 
 class ClassScope(Scope):
     def __init__(self, parent: Scope, class_name: str) -> None:
@@ -67,9 +86,18 @@ class ClassScope(Scope):
 class ScopeStack:
     """
     Pila de scopes para usar desde el TypeChecker.
+    Cada scope nuevo se registra en 'tree' (ScopeTree) para poder consultarlo
+    después de que se desapila.
     """
     def __init__(self, root: Optional[Scope] = None):
         self.stack: list[Scope] = [root] if root else []
+        self.tree = ScopeTree()
+        if root:
+            self._register(root)
+
+    def _register(self, s: Scope) -> None:
+        parent_id = self.stack[-2].tree_id if len(self.stack) > 1 else -1
+        s.tree_id = self.tree.open(s, parent_id)
 
     @property
     def current(self) -> Scope:
@@ -91,6 +119,7 @@ class ScopeStack:
         else:
             s = Scope(kind, parent)
         self.stack.append(s)
+        self._register(s)
         return s
     
     def push_child(self, child: Scope) -> Scope:
@@ -104,7 +133,19 @@ class ScopeStack:
         if child is new_parent:
             return child
 
+        # Si ya es ancestro del actual (p.ej. el global), reparentarlo crearía
+        # un ciclo en la cadena de resolución: se apila tal cual.
+        s = new_parent
+        while s is not None:
+            if s is child:
+                self.stack.append(child)
+                return child
+            s = s.parent
+
         child.parent = self.current if self.stack else None
+        child._misses.clear()   # cambió la cadena de padres
+        if child.parent is not None:
+            child._define_epoch = child.parent._define_epoch
         self.stack.append(child)
         return child
 
@@ -114,6 +155,7 @@ class ScopeStack:
         fs = FunctionScope(parent, return_type, name)
         self.stack.append(fs)
         fs.owner = parent.resolve(name) if (name and parent) else None
+        self._register(fs)
         return fs
 
     def push_class(self, class_name: str) -> ClassScope:
@@ -121,12 +163,17 @@ class ScopeStack:
         cs = ClassScope(parent, class_name)
         self.stack.append(cs)
         cs.owner = parent.resolve(class_name) if parent else None
+        self._register(cs)
         return cs
 
     def pop(self) -> Scope:
         if not self.stack:
             raise RuntimeError("Pop en ScopeStack vacío.")
-        return self.stack.pop()
+        s = self.stack.pop()
+        # Un scope reutilizado con push_child puede seguir abierto más abajo en la pila.
+        if s.tree_id >= 0 and not any(x is s for x in self.stack):
+            self.tree.close(s.tree_id)
+        return s
 
     def depth(self) -> int:
         return len(self.stack)
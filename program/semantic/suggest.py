@@ -0,0 +1,165 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+
+
+def levenshtein(a: str, b: str, limit: int | None = None) -> int:
+    """
+    Distancia de edición entre 'a' y 'b'. Si se da 'limit' y la distancia lo
+    supera, corta temprano y devuelve limit + 1.
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        best = i
+        for j, cb in enumerate(b, 1):
+            v = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+            cur.append(v)
+            if v < best:
+                best = v
+        if limit is not None and best > limit:
+            return limit + 1
+        prev = cur
+    return prev[-1]
+
+
+class BKTree:
+    """
+    BK-tree sobre la distancia de Levenshtein. Las inserciones son
+    incrementales, así que un índice por scope puede crecer a medida que se
+    declaran símbolos sin reconstruirse.
+    """
+
+    def __init__(self) -> None:
+        self._words: List[str] = []
+        self._children: List[Dict[int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def add(self, word: str) -> None:
+        if not self._words:
+            self._words.append(word)
+            self._children.append({})
+            return
+        node = 0
+        while True:
+            d = levenshtein(word, self._words[node])
+            if d == 0:
+                return
+            nxt = self._children[node].get(d)
+            if nxt is None:
+                self._children[node][d] = len(self._words)
+                self._words.append(word)
+                self._children.append({})
+                return
+            node = nxt
+
+    def search(self, word: str, max_dist: int) -> List[Tuple[int, str]]:
+        """Palabras a distancia <= max_dist, ordenadas por (distancia, palabra)."""
+        if not self._words:
+            return []
+        out: List[Tuple[int, str]] = []
+        pending = [0]
+        while pending:
+            node = pending.pop()
+            d = levenshtein(word, self._words[node])
+            if d <= max_dist:
+                out.append((d, self._words[node]))
+            lo, hi = d - max_dist, d + max_dist
+            for edge, child in self._children[node].items():
+                if lo <= edge <= hi:
+                    pending.append(child)
+        out.sort()
+        return out
+
+
+def max_distance(name: str) -> int:
+    """Umbral de sugerencia: 1 edición para nombres de hasta 3 letras, luego ~1/3 del largo (mín. 2)."""
+    if len(name) <= 3:
+        return 1
+    return max(2, len(name) // 3)
+
+
+class Suggester:
+    """
+    Sugerencias "¿quisiste decir...?" para nombres no definidos.
+
+    Mantiene un BK-tree por scope y otro por tabla de miembros de clase. Los
+    índices se crean (o se extienden) solo cuando se reporta un error, y cada
+    resultado se cachea por nombre mal escrito, así que errores en cascada no
+    cuestan búsquedas extra.
+    """
+
+    def __init__(self) -> None:
+        # id(objeto) -> (objeto, cantidad de nombres indexados, árbol)
+        self._scope_trees: Dict[int, tuple] = {}
+        self._class_trees: Dict[int, tuple] = {}
+        self._cache: Dict[tuple, Optional[str]] = {}
+        self.lookups = 0          # búsquedas reales (no cacheadas), útil para pruebas
+
+    def _tree_for(self, table: Dict[int, tuple], owner, names: List[str],
+                  incremental: bool = True) -> BKTree:
+        entry = table.get(id(owner))
+        if entry is None or entry[0] is not owner or (not incremental and entry[1] != len(names)):
+            entry = (owner, 0, BKTree())
+        _, count, tree = entry
+        for n in names[count:]:
+            tree.add(n)
+        table[id(owner)] = (owner, len(names), tree)
+        return tree
+
+    def for_scope(self, scope, name: str) -> Optional[str]:
+        """Nombre visible más parecido a 'name' desde 'scope' (el scope más cercano gana empates)."""
+        key = ("scope", id(scope), name)
+        if key in self._cache:
+            return self._cache[key]
+        self.lookups += 1
+        limit = max_distance(name)
+        best: Optional[Tuple[int, str]] = None
+        s, seen = scope, set()
+        while s is not None and id(s) not in seen:
+            seen.add(id(s))
+            tree = self._tree_for(self._scope_trees, s, list(s.symbols))
+            hits = tree.search(name, limit)
+            if hits and (best is None or hits[0][0] < best[0]):
+                best = hits[0]
+            s = s.parent
+        result = best[1] if best else None
+        self._cache[key] = result
+        return result
+
+    def for_members(self, class_sym, name: str, resolve) -> Optional[str]:
+        """
+        Miembro (campo o método) más parecido a 'name' en 'class_sym' o sus
+        bases. 'resolve' convierte el nombre de la clase base en su símbolo.
+        """
+        key = ("class", id(class_sym), name)
+        if key in self._cache:
+            return self._cache[key]
+        self.lookups += 1
+        limit = max_distance(name)
+        best: Optional[Tuple[int, str]] = None
+        cur, seen = class_sym, set()
+        while cur is not None and hasattr(cur, "fields") and id(cur) not in seen:
+            seen.add(id(cur))
+            members = list(cur.fields) + [m for m in cur.methods if m not in cur.fields]
+            # fields y methods crecen por separado: si cambió el tamaño se reconstruye
+            tree = self._tree_for(self._class_trees, cur, members, incremental=False)
+            hits = tree.search(name, limit)
+            if hits and (best is None or hits[0][0] < best[0]):
+                best = hits[0]
+            cur = resolve(cur.base) if getattr(cur, "base", None) else None
+        result = best[1] if best else None
+        self._cache[key] = result
+        return result
+
+
+def did_you_mean(suggestion: Optional[str]) -> str:
+    """Sufijo para mensajes de error ('' si no hay sugerencia)."""
+    return f". ¿Quisiste decir '{suggestion}'?" if suggestion else ""
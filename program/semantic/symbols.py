@@ -15,29 +15,38 @@ class Symbol:
 class VarSymbol(Symbol):
     is_const: bool = False
     is_initialized: bool = False
-    offset: int | None = None   
+    offset: int | None = None   # $fp (local), $gp (global) o registro de entorno si 'captured'
+    captured: bool = False      # la usa una función anidada: vive en el entorno, no en el marco
     def __init__(self, name, type, is_const=False, is_initialized=False, line=0, col=0):
         super().__init__(name, type, category="variable" if not is_const else "const", line=line, col=col)
         self.is_const = is_const
         self.is_initialized = is_initialized
+        self.offset = None
+        self.captured = False
 
 @dataclass
 class ParamSymbol(Symbol):
     index: int = 0
+    offset: int | None = None
+    captured: bool = False
     def __init__(self, name, type, index, line=0, col=0):
         super().__init__(name, type, category="param", line=line, col=col)
         self.index = index
+        self.offset = None
+        self.captured = False
 
 @dataclass
 class FuncSymbol(Symbol):
     type: FunctionType
     params: Tuple[ParamSymbol, ...] = field(default_factory=tuple)
     closure_scope: Optional['Scope'] = None
+    frame: Optional['FrameLayout'] = None      # registro de activación (semantic/frames.py)
 
     def __init__(self, name, type, params=(), line=0, col=0, closure_scope=None):
         super().__init__(name, type, category="function", line=line, col=col)
         self.params = tuple(params)
         self.closure_scope = closure_scope
+        self.frame = None
 
 @dataclass
 class ClassSymbol(Symbol):
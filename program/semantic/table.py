@@ -1,4 +1,5 @@
 from semantic.scopes import Scope, ScopeStack
+from semantic.scope_tree import ScopeTree
 from semantic.symbols import Symbol, VarSymbol, ParamSymbol, FuncSymbol, ClassSymbol
 
 def print_scope(scope: Scope, indent=0):
@@ -26,11 +27,45 @@ def print_scope(scope: Scope, indent=0):
             for mname, msym in sym.methods.items():
                 print(f"{pad}    method {mname} : {msym.type}")
 
+def _location(sym: Symbol, kind: str) -> str:
+    """Dónde vive la variable en tiempo de ejecución (ver semantic/frames.py)."""
+    offset = getattr(sym, "offset", None)
+    if offset is None:
+        return ""
+    if getattr(sym, "captured", False):
+        return f" [env+{offset}]"
+    if kind == "global":
+        return f" [gp+{offset}]"
+    if kind == "class":
+        return f" [this+{offset}]"
+    return f" [fp{offset:+d}]"
+
+def print_scope_tree(tree: ScopeTree):
+    """Imprime todos los scopes retenidos (globales, funciones, bloques, clases...)."""
+    for sid, depth in tree.walk(0):
+        pad = "  " * depth
+        name = tree.name(sid)
+        kind = tree.kind(sid)
+        frame = tree.frames.get(sid) if kind != "class" else tree.classes.get(name)
+        print(f"{pad}Scope ({kind}{' ' + name if name else ''})"
+              + (f"  [{frame.describe()}]" if frame is not None else ""))
+        for _, sym in tree.symbols(sid):
+            print(f"{pad}- {sym.category:<8} {sym.name:<12} : {sym.type} (line {sym.line}, col {sym.col})"
+                  + _location(sym, kind))
+            if isinstance(sym, ClassSymbol):
+                layout = tree.classes.get(sym.name)
+                for mname, msym in sym.methods.items():
+                    slot = layout.slots.get(mname) if layout is not None else None
+                    print(f"{pad}    method {mname} : {msym.type}"
+                          + (f" [vtable {slot}]" if slot is not None else ""))
+
 def print_symbol_table(stack: ScopeStack):
     if not stack.stack:
         print(" No hay scopes registrados en la tabla de símbolos.")
         return
     print("\nTabla de Símbolos")
     print("====================")
-    root = stack.stack[0]
-    print_scope(root, 0)
+    if len(stack.tree):
+        print_scope_tree(stack.tree)
+    else:
+        print_scope(stack.stack[0], 0)
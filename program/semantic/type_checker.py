@@ -1,5 +1,5 @@
 from semantic.typesys import make_fn, FunctionType
-from semantic.scopes import GlobalScope, ScopeStack
+from semantic.scopes import GlobalScope, ScopeStack, FunctionScope
 from semantic.symbols import VarSymbol, FuncSymbol, ClassSymbol, ParamSymbol
 from semantic.typesys import (
     Type, INTEGER, STRING, BOOLEAN, VOID, NULL,
@@ -9,23 +9,84 @@ from semantic.typesys import (
 )
 
 from semantic.error_reporter import ErrorReporter
+from semantic.position_index import PositionIndex
+from semantic.suggest import Suggester, did_you_mean
+from semantic.cfg import build_cfg
+from semantic.dataflow import FunctionFlow, definite_assignment
+from semantic.frames import layout_function, layout_main, layout_class
 from CompiscriptVisitor import CompiscriptVisitor
 from CompiscriptParser import CompiscriptParser
 from contextlib import contextmanager
 
 class TypeChecker(CompiscriptVisitor):
-    def __init__(self, reporter: ErrorReporter):
+    def __init__(self, reporter: ErrorReporter, record_types: bool = False):
         super().__init__()
         self.reporter = reporter
+        # ctx -> tipo de cada nodo visitado (lo usa la generación de código)
+        self.types: dict | None = {} if record_types else None
         self.scopes = ScopeStack()
         self.scopes.push("global")   # GLOBAL AQUI
         self._current_class: str | None = None
+        self.index = PositionIndex()   # definiciones/referencias por posición (IDE)
+        self.suggester = Suggester()   # "¿quisiste decir...?" en errores de nombres
+        # Nombre no definido -> (error ya reportado, posiciones de uso vistas)
+        self._undefined: dict[str, tuple] = {}
+        self.cfgs: dict = {}             # FunctionDeclarationContext -> CFG (reutilizable por codegen)
+        self._dead_seen: set[tuple[int, int]] = set()
+        self._flow_pending: list = []    # CFGs a los que falta el análisis de dataflow (ver finish)
+        self._suffix_base: dict = {}     # sufijo de un leftHandSide -> tipo de lo que tiene a la izquierda
+
+    def visit(self, tree):
+        t = super().visit(tree)
+        if self.types is not None and t is not None:
+            self.types[tree] = t
+        return t
 
-    def define_symbol(self, sym):
+    def define_symbol(self, sym, token=None):
+        """
+        Define 'sym' en el scope actual. Si se pasa 'token' (el Identifier de la
+        declaración) se registra como definición en el índice de posiciones.
+        """
         if not self.scopes.stack:
             self.scopes.push("global")
         if not self.scopes.current.define(sym):
-            self.reporter.report(0, 0, "E_REDECL", f"Redeclaración de {sym.name}")
+            line = token.line if token is not None else sym.line
+            col = token.column if token is not None else sym.col
+            self.reporter.report(line, col, "E_REDECL", f"Redeclaración de {sym.name}")
+            return False
+        self.index.add_token(sym, token, is_definition=True)
+        return True
+
+    def record_reference(self, sym, node):
+        """Registra en el índice que el TerminalNode 'node' hace referencia a 'sym'."""
+        if sym is not None and node is not None:
+            self.index.add_token(sym, node.getSymbol())
+            if isinstance(sym, (VarSymbol, ParamSymbol)) and not sym.captured:
+                self.note_capture(sym)
+
+    def note_capture(self, sym):
+        """
+        Marca 'sym' como capturada si se usa desde una función anidada dentro
+        de la que la declara (las globales no cuentan: viven en la zona de datos).
+        """
+        crossed = False
+        s = self.scopes.current
+        while s is not None:
+            if s.symbols.get(sym.name) is sym:
+                if crossed and s.kind != "global" and s.kind != "class":
+                    sym.captured = True
+                return
+            if s.kind == "function":
+                crossed = True
+            s = s.parent
+
+    def layout_frame(self, fs, func_sym, name, has_this=False):
+        """Registro de activación de la función recién cerrada (ver semantic/frames.py)."""
+        frame = layout_function(self.scopes.tree, fs.tree_id, name, has_this)
+        fs.frame = frame
+        self.scopes.tree.frames[fs.tree_id] = frame
+        if func_sym is not None:
+            func_sym.frame = frame
 
     def resolve_symbol(self, name, line=0, col=0):
         if name in ("integer", "string", "boolean", "void"):
@@ -33,14 +94,57 @@ class TypeChecker(CompiscriptVisitor):
 
         sym = self.scopes.current.resolve(name)
         if sym is None:
-            self.reporter.report(line, col, "E_UNDEF", f"Símbolo no definido: {name}")
+            self.report_undefined(name, line, col)
         return sym
 
+    def lookup_symbol(self, name):
+        """
+        Resolución silenciosa: para nombres de tipo (obj_t.name, clases base) o
+        identificadores que ya se resolvieron (y reportaron) al visitar su átomo.
+        """
+        return self.scopes.current.resolve(name)
+
+    def report_undefined(self, name, line, col):
+        """Un solo E_UNDEF por nombre; los usos siguientes solo incrementan su contador."""
+        entry = self._undefined.get(name)
+        if entry is None:
+            hint = did_you_mean(self.suggester.for_scope(self.scopes.current, name))
+            err = self.reporter.report(line, col, "E_UNDEF", f"Símbolo no definido: {name}{hint}")
+            self._undefined[name] = (err, {(line, col)})
+            return
+        err, seen = entry
+        if (line, col) not in seen:
+            seen.add((line, col))
+            err.count += 1
+
+    def suggest_member(self, class_sym, name):
+        """Sufijo de sugerencia para un miembro inexistente de 'class_sym'."""
+        if not isinstance(class_sym, ClassSymbol):
+            return ""
+        return did_you_mean(self.suggester.for_members(class_sym, name, self.scopes.current.resolve))
+
     def visitProgram(self, ctx: CompiscriptParser.ProgramContext):
         for stmt in ctx.statement():
             self.visit(stmt)
+        self.finish()
+        self.scopes.tree.frames[0] = layout_main(self.scopes.tree)
         return None
 
+    def finish(self):
+        """
+        Análisis que necesitan el índice de posiciones completo: asignación
+        definida sobre el CFG de cada función chequeada (E_UNINIT). Se corre
+        una vez al final del programa (o por sentencia en modo streaming).
+        """
+        pending, self._flow_pending = self._flow_pending, []
+        if not pending:
+            return
+        resolve = lambda tok: self.index.symbol_at(tok.line, tok.column)
+        for cfg in pending:
+            for sym, tok in definite_assignment(FunctionFlow(cfg, resolve)):
+                self.reporter.report(tok.line, tok.column, "E_UNINIT",
+                                     f"Variable '{sym.name}' puede usarse sin inicializar")
+
     def visitVariableDeclaration(self, ctx: CompiscriptParser.VariableDeclarationContext):
         name = ctx.Identifier().getText()
         vtype = self.visit(ctx.typeAnnotation().type_()) if ctx.typeAnnotation() else VOID
@@ -60,7 +164,7 @@ class TypeChecker(CompiscriptVisitor):
             else:
                 sym.is_initialized = True   
 
-        self.define_symbol(sym)
+        self.define_symbol(sym, ctx.Identifier().getSymbol())
         return None
 
 
@@ -79,7 +183,7 @@ class TypeChecker(CompiscriptVisitor):
         if not can_assign(vtype, init_t):
             self.reporter.report(ctx.start.line, ctx.start.column, "E_ASSIGN",
                                 f"No se puede asignar {init_t} a {vtype}")
-        self.define_symbol(sym)
+        self.define_symbol(sym, ctx.Identifier().getSymbol())
         return None
 
 
@@ -99,10 +203,12 @@ class TypeChecker(CompiscriptVisitor):
                 return VOID
 
             # Resolver la clase y buscar el campo (con herencia)
-            class_sym = self.resolve_symbol(obj_t.name, ctx.start.line, ctx.start.column)
+            class_sym = self.lookup_symbol(obj_t.name)
+            owner_class = class_sym
             while isinstance(class_sym, ClassSymbol):
                 field = class_sym.fields.get(prop_name) if hasattr(class_sym, "fields") else None
                 if field:
+                    self.record_reference(field, ctx.Identifier())
                     # Verificar asignabilidad
                     if not can_assign(field.type, value_t):
                         self.reporter.report(ctx.start.line, ctx.start.column, "E_ASSIGN",
@@ -110,19 +216,21 @@ class TypeChecker(CompiscriptVisitor):
                     return field.type
                 # subir a la base si hay herencia
                 if hasattr(class_sym, "base") and class_sym.base:
-                    class_sym = self.resolve_symbol(class_sym.base, ctx.start.line, ctx.start.column)
+                    class_sym = self.lookup_symbol(class_sym.base)
                 else:
                     break
 
             # Campo no existe en la jerarquía
             self.reporter.report(ctx.start.line, ctx.start.column, "E_ASSIGN",
-                                f"Campo '{prop_name}' no definido en {obj_t.name}")
+                                f"Campo '{prop_name}' no definido en {obj_t.name}"
+                                f"{self.suggest_member(owner_class, prop_name)}")
             return VOID
 
         # asignación simple ->  Identifier '=' <expr> ';'
         else:
             name = ctx.Identifier().getText()
             sym = self.resolve_symbol(name, ctx.start.line, ctx.start.column)
+            self.record_reference(sym, ctx.Identifier())
             target_t = (sym.type if sym else VOID) or VOID
 
             expr_node = exprs[0] if isinstance(exprs, list) else exprs
@@ -155,47 +263,59 @@ class TypeChecker(CompiscriptVisitor):
             line=ctx.start.line, col=ctx.start.column,
             closure_scope=self.scopes.current
         )
-        self.define_symbol(func_sym)
+        self.define_symbol(func_sym, ctx.Identifier().getSymbol())
 
         parent_scope = self.scopes.current
         if hasattr(parent_scope, "func_name") and parent_scope.func_name:
-            parent_sym = self.resolve_symbol(parent_scope.func_name)
+            parent_sym = self.lookup_symbol(parent_scope.func_name)
             if isinstance(parent_sym, FuncSymbol):
                 if not hasattr(parent_sym, "nested"):
                     parent_sym.nested = {}
                 parent_sym.nested[name] = func_sym
 
-        self.scopes.push_function(ret_type, name)
-        for psym in params:
-            self.define_symbol(psym)
+        fs = self.scopes.push_function(ret_type, name)
+        for psym, p in zip(params, ctx.parameters().parameter() if ctx.parameters() else ()):
+            self.define_symbol(psym, p.Identifier().getSymbol())
 
-        returns = []
-        has_terminated = False
         with self._block():
-            for stmt in ctx.block().statement():
-                if has_terminated:
-                    self.reporter.report(
-                        stmt.start.line, stmt.start.column, "E_DEADCODE",
-                        "Código muerto: esta instrucción nunca se ejecutará"
-                    )
-                r = self.visit(stmt)
-                if stmt.returnStatement():
-                    returns.append(r or VOID)
-                    has_terminated = True
+            self.check_block_statements(ctx.block().statement(), ctx)
 
         self.scopes.pop()
-
-        if not returns and ret_type != VOID:
-            self.reporter.report(ctx.start.line, ctx.start.column, "E_RETURN",
-                                f"Función {name} sin return pero declarada {ret_type}")
-
-        for rt in returns:
-            if not can_assign(ret_type, rt):
-                self.reporter.report(ctx.start.line, ctx.start.column, "E_RETURN",
-                                    f"Return {rt} incompatible con {ret_type}")
-
+        self.layout_frame(fs, func_sym, name)
+        self.check_function_flow(ctx, name, ret_type)
         return None
 
+    def check_function_flow(self, ctx, name, ret_type):
+        """
+        Construye el CFG del cuerpo de la función y lo usa para:
+        - exigir return en todos los caminos si la función no es void
+          (if/else, switch con default, loops infinitos, ...)
+        - marcar código inalcanzable que el recorrido por bloques no ve
+          (p. ej. después de un if/else donde ambas ramas retornan)
+        """
+        cfg = build_cfg(ctx.block().statement())
+        self.cfgs[ctx] = cfg
+        self._flow_pending.append(cfg)
+        if ret_type != VOID and not cfg.all_paths_return():
+            if cfg.reachable()[cfg.exit]:
+                msg = f"Función {name} no retorna en todos los caminos pero está declarada {ret_type}"
+            else:
+                msg = f"Función {name} sin return pero declarada {ret_type}"
+            self.reporter.report(ctx.start.line, ctx.start.column, "E_RETURN", msg)
+        for root in cfg.unreachable_regions():
+            stmt = cfg.first_item(root)
+            if stmt is not None:
+                self.report_dead(stmt)
+
+    def report_dead(self, stmt):
+        """Reporta código muerto una sola vez por posición (lo pueden detectar el recorrido y el CFG)."""
+        pos = (stmt.start.line, stmt.start.column)
+        if pos in self._dead_seen:
+            return
+        self._dead_seen.add(pos)
+        self.reporter.report(pos[0], pos[1], "E_DEADCODE",
+                             "Código muerto: esta instrucción nunca se ejecutará")
+
     def visitReturnStatement(self, ctx):
         # Validar que estemos dentro de una función
         if not self.scopes.inside("function"):
@@ -205,10 +325,16 @@ class TypeChecker(CompiscriptVisitor):
                 self.visit(ctx.expression())
             return VOID
 
-        # Evaluar el tipo retornado y regresarlo (visitFunctionDeclaration lo recolecta)
         ret_t = VOID
         if ctx.expression() is not None:
             ret_t = self.visit(ctx.expression()) or VOID
+
+        # Se valida contra la función más interna, también para returns anidados en if/loops/switch
+        fscope = next((s for s in reversed(self.scopes.stack) if isinstance(s, FunctionScope)), None)
+        expected = fscope.return_type if fscope is not None else None
+        if expected is not None and not can_assign(expected, ret_t):
+            self.reporter.report(ctx.start.line, ctx.start.column, "E_RETURN",
+                                f"Return {ret_t} incompatible con {expected}")
         return ret_t
 
 
@@ -278,12 +404,12 @@ class TypeChecker(CompiscriptVisitor):
 
         # Nombre base (para llamadas del estilo: foo(...))
         base_name = None
-        if lhs_ctx.primaryAtom() and lhs_ctx.primaryAtom().Identifier():
+        if isinstance(lhs_ctx.primaryAtom(), CompiscriptParser.IdentifierExprContext):
             base_name = lhs_ctx.primaryAtom().Identifier().getText()
 
         # llamada simple:  Identifier '(' args ')'    (no hay más suffixes)
         if len(lhs_ctx.suffixOp()) == 1 and lhs_ctx.suffixOp(0) == ctx and base_name is not None:
-            sym = self.resolve_symbol(base_name, ctx.start.line, ctx.start.column)
+            sym = self.lookup_symbol(base_name)
             if not sym or not isinstance(sym, FuncSymbol):
                 self.reporter.report(ctx.start.line, ctx.start.column, "E_CALL",
                                     f"{base_name} no es una función")
@@ -317,17 +443,22 @@ class TypeChecker(CompiscriptVisitor):
             if isinstance(prev_suffix, CompiscriptParser.PropertyAccessExprContext):
                 method_name = prev_suffix.Identifier().getText()
                 obj_name = lhs_ctx.primaryAtom().getText()
-                obj_sym = self.resolve_symbol(obj_name, ctx.start.line, ctx.start.column)
+                if isinstance(lhs_ctx.primaryAtom(), CompiscriptParser.ThisExprContext):
+                    # this.metodo(...): la clase que se está chequeando (E_THIS ya se reportó fuera de una)
+                    obj_t = Type(self._current_class) if self._current_class else None
+                else:
+                    obj_sym = self.lookup_symbol(obj_name)
+                    obj_t = obj_sym.type if obj_sym else None
 
-                if not obj_sym or not isinstance(obj_sym.type, Type):
+                if not isinstance(obj_t, Type):
                     self.reporter.report(ctx.start.line, ctx.start.column, "E_CALL",
                                         f"{obj_name} no es un objeto válido")
                     return VOID
 
-                class_sym = self.resolve_symbol(obj_sym.type.name, ctx.start.line, ctx.start.column)
+                class_sym = self.lookup_symbol(obj_t.name)
                 if not isinstance(class_sym, ClassSymbol):
                     self.reporter.report(ctx.start.line, ctx.start.column, "E_CALL",
-                                        f"{obj_sym.type.name} no es una clase válida")
+                                        f"{obj_t.name} no es una clase válida")
                     return VOID
 
                 # Buscar método en la jerarquía (herencia)
@@ -338,24 +469,25 @@ class TypeChecker(CompiscriptVisitor):
                     if method:
                         break
                     if hasattr(cur_class, "base") and cur_class.base:
-                        cur_class = self.resolve_symbol(cur_class.base, ctx.start.line, ctx.start.column)
+                        cur_class = self.lookup_symbol(cur_class.base)
                     else:
                         cur_class = None
 
                 if not method:
                     self.reporter.report(ctx.start.line, ctx.start.column, "E_CALL",
-                                        f"Método {method_name} no definido en {obj_sym.type.name}")
+                                        f"Método {method_name} no definido en {obj_t.name}"
+                                        f"{self.suggest_member(class_sym, method_name)}")
                     return VOID
 
                 # Chequeo de aridad y tipos
                 if len(args) != len(method.params):
                     self.reporter.report(ctx.start.line, ctx.start.column, "E_CALL",
-                                        f"Número incorrecto de argumentos en {obj_sym.type.name}.{method_name}")
+                                        f"Número incorrecto de argumentos en {obj_t.name}.{method_name}")
                 else:
                     for i, (arg_t, param) in enumerate(zip(args, method.params)):
                         if not can_assign(param.type, arg_t):
                             self.reporter.report(ctx.start.line, ctx.start.column, "E_CALL",
-                                                f"Argumento {i} incompatible en {obj_sym.type.name}.{method_name}: {arg_t} esperado {param.type}")
+                                                f"Argumento {i} incompatible en {obj_t.name}.{method_name}: {arg_t} esperado {param.type}")
 
                 return method.type.ret if isinstance(method.type, FunctionType) else method.type
 
@@ -374,6 +506,7 @@ class TypeChecker(CompiscriptVisitor):
         if name == "void": return VOID
 
         sym = self.resolve_symbol(name, ctx.start.line, ctx.start.column)
+        self.record_reference(sym, ctx.Identifier())
         if sym:
             if isinstance(sym, (VarSymbol, ParamSymbol)):
                 return sym.type
@@ -392,10 +525,13 @@ class TypeChecker(CompiscriptVisitor):
         csym.methods = {}
         if ctx.Identifier(1):
             csym.base = ctx.Identifier(1).getText()
+            base_sym = self.scopes.current.resolve(csym.base)
+            if isinstance(base_sym, ClassSymbol):
+                self.record_reference(base_sym, ctx.Identifier(1))
         else:
             csym.base = None
         
-        self.define_symbol(csym)
+        self.define_symbol(csym, ctx.Identifier(0).getSymbol())
 
         prev = self._current_class
         self._current_class = name
@@ -418,12 +554,17 @@ class TypeChecker(CompiscriptVisitor):
                 fsym = FuncSymbol(fname, type=func_type, params=tuple(params),
                                 line=member.start.line, col=member.start.column)
                 csym.methods[fname] = fsym
+                self.index.add_token(fsym, member.functionDeclaration().Identifier().getSymbol(),
+                                     is_definition=True)
 
-                self.scopes.push_function(ret_type, fname)
-                for psym in params:
-                    self.define_symbol(psym)
+                fs = self.scopes.push_function(ret_type, fname)
+                for psym, p in zip(params, member.functionDeclaration().parameters().parameter()
+                                   if member.functionDeclaration().parameters() else ()):
+                    self.define_symbol(psym, p.Identifier().getSymbol())
                 self.visit(member.functionDeclaration().block())
                 self.scopes.pop()
+                self.layout_frame(fs, fsym, f"{name}.{fname}", has_this=True)
+                self.check_function_flow(member.functionDeclaration(), fname, ret_type)
 
             elif member.variableDeclaration():
                 vname = member.variableDeclaration().Identifier().getText()
@@ -431,17 +572,19 @@ class TypeChecker(CompiscriptVisitor):
                 vsym = VarSymbol(vname, vtype, is_const=False, is_initialized=False,
                                 line=member.start.line, col=member.start.column)
                 csym.fields[vname] = vsym
-                self.define_symbol(vsym)
+                self.define_symbol(vsym, member.variableDeclaration().Identifier().getSymbol())
 
             elif member.constantDeclaration():
                 cname = member.constantDeclaration().Identifier().getText()
                 ctype = self.visit(member.constantDeclaration().typeAnnotation().type_()) if member.constantDeclaration().typeAnnotation() else VOID
                 csym.fields[cname] = VarSymbol(cname, ctype, is_const=True, is_initialized=True,
                                             line=member.start.line, col=member.start.column)
-                self.define_symbol(csym.fields[cname])
+                self.define_symbol(csym.fields[cname], member.constantDeclaration().Identifier().getSymbol())
 
         self.scopes.pop()
         self._current_class = prev
+        classes = self.scopes.tree.classes
+        classes[name] = layout_class(csym, classes.get(csym.base) if csym.base else None)
         return None
 
     def visitLiteralExpr(self, ctx: CompiscriptParser.LiteralExprContext):
@@ -494,6 +637,7 @@ class TypeChecker(CompiscriptVisitor):
             self.reporter.report(ctx.start.line, ctx.start.column, "E_NEW",
                                 f"Clase no definida: {class_name}")
             return VOID
+        self.record_reference(sym, ctx.Identifier())
 
         args = []
         if ctx.arguments():
@@ -502,7 +646,7 @@ class TypeChecker(CompiscriptVisitor):
 
         ctor = sym.methods.get("constructor")
         if not ctor and hasattr(sym, "base") and sym.base:
-            base_sym = self.resolve_symbol(sym.base, ctx.start.line, ctx.start.column)
+            base_sym = self.lookup_symbol(sym.base)
             if isinstance(base_sym, ClassSymbol):
                 ctor = base_sym.methods.get("constructor")
 
@@ -527,6 +671,9 @@ class TypeChecker(CompiscriptVisitor):
 
         if ctx.baseType().Identifier():
             elem = Type(ctx.baseType().Identifier().getText())
+            class_sym = self.scopes.current.resolve(elem.name)
+            if isinstance(class_sym, ClassSymbol):
+                self.record_reference(class_sym, ctx.baseType().Identifier())
         elif base_txt == "integer":
             elem = INTEGER
         elif base_txt == "string":
@@ -614,7 +761,7 @@ class TypeChecker(CompiscriptVisitor):
         var_name = ctx.Identifier().getText()
         sym = VarSymbol(var_name, elem_t, is_const=False, is_initialized=True,
                         line=ctx.start.line, col=ctx.start.column)
-        self.define_symbol(sym)
+        self.define_symbol(sym, ctx.Identifier().getSymbol())
 
         self.scopes.push("loop")
         self.visit(ctx.block())  # BlockScope dentro del loop
@@ -657,20 +804,25 @@ class TypeChecker(CompiscriptVisitor):
         self.scopes.push("catch")
         err_name = ctx.Identifier().getText()
         self.define_symbol(VarSymbol(err_name, STRING, is_const=False, is_initialized=True,
-                                    line=ctx.start.line, col=ctx.start.column))
+                                    line=ctx.start.line, col=ctx.start.column),
+                           ctx.Identifier().getSymbol())
         self.visit(ctx.block(1))  
         self.scopes.pop()
         return None
 
 
     def visitIndexExpr(self, ctx: CompiscriptParser.IndexExprContext):
-        lhs_ctx = ctx.parentCtx.primaryAtom()
-        if lhs_ctx and lhs_ctx.Identifier():
-            arr_name = lhs_ctx.Identifier().getText()
-            arr_sym = self.resolve_symbol(arr_name, ctx.start.line, ctx.start.column)
-            arr_t = arr_sym.type if arr_sym else VOID
-        else:
-            arr_t = VOID
+        # el arreglo es lo que dejó el sufijo anterior: en m[1][0] el segundo
+        # índice se aplica a m[1], con una dimensión menos que m
+        arr_t = self._suffix_base.pop(ctx, None)
+        if arr_t is None:
+            lhs_ctx = ctx.parentCtx.primaryAtom()
+            if lhs_ctx and lhs_ctx.Identifier():
+                arr_name = lhs_ctx.Identifier().getText()
+                arr_sym = self.lookup_symbol(arr_name)
+                arr_t = arr_sym.type if arr_sym else VOID
+            else:
+                arr_t = VOID
 
         idx_t = self.visit(ctx.expression()) or VOID
         if idx_t != INTEGER:
@@ -711,14 +863,16 @@ class TypeChecker(CompiscriptVisitor):
         prop_name = ctx.Identifier().getText()
 
         if isinstance(obj_t, Type):
-            class_sym = self.resolve_symbol(obj_t.name, ctx.start.line, ctx.start.column)
+            class_sym = self.lookup_symbol(obj_t.name)
             while isinstance(class_sym, ClassSymbol):   
                 if prop_name in class_sym.fields:
+                    self.record_reference(class_sym.fields[prop_name], ctx.Identifier())
                     return class_sym.fields[prop_name].type
                 if prop_name in class_sym.methods:
+                    self.record_reference(class_sym.methods[prop_name], ctx.Identifier())
                     return class_sym.methods[prop_name].type
                 if hasattr(class_sym, "base") and class_sym.base:
-                    class_sym = self.resolve_symbol(class_sym.base, ctx.start.line, ctx.start.column)
+                    class_sym = self.lookup_symbol(class_sym.base)
                 else:
                     break
         return VOID
@@ -726,6 +880,7 @@ class TypeChecker(CompiscriptVisitor):
     def visitLeftHandSide(self, ctx: CompiscriptParser.LeftHandSideContext):
         t = self.visit(ctx.primaryAtom()) or VOID
         for suffix in ctx.suffixOp():
+            self._suffix_base[suffix] = t
             res = self.visit(suffix)
             t = res
         return t
@@ -779,11 +934,8 @@ class TypeChecker(CompiscriptVisitor):
         has_terminated = False
         for stmt in stmts:
             if has_terminated:
-                self.reporter.report(
-                    stmt.start.line, stmt.start.column, "E_DEADCODE",
-                    "Código muerto: esta instrucción nunca se ejecutará"
-                )
-            result = self.visit(stmt)
+                self.report_dead(stmt)
+            self.visit(stmt)
 
             if stmt.returnStatement() or stmt.breakStatement() or stmt.continueStatement():
                 has_terminated = True
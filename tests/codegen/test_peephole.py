@@ -0,0 +1,77 @@
+from tests.intermediate.util import compile_tac
+from codegen.mips import generate_mips, parse_asm
+from codegen.peephole import PeepholeOptimizer, PeepholeReport, peephole
+from codegen.simulator import MipsSimulator
+
+PROGRAM = """
+let total: integer = 0;
+let i: integer = 0;
+while (i < 20) {
+  if (i % 3 == 0) { total = total + i; }
+  i = i + 1;
+}
+let names: string[] = ["a", "b"];
+for (let k: integer = 0; k < 2; k = k + 1) {
+  print(names[k] + names[k]);
+}
+print(total);
+"""
+
+
+def _run(asm: str):
+    report = PeepholeReport(before=0)
+    return PeepholeOptimizer().run_code(parse_asm(asm), report), report
+
+
+def test_rules_on_small_windows():
+    code, report = _run("""
+        sw $t0, -12($fp)
+        lw $t1, -12($fp)
+        move $t1, $t1
+        xor $t2, $t0, $t1
+        sltiu $t2, $t2, 1
+        beq $t2, $zero, L3
+        j L1
+    L3:
+        li $v0, 1
+    L1:
+        jr $ra
+    """)
+    assert code == parse_asm("""
+        sw $t0, -12($fp)
+        move $t1, $t0
+        beq $t0, $t1, L1
+        li $v0, 1
+    L1:
+        jr $ra
+    """)
+    assert report.hits["redundant-load"] == 1
+    assert report.hits["compare-branch"] == 2
+    assert report.hits["branch-over-jump"] == 1
+
+
+def test_live_registers_are_not_rewritten():
+    asm = """
+        lw $t8, 0($gp)
+        move $a0, $t8
+        addu $a1, $t8, $t8
+        jr $ra
+    """
+    code, report = _run(asm)
+    assert code == parse_asm(asm)
+    assert sum(report.hits.values()) == 0
+
+
+def test_peephole_keeps_output_and_shrinks_code():
+    prog = compile_tac(PROGRAM)
+    plain = generate_mips(prog, allocate=False)
+    expected = MipsSimulator(plain).run()
+    before = MipsSimulator(plain)
+    before.run()
+    mips = generate_mips(prog, allocate=False)
+    report = peephole(mips)
+    after = MipsSimulator(mips)
+    assert after.run() == expected
+    assert report.after < report.before
+    assert mips.totals().instructions == sum(f.instructions for f in mips.functions)
+    assert after.steps < before.steps and after.loads < before.loads
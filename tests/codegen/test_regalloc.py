@@ -0,0 +1,98 @@
+from tests.intermediate.util import compile_tac
+from intermediate.interp import TacInterpreter
+from intermediate.optimize import optimize
+from codegen.mips import generate_mips
+from codegen.simulator import MipsSimulator
+from codegen.regalloc import Interval, LinearScan
+
+PROGRAM = """
+function fib(n: integer): integer {
+  if (n < 2) { return n; }
+  return fib(n - 1) + fib(n - 2);
+}
+let total: integer = 0;
+let i: integer = 0;
+while (i < 100) {
+  let j: integer = 0;
+  while (j < i) {
+    total = total + j * i % 7;
+    j = j + 1;
+  }
+  i = i + 1;
+}
+print(total);
+print(fib(10));
+"""
+
+BLOCKS = """
+function f(a: integer, b: integer): integer {
+  let x: integer = a;
+  if (a > b) { let y: integer = 1; let z: integer = 2; x = y + z; }
+  else { let w: integer = 3; x = w; }
+  while (x < 10) { let k: integer = x; x = k + 1; }
+  return x;
+}
+print(f(5, 1));
+print(f(1, 5));
+"""
+
+# con -O1 la propagación de copias usa 'y' fuera de su bloque, después de 'w'
+PROPAGATED = """
+function f(a: integer): integer {
+  let x: integer = 0;
+  { let y: integer = a * 2; x = y; }
+  { let w: integer = a + 100; print(w); }
+  return x;
+}
+print(f(3));
+"""
+
+
+def test_allocation_drops_loads_and_stores():
+    prog = compile_tac(PROGRAM)
+    naive = generate_mips(prog, allocate=False).totals()
+    alloc = generate_mips(prog).totals()
+    assert alloc.loads * 2 < naive.loads
+    assert alloc.stores < naive.stores
+    # el TAC original no se toca: se puede volver a generar
+    assert generate_mips(prog).totals().loads == alloc.loads
+
+
+def test_spilled_locals_take_their_slots_from_the_semantic_frame():
+    prog = compile_tac(BLOCKS)
+    slots = {v.name: v.slot for v in prog.vars if v.kind == "local"}
+    assert slots["x"] == 4 and slots["y"] == slots["w"] == slots["k"] == 8
+    shared = generate_mips(prog, allocate=False)
+    # 'let x = a': x en $fp-12, el mismo offset que le da semantic.frames
+    copy = [("lw", "$t8", 0, "$fp"), ("sw", "$t8", -12, "$fp")]
+    assert any(shared.text[i:i + 2] == copy for i in range(len(shared.text)))
+    assert MipsSimulator(shared).run() == TacInterpreter(prog).run() == ["10", "10"]
+    for v in prog.vars:
+        v.slot = None                                        # un slot propio por variable
+    separate = generate_mips(prog, allocate=False)
+    frame = lambda m: next(s.frame for s in m.functions if s.name == "f")
+    assert frame(shared) + 8 == frame(separate)
+
+
+def test_shared_slots_are_not_reused_while_both_values_are_live():
+    prog = compile_tac(PROPAGATED)
+    optimize(prog)
+    assert MipsSimulator(generate_mips(prog, allocate=False)).run() == ["103", "6"]
+
+
+def test_values_live_across_calls_get_saved_registers():
+    a, b = Interval(1, 0, 10), Interval(2, 2, 4)
+    a.crosses_call = True
+    scan = LinearScan()
+    scan.allocate([a, b])
+    assert a.reg.startswith("$s") and b.reg.startswith("$t")
+    assert scan.used_s == {a.reg}
+
+
+def test_pressure_spills_the_interval_that_ends_last():
+    long = Interval(1, 0, 100)
+    short = [Interval(2 + k, 1 + k, 5 + k) for k in range(3)]
+    scan = LinearScan(t_regs=("$t0", "$t1"), s_regs=("$s0",))
+    scan.allocate([long] + short)
+    assert scan.spilled == [long]
+    assert all(iv.reg for iv in short)
@@ -0,0 +1,133 @@
+import pytest
+
+from tests.intermediate.util import compile_tac
+from intermediate.interp import TacInterpreter
+from intermediate.optimize import optimize
+from intermediate.global_opt import optimize_global
+from codegen.mips import generate_mips
+from codegen.simulator import MipsSimulator, SimulatorError, load_asm
+
+PROGRAM = """
+class Animal {
+  let name: string;
+  function constructor(name: string) { this.name = name; }
+  function speak(): string { return this.name + " hace ruido"; }
+}
+function counter(start: integer): integer {
+  let total: integer = start;
+  function add(k: integer): integer {
+    total = total + k;
+    return total;
+  }
+  add(2);
+  add(3);
+  return total;
+}
+function at(a: integer[], i: integer): string {
+  try {
+    return "ok " + a[i];
+  } catch (err) {
+    return "fallo: " + err;
+  }
+}
+let a: Animal = new Animal("Rex");
+print(a.speak());
+print(counter(10));
+let nums: integer[] = [3, 1, 2];
+print(nums);
+print(at(nums, 1));
+print(at(nums, 5));
+print("abc" < "abd");
+print(-7 / 2);
+print(-7 % 3);
+"""
+
+LOOPS = """
+function work(n: integer): integer {
+  let total: integer = 0;
+  let i: integer = 0;
+  while (i < n) {
+    let j: integer = 0;
+    while (j < i) {
+      total = total + j * i % 7;
+      j = j + 1;
+    }
+    i = i + 1;
+  }
+  return total;
+}
+print(work(50));
+"""
+
+UNTYPED_PRINTS = """
+class Node {
+  let next: Node;
+  let v: integer;
+  function constructor(v: integer) { this.v = v; }
+}
+let flag: boolean = 3 > 2;
+let n: Node = new Node(1);
+print("b=" + flag);
+print(n.next == null);
+print("x" + (n.v < 2));
+"""
+
+NESTED = """
+let m: integer[][] = [[1, 2], [3, 4]];
+print(m[1][0]);
+let names: string[][] = [["a", "b"], ["c"]];
+print(names[1][0] + names[0][1]);
+"""
+
+
+@pytest.mark.parametrize("level", [0, 2])
+@pytest.mark.parametrize("allocate", [False, True])
+def test_compiled_program_matches_interpreter(level, allocate):
+    expected = TacInterpreter(compile_tac(PROGRAM)).run()
+    prog = compile_tac(PROGRAM)
+    if level:
+        optimize_global(prog)
+    assert MipsSimulator(generate_mips(prog, allocate=allocate)).run() == expected
+
+
+@pytest.mark.parametrize("level", [0, 2])
+def test_print_without_recorded_type_uses_the_producing_instruction(level):
+    # el checker deja 'void' en estas expresiones: sin deducir el tag, MIPS
+    # imprimía la dirección del string o 1 en vez de true
+    expected = TacInterpreter(compile_tac(UNTYPED_PRINTS)).run()
+    assert expected == ["b=true", "true", "xtrue"]
+    prog = compile_tac(UNTYPED_PRINTS)
+    if level:
+        optimize_global(prog)
+    assert MipsSimulator(generate_mips(prog)).run() == expected
+
+
+@pytest.mark.parametrize("opt", [None, optimize, optimize_global])
+@pytest.mark.parametrize("allocate", [False, True])
+def test_nested_array_element_prints_as_its_element_type(opt, allocate):
+    # cada índice quita una dimensión: m[1][0] es integer, no integer[]
+    prog = compile_tac(NESTED)
+    if opt:
+        opt(prog)
+    assert MipsSimulator(generate_mips(prog, allocate=allocate)).run() == ["3", "cb"]
+
+
+def test_instruction_counts_as_regression_metric():
+    naive = MipsSimulator(generate_mips(compile_tac(LOOPS), allocate=False))
+    fast = MipsSimulator(generate_mips(compile_tac(LOOPS)))
+    assert naive.run() == fast.run() == ["3038"]
+    assert fast.loads * 20 < naive.loads
+    assert fast.steps * 2 < naive.steps
+    assert fast.cycles < naive.cycles
+    # presupuesto fijo: una regresión en el backend lo rompe
+    assert fast.steps < 12000
+    assert fast.op_counts()["mul"] == 1225
+
+
+def test_assembly_text_round_trips_and_runaway_loops_stop():
+    mips = generate_mips(compile_tac(PROGRAM))
+    sim = MipsSimulator(load_asm(mips.to_asm()))
+    assert sim.run() == MipsSimulator(mips).run()
+    spin = generate_mips(compile_tac("while (true) { }"))
+    with pytest.raises(SimulatorError):
+        MipsSimulator(spin, max_steps=1000).run()
@@ -0,0 +1,67 @@
+from tests.intermediate.util import compile_tac
+from intermediate.escape import escaping_functions, heap_environments
+from intermediate.tac import MOV, K_TEMP, operand
+from codegen.mips import generate_mips
+from codegen.simulator import MipsSimulator
+
+PROGRAM = """
+function sumSquares(n: integer): integer {
+  let total: integer = 0;
+  function add(v: integer): void { total = total + v * v; }
+  for (let i: integer = 1; i <= n; i = i + 1) { add(i); }
+  return total;
+}
+function depth(a: integer, b: integer): integer {
+  let x: integer = a;
+  function mid(y: integer): integer {
+    let z: integer = y + b;
+    function inner(w: integer): integer { x = x + w; return x + z; }
+    return inner(y) + inner(1);
+  }
+  return mid(2) + mid(3) + x;
+}
+function loop(n: integer, acc: integer): integer {
+  let seen: integer = n;
+  function peek(): integer { return seen; }
+  if (n == 0) { return acc; }
+  return loop(n - 1, acc + peek());
+}
+function tailInner(n: integer): integer {
+  let base: integer = n * 10;
+  function finish(k: integer): integer { return base + k; }
+  return finish(n);
+}
+print(sumSquares(10));
+print(depth(5, 7));
+print(loop(100, 0));
+print(tailInner(4));
+"""
+
+EXPECTED = ["385", "88", "5050", "44"]
+
+
+def _run(stack_envs):
+    mips = generate_mips(compile_tac(PROGRAM), stack_envs=stack_envs)
+    sim = MipsSimulator(mips)
+    assert sim.run() == EXPECTED
+    return mips, sim
+
+
+def test_closures_that_do_not_escape_keep_their_environment_in_the_frame():
+    prog = compile_tac(PROGRAM)
+    assert escaping_functions(prog) == set() and heap_environments(prog) == set()
+    heap_mips, heap = _run(stack_envs=False)
+    mips, fast = _run(stack_envs=True)
+    stats = {f.name: f for f in mips.functions}
+    assert all(stats[name].stack_env for name in ("sumSquares", "depth", "depth.mid", "loop"))
+    # ni un sbrk para entornos: el heap no crece
+    assert fast.brk < heap.brk and fast.steps < heap.steps
+    assert mips.totals().stores < heap_mips.totals().stores
+
+
+def test_function_used_as_a_value_escapes_with_its_enclosing_environments():
+    prog = compile_tac(PROGRAM)
+    inner = next(i for i, f in enumerate(prog.functions) if f.name == "depth.mid.inner")
+    prog.code.emit(MOV, operand(K_TEMP, 0), prog.name("depth.mid.inner"))
+    assert escaping_functions(prog) == {inner}
+    assert {prog.functions[fi].name for fi in heap_environments(prog)} == {"depth", "depth.mid"}
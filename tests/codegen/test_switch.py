@@ -0,0 +1,102 @@
+from tests.intermediate.util import compile_tac
+import intermediate.tac_gen as tac_gen
+from intermediate.tac import TacProgram, SWITCH, HASH, LT, EQ
+from intermediate.interp import TacInterpreter
+from intermediate.global_opt import optimize_global
+from codegen.mips import generate_mips
+from codegen.peephole import peephole
+from codegen.simulator import MipsSimulator
+
+PROGRAM = """
+function dense(s: integer): integer {
+  let r: integer = 0;
+  switch (s) {
+    case 0: r = 10; break;
+    case 1: r = 11; break;
+    case 2: r = 12;
+    case 3: r = r + 13; break;
+    case 4: r = 14; break;
+    case 6: r = 16; break;
+    case 1: r = 99; break;
+    default: r = -1;
+  }
+  return r;
+}
+function sparse(s: integer): integer {
+  switch (s) {
+    case -100: return 1;
+    case 5: return 2;
+    case 70: return 3;
+    case 900: return 4;
+    case 901: return 5;
+    case 902: return 6;
+    case 903: return 7;
+    case 12345: return 8;
+  }
+  return 0;
+}
+function word(w: string): integer {
+  switch (w) {
+    case "uno": return 1;
+    case "dos": return 2;
+    case "tres": return 3;
+    case "cuatro": return 4;
+    case "cinco": return 5;
+    default: return 0;
+  }
+}
+let acc: integer = 0;
+for (let i: integer = -2; i < 9; i = i + 1) { acc = acc * 3 + dense(i); }
+print(acc);
+let ks: integer[] = [-100, 5, 6, 70, 900, 903, 904, 12345];
+for (let j: integer = 0; j < 8; j = j + 1) { print(sparse(ks[j])); }
+let ws: string[] = ["uno", "dos", "tres", "cuatro", "cinco", "seis"];
+for (let j: integer = 0; j < 6; j = j + 1) { print(word(ws[j] + "")); }
+"""
+
+EXPECTED = ["33566", "1", "2", "0", "3", "4", "7", "0", "8", "1", "2", "3", "4", "5", "0"]
+
+
+def _ops(prog, name):
+    f = prog.function(name)
+    return [prog.code.op[i] for i in range(f.start, f.end)]
+
+
+def test_dispatch_strategy_follows_case_density():
+    prog = compile_tac(PROGRAM)
+    dense, sparse, word = _ops(prog, "dense"), _ops(prog, "sparse"), _ops(prog, "word")
+    assert dense.count(SWITCH) == 1 and EQ not in dense
+    # búsqueda binaria; el tramo 900..903 va a su propia tabla
+    assert sparse.count(SWITCH) == 1 and sparse.count(LT) >= 2
+    assert word.count(HASH) == 1
+    assert TacInterpreter(prog).run() == EXPECTED
+    back = TacProgram.from_bytes(prog.to_bytes())
+    assert back.tables == prog.tables
+    assert TacInterpreter(back).run() == EXPECTED
+
+
+def test_compiled_switch_matches_interpreter():
+    for level in (0, 2):
+        prog = compile_tac(PROGRAM)
+        if level:
+            optimize_global(prog)
+        for allocate in (False, True):
+            mips = generate_mips(prog, allocate=allocate)
+            peephole(mips)
+            assert MipsSimulator(mips).run() == EXPECTED
+
+
+def test_jump_table_beats_compare_chain(monkeypatch):
+    src = "function f(n: integer): integer {\n let acc: integer = 0;\n let i: integer = 0;\n" \
+          " while (i < n) {\n  switch (i % 16) {\n" + \
+          "".join(f"   case {k}: acc = acc + {k * 3}; break;\n" for k in range(16)) + \
+          "  }\n  i = i + 1;\n }\n return acc;\n}\nprint(f(320));\n"
+
+    def steps():
+        sim = MipsSimulator(generate_mips(compile_tac(src)))
+        assert sim.run() == ["7200"]
+        return sim.steps
+
+    fast = steps()
+    monkeypatch.setattr(tac_gen, "SWITCH_LINEAR", 1000)
+    assert fast * 3 < steps() * 2
@@ -0,0 +1,61 @@
+from tests.intermediate.util import compile_tac
+from codegen.mips import generate_mips
+from codegen.simulator import MipsSimulator
+
+PROGRAM = """
+function sum(n: integer, acc: integer): integer {
+  if (n == 0) { return acc; }
+  return sum(n - 1, acc + n);
+}
+function rot(a: integer, b: integer, c: integer, n: integer): integer {
+  if (n == 0) { return a * 100 + b * 10 + c; }
+  return rot(c, a, b, n - 1);
+}
+function count(n: integer, acc: integer): integer {
+  let k: integer = 0;
+  function bump(): integer { k = k + 1; return k; }
+  bump();
+  if (n == 0) { return acc + k; }
+  return count(n - 1, acc + bump());
+}
+function viaSum(n: integer, unused: integer): integer {
+  return sum(n, 0);
+}
+function sq(x: integer): integer { return x * x; }
+print(sum(2000, 0));
+print(rot(1, 2, 3, 4));
+print(count(5, 0));
+print(viaSum(10, 0));
+print(sq(12));
+"""
+
+EXPECTED = ["2001000", "312", "11", "55", "144"]
+
+
+def _run(**kwargs):
+    mips = generate_mips(compile_tac(PROGRAM), **kwargs)
+    sim = MipsSimulator(mips)
+    return mips, sim, sim.run()
+
+
+def test_tail_recursion_runs_in_constant_stack():
+    _, plain, out = _run(tail_calls=False, leaves=False)
+    assert out == EXPECTED
+    mips, fast, out = _run()
+    assert out == EXPECTED
+    assert plain.stack_bytes > 2000 * 8
+    assert fast.stack_bytes < 200
+    assert fast.steps < plain.steps
+    stats = {f.name: f for f in mips.functions}
+    assert stats["sum"].tail_calls == 1 and stats["viaSum"].tail_calls == 1
+    assert stats["rot"].tail_calls == 1 and stats["count"].tail_calls == 1
+
+
+def test_leaf_functions_have_no_frame():
+    mips, _, _ = _run()
+    stats = {f.name: f for f in mips.functions}
+    # la recursión de cola es un salto: 'sum' también queda como hoja
+    assert stats["sq"].frameless and stats["sum"].frameless
+    assert stats["sq"].instructions <= 4 and stats["sq"].stores == 0
+    # 'count' tiene un entorno (en su marco) y llama a 'bump': necesita marco
+    assert not stats["count"].frameless and not stats["viaSum"].frameless
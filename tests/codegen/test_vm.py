@@ -0,0 +1,100 @@
+from tests.intermediate.util import compile_tac
+from intermediate.interp import TacInterpreter
+from intermediate.optimize import optimize
+from intermediate.global_opt import optimize_global
+from intermediate.inline import inline_calls
+from codegen.bytecode import compile_bytecode, B_STORE, B_LOAD
+from codegen.vm import StackVM
+from perf.vm_bench import benchmark
+
+PROGRAM = """
+class Animal {
+  let name: string;
+  function constructor(name: string) { this.name = name; }
+  function speak(): string { return this.name + "..."; }
+  function describe(): string { return "<" + this.speak() + ">"; }
+}
+class Dog : Animal {
+  function constructor(name: string) { this.name = name; }
+  function speak(): string { return this.name + " guau"; }
+}
+function counter(n: integer): integer {
+  let total: integer = 0;
+  function add(v: integer): void { total = total + v; }
+  foreach (x in [n, n * 2, n * 3]) { add(x); }
+  return total;
+}
+function kind(k: integer): string {
+  switch (k) {
+    case 0: return "cero";
+    case 1: return "uno";
+    case 2: return "dos";
+    default: return "otro";
+  }
+}
+let cat: Animal = new Animal("gato");
+print(cat.describe());
+let dogs: Dog[] = [new Dog("rex"), new Dog("fido")];
+foreach (d in dogs) { print(d.describe()); }
+print(counter(7));
+for (let i: integer = 0; i < 4; i = i + 1) { print(kind(i)); }
+let xs: integer[] = [1, 2, 3];
+try { print(xs[3]); } catch (e) { print("error: " + e); }
+try { print(10 / (xs[0] - 1)); } catch (e) { print("error: " + e); }
+print(xs);
+"""
+
+EXPECTED = ["<gato...>", "<rex guau>", "<fido guau>", "42", "cero", "uno", "dos", "otro",
+            "error: Índice fuera de rango: 3", "error: División por cero", "[1, 2, 3]"]
+
+BENCH = """
+function fib(n: integer): integer {
+  if (n < 2) { return n; }
+  return fib(n - 1) + fib(n - 2);
+}
+let xs: integer[] = [5, 3, 8, 1, 9, 2, 7, 4, 6, 0];
+let s: integer = 0;
+for (let k: integer = 0; k < 200; k = k + 1) {
+  for (let i: integer = 0; i < 10; i = i + 1) { s = (s + xs[i] * k) % 100003; }
+}
+print(s);
+print(fib(16));
+"""
+
+
+def test_vm_matches_interpreter_on_every_feature():
+    assert TacInterpreter(compile_tac(PROGRAM)).run() == EXPECTED
+    for level in (0, 2):
+        prog = compile_tac(PROGRAM)
+        if level:
+            inline_calls(prog)
+            optimize_global(prog)
+        assert StackVM(compile_bytecode(prog)).run() == EXPECTED
+
+
+def test_comparison_feeding_a_branch_stays_on_the_stack():
+    bc = compile_bytecode(compile_tac("function f(n: integer): integer {\n"
+                                      "  if (n < 2) { return 1; }\n  return n;\n}\nprint(f(3));\n"))
+    f = next(fn for fn in bc.functions if fn.name == "f")
+    ops = [bc.code[f.entry + k] for k in (0, 2, 4, 5)]
+    assert ops[0] == B_LOAD and B_STORE not in ops
+    assert StackVM(bc).run() == ["3"]
+
+
+def test_switch_folded_by_the_optimizer_leaves_no_dangling_table():
+    source = ("function g(x: integer): integer {\n"
+              "  switch (x) { case 1: return 10; case 2: return 20; case 3: return 30;\n"
+              "    case 4: return 40; default: return 0; }\n"
+              "}\nprint(g(2));\nprint(g(7));\n")
+    for opt in (optimize, lambda p: (inline_calls(p), optimize_global(p))):
+        prog = compile_tac(source)
+        opt(prog)
+        assert StackVM(compile_bytecode(prog)).run() == ["20", "0"]
+
+
+def test_vm_dispatch_count_stays_close_to_the_tac_instruction_count():
+    # sin dejar temporales en la pila la VM despacha ~2.8 instrucciones por cada una del TAC
+    bench = benchmark(compile_tac(BENCH), repeat=1)
+    assert bench.tac_instructions > 20_000
+    assert bench.vm_dispatches < 2.3 * bench.tac_instructions
+    assert "despachos VM" in bench.to_text()
@@ -0,0 +1,71 @@
+from tests.intermediate.util import compile_tac
+from intermediate.tac import METHOD, CALL, GETF, K_NAME
+from intermediate.interp import TacInterpreter
+from intermediate.global_opt import optimize_global
+from intermediate.inline import inline_calls
+from codegen.mips import generate_mips
+from codegen.peephole import peephole
+from codegen.simulator import MipsSimulator
+
+PROGRAM = """
+class Shape {
+  let name: string;
+  let sides: integer;
+  function constructor(name: string, sides: integer) { this.name = name; this.sides = sides; }
+  function area(): integer { return 0; }
+  function show(): string { return this.name + "=" + this.area(); }
+  function count(): integer { return this.sides; }
+}
+class Rect : Shape {
+  let w: integer;
+  let h: integer;
+  function constructor(w: integer, h: integer) { this.name = "rect"; this.sides = 4; this.w = w; this.h = h; }
+  function area(): integer { return this.w * this.h; }
+}
+class Square : Rect {
+  function constructor(s: integer) { this.name = "square"; this.sides = 4; this.w = s; this.h = s; }
+  function show(): string { return "[" + this.area() + "]"; }
+}
+let s: Shape = new Shape("punto", 0);
+let r: Rect = new Rect(3, 4);
+let q: Square = new Square(5);
+print(s.show());
+print(r.show());
+print(q.show());
+print(r.count() + q.count() + s.count());
+print(r.w + q.h);
+print(q);
+"""
+
+EXPECTED = ["punto=0", "rect=12", "[25]", "8", "8", "<Square>"]
+
+
+def _ops(prog, name):
+    f = prog.function(name)
+    return [prog.code.op[i] for i in range(f.start, f.end)]
+
+
+def test_overridden_methods_dispatch_through_the_vtable():
+    prog = compile_tac(PROGRAM)
+    # 'area' y 'show' se redefinen en subclases: llamada indirecta por slot
+    assert METHOD in _ops(prog, "Shape.show") and METHOD in _ops(prog, "__main__")
+    # 'count' nunca se redefine: sigue siendo una llamada directa
+    assert "Shape.count" in {prog.names[prog.code.a[i] >> 3] for i in range(len(prog.code))
+                             if prog.code.op[i] == CALL and prog.code.a[i] & 7 == K_NAME}
+    assert prog.class_of("Square").methods == ["Rect.area", "Square.show", "Shape.count"]
+    offsets = {prog.fields[prog.code.b[i] >> 3][0]: prog.field_offset(prog.code.b[i])
+               for i in range(len(prog.code)) if prog.code.op[i] == GETF}
+    assert offsets == {"name": 4, "sides": 8, "w": 12, "h": 16}
+    assert TacInterpreter(prog).run() == EXPECTED
+
+
+def test_compiled_dispatch_matches_interpreter():
+    for level in (0, 2):
+        prog = compile_tac(PROGRAM)
+        if level:
+            inline_calls(prog)
+            optimize_global(prog)
+        for allocate in (False, True):
+            mips = generate_mips(prog, allocate=allocate)
+            peephole(mips)
+            assert MipsSimulator(mips).run() == EXPECTED
@@ -0,0 +1,40 @@
+import os
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.error.ErrorListener import ErrorListener
+from CompiscriptLexer import CompiscriptLexer
+from frontend.fast_lexer import FastLexer
+from tests.semantic.util import compile_source
+
+PROGRAM_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "program")
+
+class _Errors(ErrorListener):
+    def __init__(self):
+        self.seen = []
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.seen.append((line, column, msg))
+
+def _tokens(lexer_cls, source):
+    lexer = lexer_cls(InputStream(source))
+    errors = _Errors()
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(errors)
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    toks = [(t.type, t.text, t.line, t.column, t.start, t.stop, t.tokenIndex) for t in stream.tokens]
+    return toks, errors.seen
+
+def test_conformance_with_antlr_lexer_on_sample_programs():
+    for name in ("program.cps", "program_ok.cps", "program_bad.cps"):
+        with open(os.path.join(PROGRAM_DIR, name), encoding="utf-8") as f:
+            source = f.read()
+        assert _tokens(FastLexer, source) == _tokens(CompiscriptLexer, source), name
+
+def test_conformance_on_edge_cases_and_errors():
+    source = ('letter let x1 = 12abc; a<=b==c!=d&&e||!f; /* multi\nline */ "str" // fin\n'
+              'a @ b; "sin cierre\nx & y | z /* abierto')
+    assert _tokens(FastLexer, source) == _tokens(CompiscriptLexer, source)
+
+def test_fast_lexer_selectable_in_compile_source():
+    rep, checker = compile_source("let x: integer = 1 + 2;", lexer="fast")
+    assert not rep.has_errors()
+    assert "x" in checker.scopes.stack[0].symbols
@@ -0,0 +1,41 @@
+import os
+from antlr4 import InputStream
+from CompiscriptParser import CompiscriptParser
+from frontend.fast_lexer import create_lexer
+from frontend.streaming import SlidingTokenStream, stream_check
+from frontend.syntax_errors import attach_syntax_listener
+from program.semantic.type_checker import TypeChecker
+from program.semantic.error_reporter import ErrorReporter
+from tests.semantic.util import compile_source
+
+PROGRAM = os.path.join(os.path.dirname(__file__), "..", "..", "program", "program.cps")
+
+def _stream(source, mode="skip"):
+    reporter = ErrorReporter()
+    lexer = create_lexer(InputStream(source), "antlr")
+    stream = SlidingTokenStream(lexer)
+    parser = CompiscriptParser(stream)
+    syntax = attach_syntax_listener(lexer, parser, reporter)
+    checker = TypeChecker(reporter)
+    stats = stream_check(parser, stream, checker, syntax, mode)
+    return reporter, checker, stats
+
+def test_streaming_matches_whole_tree_check():
+    with open(PROGRAM, encoding="utf-8") as f:
+        source = f.read() + "\nlet bad: string = 1;\nprint(undefinedName);\n"
+    rep_full, checker_full = compile_source(source)
+    rep_stream, checker_stream, stats = _stream(source)
+
+    assert [str(e) for e in rep_stream] == [str(e) for e in rep_full]
+    assert list(checker_stream.scopes.stack[0].symbols) == list(checker_full.scopes.stack[0].symbols)
+    # nunca se retuvo más que una fracción de los tokens del archivo
+    assert stats.statements == stats.checked
+    assert stats.max_window < stats.tokens // 4
+
+def test_streaming_skips_statements_with_syntax_errors():
+    source = "let a: integer = 1;\nlet b: integer = ;\nlet c: string = a;\n"
+    rep, checker, stats = _stream(source, mode="partial")
+    assert [e.code for e in rep] == ["E_SYNTAX", "E_ASSIGN"]
+    assert stats.skipped == 1
+    rep, _, stats = _stream(source, mode="skip")
+    assert [e.code for e in rep] == ["E_SYNTAX"]
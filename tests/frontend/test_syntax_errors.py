@@ -0,0 +1,25 @@
+from tests.semantic.util import compile_source
+
+BROKEN = """
+let ok: integer = 1;
+let roto: integer = ;
+let s: string = ok;
+"""
+
+def test_syntax_errors_are_reported_and_semantics_skipped():
+    rep, checker = compile_source(BROKEN, syntax_mode="skip")
+    codes = [e.code for e in rep]
+    assert "E_SYNTAX" in codes
+    assert set(codes) == {"E_SYNTAX"}            # modo skip: sin errores semánticos
+    assert not checker.scopes.stack[0].symbols   # el checker no corrió
+
+def test_partial_mode_checks_only_unaffected_statements():
+    rep, checker = compile_source(BROKEN, syntax_mode="partial")
+    semantic = [e for e in rep if e.code != "E_SYNTAX"]
+    # 'let s: string = ok;' sí se chequea y falla por tipos; 'roto' no se declara
+    assert [e.code for e in semantic] == ["E_ASSIGN"]
+    assert "roto" not in checker.scopes.stack[0].symbols
+
+def test_valid_program_has_no_syntax_errors():
+    rep, _ = compile_source("let x: integer = 1;")
+    assert not rep.has_errors()
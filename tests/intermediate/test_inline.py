@@ -0,0 +1,87 @@
+from tests.intermediate.util import compile_tac
+from intermediate.interp import TacInterpreter
+from intermediate.inline import inline_calls, Inliner
+from intermediate.global_opt import optimize_global
+from intermediate.tac import CALL
+from codegen.mips import generate_mips
+from codegen.simulator import MipsSimulator
+
+PROGRAM = """
+class Point {
+  let x: integer;
+  let y: integer;
+  function constructor(x: integer, y: integer) { this.x = x; this.y = y; }
+  function getX(): integer { return this.x; }
+  function getY(): integer { return this.y; }
+}
+function sq(v: integer): integer { return v * v; }
+function clamp(v: integer, lo: integer, hi: integer): integer {
+  if (v < lo) { return lo; }
+  if (v > hi) { return hi; }
+  return v;
+}
+function fact(n: integer): integer {
+  if (n <= 1) { return 1; }
+  return n * fact(n - 1);
+}
+function outer(k: integer): integer {
+  let total: integer = 0;
+  function add(v: integer): void { total = total + v * k; }
+  let i: integer = 0;
+  while (i < 5) { add(i); i = i + 1; }
+  return total;
+}
+let p: Point = new Point(3, 4);
+let acc: integer = 0;
+let i: integer = 0;
+while (i < 100) {
+  acc = acc + sq(p.getX()) + clamp(i, 10, 50) + p.getY();
+  i = i + 1;
+}
+print(acc);
+print(fact(6));
+print(outer(3));
+"""
+
+
+def _calls(prog, name):
+    f = prog.function(name)
+    return sum(1 for i in range(f.start, f.end) if prog.code.op[i] == CALL)
+
+
+def test_small_calls_are_inlined_and_output_is_kept():
+    plain = TacInterpreter(compile_tac(PROGRAM))
+    expected = plain.run()
+    prog = compile_tac(PROGRAM)
+    report = inline_calls(prog)
+    inlined = {(s.caller, s.callee) for s in report.sites}
+    assert {("__main__", "Point.getX"), ("__main__", "sq"), ("__main__", "clamp")} <= inlined
+    assert all(s.in_loop for s in report.sites if s.callee in ("sq", "clamp"))
+    assert report.growth < 0.5 and "Inlining:" in report.to_text()
+    fast = TacInterpreter(prog)
+    assert fast.run() == expected
+    assert fast.steps < plain.steps
+    optimize_global(prog)
+    assert MipsSimulator(generate_mips(prog)).run() == expected
+
+
+def test_recursion_is_not_inlined():
+    prog = compile_tac(PROGRAM)
+    report = inline_calls(prog)
+    assert report.skipped["fact"] == "recursiva"
+    assert _calls(prog, "fact") == 1 and prog.function("fact") is not None
+
+
+def test_captured_variables_survive_and_dead_closure_is_removed():
+    prog = compile_tac(PROGRAM)
+    report = inline_calls(prog)
+    assert ("outer", "outer.add") in {(s.caller, s.callee) for s in report.sites}
+    # 'add' era el único que capturaba 'total' y 'k': sin llamadas, desaparece
+    assert "outer.add" in report.removed and prog.function("outer.add") is None
+    assert _calls(prog, "outer") == 0
+    assert TacInterpreter(prog).run()[-1] == "30"
+    # con un tope de crecimiento nulo solo entran los cuerpos que no agrandan el código
+    prog = compile_tac(PROGRAM)
+    tight = Inliner(prog, max_growth=0.0).run()
+    assert len(tight.sites) < len(report.sites)
+    assert TacInterpreter(prog).run()[-1] == "30"
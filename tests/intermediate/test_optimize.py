@@ -0,0 +1,52 @@
+from tests.intermediate.util import compile_tac
+from intermediate.interp import TacInterpreter
+from intermediate.optimize import optimize
+
+PROGRAM = """
+const PI: integer = 314;
+let total: integer = 0;
+function area(r: integer): integer {
+  let k: integer = 2 * 1;
+  let unused: integer = r * 7;
+  let y: integer = r;
+  return PI * y * y / 100 + 0 * k + (y - y);
+}
+let i: integer = 0;
+while (i < 10) {
+  total = total + area(i) * 1;
+  i = i + 1;
+}
+if (false) { print("nunca"); }
+print("total: " + total);
+try {
+  print(10 / (i - 10));
+} catch (e) {
+  print("error: " + e);
+}
+"""
+
+def test_constants_are_folded_and_dead_code_removed():
+    prog = compile_tac(PROGRAM)
+    optimize(prog)
+    text = prog.to_text()
+    assert "314 * r" in text            # 'const' global propagada
+    assert "unused" not in text and "k =" not in text
+    assert "nunca" not in text
+
+def test_optimized_program_prints_the_same_with_fewer_steps():
+    plain = TacInterpreter(compile_tac(PROGRAM))
+    expected = plain.run()
+    prog = compile_tac(PROGRAM)
+    optimize(prog)
+    opt = TacInterpreter(prog)
+    assert opt.run() == expected == ["total: 891", "error: División por cero"]
+    assert opt.steps < plain.steps
+
+def test_report_counts_removed_instructions_per_pass():
+    prog = compile_tac(PROGRAM)
+    report = optimize(prog)
+    by_name = {p.name: p for p in report.passes}
+    assert report.after == len(prog.code) < report.before
+    assert sum(p.removed for p in report.passes) == report.before - report.after
+    assert by_name["dead-code-elimination"].removed > 0
+    assert by_name["constant-folding"].rewritten > 0
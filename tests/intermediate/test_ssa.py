@@ -0,0 +1,45 @@
+from tests.intermediate.util import compile_tac
+from intermediate.interp import TacInterpreter
+from intermediate.ssa import SsaFunction
+from intermediate.global_opt import optimize_global
+from intermediate.tac import DEST_OPS
+
+LOOPS = """
+function work(n: integer, k: integer): integer {
+  let s: integer = 0;
+  let i: integer = 0;
+  let debug: boolean = false;
+  while (i < n) {
+    if (debug) { print("nunca"); }
+    s = s + (k * k + 3) * i + (k * k + 3);
+    i = i + 1;
+  }
+  return s;
+}
+print(work(50, 5));
+"""
+
+def test_ssa_names_are_defined_once_and_loop_header_gets_phis():
+    prog = compile_tac(LOOPS)
+    sf = SsaFunction(prog, prog.functions.index(prog.function("work")))
+    sf.construct()
+    defs = [phi.dest for b in sf.live_blocks() for phi in b.phis]
+    defs += [ins[1] for b in sf.live_blocks() for ins in b.code if ins[0] in DEST_OPS]
+    assert len(defs) == len(set(defs))
+    headers = [b for b in sf.live_blocks() if b.phis]
+    # s e i se unen en la cabecera del while
+    assert len(headers) == 1 and len(headers[0].phis) >= 2
+
+def test_global_optimizations_keep_output_and_cut_loop_work():
+    plain = TacInterpreter(compile_tac(LOOPS))
+    expected = plain.run()
+    prog = compile_tac(LOOPS)
+    optimize_global(prog)
+    text = prog.to_text()
+    assert "nunca" not in text                          # SCCP: 'debug' es false en todo el ciclo
+    work = text[text.index("function work"):]
+    assert work.index("k * k") < work.index("L")        # LICM: sale del ciclo y se calcula una vez
+    assert work.count("k * k") == 1                     # GVN: la segunda aparición se reutiliza
+    opt = TacInterpreter(prog)
+    assert opt.run() == expected
+    assert opt.steps < plain.steps * 0.75
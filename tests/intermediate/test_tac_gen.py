@@ -0,0 +1,68 @@
+import struct
+
+from antlr4 import InputStream, CommonTokenStream
+from CompiscriptLexer import CompiscriptLexer
+from CompiscriptParser import CompiscriptParser
+from semantic.error_reporter import ErrorReporter
+from semantic.type_checker import TypeChecker
+from tests.intermediate.util import compile_tac
+from intermediate.tac import TacProgram, CONCAT, ADD, INT_MAX
+from intermediate.tac_gen import generate_tac
+
+def test_temporaries_are_recycled():
+    prog = compile_tac("""
+    function f(a: integer, b: integer): integer {
+      return (a + b) * (a - b) + (a * b) - (b * a) + (a + 1) * (b + 2);
+    }
+    """)
+    f = prog.function("f")
+    # acumulador + los dos operandos de (a + 1) * (b + 2); sin reciclar serían 11
+    assert f.temps == 3
+    assert f.params and [prog.vars[p >> 3].name for p in f.params] == ["a", "b"]
+
+def test_calls_methods_and_concat_text():
+    prog = compile_tac("""
+    class A {
+      let n: integer;
+      function constructor(n: integer) { this.n = n; }
+      function get(): integer { return this.n; }
+    }
+    function g(x: integer): integer { return x + 1; }
+    let a: A = new A(g(1));
+    print("valor: " + a.get());
+    """)
+    text = prog.to_text()
+    assert "call A.constructor, 2" in text
+    assert "call A.get, 1" in text
+    # los 'param' de la llamada externa no se intercalan con la llamada anidada
+    assert "param 1\n    t1 = call g, 1\n    param t0\n    param t1\n    call A.constructor, 2" in text
+    main = prog.function("__main__")
+    ops = [prog.code.op[i] for i in range(main.start, main.end)]
+    assert CONCAT in ops and ADD not in ops
+
+def test_binary_round_trip():
+    prog = compile_tac("""
+    let xs: integer[] = [1, 2, 3];
+    let s: integer = 0;
+    foreach (x in xs) { if (x > 1) { s = s + x; } }
+    try { print(xs[5]); } catch (e) { print("err: " + e); }
+    """)
+    back = TacProgram.from_bytes(prog.to_bytes())
+    assert back.to_text() == prog.to_text()
+    assert len(back.code) == len(prog.code)
+
+def test_binary_operands_are_little_endian():
+    prog = compile_tac("let big: integer = 123456789; print(big - 7);")
+    n = len(prog.code)
+    data = prog.to_bytes()
+    assert data[-8 * n:] == struct.pack(f"<{n}q", *prog.code.b)
+
+def test_int_literal_out_of_operand_range_is_reported():
+    reporter = ErrorReporter()
+    source = f"let ok: integer = {INT_MAX};\nlet big: integer = {INT_MAX + 1};"
+    tree = CompiscriptParser(CommonTokenStream(CompiscriptLexer(InputStream(source)))).program()
+    checker = TypeChecker(reporter, record_types=True)
+    checker.visit(tree)
+    assert not reporter.has_errors()
+    generate_tac(tree, checker)
+    assert [(e.line, e.code) for e in reporter] == [(2, "E_INT_RANGE")]
@@ -0,0 +1,31 @@
+from antlr4 import InputStream, CommonTokenStream
+from CompiscriptLexer import CompiscriptLexer
+from CompiscriptParser import CompiscriptParser
+from semantic.type_checker import TypeChecker
+from semantic.error_reporter import ErrorReporter
+from intermediate.tac_gen import generate_tac
+
+def compile_tac(source: str):
+    """
+    Chequea 'source' y genera su TAC. Falla si hay errores: los tests de
+    generación de código parten de programas válidos.
+    """
+    reporter = ErrorReporter()
+    parser = CompiscriptParser(CommonTokenStream(CompiscriptLexer(InputStream(source))))
+    tree = parser.program()
+    checker = TypeChecker(reporter, record_types=True)
+    checker.visit(tree)
+    assert not reporter.has_errors(), [str(e) for e in reporter]
+    return generate_tac(tree, checker)
+
+
+def compile_py(source: str) -> str:
+    """Como compile_tac, pero devuelve el Python que genera codegen/pygen.py."""
+    from codegen.pygen import generate_python
+    reporter = ErrorReporter()
+    parser = CompiscriptParser(CommonTokenStream(CompiscriptLexer(InputStream(source))))
+    tree = parser.program()
+    checker = TypeChecker(reporter, record_types=True)
+    checker.visit(tree)
+    assert not reporter.has_errors(), [str(e) for e in reporter]
+    return generate_python(tree, checker)
@@ -0,0 +1,35 @@
+import json
+import pytest
+from perf.memory_report import MemoryProfiler, profile_source
+
+def test_phase_measures_peak_and_retained():
+    mem = MemoryProfiler(top=3)
+    keep = []
+    try:
+        with mem.phase("alloc"):
+            keep.append(bytearray(200_000))
+            tmp = bytearray(500_000)
+            del tmp
+    finally:
+        mem.stop()
+    p = mem.phases[0]
+    assert p.retained_bytes >= 200_000
+    assert p.peak_bytes >= 700_000 > p.retained_bytes
+    assert p.top_sites and "test_memory_report.py" in p.top_sites[0].location
+
+def test_profile_source_reports_every_phase():
+    mem = profile_source("let x: integer = 1;\nfunction f(a: integer): integer { return a; }\n" * 20)
+    names = [p.name for p in mem.phases]
+    assert names == ["lexing", "parsing", "checking", "symbol-table"]
+    data = json.loads(mem.to_json())
+    assert data["phases"][1]["retained_bytes"] > 0     # el árbol sigue vivo
+    assert "parsing" in mem.to_text()
+
+def test_profile_source_follows_the_syntax_mode():
+    # con errores sintácticos el árbol tiene huecos: el chequeo pasa por run_checker
+    broken = "let x: integer = 1;\nlet y: integer = ;\nprint(x);\n"
+    for mode in ("skip", "partial", "full"):
+        mem = profile_source(broken, syntax_mode=mode)
+        assert [p.name for p in mem.phases][2] == "checking"
+    with pytest.raises(ValueError):
+        profile_source(broken, syntax_mode="todo")
@@ -0,0 +1,31 @@
+from antlr4 import InputStream, CommonTokenStream
+from CompiscriptLexer import CompiscriptLexer
+from CompiscriptParser import CompiscriptParser
+from perf.parser_profile import enable_profiling, ParseProfile
+
+SOURCE = """
+let x: integer = 1;
+x = x + 1;
+foo(x).bar = 3;
+print(x);
+"""
+
+def _profile(source):
+    parser = CompiscriptParser(CommonTokenStream(CompiscriptLexer(InputStream(source))))
+    sim = enable_profiling(parser)
+    parser.program()
+    return ParseProfile.from_simulator(sim)
+
+def test_profile_maps_decisions_to_rules():
+    prof = _profile(SOURCE)
+    rules = prof.by_rule()
+    assert "statement" in rules
+    stmt = rules["statement"][0]
+    assert stmt.invocations == 4
+    assert stmt.sll_max_lookahead >= 2          # 'x =' vs expresión requiere más de un token
+    assert all(d.time_ns > 0 for d in prof.decisions)
+
+def test_profile_reports_as_text_and_json():
+    prof = _profile(SOURCE)
+    assert "statement" in prof.to_text()
+    assert '"rule": "statement"' in prof.to_json()
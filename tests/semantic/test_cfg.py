@@ -0,0 +1,60 @@
+from antlr4 import InputStream, CommonTokenStream
+from CompiscriptLexer import CompiscriptLexer
+from CompiscriptParser import CompiscriptParser
+from tests.semantic.util import compile_source
+from semantic.cfg import build_cfg
+
+
+def _cfg(body: str):
+    parser = CompiscriptParser(CommonTokenStream(CompiscriptLexer(InputStream(body))))
+    return build_cfg(parser.program().statement())
+
+
+def test_all_paths_return_for_if_else_and_switch():
+    code = """
+    function signo(x: integer): integer {
+      if (x < 0) { return -1; } else { return 1; }
+    }
+    function nombre(x: integer): string {
+      switch (x) {
+        case 1: return "uno";
+        default: return "otro";
+      }
+    }
+    function infinito(): integer {
+      while (true) { return 1; }
+    }
+    """
+    rep, _ = compile_source(code)
+    assert not rep.has_errors(), [str(e) for e in rep]
+
+
+def test_missing_return_on_some_path_and_unreachable_after_if_else():
+    code = """
+    function f(x: integer): integer {
+      if (x > 0) { return 1; }
+    }
+    function g(x: integer): integer {
+      if (x > 0) { return 1; } else { return 2; }
+      print(x);
+    }
+    function h(x: integer): integer {
+      switch (x) { case 1: return 1; }
+    }
+    """
+    rep, _ = compile_source(code)
+    returns = [e for e in rep if e.code == "E_RETURN"]
+    assert [e.line for e in returns] == [2, 9]
+    dead = [e for e in rep if e.code == "E_DEADCODE"]
+    assert [(e.line, e.col) for e in dead] == [(7, 6)]
+
+
+def test_switch_fall_through_and_break_edges():
+    cfg = _cfg("switch (x) { case 1: print(1); case 2: print(2); break; default: print(3); }")
+    labels = cfg.labels
+    case1, case2 = [b for b in range(len(cfg)) if labels[b] == "switch.case"]
+    end = labels.index("switch.end")
+    assert case2 in cfg.successors(case1)            # fall-through
+    assert end in cfg.successors(case2)              # break
+    assert not cfg.all_paths_return()
+    assert all(cfg.reachable()[b] for b in (case1, case2, end))
@@ -0,0 +1,60 @@
+from tests.semantic.util import compile_source
+from semantic.dataflow import FunctionFlow, liveness, ReachingDefinitions
+
+
+def _flow(code: str):
+    rep, checker = compile_source(code)
+    cfg = list(checker.cfgs.values())[0]
+    flow = FunctionFlow(cfg, lambda tok: checker.index.symbol_at(tok.line, tok.column))
+    return rep, flow
+
+
+def test_use_before_init_on_some_path():
+    code = """
+    function f(c: boolean): integer {
+      let x: integer;
+      let y: integer;
+      if (c) { x = 1; y = 2; } else { x = 2; }
+      let z: integer = x + y;
+      return z;
+    }
+    """
+    rep, _ = compile_source(code)
+    uninit = [(e.line, e.col) for e in rep if e.code == "E_UNINIT"]
+    assert uninit == [(6, 27)], [str(e) for e in rep]
+
+
+def test_params_foreach_and_loops_are_not_flagged():
+    code = """
+    function g(n: integer): integer {
+      let total: integer;
+      total = 0;
+      let i: integer;
+      for (i = 0; i < n; i = i + 1) { total = total + i; }
+      foreach (v in [1, 2, 3]) { total = total + v; }
+      return total + n;
+    }
+    """
+    rep, _ = compile_source(code)
+    assert not rep.has_errors(), [str(e) for e in rep]
+
+
+def test_liveness_and_reaching_definitions():
+    code = """
+    function h(c: boolean): integer {
+      let a: integer = 1;
+      let b: integer = 2;
+      if (c) { a = 3; }
+      return a;
+    }
+    """
+    rep, flow = _flow(code)
+    assert not rep.has_errors()
+    names = lambda syms: sorted(s.name for s in syms)
+    live = liveness(flow)
+    cfg = flow.cfg
+    assert names(flow.mask(live.in_[cfg.ENTRY])) == ["c"]          # 'b' nunca se lee
+    ret_block = cfg.labels.index("if.end")
+    rd = ReachingDefinitions(flow)
+    lines = sorted(tok.line for sym, tok in rd.reaching(ret_block) if sym.name == "a")
+    assert lines == [3, 5]
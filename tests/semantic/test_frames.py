@@ -0,0 +1,79 @@
+from tests.semantic.util import compile_source
+
+def _frames(checker):
+    tree = checker.scopes.tree
+    return {f.name: f for f in tree.frames.values()}
+
+def test_disjoint_blocks_share_slots_and_params_get_incoming_offsets():
+    rep, checker = compile_source("""
+    function f(a: integer, b: integer): integer {
+      let x: integer = a;
+      if (a > b) { let y: integer = 1; let z: integer = 2; x = y + z; }
+      else { let w: integer = 3; x = w; }
+      while (x < 10) { let k: integer = x; x = k + 1; }
+      return x;
+    }
+    """)
+    assert not rep.has_errors(), [str(e) for e in rep]
+    frame = _frames(checker)["f"]
+    assert [p.offset for p in frame.params] == [0, 4]
+    # x + (y, z) en el peor bloque; w y k reutilizan los slots de y
+    assert frame.locals_size == 12 and frame.locals_total == 20
+    assert frame.frame_size(temps=1) == 24
+    assert frame.env_slot is None and frame.link_slot is None
+
+def test_captured_variables_live_in_the_environment():
+    rep, checker = compile_source("""
+    function counter(start: integer): integer {
+      let n: integer = start;
+      let other: integer = 0;
+      function inc(step: integer): integer { n = n + step; return n; }
+      return inc(other + 1);
+    }
+    """)
+    assert not rep.has_errors(), [str(e) for e in rep]
+    frames = _frames(checker)
+    outer, inner = frames["counter"], frames["inc"]
+    assert [s.name for s in outer.captured] == ["n"]
+    assert outer.env_size == 8 and outer.captured[0].offset == 4     # [enlace, n]
+    assert outer.env_slot == -12                                     # primer slot del marco
+    other = checker.index.symbol_at(4, 10)
+    assert other.name == "other" and not other.captured and other.offset == -16
+    assert inner.link_slot == -12 and not inner.captured
+
+def test_methods_receive_this_as_first_argument():
+    rep, checker = compile_source("""
+    class P {
+      let v: integer;
+      function set(v: integer): void { this.v = v; }
+    }
+    """)
+    assert not rep.has_errors(), [str(e) for e in rep]
+    frame = _frames(checker)["P.set"]
+    assert frame.has_this and frame.this_offset == 0
+    assert frame.param_offsets == [4]
+
+def test_class_layout_extends_base_and_overrides_in_place():
+    rep, checker = compile_source("""
+    class A {
+      let x: integer;
+      let y: integer;
+      function f(): integer { return 1; }
+      function g(): integer { return 2; }
+    }
+    class B : A {
+      let z: integer;
+      let x: integer;
+      function constructor() { this.z = 0; }
+      function h(): integer { return 3; }
+      function f(): integer { return 4; }
+    }
+    """)
+    assert not rep.has_errors(), [str(e) for e in rep]
+    a, b = checker.scopes.tree.classes["A"], checker.scopes.tree.classes["B"]
+    assert a.fields == {"x": 4, "y": 8} and a.size == 12
+    # los campos heredados conservan su offset; 'x' redeclarado reutiliza el suyo
+    assert b.fields == {"x": 4, "y": 8, "z": 12} and b.size == 16
+    assert a.methods == ["A.f", "A.g"]
+    assert b.methods == ["B.f", "A.g", "B.h"] and b.method_offset("h") == 12
+    assert "constructor" not in b.slots
@@ -0,0 +1,37 @@
+from tests.semantic.util import compile_source
+
+CODE = """let total: integer = 0;
+function suma(a: integer, b: integer): integer {
+  return a + b;
+}
+total = suma(total, 2);
+class P { let x: integer; }
+let p: P = new P();
+p.x = total;
+"""
+
+def test_definition_and_references():
+    rep, checker = compile_source(CODE)
+    assert not rep.has_errors(), [str(e) for e in rep]
+    idx = checker.index
+
+    # 'total' en la línea 5 (columna 0) resuelve a la declaración de la línea 1
+    sym = idx.symbol_at(5, 0)
+    assert sym is not None and sym.name == "total"
+    d = idx.definition_at(5, 0)
+    assert (d.line, d.col, d.end_col) == (1, 4, 9)
+    refs = [(s.line, s.col) for s in idx.references(sym)]
+    assert refs == [(5, 0), (5, 13), (8, 6)]
+
+    # hover sobre el parámetro 'a' dentro del cuerpo
+    assert idx.hover(3, 9) == "param a: integer"
+    # miembros de clase y tipos anotados
+    assert idx.symbol_at(8, 2).name == "x"
+    assert idx.symbol_at(7, 7).category == "class"
+
+def test_positions_outside_tokens_and_redecl_position():
+    rep, checker = compile_source("let a: integer = 1;\nlet a: integer = 2;\n")
+    assert checker.index.at(1, 0) is None      # 'let' no es un identificador
+    assert checker.index.at(99, 0) is None
+    redecl = [e for e in rep if e.code == "E_REDECL"]
+    assert redecl and (redecl[0].line, redecl[0].col) == (2, 4)
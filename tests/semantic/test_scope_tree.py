@@ -0,0 +1,36 @@
+from tests.semantic.util import compile_source
+
+def test_nested_scopes_are_retained_after_check():
+    code = """
+    let g: integer = 1;
+    function outer(x: integer): integer {
+      let base: integer = 5;
+      function inner(y: integer): integer {
+        return base + y;
+      }
+      return base + x;
+    }
+    """
+    rep, checker = compile_source(code)
+    assert not rep.has_errors(), [str(e) for e in rep]
+    tree = checker.scopes.tree
+
+    funcs = {tree.name(sid): sid for sid, _ in tree.walk() if tree.kind(sid) == "function"}
+    assert set(funcs) == {"outer", "inner"}
+    # inner cuelga (a través del bloque del cuerpo) de outer
+    assert tree.enclosing(tree.parent[funcs["inner"]], "function") == funcs["outer"]
+    assert [n for n, _ in tree.symbols(funcs["inner"])] == ["y"]
+
+    # resolución post-hoc sin volver a correr el TypeChecker
+    body = next(tree.children(funcs["inner"]))
+    assert tree.lookup(body, "base").name == "base"
+    assert tree.lookup(body, "g") is checker.scopes.stack[0].symbols["g"]
+    assert tree.lookup(body, "nope") is None
+
+def test_scope_of_symbol():
+    rep, checker = compile_source("while (true) { let k: integer = 0; }")
+    tree = checker.scopes.tree
+    block = next(sid for sid, _ in tree.walk() if tree.kind(sid) == "block")
+    sym = tree.symbols(block)[0][1]
+    assert tree.scope_of(sym) == block
+    assert tree.kind(tree.parent[block]) == "loop"
@@ -65,3 +65,14 @@ def test_no_cross_resolution_between_siblings():
     b = Scope('block', parent=g)
     assert a.define(VarSymbol('x', Int)) is True
     assert b.resolve('x') is None
+
+def test_negative_cache_is_per_scope_tree():
+    # la época de cada nombre vive en la raíz: otro árbol no la comparte
+    g1, g2 = GlobalScope(), GlobalScope()
+    b = Scope('block', parent=g1)
+    assert b.resolve('w') is None
+    assert b._define_epoch is g1._define_epoch and g1._define_epoch is not g2._define_epoch
+    g2.define(VarSymbol('w', Int))
+    assert 'w' not in g1._define_epoch
+    g1.define(VarSymbol('w', Int))
+    assert b.resolve('w') is not None
@@ -0,0 +1,32 @@
+from tests.semantic.util import compile_source
+from program.semantic.suggest import BKTree, levenshtein
+
+def test_bktree_search():
+    t = BKTree()
+    for w in ["contador", "contenido", "total", "tota", "x"]:
+        t.add(w)
+    assert t.search("contdor", 1) == [(1, "contador")]
+    assert [w for _, w in t.search("totl", 1)] == ["tota", "total"]
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("a" * 10, "b", limit=2) == 3
+
+def test_undefined_symbol_and_member_suggestions():
+    code = """
+    let contador: integer = 0;
+    class Punto {
+      let coordX: integer;
+      function mover(): void { }
+    }
+    let p: Punto = new Punto();
+    contdor = 1;
+    let y: integer = contdor + contdor;
+    p.coordx = 3;
+    p.mvoer();
+    """
+    rep, checker = compile_source(code)
+    msgs = [e.msg for e in rep]
+    assert any("contdor" in m and "¿Quisiste decir 'contador'?" in m for m in msgs), msgs
+    assert any("coordx" in m and "'coordX'" in m for m in msgs), msgs
+    assert any("mvoer" in m and "'mover'" in m for m in msgs), msgs
+    # la cascada de 'contdor' en el mismo scope reutiliza el resultado cacheado
+    assert checker.suggester.lookups == 3
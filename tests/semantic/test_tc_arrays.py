@@ -25,3 +25,14 @@ def test_multidim_arrays_basics():
     """
     rep, _ = compile_source(code)
     assert not rep.has_errors(), f"Esperaba sin errores, got: {[str(e) for e in rep]}"
+
+def test_each_index_strips_one_dimension():
+    code = """
+    let m: integer[][] = [[1,2],[3,4]];
+    let v: integer = m[1][0];
+    let row: integer[] = m[1];
+    """
+    rep, _ = compile_source(code)
+    assert not rep.has_errors(), [str(e) for e in rep]
+    rep, _ = compile_source("let m: integer[][] = [[1]];\nlet s: integer[] = m[0][0];")
+    assert [e.code for e in rep] == ["E_ASSIGN"]
@@ -0,0 +1,31 @@
+from tests.semantic.util import compile_source
+from semantic.scopes import Scope
+from semantic.symbols import VarSymbol
+import semantic.typesys as T
+
+def test_negative_cache_invalidated_on_define():
+    g = Scope('global')
+    inner = Scope('block', parent=g)
+    assert inner.resolve('late') is None
+    assert 'late' in inner._misses            # fallo cacheado
+    g.define(VarSymbol('late', T.INTEGER))     # define en un ancestro invalida la caché
+    assert inner.resolve('late') is g.symbols['late']
+
+def test_undefined_name_reported_once_with_count():
+    code = """
+    let a: integer = zz + 1;
+    let b: integer = zz * 2;
+    function f(): integer { return zz; }
+    """
+    rep, _ = compile_source(code)
+    undef = [e for e in rep if e.code == "E_UNDEF"]
+    assert len(undef) == 1
+    assert undef[0].count == 3 and "(3 referencias)" in str(undef[0])
+
+def test_calling_global_function_from_function_does_not_cycle():
+    code = """
+    function g(): integer { return 1; }
+    function f(): integer { let a: integer = g(); return a + missing; }
+    """
+    rep, _ = compile_source(code)
+    assert [e.code for e in rep if e.code == "E_UNDEF"] == ["E_UNDEF"]
@@ -1,22 +1,29 @@
 from antlr4 import InputStream, CommonTokenStream
-from program.CompiscriptLexer import CompiscriptLexer
-from program.CompiscriptParser import CompiscriptParser
+from CompiscriptParser import CompiscriptParser
 from program.semantic.type_checker import TypeChecker
 from program.semantic.error_reporter import ErrorReporter
 from program.semantic.scopes import GlobalScope
+from frontend.syntax_errors import attach_syntax_listener, run_checker
+from frontend.fast_lexer import create_lexer
 
-def compile_source(source: str):
+def compile_source(source: str, syntax_mode: str = "full", lexer: str = "antlr"):
     """
     Compila una cadena de código Compiscript y devuelve (reporter, checker).
+    Los errores sintácticos quedan en el reporter con código E_SYNTAX; por
+    defecto el checker corre igual ("full"), así las pruebas semánticas con
+    alguna línea inválida siguen chequeando el resto.
+    'lexer' elige entre el lexer generado por ANTLR ("antlr") y el de regex ("fast").
     """
+    reporter = ErrorReporter()
+
     input_stream = InputStream(source)
-    lexer = CompiscriptLexer(input_stream)
-    stream = CommonTokenStream(lexer)
+    lex = create_lexer(input_stream, lexer)
+    stream = CommonTokenStream(lex)
     parser = CompiscriptParser(stream)
+    syntax = attach_syntax_listener(lex, parser, reporter)
     tree = parser.program()
 
-    reporter = ErrorReporter()
     checker = TypeChecker(reporter)
 
-    checker.visit(tree)
+    run_checker(checker, tree, syntax, syntax_mode)
     return reporter, checker